@@ -12,12 +12,11 @@ echo "Python version: $(python --version)"
 echo "Running database migrations..."
 poetry run alembic upgrade head
 
-# Start uvicorn server
-echo "Starting uvicorn server on port ${WEBSITES_PORT:-8000}..."
-exec poetry run uvicorn app.main:app \
+# Start the API: preloaded app forked into uvicorn workers (one per core
+# unless WEB_CONCURRENCY is set), drained gracefully on SIGTERM
+echo "Starting API server on port ${WEBSITES_PORT:-8000}..."
+exec poetry run python -m app.server \
     --host 0.0.0.0 \
     --port "${WEBSITES_PORT:-8000}" \
     --log-level info \
-    --access-log \
-    --proxy-headers \
     --forwarded-allow-ips='*'
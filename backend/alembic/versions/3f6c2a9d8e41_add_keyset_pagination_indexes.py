@@ -0,0 +1,47 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: 3f6c2a9d8e41
+Revises: ac89c13f550c
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f6c2a9d8e41"
+down_revision = "ac89c13f550c"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns) - columns match the list sort keys so both
+# ORDER BY ... LIMIT and the keyset row comparison are served by one index scan
+KEYSET_INDEXES = [
+    ("idx_events_keyset", "events", "event_datetime DESC, id DESC"),
+    ("idx_events_npo_keyset", "events", "npo_id, event_datetime DESC, id DESC"),
+    (
+        "idx_auction_items_event_newest_keyset",
+        "auction_items",
+        "event_id, created_at DESC, bid_number, id",
+    ),
+    (
+        "idx_event_registrations_user_keyset",
+        "event_registrations",
+        "user_id, created_at DESC, id DESC",
+    ),
+    ("idx_registration_guests_keyset", "registration_guests", "created_at, id"),
+    ("idx_npos_keyset", "npos", "created_at DESC, id DESC"),
+    ("idx_users_keyset", "users", "created_at DESC, id DESC"),
+]
+
+
+def upgrade() -> None:
+    """Create composite (sort key, id) indexes for cursor-paginated listings."""
+    for name, table, columns in KEYSET_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns});")
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    for name, _table, _columns in reversed(KEYSET_INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name};")
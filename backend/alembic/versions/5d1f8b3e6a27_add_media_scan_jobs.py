@@ -0,0 +1,56 @@
+"""Add media scan job queue
+
+Revision ID: 5d1f8b3e6a27
+Revises: e2a9c7b41d06
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d1f8b3e6a27"
+down_revision = "e2a9c7b41d06"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create media_scan_jobs."""
+    op.create_table(
+        "media_scan_jobs",
+        sa.Column("media_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "available_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["media_id"], ["event_media.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("media_id"),
+    )
+
+    # Partial index: workers only look at jobs that are due or leased
+    op.create_index(
+        "idx_media_scan_jobs_due",
+        "media_scan_jobs",
+        ["available_at"],
+        postgresql_where=sa.text("available_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop media_scan_jobs."""
+    op.drop_index("idx_media_scan_jobs_due", table_name="media_scan_jobs")
+    op.drop_table("media_scan_jobs")
@@ -0,0 +1,126 @@
+"""Denormalize event_id onto registration_guests for bidder number uniqueness
+
+Replaces the check_bidder_number_uniqueness() trigger (migration 015), which
+ran a COUNT(*) join over all of an event's guests for every written row and
+was not safe under concurrent transactions, with a partial unique index on
+(event_id, bidder_number).
+
+registration_guests.event_id is kept in sync with its registration by a
+composite foreign key (registration_id, event_id) -> event_registrations
+(id, event_id) with ON UPDATE CASCADE.
+
+Revision ID: 6e2b8d4a1f73
+Revises: 8c3e5a7f2d19
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6e2b8d4a1f73"
+down_revision = "8c3e5a7f2d19"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add and backfill registration_guests.event_id, then swap the trigger for an index."""
+    op.add_column(
+        "registration_guests",
+        sa.Column(
+            "event_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="Event of the guest's registration (denormalized, kept in sync by FK)",
+        ),
+    )
+    op.execute("""
+        UPDATE registration_guests rg
+        SET event_id = er.event_id
+        FROM event_registrations er
+        WHERE er.id = rg.registration_id
+    """)
+    op.alter_column("registration_guests", "event_id", nullable=False)
+
+    op.create_unique_constraint(
+        "uq_event_registrations_id_event", "event_registrations", ["id", "event_id"]
+    )
+    op.create_foreign_key(
+        "fk_registration_guests_registration_event",
+        "registration_guests",
+        "event_registrations",
+        ["registration_id", "event_id"],
+        ["id", "event_id"],
+        onupdate="CASCADE",
+        ondelete="CASCADE",
+    )
+    op.create_index("ix_registration_guests_event_id", "registration_guests", ["event_id"])
+
+    op.execute("DROP TRIGGER IF EXISTS trg_check_bidder_number_uniqueness ON registration_guests")
+    op.execute("DROP FUNCTION IF EXISTS check_bidder_number_uniqueness")
+
+    # Fails if duplicate numbers slipped past the trigger; resolve those first
+    op.create_index(
+        "uq_registration_guests_event_bidder_number",
+        "registration_guests",
+        ["event_id", "bidder_number"],
+        unique=True,
+        postgresql_where=sa.text("bidder_number IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Restore the uniqueness trigger and drop the denormalized column."""
+    op.drop_index("uq_registration_guests_event_bidder_number", table_name="registration_guests")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION check_bidder_number_uniqueness()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            event_id_var UUID;
+            existing_count INTEGER;
+        BEGIN
+            IF NEW.bidder_number IS NULL THEN
+                RETURN NEW;
+            END IF;
+
+            SELECT event_id INTO event_id_var
+            FROM event_registrations
+            WHERE id = NEW.registration_id;
+
+            SELECT COUNT(*) INTO existing_count
+            FROM registration_guests rg
+            JOIN event_registrations er ON rg.registration_id = er.id
+            WHERE er.event_id = event_id_var
+              AND rg.bidder_number = NEW.bidder_number
+              AND rg.id != NEW.id;
+
+            IF existing_count > 0 THEN
+                RAISE EXCEPTION
+                    'Bidder number % is already assigned to another guest in this event',
+                    NEW.bidder_number
+                USING ERRCODE = '23505';
+            END IF;
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_check_bidder_number_uniqueness
+        BEFORE INSERT OR UPDATE OF bidder_number
+        ON registration_guests
+        FOR EACH ROW
+        EXECUTE FUNCTION check_bidder_number_uniqueness();
+    """)
+
+    op.drop_index("ix_registration_guests_event_id", table_name="registration_guests")
+    op.drop_constraint(
+        "fk_registration_guests_registration_event", "registration_guests", type_="foreignkey"
+    )
+    op.drop_constraint("uq_event_registrations_id_event", "event_registrations", type_="unique")
+    op.drop_column("registration_guests", "event_id")
@@ -0,0 +1,56 @@
+"""Add responsive image derivative metadata
+
+Revision ID: 8c3e5a7f2d19
+Revises: 5d1f8b3e6a27
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8c3e5a7f2d19"
+down_revision = "5d1f8b3e6a27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add derivative metadata columns for auction item media, event media and logos."""
+    op.add_column(
+        "auction_item_media",
+        sa.Column(
+            "derivatives",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Responsive renditions for srcset (see ImageDerivativeService)",
+        ),
+    )
+    op.add_column(
+        "event_media",
+        sa.Column(
+            "derivatives",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Responsive renditions for srcset, rendered after a clean scan",
+        ),
+    )
+    op.add_column(
+        "npo_branding",
+        sa.Column(
+            "logo_derivatives",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Resized logo renditions (url, width, height, format)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop derivative metadata columns."""
+    op.drop_column("npo_branding", "logo_derivatives")
+    op.drop_column("event_media", "derivatives")
+    op.drop_column("auction_item_media", "derivatives")
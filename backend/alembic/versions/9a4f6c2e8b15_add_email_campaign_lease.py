@@ -0,0 +1,36 @@
+"""Add email campaign lease and resume point
+
+Revision ID: 9a4f6c2e8b15
+Revises: 6e2b8d4a1f73
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9a4f6c2e8b15"
+down_revision = "6e2b8d4a1f73"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Track the runner's lease and the last queued guest of a campaign."""
+    op.add_column(
+        "email_campaigns",
+        sa.Column("last_recipient_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "email_campaigns",
+        sa.Column("lease_expires_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the campaign lease columns."""
+    op.drop_column("email_campaigns", "lease_expires_at")
+    op.drop_column("email_campaigns", "last_recipient_id")
@@ -0,0 +1,84 @@
+"""Add email campaigns
+
+Revision ID: c4d8f2a6b7e1
+Revises: 7b2e4d1c9a53
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4d8f2a6b7e1"
+down_revision = "7b2e4d1c9a53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create email_campaigns and link outbox rows to their campaign."""
+    op.create_table(
+        "email_campaigns",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_by_user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("campaign_type", sa.String(length=50), nullable=False),
+        sa.Column("audience", sa.String(length=20), nullable=False),
+        sa.Column("custom_message", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=20), server_default="pending", nullable=False),
+        sa.Column("total_recipients", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("queued_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["created_by_user_id"], ["users.id"], ondelete="SET NULL"),
+        sa.CheckConstraint(
+            "audience IN ('unconfirmed', 'not_invited', 'all')",
+            name="ck_email_campaigns_audience",
+        ),
+        sa.CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed')",
+            name="ck_email_campaigns_status",
+        ),
+    )
+    op.create_index("idx_email_campaigns_event_id", "email_campaigns", ["event_id"])
+
+    op.add_column(
+        "email_outbox",
+        sa.Column("campaign_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_foreign_key(
+        "fk_email_outbox_campaign_id",
+        "email_outbox",
+        "email_campaigns",
+        ["campaign_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index("idx_email_outbox_campaign_id", "email_outbox", ["campaign_id"])
+
+
+def downgrade() -> None:
+    """Drop email campaigns."""
+    op.drop_index("idx_email_outbox_campaign_id", table_name="email_outbox")
+    op.drop_constraint("fk_email_outbox_campaign_id", "email_outbox", type_="foreignkey")
+    op.drop_column("email_outbox", "campaign_id")
+    op.drop_index("idx_email_campaigns_event_id", table_name="email_campaigns")
+    op.drop_table("email_campaigns")
@@ -0,0 +1,145 @@
+"""Partition audit_logs by month and add query indexes
+
+Revision ID: e2a9c7b41d06
+Revises: c4d8f2a6b7e1
+Create Date: 2026-10-19 15:00:00.000000
+
+Rebuilds audit_logs as a table range-partitioned on created_at with one
+partition per month (audit_logs_pYYYYMM) plus a DEFAULT partition, and copies
+existing rows across. The primary key becomes (created_at, id) because a
+partitioned table's unique constraints must include the partition key.
+Partitions for upcoming months are created by the audit log maintenance job.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e2a9c7b41d06"
+down_revision = "c4d8f2a6b7e1"
+branch_labels = None
+depends_on = None
+
+# Months of partitions created ahead of the current month
+PARTITIONS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, action, resource_type, resource_id, ip_address, user_agent, metadata, created_at"
+)
+
+
+def upgrade() -> None:
+    """Move audit_logs to a monthly partitioned table."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned")
+    op.execute(
+        "ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey "
+        "TO audit_logs_unpartitioned_pkey"
+    )
+
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            user_id UUID REFERENCES users (id) ON DELETE SET NULL,
+            action VARCHAR(50) NOT NULL,
+            resource_type VARCHAR(50),
+            resource_id UUID,
+            ip_address VARCHAR(45) NOT NULL,
+            user_agent VARCHAR,
+            metadata JSONB,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (created_at, id)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    # One partition per UTC month from the oldest row through PARTITIONS_AHEAD months out
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month TIMESTAMP := date_trunc(
+                'month',
+                COALESCE((SELECT min(created_at) FROM audit_logs_unpartitioned), now())
+                    AT TIME ZONE 'UTC'
+            );
+            last_month TIMESTAMP := date_trunc('month', now() AT TIME ZONE 'UTC')
+                + interval '{PARTITIONS_AHEAD} months';
+        BEGIN
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                    'audit_logs_p' || to_char(month, 'YYYYMM'),
+                    month AT TIME ZONE 'UTC',
+                    (month + interval '1 month') AT TIME ZONE 'UTC'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END $$;
+        """
+    )
+
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_unpartitioned")
+    op.drop_table("audit_logs_unpartitioned")
+
+    # Indexes on the parent are created on every partition
+    op.create_index("idx_audit_logs_user_created", "audit_logs", ["user_id", "created_at"])
+    op.create_index(
+        "idx_audit_logs_resource_created",
+        "audit_logs",
+        ["resource_type", "resource_id", "created_at"],
+    )
+    op.create_index("idx_audit_logs_action_created", "audit_logs", ["action", "created_at"])
+    op.create_index("idx_audit_logs_ip_address", "audit_logs", ["ip_address"])
+    op.create_index(
+        "idx_audit_logs_metadata_gin",
+        "audit_logs",
+        ["metadata"],
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Move audit_logs back to a single table."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute(
+        "ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey "
+        "TO audit_logs_partitioned_pkey"
+    )
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            user_id UUID REFERENCES users (id) ON DELETE SET NULL,
+            action VARCHAR(50) NOT NULL,
+            resource_type VARCHAR(50),
+            resource_id UUID,
+            ip_address VARCHAR(45) NOT NULL,
+            user_agent VARCHAR,
+            metadata JSONB,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_partitioned")
+    # Dropping the parent drops all of its partitions
+    op.execute("DROP TABLE audit_logs_partitioned")
+
+    # The single-table indexes, under their original names
+    op.create_index("idx_audit_logs_user_id", "audit_logs", ["user_id"])
+    op.create_index("idx_audit_logs_action", "audit_logs", ["action"])
+    op.create_index("idx_audit_logs_created_at", "audit_logs", [sa.text("created_at DESC")])
+    op.create_index("idx_audit_logs_ip_address", "audit_logs", ["ip_address"])
+    op.create_index(
+        "idx_audit_logs_metadata_gin", "audit_logs", ["metadata"], postgresql_using="gin"
+    )
+    op.create_index(
+        "idx_audit_logs_user_created", "audit_logs", ["user_id", sa.text("created_at DESC")]
+    )
+    op.create_index(
+        "idx_audit_logs_action_created", "audit_logs", ["action", sa.text("created_at DESC")]
+    )
@@ -4,8 +4,10 @@ Exposes /metrics in the Prometheus text format. Other modules should import
 metrics from `app.core.metrics` and increment counters as appropriate.
 """
 
+import os
+
 from fastapi import APIRouter, Response
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest, multiprocess
 
 router = APIRouter()
 
@@ -15,7 +17,14 @@ async def metrics_endpoint() -> Response:
     """Return Prometheus-formatted metrics for scraping.
 
     Returns the default registry's metrics in text format with the
-    appropriate content type.
+    appropriate content type. Under the multi-process server (app.server),
+    the values of all worker processes are collected instead, whichever
+    worker serves the scrape.
     """
-    body = generate_latest()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        body = generate_latest(registry)
+    else:
+        body = generate_latest()
     return Response(content=body, media_type=CONTENT_TYPE_LATEST)
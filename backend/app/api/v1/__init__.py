@@ -1,6 +1,8 @@
 """API v1 routes package."""
 
-from fastapi import APIRouter
+from enum import Enum
+
+from fastapi import APIRouter, FastAPI
 
 from app.api.v1 import (
     admin,
@@ -14,6 +16,7 @@ from app.api.v1 import (
     consent,
     cookies,
     donor_seating,
+    event_changes,
     events,
     events_food_options,
     events_links,
@@ -31,35 +34,48 @@ from app.api.v1 import (
 from app.api.v1.public import contact as public_contact
 from app.api.v1.public import events as public_events
 
-# Create v1 API router
-api_router = APIRouter()
+# Sub-routers: (router, prefix under /api/v1, tags)
+ROUTERS: list[tuple[APIRouter, str, list[str | Enum]]] = [
+    (auth.router, "/auth", ["auth"]),
+    (users.router, "/users", ["users"]),
+    (npos.router, "", ["npos"]),
+    (members.router, "", ["members"]),
+    (invitations.router, "", ["invitations"]),
+    (branding.router, "", ["branding"]),
+    (events.router, "", ["events"]),
+    (event_changes.router, "", ["events"]),
+    (events_links.router, "", ["events", "links"]),
+    (events_media.router, "", ["events", "media"]),
+    (events_food_options.router, "", ["events", "food-options"]),
+    (sponsors.router, "", ["events", "sponsors"]),
+    (registrations.router, "", ["registrations"]),
+    (checkin.router, "", ["checkin"]),
+    (auction_items.router, "", ["auction-items"]),
+    (auction_item_media.router, "", ["auction-items", "media"]),
+    (legal_documents.router, "/legal", ["legal"]),
+    (consent.router, "/consent", ["consent"]),
+    (cookies.router, "/cookies", ["cookies"]),
+    (search.router, "", ["search"]),
+    (public_contact.router, "/public", ["public-contact"]),
+    (public_events.router, "/public", ["public-events"]),
+    (public_testimonials.router, "", ["public-testimonials"]),
+    (admin_testimonials.router, "", ["admin-testimonials"]),
+    (admin_seating.router, "", ["admin-seating"]),
+    (donor_seating.router, "", ["donor-seating"]),
+    (admin.router, "", ["admin"]),
+]
+
+
+def include_api_routers(app: FastAPI, prefix: str = "/api/v1") -> None:
+    """Mount the v1 routers on the app.
+
+    They are included straight into the app rather than through a v1
+    APIRouter: include_router rebuilds every route (dependency analysis and
+    response fields), so an intermediate router would build them all once
+    more at import.
+    """
+    for router, router_prefix, tags in ROUTERS:
+        app.include_router(router, prefix=f"{prefix}{router_prefix}", tags=tags)
 
-# Include sub-routers
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(users.router, prefix="/users", tags=["users"])
-api_router.include_router(npos.router, tags=["npos"])
-api_router.include_router(members.router, tags=["members"])
-api_router.include_router(invitations.router, tags=["invitations"])
-api_router.include_router(branding.router, tags=["branding"])
-api_router.include_router(events.router, tags=["events"])
-api_router.include_router(events_links.router, tags=["events", "links"])
-api_router.include_router(events_media.router, tags=["events", "media"])
-api_router.include_router(events_food_options.router, tags=["events", "food-options"])
-api_router.include_router(sponsors.router, tags=["events", "sponsors"])
-api_router.include_router(registrations.router, tags=["registrations"])
-api_router.include_router(checkin.router, tags=["checkin"])
-api_router.include_router(auction_items.router, tags=["auction-items"])
-api_router.include_router(auction_item_media.router, tags=["auction-items", "media"])
-api_router.include_router(legal_documents.router, prefix="/legal", tags=["legal"])
-api_router.include_router(consent.router, prefix="/consent", tags=["consent"])
-api_router.include_router(cookies.router, prefix="/cookies", tags=["cookies"])
-api_router.include_router(search.router, tags=["search"])
-api_router.include_router(public_contact.router, prefix="/public", tags=["public-contact"])
-api_router.include_router(public_events.router, prefix="/public", tags=["public-events"])
-api_router.include_router(public_testimonials.router, tags=["public-testimonials"])
-api_router.include_router(admin_testimonials.router, tags=["admin-testimonials"])
-api_router.include_router(admin_seating.router, tags=["admin-seating"])
-api_router.include_router(donor_seating.router, tags=["donor-seating"])
-api_router.include_router(admin.router, tags=["admin"])
 
-__all__ = ["api_router"]
+__all__ = ["ROUTERS", "include_api_routers"]
@@ -1,18 +1,30 @@
 """Admin API endpoints for SuperAdmin operations."""
 
+import json
+from datetime import datetime
 from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.pagination import CursorQuery, TotalModeQuery
+from app.core.scheduler import scheduler
 from app.middleware.auth import get_current_user
 from app.models.user import User
+from app.schemas.audit_log import AuditLogListResponse, AuditLogResponse
+from app.schemas.email_campaign import (
+    EmailCampaignCreateRequest,
+    EmailCampaignDeliveryCounts,
+    EmailCampaignResponse,
+)
 from app.schemas.npo import NPOResponse
 from app.services.admin_guest_service import AdminGuestService
 from app.services.application_service import ApplicationService
+from app.services.audit_log_query_service import AuditLogQueryService
+from app.services.email_campaign_service import EmailCampaignService
 from app.services.email_service import get_email_service
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -210,6 +222,7 @@ async def review_application(
                 to_email=npo.creator.email if npo.creator else npo.email,
                 npo_name=npo.name,
                 applicant_name=creator_name,
+                db=db,
             )
         else:  # reject
             await email_service.send_application_rejected_email(
@@ -217,6 +230,7 @@ async def review_application(
                 npo_name=npo.name,
                 reason=review_request.notes,
                 applicant_name=creator_name,
+                db=db,
             )
     except Exception as e:
         # Log error but don't fail the request - application was already updated
@@ -436,3 +450,212 @@ async def send_guest_invitation(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to send invitation",
         )
+
+
+@router.post(
+    "/events/{event_id}/email-campaigns",
+    response_model=EmailCampaignResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start guest invitation campaign",
+    description="Queue invitation emails to all matching guests of an event in throttled batches",
+)
+async def create_email_campaign(
+    event_id: UUID,
+    request: EmailCampaignCreateRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_superadmin),
+) -> EmailCampaignResponse:
+    """
+    Start a bulk guest invitation campaign.
+
+    **SuperAdmin only**
+
+    The invitation template is rendered once for the campaign and emails are
+    queued in the background (resumed by the scheduler if the worker stops
+    mid-campaign); poll the campaign for progress.
+
+    Args:
+        event_id: Event UUID
+        request: Audience and optional custom message
+        background_tasks: FastAPI background tasks
+        db: Database session
+        current_user: Current SuperAdmin user
+
+    Returns:
+        The pending campaign
+
+    Raises:
+        HTTPException: If event not found or a campaign is already in progress
+    """
+    campaign = await EmailCampaignService.create_campaign(
+        db=db,
+        event_id=event_id,
+        audience=request.audience,
+        custom_message=request.custom_message,
+        created_by_user_id=current_user.id,
+    )
+    # The runner uses its own session, so the campaign must be committed first
+    await db.commit()
+    background_tasks.add_task(EmailCampaignService.run_campaign, campaign.id)
+
+    return EmailCampaignResponse.model_validate(campaign)
+
+
+@router.get(
+    "/events/{event_id}/email-campaigns/{campaign_id}",
+    response_model=EmailCampaignResponse,
+    summary="Get email campaign progress",
+    description="Get queueing and delivery progress of a guest email campaign",
+)
+async def get_email_campaign(
+    event_id: UUID,
+    campaign_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_superadmin),
+) -> EmailCampaignResponse:
+    """
+    Get email campaign progress.
+
+    **SuperAdmin only**
+
+    Args:
+        event_id: Event UUID
+        campaign_id: Campaign UUID
+        db: Database session
+        current_user: Current SuperAdmin user
+
+    Returns:
+        Campaign status with outbox delivery counts
+
+    Raises:
+        HTTPException: If campaign not found
+    """
+    campaign = await EmailCampaignService.get_campaign(
+        db=db, event_id=event_id, campaign_id=campaign_id
+    )
+    counts = await EmailCampaignService.get_delivery_counts(db=db, campaign_id=campaign.id)
+
+    response = EmailCampaignResponse.model_validate(campaign)
+    response.delivery = EmailCampaignDeliveryCounts(**counts)
+    return response
+
+
+@router.get(
+    "/audit-logs",
+    response_model=AuditLogListResponse,
+    summary="Search audit logs",
+    description="Search audit log records, newest first, with keyset pagination (SuperAdmin only)",
+)
+async def search_audit_logs(
+    user_id: UUID | None = None,
+    action: Annotated[list[str] | None, Query(description="Repeat to match any of several")] = None,
+    resource_type: str | None = None,
+    resource_id: UUID | None = None,
+    ip_address: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    metadata: Annotated[
+        str | None,
+        Query(description='JSON object the metadata must contain, e.g. {"email": "a@b.org"}'),
+    ] = None,
+    cursor: CursorQuery = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    total_mode: TotalModeQuery = "none",
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_superadmin),
+) -> AuditLogListResponse:
+    """
+    Search audit log records.
+
+    **SuperAdmin only**
+
+    Used for compliance reviews, e.g. pulling a user's full history for a
+    GDPR request (user_id, or metadata={"email": ...} for records written
+    before the account existed or after it was deleted).
+
+    Args:
+        user_id: Records about this user
+        action: Actions to include
+        resource_type: Resource type
+        resource_id: Resource UUID
+        ip_address: Client IP address
+        since: Records at or after this time
+        until: Records before this time
+        metadata: JSON object for metadata containment filtering
+        cursor: Cursor from the previous page's next_cursor
+        limit: Page size
+        total_mode: How to compute total
+        db: Database session
+        current_user: Current SuperAdmin user
+
+    Returns:
+        Page of audit records with next_cursor
+
+    Raises:
+        HTTPException: 400 if metadata is not a JSON object or the cursor is invalid
+    """
+    metadata_filter: dict[str, Any] | None = None
+    if metadata:
+        try:
+            metadata_filter = json.loads(metadata)
+        except json.JSONDecodeError:
+            metadata_filter = None
+        if not isinstance(metadata_filter, dict):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="metadata must be a JSON object",
+            )
+
+    page = await AuditLogQueryService.search(
+        db,
+        user_id=user_id,
+        actions=action,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        ip_address=ip_address,
+        since=since,
+        until=until,
+        metadata=metadata_filter,
+        cursor=cursor,
+        limit=limit,
+        total_mode=total_mode,
+    )
+
+    return AuditLogListResponse(
+        items=[AuditLogResponse.model_validate(record) for record in page.items],
+        next_cursor=page.next_cursor,
+        total=page.total,
+    )
+
+
+@router.get(
+    "/scheduler/jobs",
+    summary="List scheduled jobs",
+    description="Periodic jobs with their schedule and recent runs across all replicas",
+)
+async def list_scheduled_jobs(
+    runs: Annotated[int, Query(ge=1, le=100)] = 10,
+    current_user: User = Depends(require_superadmin),
+) -> list[dict[str, Any]]:
+    """
+    List periodic jobs and their run history.
+
+    **SuperAdmin only**
+
+    Args:
+        runs: Recent runs to include per job
+        current_user: Current SuperAdmin user
+
+    Returns:
+        Jobs with interval, timeout and recent runs (newest first)
+    """
+    return [
+        {
+            "name": job.name,
+            "interval_seconds": job.interval,
+            "timeout_seconds": job.timeout,
+            "runs": await scheduler.history(job.name, limit=runs),
+        }
+        for job in scheduler.jobs.values()
+    ]
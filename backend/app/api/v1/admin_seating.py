@@ -9,8 +9,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.database import get_db
-from app.middleware.auth import get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.pagination import (
+    CursorQuery,
+    SortKey,
+    TotalModeQuery,
+    count_total,
+    order_by_keys,
+    paginate_keyset,
+)
+from app.middleware.auth import get_current_read_user, get_current_user
 from app.models.event import Event
 from app.models.registration_guest import RegistrationGuest
 from app.models.user import User
@@ -32,6 +40,8 @@ from app.services.seating_service import SeatingService
 
 router = APIRouter(prefix="/admin/events", tags=["admin-seating"])
 
+SEATING_GUEST_SORT = (SortKey(RegistrationGuest.created_at), SortKey(RegistrationGuest.id))
+
 
 @router.patch(
     "/{event_id}/seating/config",
@@ -136,8 +146,8 @@ async def configure_event_seating(
 )
 async def get_available_bidder_numbers(
     event_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_read_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     limit: int = Query(
         default=10, ge=1, le=100, description="Number of available bidder numbers to return"
     ),
@@ -521,8 +531,8 @@ async def remove_guest_from_table(
 async def get_table_occupancy(
     event_id: UUID,
     table_number: int,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_read_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> TableOccupancyResponse:
     """
     Get occupancy information for a specific table.
@@ -625,13 +635,15 @@ async def get_table_occupancy(
 )
 async def get_seating_guests(
     event_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_read_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     page: int = Query(default=1, ge=1, description="Page number"),
     per_page: int = Query(default=50, ge=1, le=200, description="Items per page"),
     table_filter: int | None = Query(
         default=None, description="Filter by table number (null for unassigned)"
     ),
+    cursor: CursorQuery = None,
+    total_mode: TotalModeQuery = "none",
 ) -> GuestSeatingListResponse:
     """
     Get paginated list of guests with seating information.
@@ -647,6 +659,8 @@ async def get_seating_guests(
         page: Page number (default 1)
         per_page: Items per page (default 50, max 200)
         table_filter: Optional table number filter (null for unassigned only)
+        cursor: Keyset cursor (empty for the first page); replaces page when set
+        total_mode: Total computation in cursor mode (default none)
 
     Returns:
         GuestSeatingListResponse with paginated guest list
@@ -705,18 +719,30 @@ async def get_seating_guests(
         else:
             base_query = base_query.where(RegistrationGuest.table_number == table_filter)
 
-    # Get total count
-    from sqlalchemy import func
-
-    count_query = select(func.count()).select_from(base_query.subquery())
-    count_result = await db.execute(count_query)
-    total = count_result.scalar_one()
-
-    # Get paginated results
-    offset = (page - 1) * per_page
-    guests_query = base_query.offset(offset).limit(per_page)
-    guests_result = await db.execute(guests_query)
-    guests_with_registration = list(guests_result.all())
+    # Get paginated results in a stable order (oldest guests first)
+    next_cursor = None
+    current_page: int | None = page
+    total: int | None
+    if cursor is not None:
+        keyset_page = await paginate_keyset(
+            db,
+            base_query,
+            SEATING_GUEST_SORT,
+            scope=f"seating_guests:{event_id}",
+            cursor=cursor,
+            limit=per_page,
+            total_mode=total_mode,
+        )
+        guests_with_registration = keyset_page.items
+        total, next_cursor, current_page = keyset_page.total, keyset_page.next_cursor, None
+        has_more = next_cursor is not None
+    else:
+        total = await count_total(db, base_query, "exact", scope="seating_guests") or 0
+        offset = (page - 1) * per_page
+        guests_query = order_by_keys(base_query, SEATING_GUEST_SORT).offset(offset).limit(per_page)
+        guests_result = await db.execute(guests_query)
+        guests_with_registration = list(guests_result.all())
+        has_more = (page * per_page) < total
 
     # Convert to GuestSeatingInfo
     from app.schemas.seating import GuestSeatingInfo
@@ -746,14 +772,13 @@ async def get_seating_guests(
             )
         )
 
-    has_more = (page * per_page) < total
-
     return GuestSeatingListResponse(
         guests=guest_info_list,
         total=total,
-        page=page,
+        page=current_page,
         per_page=per_page,
         has_more=has_more,
+        next_cursor=next_cursor,
     )
 
 
@@ -934,6 +959,7 @@ async def assign_registration_bidder_number(
         # Create primary guest
         primary_guest = RegistrationGuest(
             registration_id=registration.id,
+            event_id=registration.event_id,
             user_id=registration.user_id,
             checked_in=False,
         )
@@ -1040,6 +1066,7 @@ async def assign_registration_table(
         # Create primary guest
         primary_guest = RegistrationGuest(
             registration_id=registration.id,
+            event_id=registration.event_id,
             user_id=registration.user_id,
             checked_in=False,
         )
@@ -1157,8 +1184,8 @@ async def unassign_registration_table(
 )
 async def get_all_table_occupancy(
     event_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_read_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> dict[str, Any]:
     """
     Get table occupancy data for all tables.
@@ -1606,8 +1633,8 @@ async def update_table_details(
 )
 async def get_event_tables(
     event_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_read_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     include_guests: bool = Query(default=False, description="Include guest details for each table"),
 ) -> dict[str, Any]:
     """
@@ -2,11 +2,12 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.serialization import URL_SIGNER, json_response
 from app.middleware.auth import get_current_user, get_current_user_optional
 from app.models.user import User
 from app.schemas.auction_item_media import (
@@ -108,7 +109,7 @@ async def confirm_media_upload(
     request: MediaUploadConfirmRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> MediaResponse:
+) -> Response:
     """Confirm media upload and generate thumbnails."""
     # Verify auction item belongs to event
     from sqlalchemy import select
@@ -140,39 +141,11 @@ async def confirm_media_upload(
             video_url=request.video_url,
         )
 
-        # Convert media URLs to SAS URLs for secure access
-        media_dict = MediaResponse.model_validate(media).model_dump()
-
-        # Generate SAS URLs for file_path and thumbnail_path if using Azure Blob Storage
-        if media.file_path and media.file_path.startswith("https://"):
-            try:
-                # Extract blob path from URL
-                file_parts = media.file_path.split(f"{settings.azure_storage_container_name}/")
-                if len(file_parts) > 1:
-                    blob_path = "/".join(file_parts[1].split("?")[0].split("/"))
-                    media_dict["file_path"] = media_service._generate_blob_sas_url(
-                        blob_path, expiry_hours=24
-                    )
-            except (ValueError, IndexError):
-                # If SAS generation fails or URL format is unexpected, use original URL
-                pass
-
-        if media.thumbnail_path and media.thumbnail_path.startswith("https://"):
-            try:
-                # Extract blob path from thumbnail URL
-                thumb_parts = media.thumbnail_path.split(
-                    f"{settings.azure_storage_container_name}/"
-                )
-                if len(thumb_parts) > 1:
-                    thumb_blob_path = "/".join(thumb_parts[1].split("?")[0].split("/"))
-                    media_dict["thumbnail_path"] = media_service._generate_blob_sas_url(
-                        thumb_blob_path, expiry_hours=24
-                    )
-            except (ValueError, IndexError):
-                # If SAS generation fails or URL format is unexpected, use original URL
-                pass
-
-        return MediaResponse(**media_dict)
+        # Sign URLs while validating (one pass, rendered straight to bytes)
+        return json_response(
+            MediaResponse.model_validate(media, context={URL_SIGNER: media_service}),
+            status_code=status.HTTP_201_CREATED,
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -195,7 +168,7 @@ async def list_media(
     item_id: uuid.UUID,
     current_user: User | None = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db),
-) -> MediaListResponse:
+) -> Response:
     """List all media for an auction item."""
     # Verify auction item exists and belongs to event
     from sqlalchemy import select
@@ -229,48 +202,15 @@ async def list_media(
     media_result = await db.execute(media_stmt)
     media_items = media_result.scalars().all()
 
-    # Convert media URLs to SAS URLs for secure access
+    # Media URLs are signed (SAS) while validating the response
     settings = get_settings()
     media_service = AuctionItemMediaService(settings, db)
 
-    media_responses = []
-    for media in media_items:
-        media_dict = MediaResponse.model_validate(media).model_dump()
-
-        # Generate SAS URLs for file_path and thumbnail_path if using Azure Blob Storage
-        if media.file_path and media.file_path.startswith("https://"):
-            try:
-                # Extract blob path from URL
-                file_parts = media.file_path.split(f"{settings.azure_storage_container_name}/")
-                if len(file_parts) > 1:
-                    blob_path = "/".join(file_parts[1].split("?")[0].split("/"))
-                    media_dict["file_path"] = media_service._generate_blob_sas_url(
-                        blob_path, expiry_hours=24
-                    )
-            except (ValueError, IndexError):
-                # If SAS generation fails or URL format is unexpected, use original URL
-                pass
-
-        if media.thumbnail_path and media.thumbnail_path.startswith("https://"):
-            try:
-                # Extract blob path from thumbnail URL
-                thumb_parts = media.thumbnail_path.split(
-                    f"{settings.azure_storage_container_name}/"
-                )
-                if len(thumb_parts) > 1:
-                    thumb_blob_path = "/".join(thumb_parts[1].split("?")[0].split("/"))
-                    media_dict["thumbnail_path"] = media_service._generate_blob_sas_url(
-                        thumb_blob_path, expiry_hours=24
-                    )
-            except (ValueError, IndexError):
-                # If SAS generation fails or URL format is unexpected, use original URL
-                pass
-
-        media_responses.append(MediaResponse(**media_dict))
-
-    return MediaListResponse(
-        items=media_responses,
-        total=len(media_items),
+    return json_response(
+        MediaListResponse.model_validate(
+            {"items": media_items, "total": len(media_items)},
+            context={URL_SIGNER: media_service},
+        )
     )
 
 
@@ -294,7 +234,7 @@ async def reorder_media(
     request: MediaReorderRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> MediaListResponse:
+) -> Response:
     """Reorder media items."""
     # Verify auction item belongs to event
     from sqlalchemy import select
@@ -318,41 +258,12 @@ async def reorder_media(
     try:
         media_items = await media_service.reorder_media(item_id, request.media_order)
 
-        # Convert media URLs to SAS URLs for secure access (same as list endpoint)
-        media_responses = []
-        for media in media_items:
-            media_dict = MediaResponse.model_validate(media).model_dump()
-
-            # Generate SAS URLs for file_path and thumbnail_path if using Azure Blob Storage
-            if media.file_path and media.file_path.startswith("https://"):
-                try:
-                    file_parts = media.file_path.split(f"{settings.azure_storage_container_name}/")
-                    if len(file_parts) > 1:
-                        blob_path = "/".join(file_parts[1].split("?")[0].split("/"))
-                        media_dict["file_path"] = media_service._generate_blob_sas_url(
-                            blob_path, expiry_hours=24
-                        )
-                except (ValueError, IndexError):
-                    pass
-
-            if media.thumbnail_path and media.thumbnail_path.startswith("https://"):
-                try:
-                    thumb_parts = media.thumbnail_path.split(
-                        f"{settings.azure_storage_container_name}/"
-                    )
-                    if len(thumb_parts) > 1:
-                        thumb_blob_path = "/".join(thumb_parts[1].split("?")[0].split("/"))
-                        media_dict["thumbnail_path"] = media_service._generate_blob_sas_url(
-                            thumb_blob_path, expiry_hours=24
-                        )
-                except (ValueError, IndexError):
-                    pass
-
-            media_responses.append(MediaResponse(**media_dict))
-
-        return MediaListResponse(
-            items=media_responses,
-            total=len(media_items),
+        # Sign URLs while validating (same as list endpoint)
+        return json_response(
+            MediaListResponse.model_validate(
+                {"items": media_items, "total": len(media_items)},
+                context={URL_SIGNER: media_service},
+            )
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1,26 +1,52 @@
 """API routes for auction item management."""
 
+import csv
+import io
 import logging
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.core.database import get_db
-from app.middleware.auth import get_current_active_user, get_current_user_optional
+from app.core.database import get_db, get_read_db
+from app.core.http_cache import not_modified, set_validators
+from app.core.pagination import CursorQuery, TotalModeQuery, total_pages
+from app.core.serialization import PRIMARY_IMAGES, URL_SIGNER, json_response
+from app.middleware.auth import (
+    get_current_active_read_user,
+    get_current_active_user,
+    get_current_read_user_optional,
+)
 from app.models.auction_item import AuctionType, ItemStatus
+from app.models.event import Event
 from app.models.user import User
 from app.schemas.auction_item import (
     AuctionItemCreate,
     AuctionItemDetail,
+    AuctionItemImportRequest,
+    AuctionItemImportResponse,
     AuctionItemListResponse,
     AuctionItemResponse,
     AuctionItemUpdate,
-    PaginationInfo,
 )
-from app.services.auction_item_service import AuctionItemService
+from app.services.auction_item_service import (
+    AuctionItemImportError,
+    AuctionItemService,
+    parse_import_csv,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +115,151 @@ async def create_auction_item(
         )
 
 
+async def _require_event_admin(current_user: User, event_id: UUID, db: AsyncSession) -> None:
+    """Require NPO Admin or NPO Staff role for the event's NPO.
+
+    Raises:
+        HTTPException 403: User lacks the role or belongs to another NPO
+        HTTPException 404: Event not found
+    """
+    if current_user.role_name not in ["super_admin", "npo_admin", "npo_staff"]:  # type: ignore[attr-defined]
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions. NPO Admin or NPO Staff role required.",
+        )
+
+    event_npo_id = await db.scalar(select(Event.npo_id).where(Event.id == event_id))
+    if event_npo_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found",
+        )
+
+    # Super admins can manage any event, others must belong to the same NPO
+    if current_user.role_name != "super_admin":  # type: ignore[attr-defined]
+        if current_user.npo_id != event_npo_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have permission to manage this event",
+            )
+
+
+def _import_error(e: ValueError) -> HTTPException:
+    """Map an import failure to its HTTP error (row errors are returned as-is)."""
+    if isinstance(e, AuctionItemImportError):
+        return HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors)
+    if "not found" in str(e):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if "999" in str(e) or "maximum" in str(e).lower():
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
+@router.post(
+    "/import",
+    response_model=AuctionItemImportResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Import auction items",
+    description="Create up to 900 auction items in one request. Requires NPO Admin or NPO Staff role for the event's NPO.",
+)
+async def import_auction_items(
+    event_id: UUID,
+    import_data: AuctionItemImportRequest,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> AuctionItemImportResponse:
+    """Import auction items from JSON.
+
+    All items are validated first; if any is invalid nothing is created and
+    the errors are returned by row. Bid numbers are assigned in item order.
+    Media is uploaded per item afterwards, through the media endpoints.
+
+    Args:
+        event_id: UUID of the event
+        import_data: Items to create
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Created auction items
+
+    Raises:
+        HTTPException 403: User lacks permission for the event
+        HTTPException 404: Event not found
+        HTTPException 409: Bid number sequence exhausted (999 items)
+        HTTPException 422: Validation error
+    """
+    await _require_event_admin(current_user, event_id, db)
+
+    try:
+        items = await AuctionItemService(db).import_auction_items(
+            event_id=event_id, rows=import_data.items, created_by=current_user.id
+        )
+    except ValueError as e:
+        raise _import_error(e)
+
+    logger.info(f"User {current_user.id} imported {len(items)} auction items for event {event_id}")
+    return AuctionItemImportResponse(
+        items=[AuctionItemResponse.model_validate(item) for item in items], created=len(items)
+    )
+
+
+@router.post(
+    "/import/csv",
+    response_model=AuctionItemImportResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Import auction items from CSV",
+    description="Create up to 900 auction items from an uploaded CSV file. Requires NPO Admin or NPO Staff role for the event's NPO.",
+)
+async def import_auction_items_csv(
+    event_id: UUID,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    file: UploadFile = File(..., description="CSV with a header row of item fields"),
+) -> AuctionItemImportResponse:
+    """Import auction items from a CSV file.
+
+    The upload is spooled to disk and parsed row by row; columns are the
+    fields of the create endpoint.
+
+    Args:
+        event_id: UUID of the event
+        current_user: Authenticated user
+        db: Database session
+        file: Uploaded CSV (UTF-8, optionally with BOM)
+
+    Returns:
+        Created auction items
+
+    Raises:
+        HTTPException 403: User lacks permission for the event
+        HTTPException 404: Event not found
+        HTTPException 409: Bid number sequence exhausted (999 items)
+        HTTPException 422: Unreadable file or validation error
+    """
+    await _require_event_admin(current_user, event_id, db)
+
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        rows = parse_import_csv(lines)
+        items = await AuctionItemService(db).import_auction_items(
+            event_id=event_id, rows=rows, created_by=current_user.id
+        )
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Invalid CSV file: {e}"
+        )
+    except ValueError as e:
+        raise _import_error(e)
+    finally:
+        lines.detach()
+
+    logger.info(f"User {current_user.id} imported {len(items)} auction items for event {event_id}")
+    return AuctionItemImportResponse(
+        items=[AuctionItemResponse.model_validate(item) for item in items], created=len(items)
+    )
+
+
 @router.get(
     "",
     response_model=AuctionItemListResponse,
@@ -97,7 +268,8 @@ async def create_auction_item(
 )
 async def list_auction_items(
     event_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     auction_type: Annotated[
         str | None,
         Query(description="Filter by auction type (silent, live, or 'all' for both)"),
@@ -116,8 +288,10 @@ async def list_auction_items(
     ] = "highest_bid",
     page: Annotated[int, Query(description="Page number (1-indexed)", ge=1)] = 1,
     limit: Annotated[int, Query(description="Items per page", ge=1, le=100)] = 50,
-    current_user: Annotated[User | None, Depends(get_current_user_optional)] = None,
-) -> AuctionItemListResponse:
+    cursor: CursorQuery = None,
+    total_mode: TotalModeQuery = "none",
+    current_user: Annotated[User | None, Depends(get_current_read_user_optional)] = None,
+) -> Response:
     """List auction items for an event.
 
     **Permissions**:
@@ -133,6 +307,15 @@ async def list_auction_items(
     - highest_bid (default): Items with highest current bid first
     - newest: Most recently created items first
 
+    **Pagination**:
+    - Page-number mode (default): page + limit, exact total
+    - Cursor mode (infinite scroll): pass cursor (empty for the first page) and
+      follow pagination.next_cursor; total_mode picks exact, cached, estimated
+      or no total
+
+    **Conditional requests**: Honors If-None-Match / If-Modified-Since with a
+    304 computed from a catalog version lookup.
+
     Args:
         event_id: UUID of the event
         auction_type: Filter by auction type (or 'all')
@@ -141,7 +324,10 @@ async def list_auction_items(
         sort_by: Sort field (highest_bid or newest)
         page: Page number
         limit: Items per page
+        cursor: Keyset cursor (enables cursor mode)
+        total_mode: Total computation in cursor mode
         current_user: Optional authenticated user
+        request: Incoming request (conditional headers)
         db: Database session
 
     Returns:
@@ -170,77 +356,72 @@ async def list_auction_items(
             detail=f"Invalid sort_by: {sort_by}. Must be 'newest' or 'highest_bid'.",
         )
 
-    # List items
-    items, total = await service.list_auction_items(
-        event_id=event_id,
-        auction_type=actual_auction_type,
-        status=item_status,
-        search=search,
-        sort_by=sort_by,
-        page=page,
-        limit=limit,
-        include_drafts=include_drafts,
+    version = await service.get_catalog_version(
+        event_id,
+        actual_auction_type,
+        item_status,
+        search,
+        sort_by,
+        page,
+        limit,
+        include_drafts,
+        cursor,
+        total_mode,
     )
+    if (cached := not_modified(request, version)) is not None:
+        return cached
 
-    # Calculate pagination
-    total_pages = (total + limit - 1) // limit if total > 0 else 0
-
-    # Enrich items with primary image URLs
-    from sqlalchemy import select
-
-    from app.models.auction_item import AuctionItemMedia
-    from app.services.auction_item_media_service import AuctionItemMediaService
-
-    settings = get_settings()
-    media_service = AuctionItemMediaService(settings, db)
-
-    enriched_items = []
-    for item in items:
-        item_dict = AuctionItemResponse.model_validate(item).model_dump()
-
-        # Fetch primary image (first image by display_order)
-        media_stmt = (
-            select(AuctionItemMedia)
-            .where(
-                AuctionItemMedia.auction_item_id == item.id,
-                AuctionItemMedia.media_type == "image",
-            )
-            .order_by(AuctionItemMedia.display_order)
-            .limit(1)
+    # List items
+    next_cursor = None
+    current_page: int | None = page
+    if cursor is not None:
+        keyset_page = await service.list_auction_items_keyset(
+            event_id=event_id,
+            auction_type=actual_auction_type,
+            status=item_status,
+            search=search,
+            sort_by=sort_by,
+            cursor=cursor,
+            limit=limit,
+            include_drafts=include_drafts,
+            total_mode=total_mode,
         )
-        media_result = await db.execute(media_stmt)
-        primary_media = media_result.scalar_one_or_none()
-
-        if primary_media and primary_media.file_path:
-            # Generate SAS URL for full-resolution image (not thumbnail)
-            if primary_media.file_path.startswith("https://"):
-                blob_path = "/".join(
-                    primary_media.file_path.split(f"{settings.azure_storage_container_name}/")[1]
-                    .split("?")[0]
-                    .split("/")
-                )
-                try:
-                    item_dict["primary_image_url"] = media_service._generate_blob_sas_url(
-                        blob_path, expiry_hours=24
-                    )
-                except ValueError:
-                    item_dict["primary_image_url"] = primary_media.file_path
-            else:
-                item_dict["primary_image_url"] = primary_media.file_path
-        else:
-            item_dict["primary_image_url"] = None
-
-        enriched_items.append(AuctionItemResponse(**item_dict))
-
-    return AuctionItemListResponse(
-        items=enriched_items,
-        pagination=PaginationInfo(
+        items, total = keyset_page.items, keyset_page.total
+        next_cursor, current_page = keyset_page.next_cursor, None
+    else:
+        items, total = await service.list_auction_items(
+            event_id=event_id,
+            auction_type=actual_auction_type,
+            status=item_status,
+            search=search,
+            sort_by=sort_by,
             page=page,
             limit=limit,
-            total=total,
-            pages=total_pages,
-        ),
+            include_drafts=include_drafts,
+        )
+
+    # Primary images for the whole page in one query, signed while validating
+    from app.services.auction_item_media_service import AuctionItemMediaService
+
+    media_service = AuctionItemMediaService(get_settings(), db)
+    primary_images = await service.get_primary_images([item.id for item in items])
+
+    body = AuctionItemListResponse.model_validate(
+        {
+            "items": items,
+            "pagination": {
+                "page": current_page,
+                "limit": limit,
+                "total": total,
+                "pages": total_pages(total, limit),
+                "next_cursor": next_cursor,
+            },
+        },
+        context={URL_SIGNER: media_service, PRIMARY_IMAGES: primary_images},
     )
+    response = json_response(body)
+    set_validators(response, version)
+    return response
 
 
 @router.get(
@@ -252,9 +433,10 @@ async def list_auction_items(
 async def get_auction_item(
     event_id: UUID,
     item_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
-) -> AuctionItemDetail:
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[User, Depends(get_current_active_read_user)],
+) -> Response:
     """Get auction item details.
 
     **Permissions**:
@@ -264,16 +446,21 @@ async def get_auction_item(
         event_id: UUID of the event
         item_id: UUID of the auction item
         current_user: Authenticated user (required)
+        request: Incoming request (conditional headers)
         db: Database session
 
     Returns:
-        Auction item with media and sponsor details
+        Auction item with media and sponsor details (or 304 if unchanged)
 
     Raises:
         HTTPException 404: Item not found or doesn't belong to event
     """
     service = AuctionItemService(db)
 
+    version = await service.get_item_version(event_id, item_id)
+    if (cached := not_modified(request, version)) is not None:
+        return cached
+
     # Get item with relationships
     item = await service.get_auction_item_by_id(
         item_id=item_id,
@@ -290,66 +477,16 @@ async def get_auction_item(
     # Authenticated users can view all items
     # Future: Add NPO-specific permissions here if needed
 
-    # Fetch media with SAS URLs
-    from sqlalchemy import select
-
-    from app.models.auction_item import AuctionItemMedia
-    from app.schemas.auction_item_media import MediaResponse
+    # Media (loaded with the item) gets SAS URLs while validating
     from app.services.auction_item_media_service import AuctionItemMediaService
 
-    settings = get_settings()
-    media_service = AuctionItemMediaService(settings, db)
-
-    # Fetch media items
-    media_stmt = (
-        select(AuctionItemMedia)
-        .where(AuctionItemMedia.auction_item_id == item_id)
-        .order_by(AuctionItemMedia.display_order)
+    media_service = AuctionItemMediaService(get_settings(), db)
+    response = json_response(
+        AuctionItemDetail.model_validate(item, context={URL_SIGNER: media_service})
     )
-    media_result = await db.execute(media_stmt)
-    media_items = media_result.scalars().all()
-
-    # Convert media URLs to SAS URLs
-    media_responses = []
-    for media in media_items:
-        media_dict = MediaResponse.model_validate(media).model_dump()
-
-        # Generate SAS URLs for file_path and thumbnail_path if using Azure Blob Storage
-        if media.file_path and media.file_path.startswith("https://"):
-            blob_path = "/".join(
-                media.file_path.split(f"{settings.azure_storage_container_name}/")[1]
-                .split("?")[0]
-                .split("/")
-            )
-            try:
-                media_dict["file_path"] = media_service._generate_blob_sas_url(
-                    blob_path, expiry_hours=24
-                )
-            except ValueError:
-                pass
-
-        if media.thumbnail_path and media.thumbnail_path.startswith("https://"):
-            thumb_blob_path = "/".join(
-                media.thumbnail_path.split(f"{settings.azure_storage_container_name}/")[1]
-                .split("?")[0]
-                .split("/")
-            )
-            try:
-                media_dict["thumbnail_path"] = media_service._generate_blob_sas_url(
-                    thumb_blob_path, expiry_hours=24
-                )
-            except ValueError:
-                pass
-
-        media_responses.append(media_dict)
-
-    # Build response dictionary with all fields
-    response_dict = {
-        **AuctionItemResponse.model_validate(item).model_dump(),
-        "media": media_responses,
-    }
-
-    return AuctionItemDetail(**response_dict)
+    if version is not None:
+        set_validators(response, version)
+    return response
 
 
 @router.patch(
@@ -75,7 +75,7 @@ async def register(
         # Register user and get verification token
         user, verification_token = await AuthService.register(db, user_data)
 
-        # Send verification email
+        # Queue verification email in the registration transaction
         from app.services.email_service import get_email_service
 
         email_service = get_email_service()
@@ -84,8 +84,9 @@ async def register(
                 to_email=user.email,
                 verification_token=verification_token,
                 user_name=user.first_name,
+                db=db,
             )
-            logger.info(f"Verification email sent to {user.email} (user_id={user.id})")
+            logger.info(f"Verification email queued for {user.email} (user_id={user.id})")
         except Exception as e:
             # Log error but don't fail registration
             logger.error(f"Failed to send verification email to {user.email}: {str(e)}")
@@ -569,6 +570,7 @@ async def resend_verification_email(
         to_email=user.email,
         verification_token=verification_token,
         user_name=user.first_name,
+        db=db,
     )
 
     # Log for debugging (not audit event since it's a retry)
@@ -3,14 +3,16 @@
 Handles visual identity configuration including colors, logos, and social media links.
 """
 
+import asyncio
 import uuid
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
 from app.core.database import get_db
 from app.core.errors import NotFoundError
+from app.core.http_cache import not_modified, set_validators
 from app.core.logging import get_logger
 from app.middleware.auth import get_current_user
 from app.models.user import User
@@ -22,7 +24,9 @@ from app.schemas.npo_branding import (
     LogoUploadResponse,
 )
 from app.services.branding_service import BrandingService
+from app.services.event_branding_service import EventBrandingService
 from app.services.file_upload_service import FileUploadService
+from app.services.image_derivative_service import ImageDerivativeService
 from app.services.npo_permission_service import NPOPermissionService
 
 router = APIRouter(prefix="/npos", tags=["NPO Branding"])
@@ -38,9 +42,11 @@ logger = get_logger(__name__)
 )
 async def get_npo_branding(
     npo_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> BrandingResponse:
+) -> BrandingResponse | Response:
     """Get NPO branding configuration.
 
     Requires:
@@ -48,19 +54,26 @@ async def get_npo_branding(
 
     Returns:
     - 200: Branding configuration
+    - 304: Not modified (If-None-Match / If-Modified-Since matched)
     - 401: Not authenticated
     - 403: No permission to access this NPO
     - 404: NPO not found
     """
-    # Check if NPO exists first (to return 404 before 403)
     branding_service = BrandingService()
-    try:
-        branding = await branding_service.get_branding(db, npo_id)
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"code": "npo_not_found", "message": str(e)},
-        )
+    version = await branding_service.get_branding_version(db, npo_id)
+
+    # Check if NPO exists first (to return 404 before 403); an existing
+    # branding row implies the NPO exists, so the full load can wait
+    branding = None
+    if version is None:
+        try:
+            branding = await branding_service.get_branding(db, npo_id)
+        except NotFoundError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"code": "npo_not_found", "message": str(e)},
+            )
+        version = branding_service.branding_version(branding.id, branding.updated_at)
 
     # Check permission
     permission_service = NPOPermissionService()
@@ -72,6 +85,14 @@ async def get_npo_branding(
             detail={"code": "no_permission", "message": "No permission to access this NPO"},
         )
 
+    if (cached := not_modified(request, version)) is not None:
+        return cached
+
+    if branding is None:
+        branding = await branding_service.get_branding(db, npo_id)
+        version = branding_service.branding_version(branding.id, branding.updated_at)
+
+    set_validators(response, version)
     return BrandingResponse.model_validate(branding)
 
 
@@ -312,10 +333,24 @@ async def upload_logo_local(
         # Get current branding first
         current_branding = await branding_service.get_branding(db, npo_id)
 
-        # Update only the logo_url field
+        # Responsive renditions (best effort: the original logo is always usable)
+        logo_derivatives = None
+        try:
+            rendered = await ImageDerivativeService.render(
+                file_content, widths=FileUploadService.LOGO_DERIVATIVE_WIDTHS
+            )
+            logo_derivatives = await asyncio.to_thread(
+                file_upload_service.upload_derivatives, logo_url, rendered.derivatives
+            )
+        except Exception as e:
+            logger.warning(f"Logo derivatives not generated for NPO {npo_id}: {e}")
+
+        # Update only the logo fields
         current_branding.logo_url = logo_url
+        current_branding.logo_derivatives = logo_derivatives
         await db.commit()
         await db.refresh(current_branding)
+        await EventBrandingService.invalidate_npo(npo_id)
 
         # Convert to response
         branding_response = BrandingResponse.model_validate(current_branding)
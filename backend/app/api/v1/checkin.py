@@ -8,6 +8,7 @@ from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.schemas.checkin import CheckInBatchRequest, CheckInBatchResponse
 from app.schemas.event_registration import EventRegistrationResponse
 from app.schemas.registration_guest import RegistrationGuestResponse
 from app.services.checkin_service import CheckInService
@@ -140,6 +141,33 @@ async def check_in_registration(
     )
 
 
+@router.post("/batch", response_model=CheckInBatchResponse)
+async def check_in_batch(
+    request: CheckInBatchRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> CheckInBatchResponse:
+    """Check in many guests and registrations of an event at once.
+
+    For checking in a whole party, and for check-in devices syncing their
+    offline queue once connectivity returns (up to 1000 operations).
+
+    - **event_id**: Event all guests/registrations belong to
+    - **operations**: `{idempotency_key, target, id, checked_in_at?}` items
+
+    Every operation needs a client-generated idempotency key: resubmitting a
+    key (retries, double taps) returns its original result with
+    `replayed: true`. Guests or registrations already checked in are left
+    unchanged and reported as `already_checked_in`.
+    """
+    results = await CheckInService.check_in_batch(db, request.event_id, request.operations)
+    return CheckInBatchResponse(
+        results=results,
+        checked_in=sum(result.status == "checked_in" for result in results),
+        already_checked_in=sum(result.status == "already_checked_in" for result in results),
+        not_found=sum(result.status == "not_found" for result in results),
+    )
+
+
 @router.post("/guests/{guest_id}", response_model=CheckInResponse)
 async def check_in_guest(
     guest_id: uuid.UUID,
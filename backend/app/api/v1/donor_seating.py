@@ -7,8 +7,8 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.middleware.auth import get_current_active_user
+from app.core.database import get_read_db
+from app.middleware.auth import get_current_active_read_user
 from app.models.user import User
 from app.schemas.seating import SeatingInfoResponse
 from app.services.seating_service import SeatingService
@@ -164,8 +164,8 @@ router = APIRouter(prefix="/donor/events", tags=["donor-seating"])
 )
 async def get_my_seating_info(
     event_id: uuid.UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[User, Depends(get_current_active_read_user)],
 ) -> SeatingInfoResponse:
     """
     Get current user's seating information for an event.
@@ -0,0 +1,146 @@
+"""Live change stream (Server-Sent Events) for an event."""
+
+import json
+import uuid
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import get_read_db
+from app.middleware.auth import get_current_active_read_user
+from app.models.event import Event
+from app.models.user import User
+from app.services.event_change_feed import RESYNC, Subscription, event_change_feed
+
+settings = get_settings()
+
+router = APIRouter(prefix="/events/{event_id}/changes", tags=["events"])
+
+# Client reconnect delay after a dropped stream (milliseconds)
+RETRY_MS = 3000
+
+
+def sse_frame(event: str, data: dict[str, object], version: int | None = None) -> str:
+    """Encode one Server-Sent Events message."""
+    lines = [] if version is None else [f"id: {version}"]
+    lines += [f"event: {event}", f"data: {json.dumps(data)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+async def change_stream(
+    subscription: Subscription,
+    version: int,
+    last_event_id: int | None,
+    heartbeat_seconds: float,
+) -> AsyncIterator[str]:
+    """Frames for one client: a greeting, then changes and heartbeats.
+
+    A reconnecting client whose Last-Event-ID is behind the current version
+    missed changes while it was away, so it is told to resync first.
+    """
+    yield f"retry: {RETRY_MS}\n\n"
+    if last_event_id is not None and last_event_id < version:
+        yield sse_frame(RESYNC, {}, version)
+    else:
+        yield sse_frame("ready", {"version": version}, version)
+
+    while True:
+        message = await subscription.get(heartbeat_seconds)
+        if message is None:
+            yield ": heartbeat\n\n"  # Keeps proxies from closing an idle stream
+        elif message["topic"] == RESYNC:
+            yield sse_frame(RESYNC, {})
+        else:
+            yield sse_frame(message["topic"], message["ids"], message["version"])
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    summary="Stream seating, check-in and catalog changes",
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_event_changes(
+    event_id: uuid.UUID,
+    current_user: Annotated[User, Depends(get_current_active_read_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    last_event_id: Annotated[str | None, Header()] = None,
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of an event's committed changes.
+
+    Replaces polling of table occupancy, seating, check-in and auction item
+    lists: refetch a list only when its topic arrives.
+
+    **Events:**
+    - `ready`: stream is live; `data.version` is the current change version
+    - `checkin`, `seating`, `registrations`, `auction_items`: something
+      changed; `data` holds the affected ids (`guest_ids`, `registration_ids`,
+      `table_ids`, `item_ids`), or is empty if too many changed
+    - `resync`: changes may have been missed; refetch everything
+
+    Requires NPO Admin or NPO Staff role for the event's NPO: guest and
+    registration ids give access to check-in and invitations. The token goes
+    in the Authorization header, so browsers need a fetch-based EventSource
+    client. Messages carry ids only; the data itself is fetched from the
+    authorized endpoints. Reconnecting clients send `Last-Event-ID` and get a
+    `resync` if they missed anything.
+    """
+    if not settings.event_stream_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Change streams are disabled"
+        )
+
+    # Require NPO Admin or NPO Staff role
+    if current_user.role_name not in ["super_admin", "npo_admin", "npo_staff"]:  # type: ignore[attr-defined]
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions. NPO Admin or NPO Staff role required.",
+        )
+
+    event_npo_id = await db.scalar(select(Event.npo_id).where(Event.id == event_id))
+    if event_npo_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found",
+        )
+
+    # Super admins can view any event, others must belong to the same NPO
+    if current_user.role_name != "super_admin":  # type: ignore[attr-defined]
+        if current_user.npo_id != event_npo_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have permission to manage this event",
+            )
+
+    if event_change_feed.connections >= settings.event_stream_max_connections:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many open change streams; poll instead",
+            headers={"Retry-After": "30"},
+        )
+
+    # The stream can stay open for hours; don't hold a database connection for it
+    await db.close()
+
+    last_seen = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+
+    async def frames() -> AsyncIterator[str]:
+        async with event_change_feed.subscribe(event_id) as subscription:
+            # Read after subscribing so no change falls between the two
+            version = await event_change_feed.current_version(event_id)
+            async for frame in change_stream(
+                subscription, version, last_seen, settings.event_stream_heartbeat_seconds
+            ):
+                yield frame
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,11 +4,13 @@ import logging
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.middleware.auth import get_current_active_user
+from app.core.database import get_db, get_read_db
+from app.core.http_cache import not_modified, set_validators
+from app.core.pagination import CursorQuery, TotalModeQuery, total_pages
+from app.middleware.auth import get_current_active_read_user, get_current_active_user
 from app.models.user import User
 from app.schemas.event import (
     EventCreateRequest,
@@ -57,10 +59,20 @@ async def create_event(
 @router.get("/{event_id}", response_model=EventDetailResponse)
 async def get_event(
     event_id: uuid.UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
-) -> EventDetailResponse:
-    """Get event details by ID."""
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[User, Depends(get_current_active_read_user)],
+) -> EventDetailResponse | Response:
+    """Get event details by ID.
+
+    Honors If-None-Match / If-Modified-Since: revalidation is answered with
+    304 from a version lookup without loading the event graph.
+    """
+    version = await EventService.get_event_version(db, event_id)
+    if (cached := not_modified(request, version)) is not None:
+        return cached
+
     event = await EventService.get_event_by_id(db, event_id)
     if not event:
         raise HTTPException(
@@ -87,6 +99,14 @@ async def get_event(
                     blob_name = "/".join(parts[4:])  # Get everything after container
                     media_item["file_url"] = MediaService.generate_read_sas_url(blob_name)
 
+            # Responsive derivatives are private blobs too
+            for derivative in media_item.get("derivatives") or []:
+                parts = derivative["url"].split("/")
+                if len(parts) >= 5:
+                    derivative["url"] = MediaService.generate_read_sas_url("/".join(parts[4:]))
+
+    if version is not None:
+        set_validators(response, version)
     return EventDetailResponse(**response_dict)
 
 
@@ -186,16 +206,23 @@ async def delete_event(
 
 @router.get("", response_model=EventListResponse)
 async def list_events(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[User, Depends(get_current_active_read_user)],
     npo_id: Annotated[uuid.UUID | None, Query()] = None,
     status_param: Annotated[str | None, Query(alias="status")] = None,
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: CursorQuery = None,
+    total_mode: TotalModeQuery = "none",
 ) -> EventListResponse:
     """
     List events with filtering and pagination.
 
+    Pagination:
+    - Page-number mode (default): page + per_page, exact total
+    - Cursor mode: pass cursor (empty for the first page), follow next_cursor;
+      total_mode selects exact, cached, estimated or no total
+
     Access Control:
     - Super Admin: Can view all events (or filter by npo_id if specified)
     - NPO Admin: Can view events in their NPO only
@@ -224,13 +251,27 @@ async def list_events(
     permission_service = PermissionService()
     filtered_npo_id = permission_service.get_npo_filter_for_user(current_user, npo_id)
 
-    events, total = await EventService.list_events(
-        db,
-        npo_id=filtered_npo_id,
-        status_filter=status_filter,
-        page=page,
-        per_page=per_page,
-    )
+    next_cursor = None
+    current_page: int | None = page
+    if cursor is not None:
+        keyset_page = await EventService.list_events_keyset(
+            db,
+            npo_id=filtered_npo_id,
+            status_filter=status_filter,
+            cursor=cursor,
+            limit=per_page,
+            total_mode=total_mode,
+        )
+        events, total, next_cursor = keyset_page.items, keyset_page.total, keyset_page.next_cursor
+        current_page = None
+    else:
+        events, total = await EventService.list_events(
+            db,
+            npo_id=filtered_npo_id,
+            status_filter=status_filter,
+            page=page,
+            per_page=per_page,
+        )
 
     # Manually construct response items to include NPO name
     items = []
@@ -259,16 +300,17 @@ async def list_events(
     return EventListResponse(
         items=items,
         total=total,
-        page=page,
+        page=current_page,
         per_page=per_page,
-        total_pages=(total + per_page - 1) // per_page,
+        total_pages=total_pages(total, per_page),
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/public/{slug}", response_model=EventDetailResponse)
 async def get_public_event(
     slug: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> EventDetailResponse:
     """
     Public endpoint: Get active event by URL slug.
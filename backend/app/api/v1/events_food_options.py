@@ -9,10 +9,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.reorder import InvalidOrderError, reorder_rows
 from app.middleware.auth import get_current_active_user
 from app.models.event import FoodOption
 from app.models.user import User
-from app.schemas.event import FoodOptionCreateRequest, FoodOptionResponse, FoodOptionUpdateRequest
+from app.schemas.event import (
+    FoodOptionCreateRequest,
+    FoodOptionReorderRequest,
+    FoodOptionResponse,
+    FoodOptionUpdateRequest,
+)
 from app.services.event_service import EventService
 
 logger = logging.getLogger(__name__)
@@ -52,6 +58,7 @@ async def create_food_option(
     await db.flush()  # Flush to get the ID without committing
     await db.refresh(food_option)
     await db.commit()  # Commit the transaction
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
 
     logger.info(
         f"Created food option {food_option.id} for event {event_id} by user {current_user.id}"
@@ -67,6 +74,46 @@ async def create_food_option(
     )
 
 
+@router.patch("/reorder", response_model=list[FoodOptionResponse], status_code=status.HTTP_200_OK)
+async def reorder_food_options(
+    event_id: uuid.UUID,
+    request: FoodOptionReorderRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> list[FoodOptionResponse]:
+    """
+    Reorder an event's food options (drag and drop).
+
+    Provide food option IDs in the desired order; they get display_order 0..n-1.
+    """
+    # Verify event exists
+    event = await EventService.get_event_by_id(db, event_id)
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found",
+        )
+
+    try:
+        food_options = await reorder_rows(
+            db, FoodOption, request.food_option_ids, FoodOption.event_id == event_id
+        )
+    except InvalidOrderError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid food option IDs: {e.ids}",
+        ) from e
+    await db.commit()
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
+
+    logger.info(
+        f"Reordered {len(food_options)} food options for event {event_id} by user {current_user.id}"
+    )
+
+    return [FoodOptionResponse.model_validate(option) for option in food_options]
+
+
 @router.patch("/{option_id}", response_model=FoodOptionResponse, status_code=status.HTTP_200_OK)
 async def update_food_option(
     event_id: uuid.UUID,
@@ -110,6 +157,7 @@ async def update_food_option(
     await db.flush()
     await db.refresh(food_option)
     await db.commit()  # Commit the transaction
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
 
     logger.info(f"Updated food option {option_id} for event {event_id} by user {current_user.id}")
 
@@ -157,5 +205,6 @@ async def delete_food_option(
     # Delete the food option
     await db.delete(food_option)
     await db.commit()  # Commit the transaction
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
 
     logger.info(f"Deleted food option {option_id} from event {event_id} by user {current_user.id}")
@@ -9,10 +9,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.reorder import InvalidOrderError, reorder_rows
 from app.middleware.auth import get_current_active_user
 from app.models.event import EventLink
 from app.models.user import User
-from app.schemas.event import EventLinkCreateRequest, EventLinkResponse, EventLinkUpdateRequest
+from app.schemas.event import (
+    EventLinkCreateRequest,
+    EventLinkReorderRequest,
+    EventLinkResponse,
+    EventLinkUpdateRequest,
+)
 from app.services.event_service import EventService
 
 logger = logging.getLogger(__name__)
@@ -55,6 +61,7 @@ async def create_event_link(
     await db.flush()  # Flush to get the ID without committing
     await db.refresh(link)
     await db.commit()  # Commit the transaction
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
 
     logger.info(f"Created link {link.id} for event {event_id} by user {current_user.id}")
 
@@ -70,6 +77,42 @@ async def create_event_link(
     )
 
 
+@router.patch("/reorder", response_model=list[EventLinkResponse], status_code=status.HTTP_200_OK)
+async def reorder_event_links(
+    event_id: uuid.UUID,
+    request: EventLinkReorderRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> list[EventLinkResponse]:
+    """
+    Reorder an event's links (drag and drop).
+
+    Provide link IDs in the desired order; they get display_order 0..n-1.
+    """
+    # Verify event exists
+    event = await EventService.get_event_by_id(db, event_id)
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found",
+        )
+
+    try:
+        links = await reorder_rows(db, EventLink, request.link_ids, EventLink.event_id == event_id)
+    except InvalidOrderError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid link IDs: {e.ids}",
+        ) from e
+    await db.commit()
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
+
+    logger.info(f"Reordered {len(links)} links for event {event_id} by user {current_user.id}")
+
+    return [EventLinkResponse.model_validate(link) for link in links]
+
+
 @router.patch("/{link_id}", response_model=EventLinkResponse, status_code=status.HTTP_200_OK)
 async def update_event_link(
     event_id: uuid.UUID,
@@ -111,6 +154,7 @@ async def update_event_link(
     await db.flush()
     await db.refresh(link)
     await db.commit()  # Commit the transaction
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
 
     logger.info(f"Updated link {link_id} for event {event_id} by user {current_user.id}")
 
@@ -160,5 +204,6 @@ async def delete_event_link(
     # Delete the link
     await db.delete(link)
     await db.commit()  # Commit the transaction
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
 
     logger.info(f"Deleted link {link_id} from event {event_id} by user {current_user.id}")
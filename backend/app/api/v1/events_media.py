@@ -72,6 +72,7 @@ async def request_upload_url(
         media_type=media_type_enum,
         current_user=current_user,
     )
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
 
     # URL expires in 1 hour
     expires_at = datetime.now(pytz.UTC) + timedelta(hours=1)
@@ -107,6 +108,7 @@ async def confirm_upload(
 
     # Confirm upload
     media = await MediaService.confirm_upload(db=db, media_id=media_id)
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
 
     # Generate SAS URL for read access
     file_url = media.file_url
@@ -151,3 +153,4 @@ async def delete_media(
 
     # Delete media
     await MediaService.delete_media(db=db, media_id=media_id, current_user=current_user)
+    await EventService.invalidate_public_cache(event_id, include_lists=False)
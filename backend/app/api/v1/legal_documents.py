@@ -3,10 +3,11 @@
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.http_cache import PUBLIC_CACHE_CONTROL, not_modified, set_validators
 from app.middleware.auth import get_current_user, require_role
 from app.models.legal_document import LegalDocumentStatus, LegalDocumentType
 from app.models.user import User
@@ -26,18 +27,26 @@ service = LegalDocumentService()
 
 @router.get("/documents", response_model=list[LegalDocumentPublicResponse])
 async def get_current_documents(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-) -> list[LegalDocumentPublicResponse]:
+) -> list[LegalDocumentPublicResponse] | Response:
     """Get all currently published legal documents (public endpoint).
 
     Returns the latest published version of Terms of Service and Privacy Policy.
-    No authentication required.
+    No authentication required. Honors If-None-Match / If-Modified-Since.
 
     Returns:
-        List of published documents
+        List of published documents (or 304 if unchanged)
     """
     try:
+        version = await service.get_published_version(db=db)
+        cached = not_modified(request, version, cache_control=PUBLIC_CACHE_CONTROL)
+        if cached is not None:
+            return cached
+
         documents = await service.get_all_current_published(db=db)
+        set_validators(response, version, cache_control=PUBLIC_CACHE_CONTROL)
         return documents
     except Exception as e:
         logger.error(f"Error fetching current documents: {e}")
@@ -50,15 +59,17 @@ async def get_current_documents(
 @router.get("/documents/{document_type}", response_model=LegalDocumentPublicResponse)
 async def get_document_by_type(
     document_type: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-) -> LegalDocumentPublicResponse:
+) -> LegalDocumentPublicResponse | Response:
     """Get current published document by type (public endpoint).
 
     Args:
         document_type: 'terms_of_service' or 'privacy_policy'
 
     Returns:
-        Published document
+        Published document (or 304 if unchanged)
 
     Raises:
         HTTPException 400: Invalid document type
@@ -74,6 +85,11 @@ async def get_document_by_type(
         )
 
     try:
+        version = await service.get_published_version(db=db, document_type=doc_type)
+        cached = not_modified(request, version, cache_control=PUBLIC_CACHE_CONTROL)
+        if cached is not None:
+            return cached
+
         document = await service.get_current_published(db=db, document_type=doc_type)
         if not document:
             raise HTTPException(
@@ -81,6 +97,7 @@ async def get_document_by_type(
                 detail=f"No published {document_type} found",
             )
 
+        set_validators(response, version, cache_control=PUBLIC_CACHE_CONTROL)
         return LegalDocumentPublicResponse.model_validate(document)
     except HTTPException:
         raise
@@ -99,8 +116,10 @@ async def get_document_by_type(
 async def get_document_by_version(
     document_type: str,
     version: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-) -> LegalDocumentPublicResponse:
+) -> LegalDocumentPublicResponse | Response:
     """Get specific document version (public endpoint).
 
     Args:
@@ -108,7 +127,7 @@ async def get_document_by_version(
         version: Semantic version (e.g., '1.0', '2.1')
 
     Returns:
-        Document at specified version
+        Document at specified version (or 304 if unchanged)
 
     Raises:
         HTTPException 400: Invalid document type or version format
@@ -124,6 +143,13 @@ async def get_document_by_version(
         )
 
     try:
+        doc_version = await service.get_document_version(
+            db=db, document_type=doc_type, version=version
+        )
+        cached = not_modified(request, doc_version, cache_control=PUBLIC_CACHE_CONTROL)
+        if cached is not None:
+            return cached
+
         document = await service.get_by_type_and_version(
             db=db, document_type=doc_type, version=version
         )
@@ -133,6 +159,8 @@ async def get_document_by_version(
                 detail=f"Document {document_type} v{version} not found",
             )
 
+        if doc_version is not None:
+            set_validators(response, doc_version, cache_control=PUBLIC_CACHE_CONTROL)
         return LegalDocumentPublicResponse.model_validate(document)
     except HTTPException:
         raise
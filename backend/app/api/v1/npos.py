@@ -11,8 +11,9 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.middleware.auth import get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.pagination import CursorQuery, TotalModeQuery, total_pages
+from app.middleware.auth import get_current_read_user, get_current_user
 from app.middleware.request_id import get_request_id
 from app.models.npo import NPOStatus
 from app.models.user import User
@@ -92,13 +93,15 @@ async def create_npo(
 
 @router.get("", response_model=NPOListResponse)
 async def list_npos(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_read_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
     npo_status: Annotated[str | None, Query(alias="status")] = None,
     search: Annotated[str | None, Query()] = None,
     created_by_user_id: Annotated[uuid.UUID | None, Query()] = None,
+    cursor: CursorQuery = None,
+    total_mode: TotalModeQuery = "none",
 ) -> NPOListResponse:
     """
     List NPOs with filtering and pagination.
@@ -114,6 +117,8 @@ async def list_npos(
     - status: Filter by status (DRAFT, PENDING_APPROVAL, APPROVED, SUSPENDED, REJECTED)
     - search: Search in name, description, mission_statement
     - created_by_user_id: Filter by creator (SuperAdmin only)
+    - cursor: Keyset cursor (empty for the first page); replaces page when set
+    - total_mode: Total computation in cursor mode (exact, cached, estimate, none)
 
     **Returns:**
         Paginated list of NPOs
@@ -142,7 +147,17 @@ async def list_npos(
     )
 
     # Get filtered NPOs based on user permissions
-    npos, total = await NPOService.list_npos(db, current_user, list_params)
+    next_cursor = None
+    current_page: int | None = page
+    total: int | None
+    if cursor is not None:
+        keyset_page = await NPOService.list_npos_keyset(
+            db, current_user, list_params, cursor, total_mode
+        )
+        npos, total = keyset_page.items, keyset_page.total
+        next_cursor, current_page = keyset_page.next_cursor, None
+    else:
+        npos, total = await NPOService.list_npos(db, current_user, list_params)
 
     # Convert to response schemas, including logo_url from branding
     npo_responses = []
@@ -156,9 +171,10 @@ async def list_npos(
     return NPOListResponse(
         items=npo_responses,
         total=total,
-        page=page,
+        page=current_page,
         page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
+        total_pages=total_pages(total, page_size),
+        next_cursor=next_cursor,
     )
 
 
@@ -406,6 +422,7 @@ async def submit_npo_application(
             to_email=current_user.email,
             npo_name=npo.name,
             applicant_name=creator_name,
+            db=db,
         )
 
         # Send notification to admins
@@ -413,6 +430,7 @@ async def submit_npo_application(
             npo_name=npo.name,
             npo_email=npo.email,
             applicant_name=creator_name,
+            db=db,
         )
     except Exception as e:
         # Log error but don't fail the request - application was already submitted
@@ -4,13 +4,26 @@ import logging
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import CachedBody
+from app.core.database import get_primary_read_db
+from app.core.http_cache import (
+    PUBLIC_CACHE_CONTROL,
+    body_version,
+    not_modified,
+    set_validators,
+)
+from app.core.pagination import CursorQuery, TotalModeQuery, total_pages
 from app.models.event import EventStatus
 from app.schemas.event import EventDetailResponse, EventListResponse, EventSummaryResponse
-from app.services.event_service import EventService
+from app.services.event_service import (
+    PUBLIC_EVENT_LIST_TAG,
+    EventService,
+    public_event_cache,
+    public_event_tag,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,61 +32,112 @@ router = APIRouter(prefix="/events/public", tags=["public-events"])
 
 @router.get("", response_model=EventListResponse)
 async def list_public_events(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=100)] = 10,
     npo_id: uuid.UUID | None = None,
-) -> EventListResponse:
+    cursor: CursorQuery = None,
+    total_mode: TotalModeQuery = "none",
+) -> Response:
     """
     List all active (published) events for public browsing.
 
     Only events with status=ACTIVE are returned.
     No authentication required.
+    Supports page-number or cursor pagination (pass cursor, follow next_cursor).
+    Served from the public event cache (serialized JSON bytes); the ETag is
+    a hash of those bytes, so revalidation never touches the database.
     """
-    events, total = await EventService.list_events(
-        db=db,
-        page=page,
-        per_page=per_page,
-        npo_id=npo_id,
-        status_filter=EventStatus.ACTIVE,
-    )
 
-    total_pages = (total + per_page - 1) // per_page
+    async def load() -> CachedBody:
+        next_cursor = None
+        current_page: int | None = page
+        if cursor is not None:
+            keyset_page = await EventService.list_events_keyset(
+                db=db,
+                npo_id=npo_id,
+                status_filter=EventStatus.ACTIVE,
+                cursor=cursor,
+                limit=per_page,
+                total_mode=total_mode,
+            )
+            events, total = keyset_page.items, keyset_page.total
+            next_cursor, current_page = keyset_page.next_cursor, None
+        else:
+            events, total = await EventService.list_events(
+                db=db,
+                page=page,
+                per_page=per_page,
+                npo_id=npo_id,
+                status_filter=EventStatus.ACTIVE,
+            )
+
+        response = EventListResponse(
+            items=[
+                EventSummaryResponse.model_validate(event, from_attributes=True) for event in events
+            ],
+            total=total,
+            page=current_page,
+            per_page=per_page,
+            total_pages=total_pages(total, per_page),
+            next_cursor=next_cursor,
+        )
+        return CachedBody(response.model_dump_json().encode(), (PUBLIC_EVENT_LIST_TAG,))
 
-    return EventListResponse(
-        items=[
-            EventSummaryResponse.model_validate(event, from_attributes=True) for event in events
-        ],
-        total=total,
-        page=page,
-        per_page=per_page,
-        total_pages=total_pages,
+    key = (
+        f"list:{npo_id}:{page}:{per_page}"
+        if cursor is None
+        else f"list:{npo_id}:cursor:{cursor}:{per_page}:{total_mode}"
     )
+    body = await public_event_cache.get_or_load(key, load)
+    return _conditional_json(request, body)
 
 
 @router.get("/{slug}", response_model=EventDetailResponse)
 async def get_public_event_by_slug(
     slug: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> EventDetailResponse:
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+) -> Response:
     """
     Get event details by slug for public viewing.
 
     Only active events can be viewed.
     No authentication required.
+    Served from the public event cache (serialized JSON bytes); the ETag is
+    a hash of those bytes, so revalidation never touches the database.
     """
-    event = await EventService.get_event_by_slug(db, slug)
 
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Event with slug '{slug}' not found",
-        )
+    async def load() -> CachedBody:
+        event = await EventService.get_event_by_slug(db, slug)
 
-    if event.status != EventStatus.ACTIVE:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Event with slug '{slug}' is not available for registration",
-        )
+        if not event:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Event with slug '{slug}' not found",
+            )
+
+        if event.status != EventStatus.ACTIVE:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Event with slug '{slug}' is not available for registration",
+            )
+
+        response = EventDetailResponse.model_validate(event, from_attributes=True)
+        return CachedBody(response.model_dump_json().encode(), (public_event_tag(event.id),))
+
+    body = await public_event_cache.get_or_load(f"slug:{slug}", load)
+    return _conditional_json(request, body)
+
+
+def _conditional_json(request: Request, body: bytes) -> Response:
+    """Wrap cached JSON bytes in a response, or a 304 if the client's copy matches."""
+    version = body_version(body)
+    cached = not_modified(request, version, cache_control=PUBLIC_CACHE_CONTROL)
+    if cached is not None:
+        return cached
 
-    return EventDetailResponse.model_validate(event, from_attributes=True)
+    response = Response(content=body, media_type="application/json")
+    set_validators(response, version, cache_control=PUBLIC_CACHE_CONTROL)
+    return response
@@ -7,8 +7,9 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.middleware.auth import get_current_active_user
+from app.core.database import get_db, get_primary_read_db
+from app.core.pagination import CursorQuery, TotalModeQuery, total_pages
+from app.middleware.auth import get_current_active_primary_read_user, get_current_active_user
 from app.models.event_registration import RegistrationStatus
 from app.models.user import User
 from app.schemas.event_registration import (
@@ -68,17 +69,28 @@ async def list_user_registrations(
     status_filter: RegistrationStatus | None = None,
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=100)] = 10,
+    cursor: CursorQuery = None,
+    total_mode: TotalModeQuery = "none",
 ) -> EventRegistrationListResponse:
     """
     Get all registrations for the current user.
 
-    Returns paginated list of user's event registrations.
+    Returns paginated list of user's event registrations. Pass cursor (empty
+    for the first page) to page by keyset via next_cursor instead of page.
     """
-    registrations, total = await EventRegistrationService.get_user_registrations(
-        db, current_user.id, status_filter, page, per_page
-    )
-
-    total_pages = (total + per_page - 1) // per_page
+    next_cursor = None
+    current_page: int | None = page
+    total: int | None
+    if cursor is not None:
+        keyset_page = await EventRegistrationService.get_user_registrations_keyset(
+            db, current_user.id, status_filter, cursor, per_page, total_mode
+        )
+        registrations, total = keyset_page.items, keyset_page.total
+        next_cursor, current_page = keyset_page.next_cursor, None
+    else:
+        registrations, total = await EventRegistrationService.get_user_registrations(
+            db, current_user.id, status_filter, page, per_page
+        )
 
     return EventRegistrationListResponse(
         registrations=[
@@ -86,16 +98,17 @@ async def list_user_registrations(
             for reg in registrations
         ],
         total=total,
-        page=page,
+        page=current_page,
         per_page=per_page,
-        total_pages=total_pages,
+        total_pages=total_pages(total, per_page),
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/events-with-branding", response_model=RegisteredEventsResponse)
 async def get_registered_events_with_branding(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+    current_user: Annotated[User, Depends(get_current_active_primary_read_user)],
 ) -> RegisteredEventsResponse:
     """
     Get events user is registered for with resolved branding.
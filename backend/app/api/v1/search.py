@@ -10,9 +10,9 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.logging import get_logger
-from app.middleware.auth import get_current_active_user
+from app.middleware.auth import get_current_active_read_user
 from app.models.auction_item import AuctionItem
 from app.models.event import Event
 from app.models.npo import NPO
@@ -34,8 +34,8 @@ router = APIRouter(prefix="/search", tags=["search"])
 @router.post("", response_model=SearchResponse)
 async def search(
     search_request: SearchRequest,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[User, Depends(get_current_active_read_user)],
 ) -> SearchResponse:
     """Search across Users, NPOs, Events, and Auction Items with role-based filtering.
 
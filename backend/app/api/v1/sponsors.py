@@ -4,11 +4,12 @@ import logging
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.middleware.auth import get_current_active_user
+from app.core.database import get_db, get_read_db
+from app.core.http_cache import not_modified, set_validators
+from app.middleware.auth import get_current_active_read_user, get_current_active_user
 from app.models.user import User
 from app.schemas.sponsor import (
     LogoUploadRequest,
@@ -31,14 +32,21 @@ router = APIRouter(prefix="/events/{event_id}/sponsors", tags=["events", "sponso
 @router.get("", response_model=list[SponsorResponse], status_code=status.HTTP_200_OK)
 async def list_sponsors(
     event_id: uuid.UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
-) -> list[SponsorResponse]:
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[User, Depends(get_current_active_read_user)],
+) -> list[SponsorResponse] | Response:
     """
     List all sponsors for an event.
 
     Returns sponsors ordered by display_order (ascending) and logo_size (descending).
+    Honors If-None-Match / If-Modified-Since with a 304 from a version lookup.
     """
+    version = await SponsorService.get_sponsors_version(db, event_id)
+    if (cached := not_modified(request, version)) is not None:
+        return cached
+
     # Verify event exists
     event = await EventService.get_event_by_id(db, event_id)
     if not event:
@@ -105,6 +113,8 @@ async def list_sponsors(
             )
         )
 
+    if version is not None:
+        set_validators(response, version)
     return sponsor_responses
 
 
@@ -392,8 +402,8 @@ async def confirm_logo_upload(
 async def get_sponsor(
     event_id: uuid.UUID,
     sponsor_id: uuid.UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[User, Depends(get_current_active_read_user)],
 ) -> SponsorResponse:
     """Get sponsor by ID."""
     sponsor = await SponsorService.get_sponsor_by_id(db, sponsor_id, event_id)
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
 from app.core.database import get_db
+from app.core.pagination import CursorQuery, TotalModeQuery
 from app.middleware.auth import get_current_user, require_role
 from app.models.user import User
 from app.schemas.users import (
@@ -219,6 +220,8 @@ async def list_users(
     email_verified: bool | None = None,
     is_active: bool | None = None,
     search: str | None = None,
+    cursor: CursorQuery = None,
+    total_mode: TotalModeQuery = "none",
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> UserListResponse:
@@ -238,6 +241,8 @@ async def list_users(
     - email_verified: Filter by email verification status
     - is_active: Filter by active status
     - search: Search in name and email
+    - cursor: Keyset cursor (empty for the first page); replaces page when set
+    - total_mode: Total computation in cursor mode (exact, cached, estimate, none)
 
     Returns:
         Paginated list of users with role information
@@ -259,6 +264,8 @@ async def list_users(
             email_verified=email_verified,
             is_active=is_active,
             search=search,
+            cursor=cursor,
+            total_mode=total_mode,
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,375 @@
+"""Two-tier read-through cache for pre-serialized response bodies.
+
+Tier 1 is a small in-process TTL/LRU map; tier 2 is Redis (raw-bytes client).
+Values are the final JSON bytes of a response, so a hit skips the database,
+Pydantic validation and JSON encoding entirely. In Redis the body is stored
+behind a one-line header listing its tags, so entries promoted to the local
+tier stay invalidatable.
+
+Invalidation is tag-based: every entry is stored with a set of tags (e.g.
+``event:{id}``) and :meth:`ResponseCache.invalidate_tags` drops all entries
+carrying any of the tags from both tiers. Invalidation only reaches the local
+tier of the process that performs it, so the local TTL is kept short and bounds
+cross-replica staleness.
+
+Redis is best-effort: any Redis error degrades to a local-only cache.
+
+Example:
+    cache = ResponseCache("public_events", ttl_seconds=60)
+
+    async def load() -> CachedBody:
+        payload = await build_response()
+        return CachedBody(payload.model_dump_json().encode(), ("event:123",))
+
+    body = await cache.get_or_load("slug:spring-gala", load)
+    return Response(content=body, media_type="application/json")
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import ClassVar, NamedTuple
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import RESPONSE_CACHE_REQUESTS_TOTAL
+from app.core.redis import execute_pipeline
+from app.services.redis_service import RedisService
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class CachedBody(NamedTuple):
+    """A serialized response body and the tags it depends on."""
+
+    body: bytes
+    tags: tuple[str, ...] = ()
+
+
+class _LocalEntry(NamedTuple):
+    expires_at: float
+    body: bytes
+    tags: tuple[str, ...]
+
+
+class ResponseCache:
+    """Read-through cache of response bytes with tag-based invalidation."""
+
+    _instances: ClassVar[list["ResponseCache"]] = []
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: int,
+        local_ttl_seconds: float | None = None,
+        max_local_entries: int | None = None,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            namespace: Key prefix and metrics label (e.g. "public_events")
+            ttl_seconds: Redis tier TTL
+            local_ttl_seconds: In-process tier TTL (default from settings)
+            max_local_entries: In-process LRU capacity (default from settings)
+        """
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.local_ttl_seconds = (
+            local_ttl_seconds
+            if local_ttl_seconds is not None
+            else settings.response_cache_local_ttl_seconds
+        )
+        self.max_local_entries = max_local_entries or settings.response_cache_local_max_entries
+        self._local: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+        # Bumped on every invalidation so loads that raced with it are not stored
+        self._generation = 0
+        self._redis_dirty = False
+        ResponseCache._instances.append(self)
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def _redis_key(self, key: str) -> str:
+        return f"cache:{self.namespace}:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"cache:{self.namespace}:tag:{tag}"
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[CachedBody]],
+    ) -> bytes:
+        """Return cached bytes for key, calling loader on a miss.
+
+        Concurrent misses for the same key in one process share a single
+        loader call. Exceptions raised by the loader (e.g. 404) propagate and
+        nothing is cached.
+
+        Args:
+            key: Cache key within this namespace
+            loader: Builds the serialized body and its tags
+
+        Returns:
+            bytes: Serialized response body
+        """
+        if not settings.response_cache_enabled:
+            return (await loader()).body
+
+        body = self._get_local(key)
+        if body is not None:
+            RESPONSE_CACHE_REQUESTS_TOTAL.labels(cache=self.namespace, result="local_hit").inc()
+            return body
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = await self._load(key, loader)
+            future.set_result(body)
+            return body
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[CachedBody]]) -> bytes:
+        generation = self._generation
+
+        try:
+            cached = await execute_pipeline(
+                f"cache.{self.namespace}.get",
+                lambda pipe: pipe.get(self._redis_key(key)),
+                binary=True,
+            )
+            stored = cached[0]
+        except RedisError as e:
+            logger.warning(
+                "Response cache read failed", extra={"cache": self.namespace, "error": str(e)}
+            )
+            stored = None
+
+        if stored is not None:
+            RESPONSE_CACHE_REQUESTS_TOTAL.labels(cache=self.namespace, result="redis_hit").inc()
+            body, tags = self._decode(stored)
+            if generation == self._generation:
+                self._set_local(key, body, tags)
+            return body
+
+        RESPONSE_CACHE_REQUESTS_TOTAL.labels(cache=self.namespace, result="miss").inc()
+        loaded = await loader()
+        if generation == self._generation:
+            self._set_local(key, loaded.body, loaded.tags)
+            await self._set_redis({key: loaded})
+        return loaded.body
+
+    async def get_many_or_load(
+        self,
+        keys: Iterable[str],
+        loader: Callable[[list[str]], Awaitable[dict[str, CachedBody]]],
+    ) -> dict[str, bytes]:
+        """Return cached bytes for many keys, loading all misses in one call.
+
+        Redis is read with a single MGET and the loader gets every key missing
+        from both tiers at once. Unlike get_or_load, concurrent misses are not
+        coalesced, so use it for cheap-to-build fragments.
+
+        Args:
+            keys: Cache keys within this namespace
+            loader: Builds bodies and tags for the given keys; keys it leaves
+                out (e.g. deleted rows) are missing from the result
+
+        Returns:
+            dict[str, bytes]: Serialized body by key
+        """
+        wanted = list(dict.fromkeys(keys))
+        if not settings.response_cache_enabled:
+            return {key: loaded.body for key, loaded in (await loader(wanted)).items()}
+
+        found: dict[str, bytes] = {}
+        remote: list[str] = []
+        for key in wanted:
+            body = self._get_local(key)
+            if body is None:
+                remote.append(key)
+            else:
+                found[key] = body
+        if found:
+            RESPONSE_CACHE_REQUESTS_TOTAL.labels(cache=self.namespace, result="local_hit").inc(
+                len(found)
+            )
+        if not remote:
+            return found
+
+        generation = self._generation
+        try:
+            stored = (
+                await execute_pipeline(
+                    f"cache.{self.namespace}.get",
+                    lambda pipe: pipe.mget([self._redis_key(key) for key in remote]),
+                    binary=True,
+                )
+            )[0]
+        except RedisError as e:
+            logger.warning(
+                "Response cache read failed", extra={"cache": self.namespace, "error": str(e)}
+            )
+            stored = [None] * len(remote)
+
+        missing: list[str] = []
+        for key, value in zip(remote, stored, strict=True):
+            if value is None:
+                missing.append(key)
+                continue
+            RESPONSE_CACHE_REQUESTS_TOTAL.labels(cache=self.namespace, result="redis_hit").inc()
+            body, tags = self._decode(value)
+            if generation == self._generation:
+                self._set_local(key, body, tags)
+            found[key] = body
+        if not missing:
+            return found
+
+        RESPONSE_CACHE_REQUESTS_TOTAL.labels(cache=self.namespace, result="miss").inc(len(missing))
+        loaded = await loader(missing)
+        if generation == self._generation and loaded:
+            for key, entry in loaded.items():
+                self._set_local(key, entry.body, entry.tags)
+            await self._set_redis(loaded)
+        found.update((key, entry.body) for key, entry in loaded.items())
+        return found
+
+    @staticmethod
+    def _decode(stored: bytes) -> tuple[bytes, tuple[str, ...]]:
+        """Split a Redis value into body and tags."""
+        header, _, body = bytes(stored).partition(b"\n")
+        return body, tuple(header.decode().split(",")) if header else ()
+
+    # ------------------------------------------------------------------
+    # Local tier
+    # ------------------------------------------------------------------
+
+    def _get_local(self, key: str) -> bytes | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return entry.body
+
+    def _set_local(self, key: str, body: bytes, tags: tuple[str, ...]) -> None:
+        if self.local_ttl_seconds <= 0:
+            return
+        self._local[key] = _LocalEntry(time.monotonic() + self.local_ttl_seconds, body, tags)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Redis tier
+    # ------------------------------------------------------------------
+
+    async def _set_redis(self, entries: dict[str, CachedBody]) -> None:
+        def build(pipe: object) -> None:
+            for key, loaded in entries.items():
+                redis_key = self._redis_key(key)
+                header = ",".join(loaded.tags).encode()
+                pipe.set(redis_key, header + b"\n" + loaded.body, ex=self.ttl_seconds)  # type: ignore[attr-defined]
+                for tag in loaded.tags:
+                    tag_key = self._tag_key(tag)
+                    pipe.sadd(tag_key, redis_key)  # type: ignore[attr-defined]
+                    pipe.expire(tag_key, self.ttl_seconds)  # type: ignore[attr-defined]
+
+        try:
+            await execute_pipeline(f"cache.{self.namespace}.set", build, binary=True)
+            self._redis_dirty = True
+        except RedisError as e:
+            logger.warning(
+                "Response cache write failed", extra={"cache": self.namespace, "error": str(e)}
+            )
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Drop every entry tagged with any of the given tags.
+
+        Call after the transaction that changed the underlying data commits.
+
+        Args:
+            tags: Tags to invalidate (e.g. "event:{id}")
+        """
+        if not tags:
+            return
+
+        self._generation += 1
+        tag_set = set(tags)
+        for key in [k for k, e in self._local.items() if tag_set.intersection(e.tags)]:
+            del self._local[key]
+
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        try:
+            members = await execute_pipeline(
+                f"cache.{self.namespace}.invalidate",
+                lambda pipe: [pipe.smembers(tag_key) for tag_key in tag_keys],
+                binary=True,
+            )
+            keys: set[bytes | str] = set(tag_keys)
+            for member_set in members:
+                keys.update(member_set)
+            await execute_pipeline(
+                f"cache.{self.namespace}.invalidate",
+                lambda pipe: pipe.unlink(*keys),
+                binary=True,
+            )
+        except RedisError as e:
+            logger.warning(
+                "Response cache invalidation failed",
+                extra={"cache": self.namespace, "tags": list(tags), "error": str(e)},
+            )
+
+        RESPONSE_CACHE_REQUESTS_TOTAL.labels(cache=self.namespace, result="invalidation").inc()
+
+    async def clear(self) -> None:
+        """Drop all entries in this namespace from both tiers."""
+        self._generation += 1
+        self._local.clear()
+        if not self._redis_dirty:
+            return
+
+        try:
+            await RedisService.delete_by_pattern(f"cache:{self.namespace}:*")
+            self._redis_dirty = False
+        except RedisError as e:
+            logger.warning(
+                "Response cache clear failed", extra={"cache": self.namespace, "error": str(e)}
+            )
+
+    @classmethod
+    async def clear_all(cls, namespaces: Iterable[str] | None = None) -> None:
+        """Clear every registered cache (or only the given namespaces)."""
+        wanted = set(namespaces) if namespaces is not None else None
+        for cache in cls._instances:
+            if wanted is None or cache.namespace in wanted:
+                await cache.clear()
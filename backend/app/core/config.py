@@ -27,9 +27,57 @@ class Settings(BaseSettings):
     # Database
     database_url: PostgresDsn
 
+    # Read replica: read-only endpoints (get_read_db) use it while its replay lag
+    # is within database_replica_max_lag_seconds, and the primary otherwise
+    database_replica_url: PostgresDsn | None = None
+    database_replica_max_lag_seconds: float = 2.0
+    database_replica_lag_check_seconds: float = 5.0  # How long a lag reading is trusted
+
     # Redis
     redis_url: RedisDsn
 
+    # Redis connection pool (shared by all callers in a process)
+    redis_max_connections: int = 50
+    redis_pool_timeout: float = 2.0  # Seconds to wait for a free pooled connection
+    redis_socket_timeout: float = 5.0
+    redis_socket_connect_timeout: float = 5.0
+    redis_health_check_interval: int = 30  # Seconds between idle connection PINGs
+    redis_protocol: Literal[2, 3] = 2  # 3 = RESP3
+
+    # Response cache (in-process tier + Redis tier)
+    response_cache_enabled: bool = True
+    response_cache_local_ttl_seconds: float = 5.0  # Bounds cross-replica staleness
+    response_cache_local_max_entries: int = 1024
+    public_event_cache_ttl_seconds: int = 60
+    event_branding_cache_ttl_seconds: int = 600  # Invalidated on event/NPO branding writes
+
+    # Keyset pagination: TTL for total_mode=cached list counts
+    pagination_count_cache_ttl_seconds: int = 30
+
+    # HTTP conditional requests (ETag / Last-Modified)
+    http_cache_signed_url_window_hours: int = 12  # Must stay below the 24h SAS URL expiry
+
+    # Response compression (negotiated via Accept-Encoding)
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024  # Bytes; smaller bodies are sent uncompressed
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4  # 0-11; higher costs CPU on every response
+
+    # Per-request database query instrumentation (Server-Timing header, metrics
+    # and a warning log for query-heavy requests, e.g. N+1 loops)
+    query_stats_enabled: bool = True
+    query_stats_server_timing: bool = True  # Exposes query count and DB time to clients
+    query_stats_warn_threshold: int = 30  # Statements per request before logging a warning
+    query_stats_slow_query_ms: float = 200.0
+
+    # Tracing: spans for HTTP requests and their SQL, Redis, blob and email calls.
+    # The request id is the trace id. Exporter "none" disables tracing; "console"
+    # writes JSON lines to stderr and "file" appends them to tracing_file_path.
+    tracing_exporter: Literal["none", "console", "file"] = "none"
+    tracing_file_path: str = "traces.jsonl"
+    tracing_sampler: Literal["always_on", "always_off", "ratio"] = "ratio"
+    tracing_sample_ratio: float = 0.1  # New traces only; an incoming traceparent decides its own
+
     # JWT Configuration
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
@@ -41,11 +89,83 @@ class Settings(BaseSettings):
     email_from_address: EmailStr
     email_from_name: str = "Fundrbolt Platform"
 
+    # Email delivery backend: azure, smtp (e.g. a MailHog/Mailpit sink), file (.eml
+    # files for tests) or log. Defaults to azure when a connection string is set.
+    email_backend: Literal["azure", "smtp", "file", "log"] | None = None
+    email_file_backend_dir: str = "/tmp/fundrbolt-emails"
+    email_smtp_host: str = "localhost"
+    email_smtp_port: int = 1025
+
+    # Transactional email outbox: rows are written in the caller's transaction
+    # and delivered by a background dispatcher started with the app
+    email_outbox_enabled: bool = True
+    email_dispatcher_enabled: bool = True
+    email_dispatch_batch_size: int = 50
+    email_dispatch_concurrency: int = 8  # Max in-flight provider calls per process
+    email_dispatch_poll_seconds: float = 5.0  # Fallback poll; commits wake it immediately
+    email_max_attempts: int = 6
+    email_retry_base_seconds: float = 30.0  # Doubles per attempt, with jitter
+    email_retry_max_seconds: float = 3600.0  # Upper bound, jitter included
+
+    # Bulk email campaigns: recipients are queued in batches whose delivery is
+    # staggered so a large campaign can't crowd out transactional email
+    email_campaign_batch_size: int = 100
+    email_campaign_batch_interval_seconds: float = 10.0
+    email_campaign_recovery_interval_seconds: float = 60.0  # Resumes stalled campaigns
+
+    # Audit log writer: records are buffered in-process and flushed with
+    # multi-row INSERTs; a full queue falls back to writing in the caller's session
+    audit_log_async_enabled: bool = True
+    audit_log_batch_size: int = 200  # Flush as soon as this many records are queued
+    audit_log_flush_interval_seconds: float = 1.0
+    audit_log_queue_max_size: int = 10000
+
+    # Audit log partitions (monthly): retention drops partitions older than
+    # this after archiving them to Blob Storage (kept if archiving isn't configured)
+    audit_log_retention_days: int = 90
+    audit_log_partitions_ahead: int = 3
+    audit_log_archive_container: str = "audit-log-archive"
+
+    # Periodic job scheduler (one replica runs each job per interval, via a Redis lock)
+    scheduler_enabled: bool = True
+    scheduler_history_size: int = 50  # Runs kept per job
+    event_close_interval_seconds: float = 900.0
+    event_close_batch_size: int = 200
+    audit_log_maintenance_interval_seconds: float = 86400.0
+
+    # Live change streams (SSE): committed seating, check-in and catalog changes
+    # are fanned out to every replica over Redis pub/sub
+    event_stream_enabled: bool = True
+    event_stream_heartbeat_seconds: float = 15.0
+    event_stream_queue_size: int = 100  # Buffered per client before it is told to resync
+    event_stream_max_connections: int = 2000  # Per process
+
     # Azure Blob Storage (for NPO logo uploads) - Optional for local dev
     azure_storage_connection_string: str | None = None
     azure_storage_container_name: str = "npo-assets"
     azure_storage_account_name: str | None = None
 
+    # Media virus scanning: confirmed uploads are queued (media_scan_jobs) and
+    # scanned by background workers that stream blobs to the scanner backend.
+    # The stub backend only detects the EICAR test file (tests/local dev);
+    # production refuses to start with it while scanning is enabled.
+    media_scan_enabled: bool = True
+    media_scanner_backend: Literal["clamd", "stub"] = "stub"
+    clamd_host: str = "localhost"
+    clamd_port: int = 3310
+    clamd_timeout_seconds: float = 30.0
+    media_scan_batch_size: int = 20
+    media_scan_concurrency: int = 4  # Max files streamed to the scanner per process
+    media_scan_chunk_size: int = 1024 * 1024
+    media_scan_poll_seconds: float = 10.0  # Fallback poll; confirmed uploads wake it
+    media_scan_max_attempts: int = 5
+
+    # Responsive image derivatives (srcset): each width is rendered in these
+    # formats plus a JPEG fallback, in a process pool started with the app
+    image_derivative_widths: list[int] = [320, 640, 960, 1280, 1920]
+    image_derivative_formats: list[Literal["avif", "webp"]] = ["avif", "webp"]
+    image_worker_processes: int = 2  # 0 renders in a thread of the API process
+
     # Frontend URLs (for email links)
     frontend_admin_url: str = "http://localhost:5173"
     frontend_donor_url: str = "http://localhost:5174"
@@ -56,6 +176,16 @@ class Settings(BaseSettings):
     super_admin_first_name: str = "Super"
     super_admin_last_name: str = "Admin"
 
+    # Production server (python -m app.server): the app is imported once and
+    # forked into worker processes; a worker is recycled after max_requests
+    # (plus up to max_requests_jitter, so workers don't all restart together)
+    web_concurrency: int = 0  # Worker processes; 0 = one per available CPU core
+    web_max_requests: int = 0  # 0 = never recycle
+    web_max_requests_jitter: int = 0
+    web_graceful_timeout_seconds: int = 30  # In-flight requests, on shutdown
+    web_shutdown_timeout_seconds: float = 60.0  # Whole worker shutdown, then SIGKILL
+    web_keepalive_seconds: int = 5
+
     # Rate Limiting
     rate_limit_login_attempts: int = 5
     rate_limit_login_window_minutes: int = 15
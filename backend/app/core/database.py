@@ -1,11 +1,23 @@
-"""Database configuration and session management."""
+"""Database configuration and session management.
+
+Write endpoints use get_db, whose transaction is committed when the request
+succeeds. Read-only endpoints use get_read_db: its transaction is started READ
+ONLY and is never committed, and it runs on the read replica when one is
+configured and caught up (replay lag within database_replica_max_lag_seconds),
+falling back to the primary otherwise. Reads that fill shared caches use
+get_primary_read_db so a lagging replica can't put stale data in them.
+"""
 
 import asyncio
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -14,15 +26,21 @@ from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.core.metrics import DB_FAILURES_TOTAL
+from app.core.metrics import DB_FAILURES_TOTAL, DB_READ_SESSIONS_TOTAL, DB_REPLICA_LAG_SECONDS
 
 settings = get_settings()
 logger = get_logger(__name__)
 
-# Convert postgresql:// to postgresql+asyncpg:// for async support
-database_url = str(settings.database_url)
-if database_url.startswith("postgresql://"):
-    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+def _async_url(url: object) -> str:
+    """Convert postgresql:// to postgresql+asyncpg:// for async support."""
+    database_url = str(url)
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return database_url
+
+
+database_url = _async_url(settings.database_url)
 
 # Create async engine
 async_engine = create_async_engine(
@@ -42,6 +60,126 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read replica engine (None when no replica is configured)
+replica_engine: AsyncEngine | None = (
+    create_async_engine(
+        _async_url(settings.database_replica_url),
+        echo=settings.debug,
+        future=True,
+        pool_pre_ping=True,
+        poolclass=NullPool,
+    )
+    if settings.database_replica_url
+    else None
+)
+
+
+def _read_only_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Session factory whose transactions begin READ ONLY.
+
+    asyncpg starts them with BEGIN READ ONLY, the same as SET TRANSACTION READ
+    ONLY without the extra round trip; writes fail in the database.
+    """
+    return async_sessionmaker(
+        engine.execution_options(postgresql_readonly=True),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+
+ReadSessionLocal = _read_only_sessionmaker(async_engine)
+ReplicaSessionLocal = _read_only_sessionmaker(replica_engine) if replica_engine else None
+
+# Seconds since the last replayed transaction, or 0 when the replica has
+# replayed everything it received (an idle primary writes no transactions, so
+# the replay timestamp alone would read as lag). NULL on a server that isn't a
+# standby.
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class ReplicaRouter:
+    """Decides whether read-only sessions may use the read replica.
+
+    The replica's replay lag is measured at most once per check interval (one
+    caller measures while the others wait for its reading); a lag above the
+    limit, or a failed measurement, routes reads to the primary until the next
+    check.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine | None,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+    ) -> None:
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._use_replica = False
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def use_replica(self) -> bool:
+        """Whether the next read-only session should use the replica."""
+        if self.engine is None:
+            return False
+        if self._is_fresh():
+            return self._use_replica
+
+        async with self._lock:
+            if not self._is_fresh():
+                self._use_replica = await self._check()
+                self._checked_at = time.monotonic()
+        return self._use_replica
+
+    def mark_unavailable(self) -> None:
+        """Route reads to the primary until the next check (e.g. a connection failed)."""
+        self._use_replica = False
+        self._checked_at = time.monotonic()
+
+    async def measure_lag(self) -> float:
+        """Replica replay lag in seconds."""
+        assert self.engine is not None
+        async with self.engine.connect() as conn:
+            lag = (await conn.execute(REPLICA_LAG_QUERY)).scalar()
+        return float(lag or 0)
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.check_interval_seconds
+        )
+
+    async def _check(self) -> bool:
+        try:
+            lag = await self.measure_lag()
+        except (SQLAlchemyError, OSError) as e:
+            logger.warning(
+                "Read replica lag check failed, reading from primary",
+                extra={"error": str(e)},
+            )
+            return False
+
+        DB_REPLICA_LAG_SECONDS.set(lag)
+        if lag > self.max_lag_seconds:
+            logger.warning(
+                "Read replica is lagging, reading from primary",
+                extra={"lag_seconds": lag, "max_lag_seconds": self.max_lag_seconds},
+            )
+            return False
+        return True
+
+
+replica_router = ReplicaRouter(
+    replica_engine,
+    max_lag_seconds=settings.database_replica_max_lag_seconds,
+    check_interval_seconds=settings.database_replica_lag_check_seconds,
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, Any]:
     """Dependency for getting async database sessions with error handling.
@@ -111,3 +249,55 @@ async def get_db() -> AsyncGenerator[AsyncSession, Any]:
                     },
                 )
                 raise
+
+
+@asynccontextmanager
+async def _read_session(
+    session_factory: async_sessionmaker[AsyncSession], target: str
+) -> AsyncIterator[AsyncSession]:
+    """Yield a read-only session; its transaction is rolled back, never committed."""
+    DB_READ_SESSIONS_TOTAL.labels(target=target).inc()
+    async with session_factory() as session:
+        try:
+            yield session
+        except OperationalError:
+            DB_FAILURES_TOTAL.inc()
+            if target == "replica":
+                replica_router.mark_unavailable()
+            raise
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, Any]:
+    """Dependency for read-only endpoints.
+
+    Uses the read replica when it is configured and caught up, the primary
+    otherwise. The transaction is READ ONLY and is not committed.
+
+    Yields:
+        AsyncSession: Read-only database session
+
+    Example:
+        @router.get("/events/{event_id}/sponsors")
+        async def list_sponsors(db: AsyncSession = Depends(get_read_db)):
+            ...
+    """
+    if ReplicaSessionLocal is not None and await replica_router.use_replica():
+        session_factory, target = ReplicaSessionLocal, "replica"
+    else:
+        session_factory, target = ReadSessionLocal, "primary"
+    async with _read_session(session_factory, target) as session:
+        yield session
+
+
+async def get_primary_read_db() -> AsyncGenerator[AsyncSession, Any]:
+    """Dependency for read-only endpoints that must see the latest commits.
+
+    Like get_read_db but always on the primary, for reads that fill shared
+    caches (a body loaded from a lagging replica would outlive the
+    invalidation that preceded it).
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    async with _read_session(ReadSessionLocal, "primary") as session:
+        yield session
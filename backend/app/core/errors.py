@@ -77,6 +77,16 @@ class ValidationError(HTTPException):
         )
 
 
+class InvalidCursorError(HTTPException):
+    """Raised when a pagination cursor is malformed or belongs to another listing."""
+
+    def __init__(self, detail: str = "Invalid cursor"):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+        )
+
+
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     """Handle HTTPException and return JSON response.
 
@@ -0,0 +1,187 @@
+"""HTTP conditional request helpers (ETag / Last-Modified / 304 Not Modified).
+
+Endpoints compute a :class:`ResourceVersion` from a cheap version lookup (a
+version counter, ``updated_at`` or a ``count``/``max(updated_at)`` aggregate
+over child rows) *before* loading the full object graph. If the client's
+validators still match, :func:`not_modified` returns a bodiless 304; otherwise
+the endpoint builds the response as usual and :func:`set_validators` attaches
+the same validators to it.
+
+Responses that embed time-limited SAS URLs pass ``signed_urls=True`` so the
+ETag also changes every ``http_cache_signed_url_window_hours``; a revalidated
+body is therefore never older than the window, which is kept below the SAS
+expiry.
+
+Example:
+    version = await SponsorService.get_sponsors_version(db, event_id)
+    if (cached := not_modified(request, version)) is not None:
+        return cached
+    ...
+    set_validators(response, version)
+"""
+
+import hashlib
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple
+
+from fastapi import Request, Response, status
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Validators must be revalidated on every use; private for per-user responses
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+
+
+class ResourceVersion(NamedTuple):
+    """Validators for a representation of a resource."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+
+def _quote_etag(digest: str) -> str:
+    return f'W/"{digest}"'
+
+
+def resource_version(
+    *parts: object,
+    last_modified: datetime | None = None,
+    signed_urls: bool = False,
+) -> ResourceVersion:
+    """Build a weak ETag from the values a representation depends on.
+
+    Args:
+        parts: Version inputs (ids, version counters, timestamps, counts, query params)
+        last_modified: Newest modification time of the underlying rows
+        signed_urls: Whether the body embeds SAS URLs that expire
+
+    Returns:
+        ResourceVersion: ETag and Last-Modified validators
+    """
+    if signed_urls:
+        window = timedelta(hours=settings.http_cache_signed_url_window_hours)
+        now = datetime.now(UTC)
+        window_start = datetime.fromtimestamp(
+            now.timestamp() // window.total_seconds() * window.total_seconds(), tz=UTC
+        )
+        parts = (*parts, window_start.isoformat())
+        # Keep If-Modified-Since consistent with the rotating ETag
+        if last_modified is None or _as_utc(last_modified) < window_start:
+            last_modified = window_start
+
+    digest = hashlib.sha1(repr(parts).encode(), usedforsecurity=False).hexdigest()[:20]
+    return ResourceVersion(_quote_etag(digest), last_modified)
+
+
+def body_version(body: bytes) -> ResourceVersion:
+    """Build a weak ETag from already-serialized response bytes.
+
+    Used where the body is served from a cache, so hashing it is cheaper than
+    a database round trip.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        ResourceVersion: ETag validator (no Last-Modified)
+    """
+    digest = hashlib.sha1(body, usedforsecurity=False).hexdigest()[:20]
+    return ResourceVersion(_quote_etag(digest))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _opaque(etag: str) -> str:
+    """Strip the weak prefix for weak comparison (RFC 9110 §8.8.3.2)."""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    wanted = _opaque(etag)
+    return any(_opaque(candidate) == wanted for candidate in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have one-second resolution
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def is_not_modified(request: Request, version: ResourceVersion) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against a version.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the client sent no ETag.
+
+    Args:
+        request: Incoming request
+        version: Current validators of the resource
+
+    Returns:
+        bool: True if the client's copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, version.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and version.last_modified is not None:
+        return _not_modified_since(if_modified_since, version.last_modified)
+
+    return False
+
+
+def set_validators(
+    response: Response,
+    version: ResourceVersion,
+    cache_control: str = PRIVATE_CACHE_CONTROL,
+) -> None:
+    """Attach ETag, Last-Modified and Cache-Control headers to a response.
+
+    Args:
+        response: Response (or the injected FastAPI response parameter)
+        version: Validators of the representation being returned
+        cache_control: Cache-Control header value
+    """
+    response.headers["ETag"] = version.etag
+    if version.last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            _as_utc(version.last_modified), usegmt=True
+        )
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified(
+    request: Request,
+    version: ResourceVersion | None,
+    cache_control: str = PRIVATE_CACHE_CONTROL,
+) -> Response | None:
+    """Return a 304 response if the client's copy is current, else None.
+
+    Args:
+        request: Incoming request
+        version: Current validators, or None if the lookup found nothing
+            (the endpoint then takes its normal path, e.g. to raise 404)
+        cache_control: Cache-Control header value
+
+    Returns:
+        Response | None: Bodiless 304 response, or None to build the full response
+    """
+    if version is None or not is_not_modified(request, version):
+        return None
+
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, version, cache_control)
+    return response
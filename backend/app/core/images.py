@@ -0,0 +1,228 @@
+"""Responsive image derivatives.
+
+``render_derivatives`` decodes an upload once and encodes a ladder of widths
+in modern formats (AVIF/WebP) plus a JPEG fallback, for ``srcset``:
+
+- JPEGs are decoded with ``draft()``, so libjpeg scales by 1/2, 1/4 or 1/8
+  while decoding when the largest derivative is much smaller than the upload
+- each width is resized from the next larger one (``reducing_gap`` uses
+  ``reduce()`` for the integer part of the scale), not from the original
+- EXIF orientation is applied and all metadata (EXIF, ICC, XMP) is dropped
+- widths above the original are never produced (no upscaling)
+
+Rendering is CPU-bound, so request handlers and workers run it through
+``image_worker_pool`` (a process pool, so encoding doesn't hold the GIL of
+the API process). This module only depends on Pillow, which keeps worker
+process start-up cheap; Pillow itself is imported on first render, so the
+API process doesn't load it until an image is uploaded.
+"""
+
+import asyncio
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Encoder settings per output format (AVIF's quality scale runs lower than JPEG's)
+FORMATS: dict[str, dict[str, Any]] = {
+    "avif": {"mime_type": "image/avif", "save": {"format": "AVIF", "quality": 55, "speed": 6}},
+    "webp": {"mime_type": "image/webp", "save": {"format": "WEBP", "quality": 78, "method": 4}},
+    "jpeg": {
+        "mime_type": "image/jpeg",
+        "save": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+    },
+}
+
+# EXIF orientations that swap width and height
+_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+class ImageProcessingError(ValueError):
+    """The upload is not a usable image (corrupt, or outside the size limits)."""
+
+
+@dataclass(frozen=True)
+class Derivative:
+    """One encoded rendition."""
+
+    width: int
+    height: int
+    format: str
+    mime_type: str
+    data: bytes = field(repr=False)
+
+    @property
+    def extension(self) -> str:
+        """File extension for blob names."""
+        return "jpg" if self.format == "jpeg" else self.format
+
+
+@dataclass(frozen=True)
+class RenderedImage:
+    """Original dimensions plus every rendition produced from one decode."""
+
+    width: int
+    height: int
+    derivatives: list[Derivative]
+    thumbnail: Derivative | None = None
+
+
+def supported_formats(formats: list[str]) -> list[str]:
+    """Requested modern formats this Pillow build can encode."""
+    from PIL import features
+
+    return [fmt for fmt in formats if fmt in FORMATS and fmt != "jpeg" and features.check(fmt)]
+
+
+def ladder(widths: list[int], original_width: int) -> list[int]:
+    """Widths to produce, largest first.
+
+    Ladder widths below the original, plus the original width itself when
+    it is smaller than the top of the ladder (so large screens still get
+    the full-resolution image in a modern format).
+    """
+    top = min(original_width, max(widths))
+    return sorted({w for w in widths if w < top} | {top}, reverse=True)
+
+
+def _encode(image: "Image.Image", fmt: str) -> Derivative:
+    from PIL import Image
+
+    buffer = BytesIO()
+    source = image
+    if fmt == "jpeg" and image.mode != "RGB":
+        # Flatten transparency onto white for the JPEG fallback
+        source = Image.new("RGB", image.size, (255, 255, 255))
+        source.paste(image, mask=image.getchannel("A") if "A" in image.getbands() else None)
+    source.save(buffer, **FORMATS[fmt]["save"])
+    return Derivative(
+        width=image.width,
+        height=image.height,
+        format=fmt,
+        mime_type=FORMATS[fmt]["mime_type"],
+        data=buffer.getvalue(),
+    )
+
+
+def render_derivatives(
+    data: bytes,
+    widths: list[int],
+    formats: list[str],
+    min_size: tuple[int, int] | None = None,
+    max_size: tuple[int, int] | None = None,
+    thumbnail_size: tuple[int, int] | None = None,
+) -> RenderedImage:
+    """Validate and render an uploaded image in one decode.
+
+    Args:
+        data: Uploaded file content
+        widths: Ladder of target widths
+        formats: Modern formats to produce (a JPEG fallback is always added)
+        min_size: Minimum (width, height) of the upload
+        max_size: Maximum (width, height) of the upload
+        thumbnail_size: Also produce a JPEG thumbnail fitting in this box
+
+    Returns:
+        RenderedImage with derivatives ordered by width (largest first)
+
+    Raises:
+        ImageProcessingError: If the file is not a valid image or breaks a size limit
+    """
+    from PIL import Image, ImageOps
+
+    try:
+        opened = Image.open(BytesIO(data))
+        raw_width, raw_height = opened.size
+        orientation = opened.getexif().get(0x0112, 1)
+    except Exception as e:
+        raise ImageProcessingError(f"Invalid image file: {e}") from e
+
+    width, height = raw_width, raw_height
+    if orientation in _TRANSPOSED_ORIENTATIONS:
+        width, height = height, width
+    if min_size and (width < min_size[0] or height < min_size[1]):
+        raise ImageProcessingError(f"Image too small. Minimum: {min_size[0]}x{min_size[1]}px")
+    if max_size and (width > max_size[0] or height > max_size[1]):
+        raise ImageProcessingError(f"Image too large. Maximum: {max_size[0]}x{max_size[1]}px")
+
+    targets = ladder(widths, width)
+    if opened.format == "JPEG":
+        scale = targets[0] / width
+        opened.draft("RGB", (math.ceil(raw_width * scale), math.ceil(raw_height * scale)))
+
+    try:
+        image: Image.Image = ImageOps.exif_transpose(opened)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+    except Exception as e:
+        raise ImageProcessingError(f"Invalid image file: {e}") from e
+    image.info.clear()
+
+    modern = supported_formats(formats)
+    derivatives: list[Derivative] = []
+    current = image
+    for target in targets:
+        size = (target, max(1, round(height * target / width)))
+        if current.size != size:
+            current = current.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        for fmt in [*modern, "jpeg"]:
+            derivatives.append(_encode(current, fmt))
+
+    thumbnail = None
+    if thumbnail_size:
+        thumb = current.copy()
+        thumb.thumbnail(thumbnail_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        thumbnail = _encode(thumb, "jpeg")
+
+    return RenderedImage(width=width, height=height, derivatives=derivatives, thumbnail=thumbnail)
+
+
+class ImageWorkerPool:
+    """Runs ``render_derivatives`` off the event loop.
+
+    Uses a process pool once started (from the application lifespan); until
+    then, or with zero processes configured, renders in a thread instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unstarted pool."""
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether worker processes are available."""
+        return self._executor is not None
+
+    def start(self, processes: int) -> None:
+        """Start ``processes`` worker processes (spawned lazily by the executor)."""
+        if self._executor is None and processes > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def stop(self) -> None:
+        """Shut the worker processes down, cancelling queued renders."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def render(self, data: bytes, **options: Any) -> RenderedImage:
+        """Render derivatives (see ``render_derivatives`` for options)."""
+        if self._executor is None:
+            return await asyncio.to_thread(render_derivatives, data, **options)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _render_with_options, data, options)
+
+
+def _render_with_options(data: bytes, options: dict[str, Any]) -> RenderedImage:
+    # run_in_executor doesn't take keyword arguments
+    return render_derivatives(data, **options)
+
+
+# Process-wide pool, started from the app lifespan
+image_worker_pool = ImageWorkerPool()
@@ -2,23 +2,156 @@
 
 This module exposes counters and helpers that other modules can import and
 increment. The /metrics endpoint will use the default registry to expose
-metrics in Prometheus text format.
+metrics in Prometheus text format (or, under the multi-process server in
+app.server, the values of all worker processes; ``multiprocess_mode`` says
+how a gauge's per-process values are combined).
 """
 
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
-# HTTP request counter (labels added later when middleware is added)
+# HTTP metrics (app.middleware.metrics); "path" is the route template, not the raw path
 HTTP_REQUESTS_TOTAL = Counter(
     "fundrbolt_http_requests_total",
     "Total number of HTTP requests processed",
     ["method", "path", "status"],
 )
 
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "fundrbolt_http_request_duration_seconds",
+    "HTTP request latency until the last response byte",
+    ["method", "path"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0),
+)
+
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "fundrbolt_http_requests_in_progress",
+    "HTTP requests currently being processed",
+    ["method"],  # the route isn't known until the request has been routed
+    multiprocess_mode="livesum",
+)
+
+HTTP_RESPONSE_SIZE_BYTES = Histogram(
+    "fundrbolt_http_response_size_bytes",
+    "HTTP response body size before compression",
+    ["method", "path"],
+    buckets=(100, 1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000),
+)
+
+# Per-request database usage (app.middleware.query_stats)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "fundrbolt_db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ["path"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+
+DB_TIME_PER_REQUEST_SECONDS = Histogram(
+    "fundrbolt_db_time_per_request_seconds",
+    "Time spent executing SQL statements per HTTP request",
+    ["path"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+DB_SLOW_QUERIES_TOTAL = Counter(
+    "fundrbolt_db_slow_queries_total",
+    "SQL statements slower than query_stats_slow_query_ms, by route",
+    ["path"],
+)
+
+DB_READ_SESSIONS_TOTAL = Counter(
+    "fundrbolt_db_read_sessions_total",
+    "Read-only request sessions, by the database they were routed to",
+    ["target"],  # primary or replica
+)
+
+DB_REPLICA_LAG_SECONDS = Gauge(
+    "fundrbolt_db_replica_lag_seconds",
+    "Last measured replay lag of the read replica",
+    multiprocess_mode="livemax",
+)
+
 # Failure counters for key subsystems
 DB_FAILURES_TOTAL = Counter("fundrbolt_db_failures_total", "Total DB failure events")
 REDIS_FAILURES_TOTAL = Counter("fundrbolt_redis_failures_total", "Total Redis failure events")
 EMAIL_FAILURES_TOTAL = Counter("fundrbolt_email_failures_total", "Total email send failures")
 
+# Email outbox dispatcher
+EMAIL_OUTBOX_DELIVERIES_TOTAL = Counter(
+    "fundrbolt_email_outbox_deliveries_total",
+    "Outbox delivery attempts by email type and outcome",
+    ["email_type", "result"],  # sent, retry, failed
+)
+
+EMAIL_SEND_DURATION_SECONDS = Histogram(
+    "fundrbolt_email_send_duration_seconds",
+    "Email provider call latency",
+    ["backend"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# Audit log pipeline (async batched writer)
+AUDIT_LOG_RECORDS_TOTAL = Counter(
+    "fundrbolt_audit_log_records_total",
+    "Audit records by write path and outcome",
+    ["result"],  # queued, written, failed, overflow
+)
+
+AUDIT_LOG_FLUSH_SIZE = Histogram(
+    "fundrbolt_audit_log_flush_size",
+    "Audit records written per multi-row INSERT",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500),
+)
+
+# Periodic job scheduler
+SCHEDULER_JOB_RUNS_TOTAL = Counter(
+    "fundrbolt_scheduler_job_runs_total",
+    "Scheduler ticks by job and outcome",
+    ["job", "status"],  # success, error, timeout, skipped (another replica holds the lock)
+)
+
+SCHEDULER_JOB_DURATION_SECONDS = Histogram(
+    "fundrbolt_scheduler_job_duration_seconds",
+    "Scheduled job run duration",
+    ["job"],
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0),
+)
+
+SCHEDULER_JOB_LAST_SUCCESS_TIMESTAMP = Gauge(
+    "fundrbolt_scheduler_job_last_success_timestamp_seconds",
+    "Unix time of the job's last successful run on this replica",
+    ["job"],
+    multiprocess_mode="max",
+)
+
+# Redis connection pool and command latency
+REDIS_POOL_WAIT_SECONDS = Histogram(
+    "fundrbolt_redis_pool_wait_seconds",
+    "Time spent waiting for a free Redis connection from the pool",
+    ["pool"],  # decoded or binary
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+REDIS_POOL_CONNECTIONS_IN_USE = Gauge(
+    "fundrbolt_redis_pool_connections_in_use",
+    "Redis connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+REDIS_COMMAND_DURATION_SECONDS = Histogram(
+    "fundrbolt_redis_command_duration_seconds",
+    "Redis command round-trip latency by call site",
+    ["call_site", "command"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+# Response cache (two-tier read-through cache)
+RESPONSE_CACHE_REQUESTS_TOTAL = Counter(
+    "fundrbolt_response_cache_requests_total",
+    "Response cache lookups and invalidations",
+    ["cache", "result"],  # local_hit, redis_hit, miss, invalidation
+)
+
 # Contact form submission counters
 CONTACT_SUBMISSIONS_TOTAL = Counter(
     "fundrbolt_contact_submissions_total",
@@ -53,11 +186,30 @@ EVENT_MEDIA_UPLOADS_TOTAL = Counter(
 EVENT_MEDIA_SCAN_RESULTS_TOTAL = Counter(
     "fundrbolt_event_media_scan_results_total",
     "Total number of virus scan results",
-    ["result"],  # clean or infected
+    ["result"],  # clean, infected, retry or failed (scanner/storage errors)
+)
+
+MEDIA_SCAN_DURATION_SECONDS = Histogram(
+    "fundrbolt_media_scan_duration_seconds",
+    "Time to stream one media file through the virus scanner",
+    ["scanner"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+EVENT_STREAM_CONNECTIONS = Gauge(
+    "fundrbolt_event_stream_connections",
+    "Open event change streams in this process",
+    multiprocess_mode="livesum",
+)
+
+EVENT_CHANGES_PUBLISHED_TOTAL = Counter(
+    "fundrbolt_event_changes_published_total",
+    "Event change notifications published, by topic",
+    ["topic"],
 )
 
 # Simple gauges for introspection
-UP = Gauge("fundrbolt_up", "Application up (1 = up, 0 = down)")
+UP = Gauge("fundrbolt_up", "Application up (1 = up, 0 = down)", multiprocess_mode="livemax")
 
 
 def set_up(value: int = 1) -> None:
@@ -68,15 +220,37 @@ def set_up(value: int = 1) -> None:
 
 __all__ = [
     "HTTP_REQUESTS_TOTAL",
+    "HTTP_REQUEST_DURATION_SECONDS",
+    "HTTP_REQUESTS_IN_PROGRESS",
+    "HTTP_RESPONSE_SIZE_BYTES",
+    "DB_QUERIES_PER_REQUEST",
+    "DB_TIME_PER_REQUEST_SECONDS",
+    "DB_SLOW_QUERIES_TOTAL",
+    "DB_READ_SESSIONS_TOTAL",
+    "DB_REPLICA_LAG_SECONDS",
     "DB_FAILURES_TOTAL",
     "REDIS_FAILURES_TOTAL",
     "EMAIL_FAILURES_TOTAL",
+    "EMAIL_OUTBOX_DELIVERIES_TOTAL",
+    "EMAIL_SEND_DURATION_SECONDS",
+    "AUDIT_LOG_RECORDS_TOTAL",
+    "AUDIT_LOG_FLUSH_SIZE",
+    "SCHEDULER_JOB_RUNS_TOTAL",
+    "SCHEDULER_JOB_DURATION_SECONDS",
+    "SCHEDULER_JOB_LAST_SUCCESS_TIMESTAMP",
+    "REDIS_POOL_WAIT_SECONDS",
+    "REDIS_POOL_CONNECTIONS_IN_USE",
+    "REDIS_COMMAND_DURATION_SECONDS",
+    "RESPONSE_CACHE_REQUESTS_TOTAL",
     "CONTACT_SUBMISSIONS_TOTAL",
     "EVENTS_CREATED_TOTAL",
     "EVENTS_PUBLISHED_TOTAL",
     "EVENTS_CLOSED_TOTAL",
     "EVENT_MEDIA_UPLOADS_TOTAL",
     "EVENT_MEDIA_SCAN_RESULTS_TOTAL",
+    "MEDIA_SCAN_DURATION_SECONDS",
+    "EVENT_STREAM_CONNECTIONS",
+    "EVENT_CHANGES_PUBLISHED_TOTAL",
     "UP",
     "set_up",
 ]
@@ -0,0 +1,366 @@
+"""Keyset (cursor) pagination with optional cached or estimated totals.
+
+Offset pagination re-scans every skipped row, so deep pages get linearly
+slower, and each page pays for an exact ``COUNT(*)``. Keyset pagination
+instead filters on the sort key of the last row seen:
+
+    WHERE (sort_key, id) > (:last_sort_key, :last_id) ORDER BY sort_key, id
+
+Cursors are opaque, URL-safe strings that encode the last row's sort values
+plus a scope (endpoint + sort), so a cursor from one listing is rejected by
+another. Every key list must end in a unique column (usually ``id``) so the
+order is total.
+
+Totals are optional (see :data:`TotalMode`):
+
+- ``none``: skip counting (infinite scroll)
+- ``estimate``: planner row estimate from ``EXPLAIN`` (no table scan)
+- ``cached``: exact count, cached in Redis for ``pagination_count_cache_ttl_seconds``
+- ``exact``: exact count on every request
+
+Example:
+    keys = [SortKey(Event.event_datetime, descending=True), SortKey(Event.id)]
+    page = await paginate_keyset(
+        db, select(Event), keys, scope="events", cursor=cursor, limit=20
+    )
+    return page.items, page.next_cursor, page.total
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, Any, Generic, Literal, NamedTuple, TypeVar
+
+from fastapi import Query
+from redis.exceptions import RedisError
+from sqlalchemy import Select, and_, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import QueryableAttribute
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
+from sqlalchemy.sql.expression import Executable
+
+from app.core.config import get_settings
+from app.core.errors import InvalidCursorError
+from app.core.logging import get_logger
+from app.core.redis import execute_pipeline
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+# A listing query selecting any number of entities or columns
+AnySelect = Select[*tuple[Any, ...]]
+SelectT = TypeVar("SelectT", bound=AnySelect)
+
+TotalMode = Literal["exact", "cached", "estimate", "none"]
+
+# Shared query parameters for list endpoints that support cursor pagination
+CursorQuery = Annotated[
+    str | None,
+    Query(
+        description=(
+            "Keyset cursor. Send an empty value for the first page, then the previous "
+            "response's next_cursor. Omit to use page-number pagination."
+        )
+    ),
+]
+TotalModeQuery = Annotated[
+    TotalMode,
+    Query(description="Cursor mode only: how to compute total (exact, cached, estimate, none)"),
+]
+
+
+class SortKey(NamedTuple):
+    """One component of a keyset sort order.
+
+    The expression must be non-null; wrap nullable columns in ``coalesce``
+    with a sentinel that sorts where NULLs should go.
+    """
+
+    expression: ColumnElement[Any] | QueryableAttribute[Any]
+    descending: bool = False
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """A page of results plus the cursor for the next page."""
+
+    items: list[T]
+    next_cursor: str | None
+    total: int | None = None
+
+
+# ----------------------------------------------------------------------
+# Cursor encoding
+# ----------------------------------------------------------------------
+
+
+def _encode_value(value: Any) -> Any:
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"u": str(value)}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    (tag, raw), *_ = value.items()
+    if tag == "dt":
+        return datetime.fromisoformat(raw)
+    if tag == "d":
+        return date.fromisoformat(raw)
+    if tag == "u":
+        return uuid.UUID(raw)
+    if tag == "n":
+        return Decimal(raw)
+    raise ValueError(f"Unknown cursor tag: {tag}")
+
+
+def _scope_digest(scope: str) -> str:
+    return hashlib.sha1(scope.encode(), usedforsecurity=False).hexdigest()[:8]
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    """Encode the sort values of the last row into an opaque cursor.
+
+    Args:
+        scope: Listing identity (endpoint + sort), e.g. "auction_items:newest"
+        values: Sort key values of the last row, in key order
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = {"s": _scope_digest(scope), "v": [_encode_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(scope: str, cursor: str) -> list[Any]:
+    """Decode a cursor produced by :func:`encode_cursor` for the same scope.
+
+    Args:
+        scope: Listing identity the cursor must belong to
+        cursor: Cursor from a previous page's ``next_cursor``
+
+    Returns:
+        list: Sort key values of the last row of the previous page
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or from another scope
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["s"] != _scope_digest(scope):
+            raise InvalidCursorError("Cursor does not belong to this listing")
+        return [_decode_value(v) for v in payload["v"]]
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+# ----------------------------------------------------------------------
+# Query building
+# ----------------------------------------------------------------------
+
+
+def total_pages(total: int | None, per_page: int) -> int | None:
+    """Number of pages for a total (None when the total was not computed)."""
+    return (total + per_page - 1) // per_page if total is not None else None
+
+
+def order_by_keys(stmt: SelectT, keys: Sequence[SortKey]) -> SelectT:
+    """Apply the ORDER BY for a key list (also used by offset pagination)."""
+    return stmt.order_by(
+        *(key.expression.desc() if key.descending else key.expression.asc() for key in keys)
+    )
+
+
+def keyset_predicate(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Build the "rows after these values" condition for a key list.
+
+    Uses a row-value comparison when every key sorts in the same direction
+    (index friendly); otherwise expands to the equivalent OR chain.
+
+    Args:
+        keys: Sort keys, ending in a unique column
+        values: Values of the last row seen, in key order
+
+    Returns:
+        SQL condition selecting rows strictly after the last row
+
+    Raises:
+        InvalidCursorError: If the number of values doesn't match the keys
+    """
+    if len(values) != len(keys):
+        raise InvalidCursorError("Cursor does not match the sort order")
+
+    if len({key.descending for key in keys}) == 1:
+        left = tuple_(*(key.expression for key in keys))
+        right = tuple_(
+            *(literal(v, key.expression.type) for key, v in zip(keys, values, strict=True))
+        )
+        return left < right if keys[0].descending else left > right
+
+    clauses = []
+    for i, key in enumerate(keys):
+        equal_prefix = [keys[j].expression == values[j] for j in range(i)]
+        after = key.expression < values[i] if key.descending else key.expression > values[i]
+        clauses.append(and_(*equal_prefix, after))
+    return or_(*clauses)
+
+
+# ----------------------------------------------------------------------
+# Totals
+# ----------------------------------------------------------------------
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a query, compiled with its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: AnySelect) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+def _count_cache_key(scope: str, stmt: AnySelect) -> str:
+    compiled = stmt.compile()
+    material = f"{compiled}|{sorted(compiled.params.items(), key=lambda kv: kv[0])!r}"
+    digest = hashlib.sha1(material.encode(), usedforsecurity=False).hexdigest()
+    return f"count:{scope}:{digest}"
+
+
+async def _exact_count(db: AsyncSession, stmt: AnySelect) -> int:
+    result = await db.execute(select(func.count()).select_from(stmt.order_by(None).subquery()))
+    return int(result.scalar_one())
+
+
+async def _estimated_count(db: AsyncSession, stmt: AnySelect) -> int:
+    result = await db.execute(_Explain(stmt.order_by(None)))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _cached_count(db: AsyncSession, stmt: AnySelect, scope: str) -> int:
+    key = _count_cache_key(scope, stmt)
+    try:
+        cached = (await execute_pipeline("pagination.count", lambda pipe: pipe.get(key)))[0]
+        if cached is not None:
+            return int(cached)
+    except RedisError as e:
+        logger.warning("Count cache read failed", extra={"scope": scope, "error": str(e)})
+
+    total = await _exact_count(db, stmt)
+    ttl = settings.pagination_count_cache_ttl_seconds
+    try:
+        await execute_pipeline("pagination.count", lambda pipe: pipe.set(key, total, ex=ttl))
+    except RedisError as e:
+        logger.warning("Count cache write failed", extra={"scope": scope, "error": str(e)})
+    return total
+
+
+async def count_total(
+    db: AsyncSession,
+    stmt: AnySelect,
+    mode: TotalMode,
+    scope: str,
+) -> int | None:
+    """Count the rows a listing query would return, per the requested mode.
+
+    Args:
+        db: Database session
+        stmt: Filtered listing query (ordering and limits are ignored)
+        mode: exact, cached, estimate or none
+        scope: Listing identity (namespaces the count cache)
+
+    Returns:
+        int | None: Total, or None for mode "none"
+    """
+    if mode == "none":
+        return None
+    if mode == "estimate":
+        return await _estimated_count(db, stmt)
+    if mode == "cached":
+        return await _cached_count(db, stmt, scope)
+    return await _exact_count(db, stmt)
+
+
+# ----------------------------------------------------------------------
+# Pagination
+# ----------------------------------------------------------------------
+
+
+async def paginate_keyset(
+    db: AsyncSession,
+    stmt: AnySelect,
+    keys: Sequence[SortKey],
+    *,
+    scope: str,
+    cursor: str | None,
+    limit: int,
+    total_mode: TotalMode = "none",
+) -> KeysetPage[Any]:
+    """Fetch one keyset page of a filtered listing query.
+
+    Items are the selected entity (or a tuple when the query selects several
+    entities, e.g. ``select(Guest, Registration)``).
+
+    Args:
+        db: Database session
+        stmt: Filtered listing query without ORDER BY / LIMIT
+        keys: Sort keys, ending in a unique column
+        scope: Listing identity (endpoint + sort) bound into cursors
+        cursor: Cursor from the previous page, or None/"" for the first page
+        limit: Page size
+        total_mode: How to compute the total (see :data:`TotalMode`)
+
+    Returns:
+        KeysetPage with items, next_cursor (None on the last page) and total
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or from another listing
+    """
+    total = await count_total(db, stmt, total_mode, scope)
+
+    page_stmt = stmt
+    if cursor:
+        page_stmt = page_stmt.where(keyset_predicate(keys, decode_cursor(scope, cursor)))
+
+    width = len(stmt.column_descriptions)  # Entities count once, not per column
+    page_stmt = order_by_keys(page_stmt, keys).add_columns(
+        *(key.expression.label(f"_keyset_{i}") for i, key in enumerate(keys))
+    )
+    rows = list((await db.execute(page_stmt.limit(limit + 1))).all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(scope, tuple(rows[-1])[width:])
+
+    items = [row[0] if width == 1 else tuple(row[:width]) for row in rows]
+    return KeysetPage(items=items, next_cursor=next_cursor, total=total)
@@ -0,0 +1,120 @@
+"""Per-request database query instrumentation.
+
+SQLAlchemy cursor events record every statement into the ``QueryStats``
+collectors active in the current context (``track_queries``). Collectors
+nest, so a test can wrap a request that the middleware is also tracking;
+outside any collector (background workers, scripts) the hooks do nothing.
+
+Statements are grouped by fingerprint (bound parameters and expanded ``IN``
+lists collapsed to ``?``), so an N+1 loop shows up as one fingerprint with a
+high count.
+
+The asyncio engine runs cursor calls in a greenlet that shares the
+caller's context, so request-scoped collectors see them.
+"""
+
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+# conn.info key holding start times of in-flight statements
+_START_TIMES_KEY = "query_stats_start"
+
+_collectors: ContextVar[tuple["QueryStats", ...]] = ContextVar("query_stats", default=())
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so repeated executions compare equal."""
+    normalized = _PLACEHOLDER.sub("?", statement)
+    normalized = _PLACEHOLDER_LIST.sub("?", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while this collector was active."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    slow_count: int = 0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        """Add one executed statement."""
+        self.count += 1
+        self.total_seconds += duration
+        if duration * 1000 >= settings.query_stats_slow_query_ms:
+            self.slow_count += 1
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, min_count: int = 2) -> list[tuple[str, int]]:
+        """Fingerprints executed at least ``min_count`` times, most frequent first."""
+        return [(sql, n) for sql, n in self.fingerprints.most_common() if n >= min_count]
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value."""
+        return f'db;dur={self.total_seconds * 1000:.1f};desc="{self.count} queries"'
+
+    def describe(self, limit: int = 5) -> str:
+        """Summary with the most repeated statements, for logs and test failures."""
+        lines = [f"{self.count} queries in {self.total_seconds * 1000:.1f}ms"]
+        lines += [f"  {n}x {sql[:200]}" for sql, n in self.repeated()[:limit]]
+        return "\n".join(lines)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statements executed in this context until the block exits."""
+    stats = QueryStats()
+    token = _collectors.set((*_collectors.get(), stats))
+    try:
+        yield stats
+    finally:
+        _collectors.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if _collectors.get():
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    collectors = _collectors.get()
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not collectors or not start_times:
+        return
+    duration = time.perf_counter() - start_times.pop()
+    for stats in collectors:
+        stats.record(statement, duration)
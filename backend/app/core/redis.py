@@ -1,17 +1,40 @@
-"""Redis client configuration and connection pooling."""
+"""Redis client configuration and connection pooling.
+
+All callers in a process share one blocking connection pool per response mode
+(decoded ``str`` for most callers, raw ``bytes`` for cached payloads). Pool size,
+timeouts, health-check interval and protocol come from settings.
+
+Instrumentation:
+- Pool checkout waits -> ``fundrbolt_redis_pool_wait_seconds``
+- Command latency per call site -> ``fundrbolt_redis_command_duration_seconds``
+  (call site set with :func:`redis_call_site`, pipelines via :func:`execute_pipeline`)
+- A tracing span per command or pipeline within traced requests
+"""
 
 import asyncio
-from typing import TYPE_CHECKING
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 import redis.asyncio as redis  # noqa: F401
-from redis.asyncio import Redis  # noqa: F401
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import RedisError
 from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.core.metrics import REDIS_FAILURES_TOTAL
+from app.core.metrics import (
+    REDIS_COMMAND_DURATION_SECONDS,
+    REDIS_FAILURES_TOTAL,
+    REDIS_POOL_CONNECTIONS_IN_USE,
+    REDIS_POOL_WAIT_SECONDS,
+)
+from app.core.tracing import Span, tracer
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis as RedisType
@@ -21,13 +44,180 @@ else:
 settings = get_settings()
 logger = get_logger(__name__)
 
-# Redis connection pool (singleton pattern)
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Call site label for command latency metrics (set by redis_call_site)
+_call_site: ContextVar[str] = ContextVar("redis_call_site", default="unattributed")
+
+
+@contextmanager
+def _call_site_scope(name: str) -> Iterator[None]:
+    token = _call_site.set(name)
+    try:
+        yield
+    finally:
+        _call_site.reset(token)
+
+
+def redis_call_site(
+    name: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Attribute Redis commands issued by an async function to a call site.
+
+    Args:
+        name: Low-cardinality call site label (e.g. "auth.blacklist")
+
+    Usage:
+        @staticmethod
+        @redis_call_site("session.get")
+        async def get_session(...): ...
+    """
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with _call_site_scope(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):  # type: ignore[type-arg]
+    """Blocking pool that records checkout wait time and connections in use."""
+
+    def __init__(self, *, pool_name: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.pool_name = pool_name
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        connection = await super().get_connection(*args, **kwargs)
+        REDIS_POOL_WAIT_SECONDS.labels(pool=self.pool_name).observe(time.perf_counter() - start)
+        REDIS_POOL_CONNECTIONS_IN_USE.labels(pool=self.pool_name).set(len(self._in_use_connections))  # type: ignore[attr-defined]
+        return connection
+
+    async def release(self, connection: Any) -> None:
+        await super().release(connection)
+        REDIS_POOL_CONNECTIONS_IN_USE.labels(pool=self.pool_name).set(len(self._in_use_connections))  # type: ignore[attr-defined]
+
+
+def _command_span(call_site: str, command: str) -> AbstractContextManager[Span | None]:
+    return tracer.span(
+        f"redis {command}",
+        kind="client",
+        attributes={"db.system": "redis", "db.operation": command, "redis.call_site": call_site},
+    )
+
+
+class InstrumentedRedis(Redis):  # type: ignore[type-arg]
+    """Redis client that records per-command latency labelled by call site."""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        call_site = _call_site.get()
+        command = str(args[0]).upper() if args else "UNKNOWN"
+        start = time.perf_counter()
+        try:
+            with _command_span(call_site, command):
+                return await super().execute_command(*args, **options)  # type: ignore[no-untyped-call]
+        finally:
+            REDIS_COMMAND_DURATION_SECONDS.labels(call_site=call_site, command=command).observe(
+                time.perf_counter() - start
+            )
+
+
+def build_connection_pool(*, decode_responses: bool) -> InstrumentedConnectionPool:
+    """Create a connection pool from settings.
+
+    Args:
+        decode_responses: Decode replies to ``str`` (True) or return raw ``bytes``
+
+    Returns:
+        InstrumentedConnectionPool: Configured blocking pool
+    """
+    return InstrumentedConnectionPool.from_url(
+        str(settings.redis_url),
+        pool_name="decoded" if decode_responses else "binary",
+        encoding="utf-8",
+        decode_responses=decode_responses,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        socket_connect_timeout=settings.redis_socket_connect_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+        protocol=settings.redis_protocol,
+    )
+
+
+# Redis clients (singleton pattern, one per response mode)
 _redis_client: RedisType | None = None  # type: ignore[type-arg]
+_redis_binary_client: RedisType | None = None  # type: ignore[type-arg]
+
+
+def _create_client(*, decode_responses: bool) -> RedisType:  # type: ignore[type-arg]
+    """Create an instrumented client on a fresh pool (connections open lazily)."""
+    return InstrumentedRedis(
+        connection_pool=build_connection_pool(decode_responses=decode_responses)
+    )
+
+
+async def _verify_connection(client: RedisType) -> None:  # type: ignore[type-arg]
+    """Ping a newly created client, retrying with exponential backoff."""
+    max_retries = 3
+    retry_delay = 1.0
+
+    for attempt in range(max_retries):
+        try:
+            # Test connection
+            with _call_site_scope("startup.ping"):
+                await client.ping()
+            logger.info(
+                "Redis connection established",
+                extra={
+                    "max_connections": settings.redis_max_connections,
+                    "protocol": settings.redis_protocol,
+                },
+            )
+            break
+
+        except (RedisConnectionError, RedisTimeoutError) as e:
+            # Increment failure counter
+            REDIS_FAILURES_TOTAL.inc()
+
+            if attempt < max_retries - 1:
+                logger.warning(
+                    "Redis connection failed, retrying",
+                    extra={
+                        "error": str(e),
+                        "attempt": attempt + 1,
+                        "max_retries": max_retries,
+                        "retry_delay": retry_delay,
+                    },
+                )
+                await asyncio.sleep(retry_delay)
+                retry_delay *= 2  # Exponential backoff
+            else:
+                logger.error(
+                    "Redis connection failed after all retries",
+                    extra={
+                        "error": str(e),
+                        "max_retries": max_retries,
+                    },
+                )
+                raise
+
+        except RedisError as e:
+            logger.error("Redis error during initialization", extra={"error": str(e)})
+            raise
 
 
 async def get_redis() -> RedisType:  # type: ignore[type-arg]
     """Get Redis client with connection pooling and error handling.
 
+    Replies are decoded to ``str``. Use :func:`get_redis_binary` for raw bytes.
+
     Returns:
         Redis: Async Redis client
 
@@ -43,69 +233,84 @@ async def get_redis() -> RedisType:  # type: ignore[type-arg]
     global _redis_client
 
     if _redis_client is None:
-        max_retries = 3
-        retry_delay = 1.0
-
-        for attempt in range(max_retries):
-            try:
-                _redis_client = redis.from_url(
-                    str(settings.redis_url),
-                    encoding="utf-8",
-                    decode_responses=True,
-                    max_connections=10,
-                    socket_connect_timeout=5,
-                    socket_timeout=5,
-                )
-                # Test connection
-                await _redis_client.ping()
-                logger.info("Redis connection established")
-                break
-
-            except (RedisConnectionError, RedisTimeoutError) as e:
-                # Increment failure counter
-                REDIS_FAILURES_TOTAL.inc()
-
-                if attempt < max_retries - 1:
-                    logger.warning(
-                        "Redis connection failed, retrying",
-                        extra={
-                            "error": str(e),
-                            "attempt": attempt + 1,
-                            "max_retries": max_retries,
-                            "retry_delay": retry_delay,
-                        },
-                    )
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    logger.error(
-                        "Redis connection failed after all retries",
-                        extra={
-                            "error": str(e),
-                            "max_retries": max_retries,
-                        },
-                    )
-                    raise
-
-            except RedisError as e:
-                logger.error("Redis error during initialization", extra={"error": str(e)})
-                raise
+        _redis_client = _create_client(decode_responses=True)
+        await _verify_connection(_redis_client)
 
     # Type narrowing: _redis_client is not None here
     assert _redis_client is not None, "Redis client should be initialized"
     return _redis_client
 
 
+async def get_redis_binary() -> RedisType:  # type: ignore[type-arg]
+    """Get Redis client that returns raw ``bytes`` (for pre-serialized payloads).
+
+    Uses its own pool because response decoding is a per-connection setting.
+
+    Returns:
+        Redis: Async Redis client with ``decode_responses=False``
+    """
+    global _redis_binary_client
+
+    if _redis_binary_client is None:
+        _redis_binary_client = _create_client(decode_responses=False)
+        await _verify_connection(_redis_binary_client)
+
+    assert _redis_binary_client is not None, "Redis client should be initialized"
+    return _redis_binary_client
+
+
+async def execute_pipeline(
+    call_site: str,
+    build: Callable[[Pipeline], object],  # type: ignore[type-arg]
+    *,
+    transaction: bool = False,
+    binary: bool = False,
+) -> list[Any]:
+    """Queue several commands and send them in a single round trip.
+
+    Args:
+        call_site: Call site label for latency metrics
+        build: Callback that queues commands on the pipeline
+        transaction: Wrap the batch in MULTI/EXEC
+        binary: Use the raw-bytes client instead of the decoded one
+
+    Returns:
+        list: One reply per queued command, in order
+
+    Example:
+        count, ttl = await execute_pipeline(
+            "rate_limit.remaining",
+            lambda pipe: pipe.zcard(key).ttl(key),
+        )
+    """
+    client = await (get_redis_binary() if binary else get_redis())
+    async with client.pipeline(transaction=transaction) as pipe:
+        build(pipe)
+        start = time.perf_counter()
+        try:
+            with _command_span(call_site, "PIPELINE") as span:
+                if span is not None:
+                    span.set_attribute("redis.commands", len(pipe.command_stack))
+                results: list[Any] = await pipe.execute()
+            return results
+        finally:
+            REDIS_COMMAND_DURATION_SECONDS.labels(call_site=call_site, command="PIPELINE").observe(
+                time.perf_counter() - start
+            )
+
+
 async def close_redis() -> None:
-    """Close Redis connection pool.
+    """Close Redis connection pools.
 
     Call this on application shutdown.
     """
-    global _redis_client
+    global _redis_client, _redis_binary_client
 
-    if _redis_client is not None:
-        await _redis_client.close()
-        _redis_client = None
+    for client in (_redis_client, _redis_binary_client):
+        if client is not None:
+            await client.aclose(close_connection_pool=True)  # type: ignore[attr-defined]
+    _redis_client = None
+    _redis_binary_client = None
 
 
 # Redis key prefixes for namespacing
@@ -0,0 +1,81 @@
+"""Set-based ``display_order`` updates for drag-and-drop reordering.
+
+Reordering N rows through the ORM costs N selects or refreshes plus the
+UPDATEs. Instead one statement writes every position and returns the rows:
+
+    UPDATE sponsors SET display_order = new_order.position, updated_at = now()
+    FROM (VALUES (:id_1, 0), (:id_2, 1), ...) AS new_order (id, position)
+    WHERE sponsors.id = new_order.id AND sponsors.event_id = :event_id
+    RETURNING sponsors.*
+
+Example:
+    sponsors = await reorder_rows(db, Sponsor, ids, Sponsor.event_id == event_id)
+    await db.commit()
+"""
+
+import uuid
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import Integer, column, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+class InvalidOrderError(ValueError):
+    """Order list with repeated ids or ids outside the scope."""
+
+    def __init__(self, message: str, ids: set[uuid.UUID]) -> None:
+        super().__init__(message)
+        self.ids = ids
+
+
+async def reorder_rows(
+    db: AsyncSession,
+    model: type[T],
+    ordered_ids: Sequence[uuid.UUID],
+    *scope: ColumnElement[bool],
+) -> list[T]:
+    """Set ``display_order`` to each id's index, in one round trip.
+
+    Doesn't commit. If ``InvalidOrderError`` is raised the UPDATE has
+    already run, so the caller must roll back.
+
+    Args:
+        db: Database session
+        model: Mapped class with ``id`` and ``display_order`` columns
+        ordered_ids: Ids in their new order (positions 0..n-1)
+        scope: Criteria every row must match (e.g. its parent's id)
+
+    Returns:
+        The updated rows, in their new order (refreshed in the session)
+
+    Raises:
+        InvalidOrderError: If ids repeat or any id doesn't match the scope
+    """
+    if len(set(ordered_ids)) != len(ordered_ids):
+        repeated = {row_id for row_id in ordered_ids if ordered_ids.count(row_id) > 1}
+        raise InvalidOrderError("Duplicate IDs in order list", repeated)
+    if not ordered_ids:
+        return []
+
+    table: Any = model
+    new_order = values(
+        column("id", table.id.type),
+        column("position", Integer),
+        name="new_order",
+    ).data([(row_id, position) for position, row_id in enumerate(ordered_ids)])
+    result = await db.execute(
+        update(table)
+        .where(table.id == new_order.c.id, *scope)
+        .values(display_order=new_order.c.position)
+        .returning(table)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    rows: list[Any] = list(result.scalars().all())
+    if len(rows) != len(ordered_ids):
+        missing = set(ordered_ids) - {row.id for row in rows}
+        raise InvalidOrderError("Invalid IDs in order list", missing)
+    return sorted(rows, key=lambda row: row.display_order)
@@ -0,0 +1,255 @@
+"""Lightweight in-process scheduler for periodic background jobs.
+
+Every API replica runs the scheduler from the application lifespan, and
+each job gets its own asyncio task that wakes up every ``interval`` seconds
+(+/- ``jitter`` so replicas don't wake up in lockstep).
+
+Leader election is per job and per run: before running, a replica takes the
+Redis key ``scheduler:lock:<job>`` with ``SET NX PX``. The key is held for
+the rest of the interval, not just the run, so a job runs at most once per
+interval across all replicas; whichever replica wakes up first after the
+key expires runs the next one. Replicas that lose the race record a
+``skipped`` tick.
+
+Each run is bounded by the job's ``timeout``, counted in Prometheus
+metrics, and appended to a capped Redis list (``scheduler:history:<job>``)
+so the run history is shared by all replicas.
+"""
+
+import asyncio
+import json
+import os
+import random
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import (
+    SCHEDULER_JOB_DURATION_SECONDS,
+    SCHEDULER_JOB_LAST_SUCCESS_TIMESTAMP,
+    SCHEDULER_JOB_RUNS_TOTAL,
+)
+from app.core.redis import get_redis, redis_call_site
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+RunStatus = Literal["success", "error", "timeout"]
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """A periodic job.
+
+    Attributes:
+        name: Unique job name (used in lock keys, metrics and history)
+        func: Coroutine function run on each tick; its return value is logged
+        interval: Seconds between runs
+        timeout: Seconds after which a run is cancelled
+        jitter: Fraction of the interval added or removed at random per tick
+        initial_delay: Seconds before the first tick (defaults to one jittered interval)
+    """
+
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval: float
+    timeout: float
+    jitter: float = 0.1
+    initial_delay: float | None = None
+
+    @property
+    def lock_ttl(self) -> float:
+        """How long the leader holds the job lock after taking it.
+
+        Long enough to cover the run, and short enough that the earliest
+        possible next tick (interval minus jitter) finds it free.
+        """
+        return max(self.interval * (1 - self.jitter), self.timeout)
+
+
+@dataclass(frozen=True)
+class JobRun:
+    """One completed run of a job."""
+
+    job: str
+    instance: str
+    started_at: str
+    duration_seconds: float
+    status: RunStatus
+    result: str | None = None
+    error: str | None = None
+
+
+def _lock_key(job: str) -> str:
+    return f"scheduler:lock:{job}"
+
+
+def _history_key(job: str) -> str:
+    return f"scheduler:history:{job}"
+
+
+class JobScheduler:
+    """Runs registered jobs periodically with per-job leader election."""
+
+    def __init__(self, instance_id: str | None = None) -> None:
+        """Initialize scheduler.
+
+        Args:
+            instance_id: Identity of this replica in locks and run history
+        """
+        self.instance_id = instance_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.jobs: dict[str, ScheduledJob] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stop = asyncio.Event()
+
+    def register(self, job: ScheduledJob) -> None:
+        """Add a job (before start)."""
+        if job.name in self.jobs:
+            raise ValueError(f"Job {job.name} is already registered")
+        self.jobs[job.name] = job
+
+    @property
+    def running(self) -> bool:
+        """Whether the job loops are running."""
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        """Start one loop per registered job."""
+        if self.running:
+            return
+        self._stop = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._loop(job), name=f"scheduler:{job.name}")
+            for job in self.jobs.values()
+        ]
+        logger.info(
+            "Job scheduler started",
+            extra={"instance": self.instance_id, "jobs": sorted(self.jobs)},
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop scheduling; in-flight runs get ``timeout`` seconds to finish."""
+        if not self._tasks:
+            return
+        self._stop.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        self._tasks = []
+        logger.info("Job scheduler stopped")
+
+    def _jittered(self, seconds: float, jitter: float) -> float:
+        return seconds * random.uniform(1 - jitter, 1 + jitter)  # nosec B311 - not security
+
+    async def _sleep(self, seconds: float) -> bool:
+        """Sleep unless stopped first; returns False once stopping."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+        except TimeoutError:
+            return True
+        return False
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        delay = job.initial_delay
+        if delay is None:
+            delay = self._jittered(job.interval, job.jitter)
+        while await self._sleep(delay):
+            await self.tick(job)
+            delay = self._jittered(job.interval, job.jitter)
+
+    async def tick(self, job: ScheduledJob) -> JobRun | None:
+        """Run the job if this replica wins its lock.
+
+        Returns:
+            The run, or None if another replica holds the lock
+        """
+        try:
+            acquired = await self._acquire_lock(job)
+        except RedisError as e:
+            # Without the lock every replica could run the job; skip this tick
+            logger.warning("Scheduler lock unavailable", extra={"job": job.name, "error": str(e)})
+            acquired = False
+        if not acquired:
+            SCHEDULER_JOB_RUNS_TOTAL.labels(job=job.name, status="skipped").inc()
+            return None
+
+        run = await self.run(job)
+        try:
+            await self._record_run(run)
+        except RedisError as e:
+            logger.warning("Could not record job run", extra={"job": job.name, "error": str(e)})
+        return run
+
+    async def run(self, job: ScheduledJob) -> JobRun:
+        """Run a job once under its timeout (no lock) and record metrics."""
+        started_at = datetime.now(UTC)
+        start = time.perf_counter()
+        status: RunStatus = "success"
+        result: Any = None
+        error: str | None = None
+        try:
+            result = await asyncio.wait_for(job.func(), timeout=job.timeout)
+        except TimeoutError:
+            status, error = "timeout", f"Timed out after {job.timeout}s"
+        except Exception as e:
+            status, error = "error", str(e)
+        duration = time.perf_counter() - start
+
+        SCHEDULER_JOB_RUNS_TOTAL.labels(job=job.name, status=status).inc()
+        SCHEDULER_JOB_DURATION_SECONDS.labels(job=job.name).observe(duration)
+        if status == "success":
+            SCHEDULER_JOB_LAST_SUCCESS_TIMESTAMP.labels(job=job.name).set(time.time())
+            logger.info(
+                "Scheduled job finished",
+                extra={"job": job.name, "duration_seconds": duration, "result": str(result)},
+            )
+        else:
+            logger.error(
+                "Scheduled job failed",
+                extra={"job": job.name, "status": status, "error": error},
+            )
+
+        return JobRun(
+            job=job.name,
+            instance=self.instance_id,
+            started_at=started_at.isoformat(),
+            duration_seconds=round(duration, 3),
+            status=status,
+            result=None if result is None else str(result)[:500],
+            error=error,
+        )
+
+    @redis_call_site("scheduler.lock")
+    async def _acquire_lock(self, job: ScheduledJob) -> bool:
+        redis = await get_redis()
+        acquired = await redis.set(
+            _lock_key(job.name), self.instance_id, nx=True, px=int(job.lock_ttl * 1000)
+        )
+        return bool(acquired)
+
+    @redis_call_site("scheduler.history")
+    async def _record_run(self, run: JobRun) -> None:
+        redis = await get_redis()
+        key = _history_key(run.job)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.lpush(key, json.dumps(asdict(run)))
+            pipe.ltrim(key, 0, settings.scheduler_history_size - 1)
+            await pipe.execute()
+
+    @redis_call_site("scheduler.history")
+    async def history(self, job: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Most recent runs of a job across all replicas, newest first."""
+        redis = await get_redis()
+        entries = await redis.lrange(_history_key(job), 0, limit - 1)
+        return [json.loads(entry) for entry in entries]
+
+
+# Shared scheduler started in the application lifespan (jobs: app.tasks.schedule)
+scheduler = JobScheduler()
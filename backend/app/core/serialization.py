@@ -0,0 +1,74 @@
+"""Single-pass response serialization.
+
+Endpoints used to validate ORM objects into response models, dump them to
+dicts, patch signed URLs in, build the models again, and then let FastAPI
+validate and serialize them once more through ``response_model``.
+
+Instead, a response is validated once straight from the ORM objects, with URL
+signing done by schema validators that read the validation context, and is
+rendered straight to JSON bytes:
+
+    context = {URL_SIGNER: media_service}
+    body = MediaListResponse.model_validate({"items": media, "total": n}, context=context)
+    return json_response(body)
+
+Returning a ``Response`` skips FastAPI's response_model processing; keep
+``response_model`` on the route for the OpenAPI schema.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Protocol
+
+from fastapi import Response, status
+from pydantic import BaseModel, ValidationInfo
+
+# Validation context keys
+URL_SIGNER = "url_signer"
+PRIMARY_IMAGES = "primary_images"
+
+
+class UrlSigner(Protocol):
+    """Turns stored media URLs into URLs clients can read (e.g. SAS URLs)."""
+
+    def signed_url(self, url: str | None) -> str | None:
+        """Readable URL for a stored URL (unchanged if it can't be signed)."""
+        ...
+
+    def sign_derivatives(self, entries: list[dict[str, Any]] | None) -> list[dict[str, Any]] | None:
+        """Derivative metadata with readable URLs."""
+        ...
+
+
+def context_value(info: ValidationInfo, key: str) -> Any:
+    """Value of a validation context key (None when validated without it)."""
+    context = info.context
+    return context.get(key) if isinstance(context, Mapping) else None
+
+
+def sign_url(url: str | None, info: ValidationInfo) -> str | None:
+    """Sign a URL field with the context's URL_SIGNER, if one was given."""
+    signer: UrlSigner | None = context_value(info, URL_SIGNER)
+    return signer.signed_url(url) if signer is not None else url
+
+
+def json_response(
+    model: BaseModel,
+    status_code: int = status.HTTP_200_OK,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Render a validated response model directly to a JSON response.
+
+    Args:
+        model: Response model (validated once, from ORM objects)
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        Response with the model's JSON bytes
+    """
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -0,0 +1,470 @@
+"""Lightweight distributed tracing.
+
+Spans follow the OpenTelemetry data model (W3C 128-bit trace ids, 64-bit
+span ids, parent links, kind, attributes, status) without pulling in the
+OpenTelemetry SDK. Instrumented calls:
+
+- HTTP: ``RequestIDMiddleware`` opens the root span of each request. The
+  request id is the trace id (a generated request id is a UUID4 whose hex
+  form is the trace id); an incoming ``traceparent`` header continues the
+  caller's trace and sampling decision.
+- SQL: cursor events on every ``Engine``
+- Redis: ``InstrumentedRedis`` commands and ``execute_pipeline``
+- Blob storage: request/response hooks on blob clients (``BLOB_CLIENT_HOOKS``)
+- Email: backend sends, with a root span per outbox delivery
+
+Only work inside a root span is traced; instrumented calls outside one (e.g.
+background jobs without a root span) record nothing. The sampler decides
+once per trace, and unsampled traces create non-recording spans only. A
+trace is handed to the exporter when its root span ends.
+"""
+
+import json
+import re
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Literal, Protocol, TextIO
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.query_stats import fingerprint
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+SpanKind = Literal["server", "client", "internal"]
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+def new_span_id() -> str:
+    """Random 64-bit span id (hex)."""
+    return secrets.token_hex(8)
+
+
+def trace_id_for(request_id: str) -> str:
+    """Trace id for a request id: the UUID's hex, or a hash of other ids."""
+    try:
+        return uuid.UUID(request_id).hex
+    except ValueError:
+        return blake2b(request_id.encode(), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class TraceParent:
+    """Parsed W3C ``traceparent`` header."""
+
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+    @classmethod
+    def parse(cls, header: str | None) -> "TraceParent | None":
+        """Parse a header, returning None if absent or malformed."""
+        match = _TRACEPARENT.match(header.strip().lower()) if header else None
+        if match is None:
+            return None
+        trace_id, span_id, flags = match.groups()
+        if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+            return None
+        return cls(trace_id=trace_id, span_id=span_id, sampled=bool(int(flags, 16) & 1))
+
+
+class Sampler(Protocol):
+    """Decides whether a new trace is recorded."""
+
+    def should_sample(self, trace_id: str) -> bool:
+        """Return True to record the trace."""
+        ...
+
+
+class RatioSampler:
+    """Samples a fixed fraction of traces, decided by the trace id.
+
+    Uses the low 64 bits of the trace id (like OpenTelemetry's
+    TraceIdRatioBased), so every service sampling at the same ratio makes
+    the same decision for a trace.
+    """
+
+    def __init__(self, ratio: float) -> None:
+        """Initialize sampler with a ratio between 0 (never) and 1 (always)."""
+        self.ratio = min(max(ratio, 0.0), 1.0)
+        self._threshold = int(self.ratio * 2**64)
+
+    def should_sample(self, trace_id: str) -> bool:
+        """Return True for trace ids below the ratio's threshold."""
+        return int(trace_id[16:], 16) < self._threshold
+
+
+class SpanExporter(Protocol):
+    """Receives finished spans, one trace at a time."""
+
+    name: str
+
+    def export(self, spans: list["Span"]) -> None:
+        """Write spans; must not raise."""
+        ...
+
+
+class ConsoleSpanExporter:
+    """Writes spans as JSON lines to a stream (stderr by default)."""
+
+    name = "console"
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        """Initialize exporter."""
+        self.stream = stream or sys.stderr
+
+    def export(self, spans: list["Span"]) -> None:
+        """Write one JSON line per span."""
+        self.stream.write("".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans))
+        self.stream.flush()
+
+
+class FileSpanExporter:
+    """Appends spans as JSON lines to a local file (works offline)."""
+
+    name = "file"
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize exporter."""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, spans: list["Span"]) -> None:
+        """Append one JSON line per span."""
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock, self.path.open("a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+@dataclass
+class _Trace:
+    trace_id: str
+    sampled: bool
+    root_id: str = ""
+    spans: list["Span"] = field(default_factory=list)
+    finished: bool = False
+
+
+@dataclass(eq=False)
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    kind: SpanKind = "internal"
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.time)
+    duration: float | None = None
+    status: Literal["ok", "error"] = "ok"
+    error: str | None = None
+    _trace: _Trace | None = field(default=None, repr=False)
+    _tracer: "Tracer | None" = field(default=None, repr=False)
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def recording(self) -> bool:
+        """Whether the span's trace is sampled (otherwise it is never exported)."""
+        return self._trace is not None and self._trace.sampled
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header for outgoing calls made within this span."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.recording else '00'}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute (ignored when not recording)."""
+        if self.recording:
+            self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Mark the span as failed."""
+        self.status = "error"
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def end(self) -> None:
+        """Finish the span (idempotent)."""
+        if self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self._start
+        if self._tracer is not None and self.recording:
+            self._tracer._finish(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable representation."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "duration_ms": round((self.duration or 0.0) * 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class Tracer:
+    """Creates spans and exports finished traces."""
+
+    def __init__(
+        self, exporter: SpanExporter | None = None, sampler: Sampler | None = None
+    ) -> None:
+        """Initialize tracer (disabled without an exporter).
+
+        Args:
+            exporter: Destination for finished traces
+            sampler: Decides which new traces are recorded (default: all)
+        """
+        self.exporter = exporter
+        self.sampler: Sampler = sampler or RatioSampler(1.0)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether root spans are created."""
+        return self.exporter is not None
+
+    def configure(self, exporter: SpanExporter | None, sampler: Sampler | None = None) -> None:
+        """Replace the exporter and sampler."""
+        self.exporter = exporter
+        self.sampler = sampler or RatioSampler(1.0)
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        kind: SpanKind = "internal",
+        attributes: dict[str, Any] | None = None,
+        root: bool = False,
+        trace_id: str | None = None,
+        parent_id: str | None = None,
+        sampled: bool | None = None,
+    ) -> Span | None:
+        """Start a span without making it current (for leaf operations).
+
+        Args:
+            name: Span name
+            kind: server, client or internal
+            attributes: Initial attributes
+            root: Start a new trace instead of a child of the current span
+            trace_id: Trace id of a new trace (default: random)
+            parent_id: Remote parent span id of a new trace (from traceparent)
+            sampled: Sampling decision of a new trace (default: ask the sampler)
+
+        Returns:
+            The span, or None when there is nothing to attach it to (no
+            current span and not a root, or tracing disabled)
+        """
+        parent = _current_span.get()
+        if root:
+            if not self.enabled:
+                return None
+            trace_id = trace_id or secrets.token_hex(16)
+            if sampled is None:
+                sampled = self.sampler.should_sample(trace_id)
+            trace = _Trace(trace_id=trace_id, sampled=sampled)
+        elif parent is None or parent._trace is None:
+            return None
+        else:
+            trace = parent._trace
+            parent_id = parent.span_id
+
+        span = Span(
+            name=name,
+            trace_id=trace.trace_id,
+            span_id=new_span_id(),
+            parent_id=parent_id,
+            kind=kind,
+            attributes=dict(attributes or {}) if trace.sampled else {},
+            _trace=trace,
+            _tracer=self,
+        )
+        if root:
+            trace.root_id = span.span_id
+        return span
+
+    @contextmanager
+    def span(self, name: str, **kwargs: Any) -> Iterator[Span | None]:
+        """Run a block in a span that is current for nested spans.
+
+        Takes the same arguments as ``start_span``; yields None when the
+        block isn't traced. Exceptions mark the span as failed.
+        """
+        span = self.start_span(name, **kwargs)
+        if span is None:
+            yield None
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def _finish(self, span: Span) -> None:
+        trace = span._trace
+        assert trace is not None  # nosec B101 - only recording spans get here
+        if trace.finished:
+            # Outlived its root (e.g. a detached task); export on its own
+            self._export([span])
+            return
+        trace.spans.append(span)
+        if span.span_id == trace.root_id:
+            trace.finished = True
+            self._export(trace.spans)
+
+    def _export(self, spans: list[Span]) -> None:
+        if self.exporter is None:
+            return
+        try:
+            self.exporter.export(spans)
+        except Exception as e:
+            logger.warning("Span export failed", extra={"error": str(e)})
+
+
+def current_span() -> Span | None:
+    """Span of the current context, if any."""
+    return _current_span.get()
+
+
+def create_sampler() -> Sampler:
+    """Sampler from settings."""
+    if settings.tracing_sampler == "always_on":
+        return RatioSampler(1.0)
+    if settings.tracing_sampler == "always_off":
+        return RatioSampler(0.0)
+    return RatioSampler(settings.tracing_sample_ratio)
+
+
+def create_span_exporter() -> SpanExporter | None:
+    """Exporter from settings (None disables tracing)."""
+    if settings.tracing_exporter == "console":
+        return ConsoleSpanExporter()
+    if settings.tracing_exporter == "file":
+        return FileSpanExporter(settings.tracing_file_path)
+    return None
+
+
+def configure_tracing() -> None:
+    """Configure the process-wide tracer from settings (app lifespan)."""
+    tracer.configure(create_span_exporter(), create_sampler())
+    if tracer.exporter is not None:
+        logger.info(
+            "Tracing enabled",
+            extra={"exporter": tracer.exporter.name, "sampler": settings.tracing_sampler},
+        )
+
+
+# Process-wide tracer (disabled until configure_tracing)
+tracer = Tracer()
+
+
+# ================================
+# SQLAlchemy
+# ================================
+
+# conn.info key holding spans of in-flight statements
+_SPANS_KEY = "tracing_spans"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_span(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    span = tracer.start_span("db.query", kind="client")
+    if span is None:
+        return
+    if span.recording:
+        span.attributes.update(
+            {"db.system": conn.dialect.name, "db.statement": fingerprint(statement)[:1000]}
+        )
+    conn.info.setdefault(_SPANS_KEY, []).append(span)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_query_span(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    spans = conn.info.get(_SPANS_KEY)
+    if spans and current_span() is not None:
+        spans.pop().end()
+
+
+@event.listens_for(Engine, "handle_error")
+def _fail_query_span(context: ExceptionContext) -> None:
+    spans = context.connection.info.get(_SPANS_KEY) if context.connection else None
+    if spans and current_span() is not None:
+        span = spans.pop()
+        span.record_exception(context.original_exception)
+        span.end()
+
+
+# ================================
+# Azure Blob Storage
+# ================================
+
+_BLOB_SPAN_KEY = "tracing_span"
+
+
+def _start_blob_span(request: Any) -> None:
+    http_request = request.http_request
+    span = tracer.start_span(f"blob {http_request.method}", kind="client")
+    if span is None:
+        return
+    # Drop the query string: it can carry a SAS token
+    span.set_attribute("http.method", http_request.method)
+    span.set_attribute("http.url", http_request.url.split("?", 1)[0])
+    request.context[_BLOB_SPAN_KEY] = span
+
+
+def _end_blob_span(response: Any) -> None:
+    span = response.context.pop(_BLOB_SPAN_KEY, None)
+    if span is None:
+        return
+    status_code = response.http_response.status_code
+    span.set_attribute("http.status_code", status_code)
+    if status_code >= 400:
+        span.status = "error"
+    span.end()
+
+
+# Client keyword arguments adding a span per Blob Storage HTTP request, e.g.
+# BlobServiceClient.from_connection_string(conn_str, **BLOB_CLIENT_HOOKS)
+BLOB_CLIENT_HOOKS: dict[str, Any] = {
+    "raw_request_hook": _start_blob_span,
+    "raw_response_hook": _end_blob_span,
+}
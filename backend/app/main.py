@@ -7,14 +7,14 @@ from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.health import router as health_router
 from app.api.metrics import router as metrics_router
-from app.api.v1 import api_router
+from app.api.v1 import include_api_routers
 from app.core.config import get_settings
-from app.core.database import async_engine
+from app.core.database import async_engine, replica_engine
 from app.core.errors import (
     AuthenticationError,
     AuthorizationError,
@@ -25,14 +25,25 @@ from app.core.errors import (
     http_exception_handler,
     validation_exception_handler,
 )
+from app.core.images import image_worker_pool
 from app.core.logging import get_logger, setup_logging
 from app.core.metrics import set_up
-from app.core.redis import get_redis
+from app.core.redis import close_redis, get_redis
+from app.core.scheduler import scheduler
+from app.core.tracing import configure_tracing
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.consent_check import ConsentCheckMiddleware
 from app.middleware.metrics import MetricsMiddleware
 from app.middleware.powered_by import PoweredByMiddleware
+from app.middleware.query_stats import QueryStatsMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 from app.middleware.slug_validator import SlugValidationMiddleware
+from app.services.audit_writer import audit_log_writer
+from app.services.email_backends import close_email_backend
+from app.services.email_dispatcher import email_dispatcher
+from app.services.event_change_feed import event_change_feed
+from app.services.media_scan_worker import media_scan_worker
+from app.tasks.schedule import register_jobs
 
 # Setup logging
 setup_logging()
@@ -48,10 +59,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Application lifespan events.
 
     Startup:
+    - Refuse to run production with the stub media scanner
+    - Configure tracing
     - Initialize Redis connection
+    - Start the email outbox dispatcher
+    - Start the audit log writer
+    - Start the image worker pool and the media scan worker
+    - Subscribe to live event changes
+    - Start the periodic job scheduler
     - Log application start
 
     Shutdown:
+    - Stop the periodic job scheduler
+    - Drain the email outbox dispatcher
+    - Stop the media scan worker and the image worker pool
+    - Drain the audit log writer
+    - Stop the event change feed
     - Close database connections
     - Close Redis connection
     """
@@ -65,10 +88,49 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         },
     )
 
+    # Checked before anything starts: the stub would mark every real upload clean
+    if (
+        settings.media_scan_enabled
+        and settings.environment == "production"
+        and settings.media_scanner_backend == "stub"
+    ):
+        raise RuntimeError(
+            "Media scanner backend is 'stub' in production; uploads would only be "
+            "checked for the EICAR test file. Set MEDIA_SCANNER_BACKEND=clamd."
+        )
+
+    # Spans are exported only if a tracing exporter is configured
+    configure_tracing()
+
     # Initialize Redis
-    redis_client = await get_redis()
+    await get_redis()
     logger.info("Redis connection established")
 
+    # Start delivering queued transactional email
+    if settings.email_dispatcher_enabled:
+        await email_dispatcher.start()
+
+    # Batch audit log writes off the request path
+    if settings.audit_log_async_enabled:
+        await audit_log_writer.start()
+
+    # Image derivatives are rendered in worker processes
+    image_worker_pool.start(settings.image_worker_processes)
+
+    # Virus-scan confirmed media uploads in the background
+    if settings.media_scan_enabled:
+        await media_scan_worker.start()
+
+    # Fan out committed seating/check-in/catalog changes to change streams
+    if settings.event_stream_enabled:
+        await event_change_feed.start()
+
+    # Periodic jobs (each run by one replica per interval)
+    if settings.scheduler_enabled:
+        if not scheduler.jobs:
+            register_jobs(scheduler)
+        await scheduler.start()
+
     # Mark service as up for metrics
     set_up(1)
 
@@ -77,12 +139,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Fundrbolt Platform API")
 
+    # Let in-flight job runs finish while their connections are still open
+    await scheduler.stop()
+
+    # Finish the in-flight email batch before closing connections
+    await email_dispatcher.stop()
+    await close_email_backend()
+
+    # In-flight scans finish or are retried once their lease expires
+    await media_scan_worker.stop()
+    image_worker_pool.stop()
+
+    # Write buffered audit records while the database is still available
+    await audit_log_writer.stop()
+
+    # Publish changes from the last commits before Redis closes
+    await event_change_feed.stop()
+
     # Close database engine
     await async_engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
     logger.info("Database connections closed")
 
-    # Close Redis connection
-    await redis_client.aclose()  # type: ignore[attr-defined]
+    # Close Redis connection pools
+    await close_redis()
     logger.info("Redis connection closed")
 
     # Mark service as down
@@ -98,6 +179,7 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Fundrbolt Platform Support",
         "email": "support@fundrbolt.com",
@@ -138,6 +220,14 @@ app.add_middleware(RequestIDMiddleware)
 # Metrics middleware
 app.add_middleware(MetricsMiddleware)
 
+# Per-request SQL statement counts and DB time (Server-Timing, N+1 warnings)
+if settings.query_stats_enabled:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        server_timing=settings.query_stats_server_timing,
+        warn_threshold=settings.query_stats_warn_threshold,
+    )
+
 # Powered-By header middleware
 app.add_middleware(PoweredByMiddleware)
 
@@ -147,6 +237,15 @@ app.add_middleware(SlugValidationMiddleware)
 # Consent check middleware
 app.add_middleware(ConsentCheckMiddleware)
 
+# Response compression (added last = outermost, so it sees final response bodies)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+
 # Exception handlers
 app.add_exception_handler(Exception, generic_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)  # type: ignore[arg-type]
@@ -158,7 +257,7 @@ app.add_exception_handler(DuplicateResourceError, http_exception_handler)  # typ
 app.add_exception_handler(RateLimitError, http_exception_handler)  # type: ignore[arg-type]
 
 # Include API routers
-app.include_router(api_router, prefix="/api/v1")
+include_api_routers(app)
 app.include_router(health_router)
 app.include_router(metrics_router)
 
@@ -13,7 +13,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_primary_read_db, get_read_db
 from app.core.security import decode_token
 from app.models.user import User
 from app.services.redis_service import RedisService
@@ -41,40 +41,8 @@ class HTTPBearerAuth(HTTPBearer):
 security = HTTPBearerAuth()
 
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """Extract and validate JWT from Authorization header.
-
-    Flow:
-    1. Extract Bearer token from Authorization header
-    2. Decode JWT and validate signature
-    3. Check if token is blacklisted in Redis
-    4. Verify token hasn't expired
-    5. Fetch user from database
-    6. Verify user is active
-
-    Args:
-        credentials: HTTP Bearer credentials from Authorization header
-        db: Database session
-
-    Returns:
-        Authenticated User object
-
-    Raises:
-        HTTPException 401: Invalid, expired, or blacklisted token
-        HTTPException 403: User account deactivated
-
-    Usage:
-        @router.get("/protected")
-        async def protected_route(
-            current_user: Annotated[User, Depends(get_current_user)]
-        ):
-            return {"user_id": current_user.id}
-    """
-    token = credentials.credentials
-
+async def _authenticate(token: str, db: AsyncSession) -> User:
+    """Resolve a bearer token to an active user (see get_current_user)."""
     try:
         # Decode and validate JWT
         payload = decode_token(token)
@@ -183,30 +151,68 @@ async def get_current_user(
         ) from e
 
 
-async def get_current_user_optional(
-    request: Request,
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User | None:
-    """Extract and validate JWT if present, return None if not authenticated.
+) -> User:
+    """Extract and validate JWT from Authorization header.
 
-    This is used for endpoints that work for both authenticated and anonymous users.
+    Flow:
+    1. Extract Bearer token from Authorization header
+    2. Decode JWT and validate signature
+    3. Check if token is blacklisted in Redis
+    4. Verify token hasn't expired
+    5. Fetch user from database
+    6. Verify user is active
 
     Args:
-        request: FastAPI request object
+        credentials: HTTP Bearer credentials from Authorization header
         db: Database session
 
     Returns:
-        Authenticated User object or None if no valid token
+        Authenticated User object
+
+    Raises:
+        HTTPException 401: Invalid, expired, or blacklisted token
+        HTTPException 403: User account deactivated
 
     Usage:
-        @router.get("/public-or-private")
-        async def flexible_route(
-            current_user: Annotated[User | None, Depends(get_current_user_optional)]
+        @router.get("/protected")
+        async def protected_route(
+            current_user: Annotated[User, Depends(get_current_user)]
         ):
-            if current_user:
-                return {"user_id": current_user.id}
-            return {"message": "Anonymous user"}
+            return {"user_id": current_user.id}
     """
+    return await _authenticate(credentials.credentials, db)
+
+
+async def get_current_read_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> User:
+    """get_current_user for read-only endpoints.
+
+    The user is looked up on the get_read_db session, which FastAPI shares
+    with a route that depends on get_read_db too, so the request never opens
+    (or commits) a transaction on the primary.
+    """
+    return await _authenticate(credentials.credentials, db)
+
+
+async def get_current_primary_read_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+) -> User:
+    """get_current_user for endpoints on get_primary_read_db (see get_current_read_user).
+
+    The user is read on the route's own primary session rather than on a
+    possibly lagging replica, and the request opens one session, not two.
+    """
+    return await _authenticate(credentials.credentials, db)
+
+
+async def _authenticate_optional(request: Request, db: AsyncSession) -> User | None:
+    """Resolve an optional bearer token (see get_current_user_optional)."""
     # Try to extract Authorization header
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
@@ -257,6 +263,57 @@ async def get_current_user_optional(
         return None
 
 
+async def get_current_user_optional(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User | None:
+    """Extract and validate JWT if present, return None if not authenticated.
+
+    This is used for endpoints that work for both authenticated and anonymous users.
+
+    Args:
+        request: FastAPI request object
+        db: Database session
+
+    Returns:
+        Authenticated User object or None if no valid token
+
+    Usage:
+        @router.get("/public-or-private")
+        async def flexible_route(
+            current_user: Annotated[User | None, Depends(get_current_user_optional)]
+        ):
+            if current_user:
+                return {"user_id": current_user.id}
+            return {"message": "Anonymous user"}
+    """
+    return await _authenticate_optional(request, db)
+
+
+async def get_current_read_user_optional(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> User | None:
+    """get_current_user_optional for read-only endpoints (see get_current_read_user)."""
+    return await _authenticate_optional(request, db)
+
+
+def _require_verified_email(user: User) -> User:
+    """Reject users whose email address is not verified yet."""
+    if not user.email_verified:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "error": {
+                    "code": "EMAIL_NOT_VERIFIED",
+                    "message": "Email verification required",
+                }
+            },
+        )
+
+    return user
+
+
 async def get_current_active_user(current_user: Annotated[User, Depends(get_current_user)]) -> User:
     """Get current user and verify email is verified.
 
@@ -279,18 +336,21 @@ async def get_current_active_user(current_user: Annotated[User, Depends(get_curr
             # User is authenticated AND email verified
             return {"user_id": current_user.id}
     """
-    if not current_user.email_verified:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "code": "EMAIL_NOT_VERIFIED",
-                    "message": "Email verification required",
-                }
-            },
-        )
+    return _require_verified_email(current_user)
+
 
-    return current_user
+async def get_current_active_read_user(
+    current_user: Annotated[User, Depends(get_current_read_user)],
+) -> User:
+    """get_current_active_user for read-only endpoints (see get_current_read_user)."""
+    return _require_verified_email(current_user)
+
+
+async def get_current_active_primary_read_user(
+    current_user: Annotated[User, Depends(get_current_primary_read_user)],
+) -> User:
+    """get_current_active_user for endpoints on get_primary_read_db."""
+    return _require_verified_email(current_user)
 
 
 def require_role(*allowed_roles: str) -> Callable[..., Any]:
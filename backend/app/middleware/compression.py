@@ -0,0 +1,219 @@
+"""Negotiated response compression (Brotli / gzip).
+
+Picks the best encoding the client accepts (``br`` preferred over ``gzip`` at
+equal q-value) and compresses bodies at or above ``compression_minimum_size``.
+Small bodies, already-encoded responses, Server-Sent Events and formats that
+are already compressed (images, archives) pass through untouched.
+
+Implemented on the plain ASGI message flow (zlib for gzip); Brotli is used
+when the ``brotli`` package is installed and silently falls back to gzip
+otherwise.
+"""
+
+import zlib
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Already compressed or streamed formats that gain nothing from compression
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    "text/event-stream",
+    "image/",
+    "video/",
+    "audio/",
+    "application/zip",
+    "application/gzip",
+    "application/pdf",
+    "application/octet-stream",
+)
+
+
+def negotiate_encoding(accept_encoding: str, brotli_available: bool = True) -> str | None:
+    """Choose a content coding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+        brotli_available: Whether Brotli may be offered
+
+    Returns:
+        "br", "gzip", or None for identity
+    """
+    qvalues: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        qvalues[coding] = q
+
+    supported = ["br", "gzip"] if brotli_available else ["gzip"]
+    best: str | None = None
+    best_q = 0.0
+    for coding in supported:
+        q = qvalues.get(coding, qvalues.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class _Compressor(Protocol):
+    """Incremental encoder shared by the gzip and Brotli codings."""
+
+    def process(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        # wbits 16 + MAX_WBITS writes the gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def process(self, data: bytes) -> bytes:
+        return bytes(self._compressor.process(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._compressor.flush())
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.finish())
+
+
+class _CompressingSend:
+    """Wraps ``send`` for one response, encoding body messages on the way out.
+
+    The start message is held back until the first body message shows whether
+    the response is large enough (or streamed) to be worth compressing.
+    """
+
+    def __init__(
+        self, send: Send, encoding: str, compressor: _Compressor, minimum_size: int
+    ) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.compressor = compressor
+        self.minimum_size = minimum_size
+        self.start_message: Message | None = None
+        self.compressing = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if "content-encoding" in headers or content_type.startswith(
+                INCOMPRESSIBLE_CONTENT_TYPES
+            ):
+                await self.send(message)
+            else:
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or (
+            self.start_message is None and not self.compressing
+        ):
+            await self.send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            if not more_body and len(body) < self.minimum_size:
+                await self.send(start)
+                await self.send(message)
+                return
+
+            self.compressing = True
+            headers = MutableHeaders(scope=start)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                # Streamed: the final length isn't known up front
+                del headers["Content-Length"]
+            else:
+                body = self.compressor.process(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            await self.send(start)
+
+        # Flush each chunk so streamed responses reach the client without waiting for the end
+        body = self.compressor.process(body)
+        body += self.compressor.flush() if more_body else self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+
+class CompressionMiddleware:
+    """Compress HTTP responses with Brotli or gzip per Accept-Encoding."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application
+            minimum_size: Bodies smaller than this (bytes) are sent uncompressed
+            gzip_level: gzip compression level (1-9)
+            brotli_quality: Brotli quality (0-11)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, brotli_available=brotli is not None)
+
+        compressor: _Compressor
+        if encoding == "br":
+            compressor = _BrotliCompressor(self.brotli_quality)
+        elif encoding == "gzip":
+            compressor = _GzipCompressor(self.gzip_level)
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(
+            scope, receive, _CompressingSend(send, encoding, compressor, self.minimum_size)
+        )
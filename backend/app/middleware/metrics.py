@@ -1,54 +1,82 @@
 """Middleware for collecting HTTP request metrics.
 
-Tracks request count, latency, and status codes for Prometheus monitoring.
+Requests are labelled by the matched route template (e.g.
+``/api/v1/events/{event_id}``), never the raw path, so ids and slugs don't
+create new Prometheus series. Unmatched requests (404s, static files) share
+the ``<unmatched>`` label.
+
+Tracks request count, a latency histogram, an in-flight gauge and a
+response size histogram (body bytes before compression). Durations use the
+monotonic ``perf_counter`` clock and run until the last body chunk is sent,
+so streamed responses are measured in full.
 """
 
 import time
-from collections.abc import Awaitable, Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_REQUESTS_TOTAL,
+    HTTP_RESPONSE_SIZE_BYTES,
+)
 
-from app.core.metrics import HTTP_REQUESTS_TOTAL
+UNMATCHED_ROUTE = "<unmatched>"
 
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect HTTP request metrics for Prometheus."""
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Process request and collect metrics.
+def route_template(scope: Scope) -> str:
+    """Path template of the route that handled the request.
 
-        Args:
-            request: The incoming request
-            call_next: The next middleware or route handler
+    FastAPI stores the matched route in the scope while routing; its
+    ``path_format`` includes router prefixes.
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
 
-        Returns:
-            The response from downstream handlers
-        """
-        # Start timing
-        start_time = time.time()
 
-        # Process request
-        response = await call_next(request)
+class MetricsMiddleware:
+    """ASGI middleware to collect HTTP request metrics for Prometheus."""
 
-        # Calculate duration
-        duration = time.time() - start_time
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI app."""
+        self.app = app
 
-        # Extract path without query params and truncate long paths
-        path = request.url.path
-        if len(path) > 100:
-            path = path[:97] + "..."
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and record metrics once the response is complete."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Increment request counter
-        HTTP_REQUESTS_TOTAL.labels(
-            method=request.method,
-            path=path,
-            status=response.status_code,
-        ).inc()
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else "OTHER"
+        start = time.perf_counter()
+        status_code = 500
+        response_size = 0
 
-        # Add duration header for debugging (optional)
-        response.headers["X-Process-Time"] = f"{duration:.4f}"
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Time to first byte, for debugging from the client side
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"x-process-time", f"{time.perf_counter() - start:.4f}".encode("latin-1"))
+                )
+                message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
 
-        return response
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            duration = time.perf_counter() - start
+            path = route_template(scope)
+            HTTP_REQUESTS_TOTAL.labels(method=method, path=path, status=status_code).inc()
+            HTTP_REQUEST_DURATION_SECONDS.labels(method=method, path=path).observe(duration)
+            HTTP_RESPONSE_SIZE_BYTES.labels(method=method, path=path).observe(response_size)
@@ -0,0 +1,74 @@
+"""Middleware reporting database usage per request.
+
+Adds a ``Server-Timing: db;dur=...;desc="N queries"`` header (statements
+issued before the response headers are sent), records query count and DB
+time histograms by route template, and logs requests over
+``query_stats_warn_threshold`` statements with their most repeated
+statements, which is usually an N+1 loop.
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import get_logger
+from app.core.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    DB_SLOW_QUERIES_TOTAL,
+    DB_TIME_PER_REQUEST_SECONDS,
+)
+from app.core.query_stats import QueryStats, track_queries
+from app.middleware.metrics import route_template
+
+logger = get_logger(__name__)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware tracking the SQL statements of each request."""
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True, warn_threshold: int = 30) -> None:
+        """Wrap an ASGI app.
+
+        Args:
+            app: ASGI application
+            server_timing: Whether to add the Server-Timing header
+            warn_threshold: Statements per request before a warning is logged
+        """
+        self.app = app
+        self.server_timing = server_timing
+        self.warn_threshold = warn_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Track statements for the duration of the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and self.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._observe(scope, stats)
+
+    def _observe(self, scope: Scope, stats: QueryStats) -> None:
+        path = route_template(scope)
+        DB_QUERIES_PER_REQUEST.labels(path=path).observe(stats.count)
+        DB_TIME_PER_REQUEST_SECONDS.labels(path=path).observe(stats.total_seconds)
+        if stats.slow_count:
+            DB_SLOW_QUERIES_TOTAL.labels(path=path).inc(stats.slow_count)
+        if stats.count > self.warn_threshold:
+            logger.warning(
+                "Query-heavy request",
+                extra={
+                    "method": scope["method"],
+                    "path": path,
+                    "query_count": stats.count,
+                    "db_time_ms": round(stats.total_seconds * 1000, 1),
+                    "repeated": stats.describe(),
+                },
+            )
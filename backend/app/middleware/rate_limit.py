@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 from fastapi import HTTPException, Request, status
 
-from app.core.redis import get_redis
+from app.core.redis import execute_pipeline
 from app.services.redis_service import RedisService
 
 if TYPE_CHECKING:
@@ -86,13 +86,11 @@ class RateLimiter:
         """
         key = self.get_rate_limit_key(identifier)
 
-        # Get current count
-        redis_client = await get_redis()
-        current_count = await redis_client.get(key)
-        count = int(current_count) if current_count else 0
-
-        # Get TTL
-        ttl = await redis_client.ttl(key)
+        # Get current count (sorted-set window) and TTL in one round trip
+        count, ttl = await execute_pipeline(
+            "rate_limit.remaining",
+            lambda pipe: pipe.zcard(key).ttl(key),
+        )
         seconds_until_reset = ttl if ttl > 0 else self.window_seconds
 
         remaining = max(0, self.max_requests - count)
@@ -8,6 +8,8 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.logging import get_logger
+from app.core.tracing import TraceParent, trace_id_for, tracer
+from app.middleware.metrics import route_template
 
 logger = get_logger(__name__)
 
@@ -28,14 +30,19 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Adds request ID to response headers
     - Stores request ID in context for logging
     - Accepts request ID from client if provided in X-Request-ID header
+    - Opens the request's root tracing span; the request ID is the trace ID
+      (an incoming W3C traceparent header continues the caller's trace)
     """
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
         """Process request and add request ID."""
-        # Get request ID from header or generate new one
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        # Get request ID from header, the caller's trace, or generate new one
+        parent = TraceParent.parse(request.headers.get("traceparent"))
+        request_id = request.headers.get("X-Request-ID") or str(
+            uuid.UUID(parent.trace_id) if parent else uuid.uuid4()
+        )
 
         # Store in context for logging
         request_id_context.set(request_id)
@@ -54,32 +61,47 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
             },
         )
 
-        try:
-            # Process request
-            response = await call_next(request)
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-
-            # Log response
-            logger.info(
-                "Request completed",
-                extra={
-                    "request_id": request_id,
-                    "status_code": response.status_code,
-                },
-            )
-
-            return response
-
-        except Exception as e:
-            # Log error with request ID
-            logger.error(
-                "Request failed",
-                extra={
-                    "request_id": request_id,
-                    "error": str(e),
-                },
-                exc_info=True,
-            )
-            raise
+        with tracer.span(
+            request.method,
+            kind="server",
+            root=True,
+            trace_id=parent.trace_id if parent else trace_id_for(request_id),
+            parent_id=parent.span_id if parent else None,
+            sampled=parent.sampled if parent else None,
+            attributes={"http.method": request.method, "http.target": request.url.path},
+        ) as span:
+            try:
+                # Process request
+                response = await call_next(request)
+
+                # Add request ID to response headers
+                response.headers["X-Request-ID"] = request_id
+
+                if span is not None:
+                    span.name = f"{request.method} {route_template(request.scope)}"
+                    span.set_attribute("http.status_code", response.status_code)
+                    if response.status_code >= 500:
+                        span.status = "error"
+
+                # Log response
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "request_id": request_id,
+                        "status_code": response.status_code,
+                    },
+                )
+
+                return response
+
+            except Exception as e:
+                # Log error with request ID
+                logger.error(
+                    "Request failed",
+                    extra={
+                        "request_id": request_id,
+                        "error": str(e),
+                    },
+                    exc_info=True,
+                )
+                raise
@@ -4,12 +4,15 @@ from app.models.auction_item import AuctionItem
 from app.models.audit_log import AuditLog
 from app.models.base import Base, TimestampMixin, UUIDMixin
 from app.models.consent import ConsentAuditLog, CookieConsent, UserConsent
+from app.models.email_campaign import EmailCampaign, EmailCampaignStatus
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
 from app.models.event import Event, EventLink, EventMedia, FoodOption
 from app.models.event_registration import EventRegistration, RegistrationStatus
 from app.models.event_table import EventTable
 from app.models.invitation import Invitation
 from app.models.legal_document import LegalDocument
 from app.models.meal_selection import MealSelection
+from app.models.media_scan_job import MediaScanJob
 from app.models.npo import NPO
 from app.models.npo_application import NPOApplication
 from app.models.npo_branding import NPOBranding
@@ -28,6 +31,10 @@ __all__ = [
     "UUIDMixin",
     "ConsentAuditLog",
     "CookieConsent",
+    "EmailCampaign",
+    "EmailCampaignStatus",
+    "EmailOutbox",
+    "EmailOutboxStatus",
     "Event",
     "EventLink",
     "EventMedia",
@@ -37,6 +44,7 @@ __all__ = [
     "Invitation",
     "LegalDocument",
     "MealSelection",
+    "MediaScanJob",
     "NPO",
     "NPOApplication",
     "NPOBranding",
@@ -4,10 +4,10 @@ import enum
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -172,6 +172,11 @@ class AuctionItemMedia(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )
     thumbnail_path: Mapped[str | None] = mapped_column(Text, nullable=True)
+    derivatives: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Responsive renditions for srcset (see ImageDerivativeService)",
+    )
     video_url: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Relationships
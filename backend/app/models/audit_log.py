@@ -1,10 +1,10 @@
 """AuditLog model for security auditing."""
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -40,6 +40,13 @@ class AuditLog(Base, UUIDMixin):
     - Immutable: No UPDATE or DELETE operations
     - Retention: 90 days in hot storage, archive to Azure Blob after 90 days
     - user_id is NULL for failed login attempts or anonymous events
+
+    Storage:
+    - In PostgreSQL the table is range-partitioned by month on created_at
+      (created by migration, maintained by app.services.audit_log_partitions);
+      the primary key is (created_at, id) because it must include the
+      partition key, and it also serves time-range scans
+    - Retention drops whole partitions after archiving them
     """
 
     __tablename__ = "audit_logs"
@@ -49,14 +56,12 @@ class AuditLog(Base, UUIDMixin):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
 
     # Event Details
     action: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
     )
     resource_type: Mapped[str | None] = mapped_column(
         String(50),
@@ -71,7 +76,6 @@ class AuditLog(Base, UUIDMixin):
     ip_address: Mapped[str] = mapped_column(
         String(45),
         nullable=False,
-        index=True,
     )
     user_agent: Mapped[str | None] = mapped_column(
         String,
@@ -86,13 +90,29 @@ class AuditLog(Base, UUIDMixin):
         nullable=True,
     )
 
-    # Timestamp (immutable, indexed)
+    # Timestamp (immutable, partition key)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(UTC),
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="audit_logs")
+
+    __table_args__ = (
+        # A user's history (GDPR export) and a resource's history, newest first
+        Index("idx_audit_logs_user_created", "user_id", "created_at"),
+        Index("idx_audit_logs_resource_created", "resource_type", "resource_id", "created_at"),
+        Index("idx_audit_logs_action_created", "action", "created_at"),
+        Index("idx_audit_logs_ip_address", "ip_address"),
+        # event_metadata @> '{...}' containment filters
+        Index(
+            "idx_audit_logs_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
@@ -0,0 +1,117 @@
+"""Email campaign model for bulk guest emails."""
+
+import enum
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, TimestampMixin, UUIDMixin
+
+if TYPE_CHECKING:
+    from app.models.event import Event
+
+
+class EmailCampaignStatus(str, enum.Enum):
+    """Campaign queueing status."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class EmailCampaignAudience(str, enum.Enum):
+    """Which guests of the event a campaign targets (guests with an email only)."""
+
+    UNCONFIRMED = "unconfirmed"  # Guests without an account yet
+    NOT_INVITED = "not_invited"  # Guests never sent an invitation
+    ALL = "all"
+
+
+class EmailCampaign(Base, UUIDMixin, TimestampMixin):
+    """Bulk email campaign to the guests of an event.
+
+    The campaign renders its template once, then queues one email_outbox row
+    per recipient in batches. Delivery progress is read from the outbox rows
+    linked by campaign_id; the counters here track queueing. The runner holds
+    a lease renewed with every batch, so a campaign whose process died is
+    resumed from last_recipient_id.
+    """
+
+    __tablename__ = "email_campaigns"
+
+    event_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    created_by_user_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    campaign_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        default="guest_invitation",
+        comment="Email kind sent by the campaign",
+    )
+
+    audience: Mapped[EmailCampaignAudience] = mapped_column(
+        Enum(
+            EmailCampaignAudience,
+            name="email_campaign_audience",
+            native_enum=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+    )
+
+    custom_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    status: Mapped[EmailCampaignStatus] = mapped_column(
+        Enum(
+            EmailCampaignStatus,
+            name="email_campaign_status",
+            native_enum=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+        default=EmailCampaignStatus.PENDING,
+        server_default=EmailCampaignStatus.PENDING.value,
+    )
+
+    total_recipients: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    queued_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    # Resume point: the last guest queued, committed with each batch
+    last_recipient_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # A running campaign whose runner stops renewing this is resumed by another
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    event: Mapped["Event"] = relationship("Event")
+
+    def __repr__(self) -> str:
+        """String representation of email campaign."""
+        return (
+            f"<EmailCampaign(id={self.id}, event_id={self.event_id}, "
+            f"audience={self.audience}, status={self.status})>"
+        )
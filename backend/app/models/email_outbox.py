@@ -0,0 +1,100 @@
+"""Email outbox model for transactional email delivery."""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin, UUIDMixin
+
+
+class EmailOutboxStatus(str, enum.Enum):
+    """Delivery status of an outbox email."""
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class EmailOutbox(Base, UUIDMixin, TimestampMixin):
+    """Email queued for delivery by the background dispatcher.
+
+    Rows are added in the same transaction as the change that triggers the
+    email (registration, invitation, password reset, ...), so an email is
+    sent if and only if that change commits.
+
+    Delivery Flow:
+    1. EmailService.enqueue_email adds a PENDING row to the caller's session
+    2. The dispatcher claims due rows (SENDING, lease in next_attempt_at)
+    3. On success the row becomes SENT; on failure it returns to PENDING with
+       an exponential backoff, or FAILED after email_max_attempts
+    4. SENDING rows whose lease expired (crashed worker) are claimed again
+    """
+
+    __tablename__ = "email_outbox"
+
+    email_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Email kind, e.g. verification, password_reset (for logs/metrics)",
+    )
+
+    to_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    subject: Mapped[str] = mapped_column(String(500), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False, comment="Plain text body")
+    html_body: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    status: Mapped[EmailOutboxStatus] = mapped_column(
+        Enum(
+            EmailOutboxStatus,
+            name="email_outbox_status",
+            native_enum=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+        default=EmailOutboxStatus.PENDING,
+        server_default=EmailOutboxStatus.PENDING.value,
+    )
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="When the row is next due (retry time, or lease expiry while sending)",
+    )
+
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    provider_message_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    campaign_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("email_campaigns.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+        comment="Bulk campaign this email belongs to (NULL for transactional email)",
+    )
+
+    __table_args__ = (
+        # Only undelivered rows are ever scanned by the dispatcher
+        Index(
+            "idx_email_outbox_due",
+            "next_attempt_at",
+            postgresql_where=text("status IN ('pending', 'sending')"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of outbox email."""
+        return (
+            f"<EmailOutbox(id={self.id}, type={self.email_type}, "
+            f"to={self.to_email}, status={self.status})>"
+        )
@@ -3,7 +3,7 @@
 import enum
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
     CheckConstraint,
@@ -14,7 +14,7 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -36,7 +36,10 @@ class EventStatus(str, enum.Enum):
 
 
 class EventMediaStatus(str, enum.Enum):
-    """Media file virus scan status."""
+    """Media file virus scan status.
+
+    Public event reads only include SCANNED media; admins see every status.
+    """
 
     UPLOADED = "uploaded"  # Uploaded, awaiting scan
     SCANNED = "scanned"  # Scanned, clean
@@ -321,7 +324,7 @@ class EventMedia(Base, UUIDMixin, TimestampMixin):
     - Maximum 10MB per file
     - Maximum 50MB total per event (enforced in service layer)
     - Allowed types: image/png, image/jpeg, image/svg+xml, application/pdf
-    - All files virus-scanned before serving
+    - All files virus-scanned; public reads only return SCANNED media
     - Files stored in Azure Blob Storage with private access
     """
 
@@ -378,6 +381,11 @@ class EventMedia(Base, UUIDMixin, TimestampMixin):
         default=0,
         comment="Order for gallery display",
     )
+    derivatives: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Responsive renditions for srcset, rendered after a clean scan",
+    )
     status: Mapped[EventMediaStatus] = mapped_column(
         Enum(
             EventMediaStatus,
@@ -99,6 +99,7 @@ class EventRegistration(Base, UUIDMixin, TimestampMixin):
         "RegistrationGuest",
         back_populates="registration",
         cascade="all, delete-orphan",
+        foreign_keys="RegistrationGuest.registration_id",
     )
     meal_selections: Mapped[list["MealSelection"]] = relationship(
         "MealSelection",
@@ -109,5 +110,7 @@ class EventRegistration(Base, UUIDMixin, TimestampMixin):
     # Unique Constraints
     __table_args__ = (
         UniqueConstraint("user_id", "event_id", name="uq_user_event_registration"),
+        # Target of the guests' (registration_id, event_id) foreign key
+        UniqueConstraint("id", "event_id", name="uq_event_registrations_id_event"),
         Index("idx_user_event_status", "user_id", "event_id", "status"),
     )
@@ -0,0 +1,64 @@
+"""Virus-scan queue for uploaded event media."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class MediaScanJob(Base):
+    """Pending virus scan of one EventMedia file.
+
+    A row is added in the same transaction that confirms the upload and is
+    deleted in the same transaction that records the scan result, so the
+    queue survives restarts and a file is never left unscanned.
+
+    Scan Flow:
+    1. MediaService.confirm_upload inserts the row (media stays UPLOADED)
+    2. A scan worker claims due rows (lease in available_at, attempts + 1)
+    3. The blob is streamed to the scanner; MediaService.mark_scan_complete
+       records SCANNED or QUARANTINED and the row is deleted
+    4. On a scanner/storage error the row is retried with backoff; after
+       media_scan_max_attempts it is parked (available_at NULL) for review
+    """
+
+    __tablename__ = "media_scan_jobs"
+
+    media_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("event_media.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    available_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        server_default=func.now(),
+        comment="When the job is next due (retry time or lease expiry); NULL once parked",
+    )
+
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_media_scan_jobs_due",
+            "available_at",
+            postgresql_where=text("available_at IS NOT NULL"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of scan job."""
+        return f"<MediaScanJob(media_id={self.media_id}, attempts={self.attempts})>"
@@ -4,7 +4,7 @@ import uuid
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import ForeignKey, String
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -71,6 +71,13 @@ class NPOBranding(Base, UUIDMixin, TimestampMixin):
         comment="Azure Blob Storage URL for NPO logo",
     )
 
+    # Responsive logo renditions for srcset (see ImageDerivativeService)
+    logo_derivatives: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Resized logo renditions (url, width, height, format)",
+    )
+
     # Social Media Links (JSON)
     # Schema: {facebook, twitter, instagram, linkedin, youtube, website, custom: [{name, url}]}
     social_media_links: Mapped[dict[str, Any] | None] = mapped_column(
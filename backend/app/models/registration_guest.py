@@ -4,15 +4,26 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    String,
+    event,
+    select,
+    text,
+)
 from sqlalchemy import DateTime as SADateTime
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapped, Mapper, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.event_registration import EventRegistration
 
 if TYPE_CHECKING:
-    from app.models.event_registration import EventRegistration
     from app.models.event_table import EventTable
     from app.models.meal_selection import MealSelection
     from app.models.user import User
@@ -28,6 +39,9 @@ class RegistrationGuest(Base, UUIDMixin, TimestampMixin):
     - If guest creates account, their user_id is linked to guest record
     - Guests without accounts can still attend (on-site registration)
     - Cannot link same user_id to multiple guests in same registration
+    - Bidder numbers are unique per event (partial unique index on the
+      denormalized event_id, which a composite FK keeps equal to the
+      registration's event)
     """
 
     __tablename__ = "registration_guests"
@@ -39,6 +53,12 @@ class RegistrationGuest(Base, UUIDMixin, TimestampMixin):
         nullable=False,
         index=True,
     )
+    event_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=False,
+        index=True,
+        comment="Event of the guest's registration (denormalized, kept in sync by FK)",
+    )
     user_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
@@ -113,6 +133,7 @@ class RegistrationGuest(Base, UUIDMixin, TimestampMixin):
     registration: Mapped["EventRegistration"] = relationship(
         "EventRegistration",
         back_populates="guests",
+        foreign_keys=[registration_id],
     )
     user: Mapped["User | None"] = relationship("User", back_populates="guest_records")
     meal_selections: Mapped[list["MealSelection"]] = relationship(
@@ -145,4 +166,35 @@ class RegistrationGuest(Base, UUIDMixin, TimestampMixin):
         return self.has_table_assignment and self.has_bidder_number
 
     # Table Configuration
-    __table_args__ = ()
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["registration_id", "event_id"],
+            ["event_registrations.id", "event_registrations.event_id"],
+            name="fk_registration_guests_registration_event",
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        Index(
+            "uq_registration_guests_event_bidder_number",
+            "event_id",
+            "bidder_number",
+            unique=True,
+            postgresql_where=text("bidder_number IS NOT NULL"),
+        ),
+    )
+
+
+@event.listens_for(RegistrationGuest, "before_insert")
+def _fill_event_id(
+    mapper: Mapper[RegistrationGuest], connection: Connection, target: RegistrationGuest
+) -> None:
+    """Copy event_id from the registration when the caller didn't set it."""
+    if target.event_id is not None:
+        return
+    registration = target.__dict__.get("registration")
+    if registration is not None and registration.event_id is not None:
+        target.event_id = registration.event_id
+    else:
+        target.event_id = connection.scalar(
+            select(EventRegistration.event_id).where(EventRegistration.id == target.registration_id)
+        )
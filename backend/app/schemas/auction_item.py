@@ -4,10 +4,14 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
+from app.core.serialization import PRIMARY_IMAGES, context_value, sign_url
 from app.models.auction_item import AuctionType, ItemStatus
 
+# An event's whole bid number range (100-999)
+MAX_IMPORT_ITEMS = 900
+
 
 class AuctionItemBase(BaseModel):
     """Base schema for auction items."""
@@ -42,6 +46,12 @@ class AuctionItemCreate(AuctionItemBase):
     pass
 
 
+class AuctionItemImportRequest(BaseModel):
+    """Schema for importing many auction items at once."""
+
+    items: list[AuctionItemCreate] = Field(..., min_length=1, max_length=MAX_IMPORT_ITEMS)
+
+
 class AuctionItemUpdate(BaseModel):
     """Schema for updating auction items (all fields optional)."""
 
@@ -72,11 +82,23 @@ class AuctionItemResponse(AuctionItemBase):
     created_at: datetime
     updated_at: datetime
     primary_image_url: str | None = Field(
-        None, description="URL of primary image (with SAS token if Azure)"
+        None,
+        description="URL of primary image (with SAS token if Azure)",
+        validate_default=True,
     )
 
     model_config = {"from_attributes": True}
 
+    @field_validator("primary_image_url", mode="before")
+    @classmethod
+    def resolve_primary_image(cls, v: str | None, info: ValidationInfo) -> str | None:
+        """Look up the item's image in the PRIMARY_IMAGES context and sign it."""
+        primary_images: dict[UUID, str] | None = context_value(info, PRIMARY_IMAGES)
+        item_id: UUID | None = info.data.get("id")
+        if primary_images is not None and item_id is not None:
+            v = primary_images.get(item_id)
+        return sign_url(v, info)
+
 
 class AuctionItemDetail(AuctionItemResponse):
     """Schema for detailed auction item response with media and sponsor."""
@@ -96,6 +118,13 @@ from app.schemas.auction_item_media import MediaResponse  # noqa: E402
 AuctionItemDetail.model_rebuild()
 
 
+class AuctionItemImportResponse(BaseModel):
+    """Schema for bulk import results (items in bid number order)."""
+
+    items: list[AuctionItemResponse]
+    created: int
+
+
 class AuctionItemListResponse(BaseModel):
     """Schema for paginated list of auction items."""
 
@@ -106,11 +135,16 @@ class AuctionItemListResponse(BaseModel):
 
 
 class PaginationInfo(BaseModel):
-    """Schema for pagination metadata."""
+    """Schema for pagination metadata.
+
+    In cursor mode page is None, total/pages are only set when requested via
+    total_mode, and next_cursor is None on the last page.
+    """
 
-    page: int = Field(..., ge=1)
+    page: int | None = Field(..., ge=1)
     limit: int = Field(..., ge=1, le=100)
-    total: int = Field(..., ge=0)
-    pages: int = Field(..., ge=0)
+    total: int | None = Field(..., ge=0)
+    pages: int | None = Field(..., ge=0)
+    next_cursor: str | None = None
 
     model_config = {"from_attributes": True}
@@ -1,9 +1,13 @@
 """Pydantic schemas for auction item media."""
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+
+from app.core.serialization import URL_SIGNER, UrlSigner, context_value, sign_url
+from app.schemas.image_derivative import ImageDerivativeResponse
 
 
 class MediaUploadRequest(BaseModel):
@@ -60,12 +64,28 @@ class MediaResponse(BaseModel):
     mime_type: str = Field(..., description="MIME type")
     display_order: int = Field(..., description="Display order for sorting")
     thumbnail_path: str | None = Field(None, description="Thumbnail URL (for images)")
+    derivatives: list[ImageDerivativeResponse] | None = Field(
+        None, description="Responsive renditions for srcset (for images)"
+    )
     video_url: str | None = Field(None, description="YouTube/Vimeo URL for video embeds")
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
 
+    @field_validator("file_path", "thumbnail_path", mode="before")
+    @classmethod
+    def sign_paths(cls, v: str | None, info: ValidationInfo) -> str | None:
+        """Sign stored URLs when validated with a URL_SIGNER context."""
+        return sign_url(v, info)
+
+    @field_validator("derivatives", mode="before")
+    @classmethod
+    def sign_derivative_urls(cls, v: Any, info: ValidationInfo) -> Any:
+        """Sign derivative URLs when validated with a URL_SIGNER context."""
+        signer: UrlSigner | None = context_value(info, URL_SIGNER)
+        return signer.sign_derivatives(v) if signer is not None else v
+
 
 class MediaReorderRequest(BaseModel):
     """Schema for reordering media items."""
@@ -0,0 +1,31 @@
+"""Pydantic schemas for audit log queries."""
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AuditLogResponse(BaseModel):
+    """Response schema for one audit log record."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    user_id: uuid.UUID | None
+    action: str
+    resource_type: str | None
+    resource_id: uuid.UUID | None
+    ip_address: str
+    user_agent: str | None
+    event_metadata: dict[str, Any] | None = Field(default=None, serialization_alias="metadata")
+    created_at: datetime
+
+
+class AuditLogListResponse(BaseModel):
+    """Response schema for a page of audit log records (newest first)."""
+
+    items: list[AuditLogResponse]
+    next_cursor: str | None = None
+    total: int | None = None
@@ -0,0 +1,66 @@
+"""Pydantic schemas for batch check-in (door volunteers and offline sync)."""
+
+import uuid
+from typing import Literal
+
+from pydantic import AwareDatetime, BaseModel, Field
+
+CheckInTarget = Literal["guest", "registration"]
+CheckInStatus = Literal["checked_in", "already_checked_in", "not_found"]
+
+MAX_BATCH_CHECK_INS = 1000
+
+
+# ================================
+# Request Schemas
+# ================================
+
+
+class CheckInOperation(BaseModel):
+    """One check-in recorded by a check-in device."""
+
+    idempotency_key: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Client-generated key; resubmitting it returns the original result",
+    )
+    target: CheckInTarget = Field(..., description="Whether id is a guest or a registration")
+    id: uuid.UUID = Field(..., description="Guest or registration ID")
+    checked_in_at: AwareDatetime | None = Field(
+        default=None,
+        description="When the check-in happened on the device (offline queues); defaults to now",
+    )
+
+
+class CheckInBatchRequest(BaseModel):
+    """Request schema for checking in many guests/registrations at once."""
+
+    event_id: uuid.UUID = Field(..., description="Event all operations belong to")
+    operations: list[CheckInOperation] = Field(..., min_length=1, max_length=MAX_BATCH_CHECK_INS)
+
+
+# ================================
+# Response Schemas
+# ================================
+
+
+class CheckInOperationResult(BaseModel):
+    """Outcome of one operation."""
+
+    idempotency_key: str
+    target: CheckInTarget
+    id: uuid.UUID
+    status: CheckInStatus
+    replayed: bool = Field(
+        default=False, description="Key was already processed; status is the original result"
+    )
+
+
+class CheckInBatchResponse(BaseModel):
+    """Response schema for batch check-in (one result per idempotency key)."""
+
+    results: list[CheckInOperationResult]
+    checked_in: int
+    already_checked_in: int
+    not_found: int
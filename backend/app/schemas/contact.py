@@ -4,7 +4,6 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-import bleach  # type: ignore[import-untyped]
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
 from app.models.contact_submission import SubmissionStatus
@@ -39,6 +38,8 @@ class ContactSubmissionCreate(BaseModel):
     @classmethod
     def sanitize_html(cls, value: str) -> str:
         """Sanitize HTML to prevent XSS attacks"""
+        import bleach  # type: ignore[import-untyped]  # Loaded on first submission
+
         return bleach.clean(value, tags=[], strip=True)  # type: ignore[no-any-return]
 
 
@@ -0,0 +1,62 @@
+"""Pydantic schemas for bulk email campaigns."""
+
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.email_campaign import EmailCampaignAudience, EmailCampaignStatus
+
+# ================================
+# Request Schemas
+# ================================
+
+
+class EmailCampaignCreateRequest(BaseModel):
+    """Request schema for starting a guest invitation campaign."""
+
+    audience: EmailCampaignAudience = Field(
+        default=EmailCampaignAudience.UNCONFIRMED,
+        description=(
+            "Guests to email: unconfirmed (no account yet), not_invited "
+            "(never sent an invitation) or all"
+        ),
+    )
+    custom_message: str | None = Field(
+        default=None,
+        max_length=2000,
+        description="Optional message included in every email",
+    )
+
+
+# ================================
+# Response Schemas
+# ================================
+
+
+class EmailCampaignDeliveryCounts(BaseModel):
+    """Outbox delivery status counts for a campaign."""
+
+    pending: int = 0
+    sending: int = 0
+    sent: int = 0
+    failed: int = 0
+
+
+class EmailCampaignResponse(BaseModel):
+    """Response schema for campaign status and progress."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    event_id: uuid.UUID
+    campaign_type: str
+    audience: EmailCampaignAudience
+    status: EmailCampaignStatus
+    total_recipients: int
+    queued_count: int
+    last_error: str | None
+    started_at: datetime | None
+    completed_at: datetime | None
+    created_at: datetime
+    delivery: EmailCampaignDeliveryCounts | None = None
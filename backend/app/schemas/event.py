@@ -8,6 +8,7 @@ from typing import Any
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
 from app.models.event import EventLinkType, EventMediaStatus, EventStatus
+from app.schemas.image_derivative import ImageDerivativeResponse
 
 # ================================
 # Request Schemas
@@ -213,6 +214,12 @@ class EventLinkUpdateRequest(BaseModel):
     display_order: int | None = Field(default=None, ge=0)
 
 
+class EventLinkReorderRequest(BaseModel):
+    """Request schema for reordering an event's links."""
+
+    link_ids: list[uuid.UUID] = Field(..., min_length=1, description="Link IDs in display order")
+
+
 # ================================
 # Food Option Schemas
 # ================================
@@ -250,6 +257,14 @@ class FoodOptionUpdateRequest(BaseModel):
         return v.strip() if v else None
 
 
+class FoodOptionReorderRequest(BaseModel):
+    """Request schema for reordering an event's food options."""
+
+    food_option_ids: list[uuid.UUID] = Field(
+        ..., min_length=1, description="Food option IDs in display order"
+    )
+
+
 # ================================
 # Response Schemas
 # ================================
@@ -267,6 +282,7 @@ class EventMediaResponse(BaseModel):
     mime_type: str
     file_size: int
     display_order: int
+    derivatives: list[ImageDerivativeResponse] | None = None
     status: EventMediaStatus
     created_at: datetime  # Fixed: model has created_at, not uploaded_at
     uploaded_by: uuid.UUID
@@ -413,10 +429,16 @@ class MediaUploadUrlResponse(BaseModel):
 
 
 class EventListResponse(BaseModel):
-    """Paginated event list response."""
+    """Paginated event list response.
+
+    Page-number mode fills page/total/total_pages. Cursor mode returns
+    next_cursor (None on the last page) and leaves page unset; total is only
+    set when requested via total_mode.
+    """
 
     items: list[EventSummaryResponse]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     per_page: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
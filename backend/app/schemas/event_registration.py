@@ -70,13 +70,18 @@ class EventRegistrationResponse(BaseModel):
 
 
 class EventRegistrationListResponse(BaseModel):
-    """Response schema for paginated list of event registrations."""
+    """Response schema for paginated list of event registrations.
+
+    In cursor mode page is None, total/total_pages are only set when requested
+    via total_mode, and next_cursor is None on the last page.
+    """
 
     registrations: list[EventRegistrationResponse]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     per_page: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
 
 
 # ================================
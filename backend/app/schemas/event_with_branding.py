@@ -6,8 +6,8 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 
-class RegisteredEventWithBranding(BaseModel):
-    """Event with resolved branding for donor PWA.
+class ResolvedEventBranding(BaseModel):
+    """An event's display data with resolved branding (cached per event).
 
     Branding colors resolve with fallback chain: event → NPO → system defaults.
     """
@@ -20,8 +20,6 @@ class RegisteredEventWithBranding(BaseModel):
     # Timing
     event_datetime: datetime
     timezone: str = Field(default="UTC")
-    is_past: bool = Field(description="True if event datetime has passed")
-    is_upcoming: bool = Field(description="True if event is within 30 days")
 
     # Display
     thumbnail_url: str | None = Field(
@@ -42,6 +40,13 @@ class RegisteredEventWithBranding(BaseModel):
         from_attributes = True
 
 
+class RegisteredEventWithBranding(ResolvedEventBranding):
+    """Event with resolved branding for donor PWA."""
+
+    is_past: bool = Field(description="True if event datetime has passed")
+    is_upcoming: bool = Field(description="True if event is within 30 days")
+
+
 class RegisteredEventsResponse(BaseModel):
     """Response containing list of events user is registered for."""
 
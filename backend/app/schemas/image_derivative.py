@@ -0,0 +1,16 @@
+"""Pydantic schemas for responsive image derivatives."""
+
+from pydantic import BaseModel, Field
+
+
+class ImageDerivativeResponse(BaseModel):
+    """One rendition of an image; group by format to build a ``srcset``."""
+
+    url: str = Field(..., description="Rendition URL")
+    width: int = Field(..., description="Width in pixels (the srcset 'w' descriptor)")
+    height: int = Field(..., description="Height in pixels")
+    format: str = Field(..., description="avif, webp or jpeg (fallback)")
+    mime_type: str = Field(..., description="MIME type, for <source type=...>")
+    size: int = Field(..., description="File size in bytes")
+
+    model_config = {"from_attributes": True}
@@ -147,13 +147,18 @@ class NPODetailResponse(NPOResponse):
 
 
 class NPOListResponse(BaseModel):
-    """Response schema for paginated NPO list."""
+    """Response schema for paginated NPO list.
+
+    In cursor mode page is None, total/total_pages are only set when requested
+    via total_mode, and next_cursor is None on the last page.
+    """
 
     items: list[NPOResponse]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
 
 
 class NPOCreateResponse(BaseModel):
@@ -5,6 +5,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.schemas.image_derivative import ImageDerivativeResponse
+
 # ================================
 # Request Schemas
 # ================================
@@ -127,6 +129,7 @@ class BrandingResponse(BaseModel):
     background_color: str | None
     accent_color: str | None
     logo_url: str | None
+    logo_derivatives: list[ImageDerivativeResponse] | None = None
     social_media_links: dict[str, str] | None
     custom_css_properties: dict[str, str] | None
     created_at: datetime
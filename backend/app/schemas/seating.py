@@ -166,13 +166,17 @@ class GuestSeatingInfo(BaseModel):
 
 
 class GuestSeatingListResponse(BaseModel):
-    """Paginated list of guests with seating information (T010)."""
+    """Paginated list of guests with seating information (T010).
+
+    In cursor mode page is None and next_cursor points at the following page.
+    """
 
     guests: list[GuestSeatingInfo]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     per_page: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class TableOccupancyResponse(BaseModel):
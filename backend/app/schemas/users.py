@@ -190,13 +190,18 @@ class UserPublicWithRole(BaseModel):
 
 
 class UserListResponse(BaseModel):
-    """Paginated response for user list."""
+    """Paginated response for user list.
+
+    In cursor mode page is None, total/total_pages are only set when requested
+    via total_mode, and next_cursor is None on the last page.
+    """
 
     items: list[UserPublicWithRole]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     per_page: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
 
 
 class UserActivateRequest(BaseModel):
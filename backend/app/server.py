@@ -0,0 +1,276 @@
+"""Production server: a pre-forking supervisor for uvicorn workers.
+
+    python -m app.server --host 0.0.0.0 --port 8000
+
+The supervisor imports the application once (so the worker processes share
+its memory pages copy-on-write), binds the listening socket, and forks
+``web_concurrency`` workers (one per available CPU core by default) that
+accept on that socket. Each worker runs the app's lifespan itself, so engines,
+Redis pools and background workers are created per process, after the fork.
+
+- Event loop and HTTP parser: uvloop and httptools when installed, otherwise
+  asyncio and h11.
+- Recycling: a worker exits after ``web_max_requests`` requests (plus a random
+  jitter) and is replaced; a worker that dies unexpectedly is replaced too.
+- Graceful drain: SIGTERM/SIGINT is passed to the workers, which stop
+  accepting, finish in-flight requests (up to ``web_graceful_timeout_seconds``)
+  and run the lifespan shutdown (audit log and email flush, engine dispose,
+  Redis close). Workers still running after ``web_shutdown_timeout_seconds``
+  are killed.
+- If a worker fails during lifespan startup the supervisor stops all workers
+  and exits, rather than respawning a worker that can't start.
+- Prometheus metrics are collected across workers (multiprocess mode, in
+  ``PROMETHEUS_MULTIPROC_DIR`` or a temporary directory).
+"""
+
+import argparse
+import gc
+import importlib.util
+import os
+import random
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+import uvicorn
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Worker exit status when the app's lifespan startup failed
+STARTUP_FAILURE = 3
+
+
+def worker_count(configured: int) -> int:
+    """Number of worker processes (``configured``, or one per usable CPU core)."""
+    if configured > 0:
+        return configured
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS
+        return os.cpu_count() or 1
+
+
+def max_requests_for_worker(max_requests: int, jitter: int) -> int | None:
+    """Request limit for a new worker (None = unlimited), jittered per worker."""
+    if max_requests <= 0:
+        return None
+    return max_requests + random.randint(0, max(jitter, 0))
+
+
+def event_loop() -> str:
+    """uvicorn loop implementation: uvloop when installed."""
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    """uvicorn HTTP implementation: httptools when installed."""
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def _prepare_metrics_dir() -> Path | None:
+    """Enable Prometheus multiprocess mode; must run before prometheus_client is imported.
+
+    Returns:
+        The temporary directory created for it, if PROMETHEUS_MULTIPROC_DIR wasn't set
+    """
+    created = None
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        created = Path(tempfile.mkdtemp(prefix="fundrbolt-metrics-"))
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = str(created)
+    # Values from a previous run would be added to this one's
+    for stale in Path(os.environ["PROMETHEUS_MULTIPROC_DIR"]).glob("*.db"):
+        stale.unlink()
+    return created
+
+
+class Supervisor:
+    """Forks, recycles and drains the worker processes."""
+
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int) -> None:
+        self.config = config
+        self.sock = sock
+        self.workers = workers
+        self.children: dict[int, float] = {}  # pid -> start time
+        self.stopping = False
+        self.exit_code = 0
+
+    def run(self) -> int:
+        """Run workers until a shutdown signal; returns the process exit code."""
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self._handle_stop)
+
+        for _ in range(self.workers):
+            self._spawn()
+        logger.info(
+            "Server started",
+            extra={
+                "workers": self.workers,
+                "loop": self.config.loop,
+                "http": self.config.http,
+                "bind": f"{self.config.host}:{self.config.port}",
+            },
+        )
+
+        deadline: float | None = None
+        while self.children:
+            self._reap()
+            if self.stopping:
+                if deadline is None:
+                    deadline = time.monotonic() + settings.web_shutdown_timeout_seconds
+                elif time.monotonic() > deadline:
+                    self._kill_remaining()
+            else:
+                while len(self.children) < self.workers:
+                    self._spawn()
+            time.sleep(0.1)
+
+        logger.info("Server stopped")
+        return self.exit_code
+
+    def _spawn(self) -> None:
+        limit = max_requests_for_worker(settings.web_max_requests, settings.web_max_requests_jitter)
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker(limit)
+        self.children[pid] = time.monotonic()
+
+    def _run_worker(self, limit: int | None) -> None:
+        """Worker process body; never returns."""
+        exit_code = 1
+        try:
+            # uvicorn installs its own handlers for a graceful shutdown
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            self.config.limit_max_requests = limit
+            server = uvicorn.Server(self.config)
+            server.run(sockets=[self.sock])
+            exit_code = 0 if server.started else STARTUP_FAILURE
+        except SystemExit as exc:  # Newer uvicorn exits from startup itself
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+        except BaseException:
+            logger.exception("Worker crashed", extra={"pid": os.getpid()})
+        finally:
+            os._exit(exit_code)
+
+    def _reap(self) -> None:
+        """Collect exited workers."""
+        # Imported late: multiprocess mode is chosen when prometheus_client is imported
+        from prometheus_client import multiprocess
+
+        while self.children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            started = self.children.pop(pid, None)
+            if started is None:
+                continue
+            multiprocess.mark_process_dead(pid)  # type: ignore[no-untyped-call]
+            exit_code = os.waitstatus_to_exitcode(status)
+            if self.stopping:
+                continue
+
+            uptime = round(time.monotonic() - started, 1)
+            if exit_code == STARTUP_FAILURE:
+                logger.error(
+                    "Worker failed to start, shutting down",
+                    extra={"pid": pid},
+                )
+                self.exit_code = STARTUP_FAILURE
+                self._stop()
+            elif exit_code == 0:
+                logger.info("Worker recycled", extra={"pid": pid, "uptime_seconds": uptime})
+            else:
+                logger.warning(
+                    "Worker exited unexpectedly, replacing it",
+                    extra={"pid": pid, "exit_code": exit_code, "uptime_seconds": uptime},
+                )
+
+    def _handle_stop(self, signum: int, frame: FrameType | None) -> None:
+        logger.info("Shutting down workers", extra={"signal": signal.Signals(signum).name})
+        self._stop()
+
+    def _stop(self) -> None:
+        if self.stopping:
+            return
+        self.stopping = True
+        for pid in self.children:
+            self._signal(pid, signal.SIGTERM)
+
+    def _kill_remaining(self) -> None:
+        for pid in self.children:
+            logger.warning("Worker did not shut down in time, killing it", extra={"pid": pid})
+            self._signal(pid, signal.SIGKILL)
+
+    @staticmethod
+    def _signal(pid: int, sig: signal.Signals) -> None:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Command line options (worker settings come from the environment)."""
+    parser = argparse.ArgumentParser(description="Run the API with pre-forked uvicorn workers")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=settings.web_concurrency)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--no-access-log", dest="access_log", action="store_false")
+    parser.add_argument(
+        "--forwarded-allow-ips",
+        default=None,
+        help="Proxies trusted for X-Forwarded-* headers (uvicorn's default: 127.0.0.1)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Preload the app, bind, and supervise the workers."""
+    args = parse_args(argv)
+    metrics_dir = _prepare_metrics_dir()
+
+    # Preload: import the app (and everything it imports) before forking
+    from app.main import app
+
+    options: dict[str, Any] = {
+        "host": args.host,
+        "port": args.port,
+        "loop": event_loop(),
+        "http": http_protocol(),
+        "lifespan": "on",
+        "log_level": args.log_level,
+        "access_log": args.access_log,
+        "proxy_headers": True,
+        "forwarded_allow_ips": args.forwarded_allow_ips,
+        "timeout_keep_alive": settings.web_keepalive_seconds,
+        "timeout_graceful_shutdown": settings.web_graceful_timeout_seconds,
+    }
+    config = uvicorn.Config(app, **options)
+    sock = config.bind_socket()
+
+    # Objects created so far are shared by the workers; keep the collector from
+    # touching (and so copying) their pages
+    gc.collect()
+    gc.freeze()
+
+    try:
+        return Supervisor(config, sock, worker_count(args.workers)).run()
+    finally:
+        sock.close()
+        if metrics_dir is not None:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
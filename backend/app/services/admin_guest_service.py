@@ -269,7 +269,7 @@ class AdminGuestService:
         # Calculate total attendees (registrants + guests)
         guests_result = await db.execute(
             select(func.count(RegistrationGuest.id))
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(EventRegistration.event_id == event_id)
         )
         total_guests = guests_result.scalar() or 0
@@ -399,6 +399,7 @@ class AdminGuestService:
                 body=body,
                 html_body=html_body,
                 email_type="guest_invitation",
+                db=db,
             )
 
             logger.info(f"Guest invitation email sent to {guest.email} for event {event.id}")
@@ -479,6 +480,7 @@ class AdminGuestService:
         # Create the guest record
         guest = RegistrationGuest(
             registration_id=admin_registration.id,
+            event_id=admin_registration.event_id,
             name=guest_data.get("name"),
             email=guest_data.get("email"),
             phone=guest_data.get("phone"),
@@ -584,6 +586,7 @@ class AdminGuestService:
                 body=body,
                 html_body=html_body,
                 email_type="admin_guest_invitation",
+                db=db,
             )
 
             # Update invitation sent timestamp
@@ -120,12 +120,8 @@ class ApplicationService:
                 detail=detail,
             )
 
-        # Update status
+        # Update status (the audit record commits with it)
         npo.status = NPOStatus.PENDING_APPROVAL
-        await db.commit()
-        await db.refresh(npo)
-
-        # Log audit event
         await AuditService.log_npo_status_changed(
             db=db,
             npo_id=npo_id,
@@ -136,6 +132,8 @@ class ApplicationService:
             changed_by_email=npo.creator.email,
             notes="Application submitted for review",
         )
+        await db.commit()
+        await db.refresh(npo)
 
         logger.info(
             f"NPO application submitted: {npo.name} (ID: {npo_id})",
@@ -207,10 +205,7 @@ class ApplicationService:
         else:  # reject
             npo.status = NPOStatus.REJECTED
 
-        await db.commit()
-        await db.refresh(npo)
-
-        # Log audit event
+        # Log audit event in the same transaction as the status change
         reviewer = await db.get(User, reviewer_id)
         if not reviewer:
             raise HTTPException(status_code=404, detail="Reviewer not found")
@@ -223,6 +218,8 @@ class ApplicationService:
             reviewed_by_user_id=reviewer_id,
             reviewed_by_email=reviewer.email,
         )
+        await db.commit()
+        await db.refresh(npo)
 
         logger.info(
             f"NPO application {decision}d: {npo.name} (ID: {npo_id})",
@@ -2,7 +2,8 @@
 
 This service handles:
 - Image/video uploads for auction items
-- Thumbnail generation for images (200x200 and 800x600)
+- Responsive derivatives for images (width ladder in AVIF/WebP + JPEG, plus a
+  200x200 card thumbnail), rendered from a single decode in a worker pool
 - Image validation (type, size, dimensions)
 - Video validation (type, size)
 - Azure Blob Storage SAS URL generation
@@ -10,30 +11,29 @@ This service handles:
 - Media deletion
 """
 
+import asyncio
 import hashlib
 import uuid
 from datetime import datetime, timedelta
-from io import BytesIO
 from pathlib import Path
-from typing import Any
-
-from azure.storage.blob import (
-    BlobSasPermissions,
-    BlobServiceClient,
-    ContentSettings,
-    generate_blob_sas,
-)
-from PIL import Image
+from typing import TYPE_CHECKING, Any
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings
+from app.core.reorder import reorder_rows
+from app.core.tracing import BLOB_CLIENT_HOOKS
 from app.models.auction_item import AuctionItemMedia
+from app.services.image_derivative_service import ImageDerivativeService
+
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient
 
 
 class AuctionItemMediaService:
     """Service for handling auction item media uploads and management."""
 
-    blob_service_client: BlobServiceClient | None
+    blob_service_client: "BlobServiceClient | None"
 
     # Allowed image MIME types
     ALLOWED_IMAGE_TYPES = {
@@ -66,7 +66,7 @@ class AuctionItemMediaService:
 
     # Thumbnail sizes
     THUMBNAIL_SMALL = (200, 200)  # Grid/card view
-    THUMBNAIL_LARGE = (800, 600)  # Detail view
+    THUMBNAIL_LARGE = (800, 600)  # Detail view (legacy; replaced by derivatives)
 
     # Media count limits per auction item
     MAX_IMAGES_PER_ITEM = 20
@@ -88,8 +88,10 @@ class AuctionItemMediaService:
 
         # Initialize blob service client if connection string is provided
         if settings.azure_storage_connection_string:
+            from azure.storage.blob import BlobServiceClient
+
             self.blob_service_client = BlobServiceClient.from_connection_string(
-                settings.azure_storage_connection_string
+                settings.azure_storage_connection_string, **BLOB_CLIENT_HOOKS
             )
         else:
             self.blob_service_client = None
@@ -111,6 +113,8 @@ class AuctionItemMediaService:
         Raises:
             ValueError: If Azure Blob Storage is not configured
         """
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         if not self.blob_service_client or not self.settings.azure_storage_account_name:
             raise ValueError("Azure Blob Storage not configured")
 
@@ -140,6 +144,50 @@ class AuctionItemMediaService:
         )
         return f"{blob_client.url}?{sas_token}"
 
+    def signed_url(self, url: str | None, expiry_hours: float = 24.0) -> str | None:
+        """SAS read URL for a stored Azure blob URL.
+
+        Args:
+            url: Stored media URL (Azure blob URL or local path)
+            expiry_hours: Hours until the SAS URL expires
+
+        Returns:
+            Signed URL, or the URL unchanged if it isn't a blob in our
+            container or SAS isn't available
+        """
+        if not url or not url.startswith("https://"):
+            return url
+        parts = url.split(f"{self.container_name}/", 1)
+        if len(parts) < 2:
+            return url
+        try:
+            return self._generate_blob_sas_url(parts[1].split("?")[0], expiry_hours=expiry_hours)
+        except ValueError:
+            return url
+
+    def sign_derivatives(
+        self, entries: list[dict[str, Any]] | None, expiry_hours: float = 24.0
+    ) -> list[dict[str, Any]] | None:
+        """Derivative metadata with SAS read URLs (unsigned URLs if SAS isn't available).
+
+        Args:
+            entries: Stored derivative metadata
+            expiry_hours: Hours until the SAS URLs expire
+
+        Returns:
+            Entries with signed URLs, or None for media without derivatives
+        """
+        if entries is None:
+            return None
+        signed = []
+        for entry in entries:
+            try:
+                url = self._generate_blob_sas_url(entry["blob_name"], expiry_hours=expiry_hours)
+            except ValueError:
+                url = entry["url"]
+            signed.append({**entry, "url": url})
+        return signed
+
     def _validate_file_type(
         self, content_type: str, file_name: str, media_type: str
     ) -> tuple[bool, str | None]:
@@ -218,43 +266,6 @@ class AuctionItemMediaService:
 
         return True, None
 
-    def _validate_image_dimensions(
-        self, file_content: bytes
-    ) -> tuple[bool, str | None, tuple[int, int] | None]:
-        """Validate image dimensions using PIL.
-
-        Args:
-            file_content: Image file content as bytes
-
-        Returns:
-            Tuple of (is_valid, error_message, dimensions)
-            dimensions is (width, height) tuple or None if invalid
-        """
-        try:
-            image = Image.open(BytesIO(file_content))
-            width, height = image.size
-
-            # Check minimum dimensions
-            if width < self.MIN_IMAGE_WIDTH or height < self.MIN_IMAGE_HEIGHT:
-                return (
-                    False,
-                    f"Image too small. Minimum: {self.MIN_IMAGE_WIDTH}x{self.MIN_IMAGE_HEIGHT}px",
-                    None,
-                )
-
-            # Check maximum dimensions
-            if width > self.MAX_IMAGE_WIDTH or height > self.MAX_IMAGE_HEIGHT:
-                return (
-                    False,
-                    f"Image too large. Maximum: {self.MAX_IMAGE_WIDTH}x{self.MAX_IMAGE_HEIGHT}px",
-                    None,
-                )
-
-            return True, None, (width, height)
-
-        except Exception as e:
-            return False, f"Invalid image file: {str(e)}", None
-
     async def _validate_media_count(
         self, auction_item_id: uuid.UUID, media_type: str
     ) -> tuple[bool, str | None]:
@@ -333,90 +344,65 @@ class AuctionItemMediaService:
         # Add size suffix
         return f"{base_name}_thumb_{size[0]}x{size[1]}.{ext}"
 
-    async def _generate_thumbnails(
+    async def _process_image(
         self, file_content: bytes, original_blob_name: str
-    ) -> dict[str, str]:
-        """Generate thumbnails for an image.
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Validate an image and upload its thumbnail and responsive derivatives.
+
+        The image is decoded once (in the image worker pool) for the dimension
+        check, the card thumbnail and every derivative.
 
         Args:
             file_content: Original image content as bytes
             original_blob_name: Original blob name
 
         Returns:
-            Dict with thumbnail URLs: {'small': url, 'large': url}
+            Tuple of (small thumbnail URL, derivative metadata entries)
 
         Raises:
-            ValueError: If thumbnail generation fails
+            ValueError: If the image is invalid or processing fails
         """
+        from azure.storage.blob import ContentSettings
+
         if not self.blob_service_client:
             raise ValueError("Azure Blob Storage not configured for thumbnail generation")
 
+        rendered = await ImageDerivativeService.render(
+            file_content,
+            min_size=(self.MIN_IMAGE_WIDTH, self.MIN_IMAGE_HEIGHT),
+            max_size=(self.MAX_IMAGE_WIDTH, self.MAX_IMAGE_HEIGHT),
+            thumbnail_size=self.THUMBNAIL_SMALL,
+        )
+        if rendered.thumbnail is None:
+            raise ValueError("Thumbnail was not rendered")
+
         try:
-            # Open original image
-            img = Image.open(BytesIO(file_content))
-
-            # Convert RGBA to RGB if needed (for JPEG compatibility)
-            image: Image.Image
-            if img.mode == "RGBA":
-                background = Image.new("RGB", img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[3])  # Use alpha channel as mask
-                image = background
-            else:
-                image = img.convert("RGB") if img.mode != "RGB" else img
-
-            thumbnails = {}
-
-            # Generate small thumbnail (200x200)
-            small_thumb = image.copy()
-            small_thumb.thumbnail(self.THUMBNAIL_SMALL, Image.Resampling.LANCZOS)
+            # Upload small thumbnail (200x200)
             small_blob_name = self._generate_thumbnail_blob_name(
                 original_blob_name, self.THUMBNAIL_SMALL
             )
-
-            # Upload small thumbnail
-            small_buffer = BytesIO()
-            small_thumb.save(small_buffer, format="JPEG", quality=85)
-            small_buffer.seek(0)
-
             small_blob_client = self.blob_service_client.get_blob_client(
                 container=self.container_name, blob=small_blob_name
             )
-            small_blob_client.upload_blob(
-                small_buffer.read(),
+            await asyncio.to_thread(
+                small_blob_client.upload_blob,
+                rendered.thumbnail.data,
                 blob_type="BlockBlob",
                 content_settings=ContentSettings(content_type="image/jpeg"),
                 overwrite=True,
             )
-            thumbnails["small"] = str(small_blob_client.url)
 
-            # Generate large thumbnail (800x600)
-            large_thumb = image.copy()
-            large_thumb.thumbnail(self.THUMBNAIL_LARGE, Image.Resampling.LANCZOS)
-            large_blob_name = self._generate_thumbnail_blob_name(
-                original_blob_name, self.THUMBNAIL_LARGE
+            derivatives = await ImageDerivativeService.upload(
+                self.blob_service_client,
+                self.container_name,
+                original_blob_name,
+                rendered.derivatives,
             )
-
-            # Upload large thumbnail
-            large_buffer = BytesIO()
-            large_thumb.save(large_buffer, format="JPEG", quality=90)
-            large_buffer.seek(0)
-
-            large_blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name, blob=large_blob_name
-            )
-            large_blob_client.upload_blob(
-                large_buffer.read(),
-                blob_type="BlockBlob",
-                content_settings=ContentSettings(content_type="image/jpeg"),
-                overwrite=True,
-            )
-            thumbnails["large"] = str(large_blob_client.url)
-
-            return thumbnails
-
         except Exception as e:
             raise ValueError(f"Failed to generate thumbnails: {str(e)}")
 
+        return str(small_blob_client.url), derivatives
+
     def _get_account_key(self) -> str:
         """Extract account key from connection string.
 
@@ -465,6 +451,8 @@ class AuctionItemMediaService:
         Raises:
             ValueError: If validation fails or Azure not configured
         """
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         # Validate file type
         is_valid, error = self._validate_file_type(content_type, file_name, media_type)
         if not is_valid:
@@ -577,25 +565,16 @@ class AuctionItemMediaService:
 
         # Initialize thumbnail path
         thumbnail_path = None
+        derivatives = None
 
-        # Generate thumbnails for images
+        # Validate images and generate thumbnail + derivatives
         if media_type == "image":
             try:
                 # Download the uploaded file
-                blob_data = blob_client.download_blob().readall()
-
-                # Validate image dimensions
-                is_valid, error, _ = self._validate_image_dimensions(blob_data)
-                if not is_valid:
-                    # Delete the uploaded blob since validation failed
-                    blob_client.delete_blob()
-                    raise ValueError(error)
-
-                # Generate thumbnails
-                thumbnails = await self._generate_thumbnails(blob_data, blob_name)
+                blob_data = await asyncio.to_thread(lambda: blob_client.download_blob().readall())
 
                 # Store small thumbnail URL (used for cards/lists)
-                thumbnail_path = thumbnails.get("small")
+                thumbnail_path, derivatives = await self._process_image(blob_data, blob_name)
 
             except Exception as e:
                 # Clean up the uploaded blob if thumbnail generation fails
@@ -615,6 +594,7 @@ class AuctionItemMediaService:
             mime_type=content_type,
             display_order=display_order,
             thumbnail_path=thumbnail_path,
+            derivatives=derivatives,
             video_url=video_url,
         )
 
@@ -639,31 +619,31 @@ class AuctionItemMediaService:
         Raises:
             ValueError: If media IDs don't belong to the auction item
         """
-        from sqlalchemy import select
-
-        # Fetch all media for this auction item
-        stmt = select(AuctionItemMedia).where(AuctionItemMedia.auction_item_id == auction_item_id)
-        result = await self.db.execute(stmt)
-        media_items = result.scalars().all()
-
-        # Verify all media IDs belong to this item
-        media_ids = {m.id for m in media_items}
-        if set(media_order) != media_ids:
-            raise ValueError("Invalid media IDs in order list")
+        from sqlalchemy import func, select
 
-        # Update display_order
-        media_by_id = {m.id: m for m in media_items}
-        for index, media_id in enumerate(media_order):
-            media_by_id[media_id].display_order = index
+        # One UPDATE ... FROM (VALUES ...) RETURNING for all positions
+        try:
+            media_items = await reorder_rows(
+                self.db,
+                AuctionItemMedia,
+                media_order,
+                AuctionItemMedia.auction_item_id == auction_item_id,
+            )
+            # Every media item of the auction item must be included
+            total = await self.db.scalar(
+                select(func.count())
+                .select_from(AuctionItemMedia)
+                .where(AuctionItemMedia.auction_item_id == auction_item_id)
+            )
+            if total != len(media_order):
+                raise ValueError("Invalid media IDs in order list")
+        except ValueError:
+            await self.db.rollback()
+            raise
 
         await self.db.commit()
 
-        # Refresh all media items to get updated_at timestamps
-        for media_id in media_order:
-            await self.db.refresh(media_by_id[media_id])
-
-        # Return in new order
-        return [media_by_id[media_id] for media_id in media_order]
+        return media_items
 
     async def delete_media(self, auction_item_id: uuid.UUID, media_id: uuid.UUID) -> bool:
         """Delete media item and associated files from Azure Blob Storage.
@@ -729,6 +709,10 @@ class AuctionItemMediaService:
                     except Exception:
                         pass  # Thumbnail might not exist
 
+                    ImageDerivativeService.delete(
+                        self.blob_service_client, self.container_name, media.derivatives
+                    )
+
             except Exception:
                 pass  # Continue with DB deletion even if blob deletion fails
 
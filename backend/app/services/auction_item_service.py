@@ -1,21 +1,121 @@
 """Service for auction item operations."""
 
+import csv
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select, text
+from pydantic import ValidationError
+from sqlalchemy import Select, Sequence, String, event, func, insert, select
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.models.auction_item import AuctionItem, AuctionType, ItemStatus
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.schema import CreateSequence
+
+from app.core.http_cache import ResourceVersion, resource_version
+from app.core.pagination import (
+    KeysetPage,
+    SortKey,
+    TotalMode,
+    count_total,
+    order_by_keys,
+    paginate_keyset,
+)
+from app.models.auction_item import AuctionItem, AuctionItemMedia, AuctionType, ItemStatus
 from app.models.event import Event
-from app.schemas.auction_item import AuctionItemCreate, AuctionItemUpdate
+from app.schemas.auction_item import (
+    MAX_IMPORT_ITEMS,
+    AuctionItemCreate,
+    AuctionItemUpdate,
+)
 from app.services.audit_service import AuditService
+from app.services.event_change_feed import AUCTION_ITEMS, queue_event_change
 
 logger = logging.getLogger(__name__)
 
+# Sorts NULL display_priority after every real priority (keyset keys must be non-null)
+_NULL_PRIORITY = 2**31 - 1
+
+# Bid number sequences known to exist, so creates skip the DDL
+_known_bid_sequences: set[str] = set()
+# Sequences created in a session's open transaction (known once it commits)
+_PENDING_SEQUENCES_KEY = "bid_number_sequences_created"
+
+
+class AuctionItemImportError(ValueError):
+    """Import rows that failed validation; nothing was written."""
+
+    def __init__(self, errors: list[dict[str, Any]]) -> None:
+        super().__init__(f"{len(errors)} import rows are invalid")
+        self.errors = errors
+
+
+def bid_number_sequence(event_id: UUID) -> Sequence:
+    """PostgreSQL sequence handing out an event's bid numbers (100-999)."""
+    return Sequence(
+        f"event_{str(event_id).replace('-', '_')}_bid_number_seq",
+        start=100,
+        minvalue=100,
+        maxvalue=999,
+    )
+
+
+def parse_import_csv(lines: Iterable[str]) -> list[AuctionItemCreate]:
+    """Parse and validate a CSV import one row at a time.
+
+    The header names AuctionItemCreate fields; empty cells take the field's
+    default.
+
+    Args:
+        lines: CSV text lines (e.g. an uploaded file opened in text mode)
+
+    Returns:
+        Validated rows, in file order
+
+    Raises:
+        AuctionItemImportError: If the file has too many rows or any row is
+            invalid (every invalid row is reported)
+    """
+    rows: list[AuctionItemCreate] = []
+    errors: list[dict[str, Any]] = []
+    for row_number, record in enumerate(csv.DictReader(lines), start=1):
+        if row_number > MAX_IMPORT_ITEMS:
+            raise AuctionItemImportError(
+                [{"row": row_number, "error": f"Imports are limited to {MAX_IMPORT_ITEMS} items"}]
+            )
+        try:
+            rows.append(
+                AuctionItemCreate.model_validate(
+                    {field: value for field, value in record.items() if field and value}
+                )
+            )
+        except ValidationError as e:
+            errors.append(
+                {
+                    "row": row_number,
+                    "error": e.errors(
+                        include_url=False, include_context=False, include_input=False
+                    ),
+                }
+            )
+    if errors:
+        raise AuctionItemImportError(errors)
+    return rows
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_created_sequences(session: Session) -> None:
+    _known_bid_sequences.update(session.info.pop(_PENDING_SEQUENCES_KEY, ()))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_created_sequences(session: Session, previous_transaction: Any) -> None:
+    # Also for savepoints: the CREATE may have been rolled back with them
+    session.info.pop(_PENDING_SEQUENCES_KEY, None)
+
 
 def calculate_bid_increment(starting_bid: Decimal) -> Decimal:
     """Calculate bid increment based on starting bid amount.
@@ -59,82 +159,134 @@ class AuctionItemService:
         """
         self.db = db
 
-    async def _ensure_bid_number_sequence(self, event_id: UUID) -> None:
+    async def _ensure_bid_number_sequence(self, event_id: UUID) -> Sequence:
         """Ensure PostgreSQL sequence exists for event bid numbers.
 
-        Creates a sequence named 'event_{event_id}_bid_number_seq' starting at 100.
-        This sequence handles concurrent bid number assignment atomically.
+        Creates a sequence named 'event_{event_id}_bid_number_seq' (100-999)
+        the first time this process sees the event. Sequences are never
+        dropped, so once one is committed later calls skip the DDL entirely.
 
         Args:
             event_id: UUID of the event
 
+        Returns:
+            The event's bid number sequence
+
         Raises:
             ValueError: If sequence cannot be created
         """
-        sequence_name = f"event_{str(event_id).replace('-', '_')}_bid_number_seq"
+        sequence = bid_number_sequence(event_id)
+        if sequence.name in _known_bid_sequences:
+            return sequence
 
         try:
-            # Check if sequence exists
-            check_query = text(
-                "SELECT EXISTS (SELECT 1 FROM pg_sequences WHERE schemaname = 'public' AND sequencename = :seq_name)"
-            )
-            result = await self.db.execute(check_query, {"seq_name": sequence_name})
-            exists = result.scalar()
-
-            if not exists:
-                # Create sequence starting at 100 (3-digit bid numbers: 100-999)
-                # Note: Sequence creation is transactional and will be committed with the main transaction
-                create_query = text(
-                    f"CREATE SEQUENCE {sequence_name} START 100 MINVALUE 100 MAXVALUE 999"
-                )
-                await self.db.execute(create_query)
-                logger.info(f"Created bid number sequence {sequence_name} for event {event_id}")
-
+            # Transactional: committed (or rolled back) with the item insert
+            await self.db.execute(CreateSequence(sequence, if_not_exists=True))
         except Exception as e:
             logger.error(f"Failed to create bid number sequence: {e}")
             raise ValueError(f"Failed to ensure bid number sequence: {e}") from e
 
-    async def _get_next_bid_number(self, event_id: UUID) -> int:
-        """Get next available bid number for an event.
+        self.db.info.setdefault(_PENDING_SEQUENCES_KEY, set()).add(sequence.name)
+        return sequence
 
-        Uses PostgreSQL sequence to atomically assign bid numbers.
-        Handles concurrency automatically via database-level locking.
+    async def _allocate_bid_numbers(self, event_id: UUID, count: int) -> list[int]:
+        """Allocate a block of bid numbers for an event in one round trip.
+
+        Numbers come from the event's sequence, so concurrent creates and
+        imports never collide. Like any sequence value they are not reused if
+        the transaction rolls back.
 
         Args:
             event_id: UUID of the event
+            count: How many bid numbers to allocate
 
         Returns:
-            Next bid number (100-999)
+            Bid numbers (100-999), ascending
 
         Raises:
             ValueError: If max bid numbers (999) reached for event
         """
-        # Ensure sequence exists
-        await self._ensure_bid_number_sequence(event_id)
+        sequence = await self._ensure_bid_number_sequence(event_id)
 
-        sequence_name = f"event_{str(event_id).replace('-', '_')}_bid_number_seq"
+        query = select(sequence.next_value())
+        if count > 1:
+            query = query.select_from(func.generate_series(1, count))
 
         try:
-            # Get next value from sequence (atomic operation)
-            query = text(f"SELECT nextval('{sequence_name}')")
             result = await self.db.execute(query)
-            bid_number = result.scalar()
+        except DBAPIError as e:
+            # The sequence may have been dropped by hand; recheck next time
+            _known_bid_sequences.discard(sequence.name)
+            if "maximum value" in str(e):
+                logger.error(f"Event {event_id} has exceeded maximum bid numbers (999)")
+                raise ValueError("Event has reached maximum auction items (900 items limit)") from e
+            logger.error(f"Failed to get next bid number: {e}")
+            raise ValueError(f"Failed to assign bid number: {e}") from e
 
-            # Ensure bid_number is valid
-            if bid_number is None:
-                raise ValueError("Failed to get bid number from sequence")
+        return sorted(int(bid_number) for bid_number in result.scalars())
 
-            bid_number = int(bid_number)  # Convert to int for type safety
+    async def _get_next_bid_number(self, event_id: UUID) -> int:
+        """Get next available bid number for an event.
 
-            if bid_number > 999:
-                logger.error(f"Event {event_id} has exceeded maximum bid numbers (999)")
-                raise ValueError("Event has reached maximum auction items (900 items limit)")
+        Args:
+            event_id: UUID of the event
 
-            return bid_number
+        Returns:
+            Next bid number (100-999)
 
-        except Exception as e:
-            logger.error(f"Failed to get next bid number: {e}")
-            raise ValueError(f"Failed to assign bid number: {e}") from e
+        Raises:
+            ValueError: If max bid numbers (999) reached for event
+        """
+        [bid_number] = await self._allocate_bid_numbers(event_id, 1)
+        return bid_number
+
+    @staticmethod
+    def _validate_buy_now(item_data: AuctionItemCreate) -> None:
+        """Cross-field validation (deferred from Pydantic schema).
+
+        Raises:
+            ValueError: If the buy now price is below the starting bid or set
+                without buy now enabled
+        """
+        if item_data.buy_now_price is not None:
+            if item_data.buy_now_price < item_data.starting_bid:
+                raise ValueError(
+                    f"Buy now price (${item_data.buy_now_price}) must be >= starting bid (${item_data.starting_bid})"
+                )
+
+            if not item_data.buy_now_enabled:
+                raise ValueError("buy_now_enabled must be True when buy_now_price is set")
+
+    @staticmethod
+    def _new_item_values(
+        event_id: UUID, item_data: AuctionItemCreate, bid_number: int, created_by: UUID
+    ) -> dict[str, Any]:
+        """Column values for a new auction item."""
+        # Auto-calculate bid_increment if not provided or set to default
+        bid_increment = item_data.bid_increment
+        if bid_increment == Decimal("50.00"):  # Default value
+            bid_increment = calculate_bid_increment(item_data.starting_bid)
+
+        return {
+            "event_id": event_id,
+            "bid_number": bid_number,
+            "title": item_data.title,
+            "description": item_data.description,
+            "auction_type": item_data.auction_type,
+            "starting_bid": item_data.starting_bid,
+            "bid_increment": bid_increment,
+            "donor_value": item_data.donor_value,
+            "cost": item_data.cost,
+            "buy_now_price": item_data.buy_now_price,
+            "buy_now_enabled": item_data.buy_now_enabled,
+            "quantity_available": item_data.quantity_available,
+            "donated_by": item_data.donated_by,
+            "sponsor_id": item_data.sponsor_id,
+            "item_webpage": item_data.item_webpage,
+            "display_priority": item_data.display_priority,
+            "status": ItemStatus.DRAFT,  # New items start as draft
+            "created_by": created_by,
+        }
 
     async def create_auction_item(
         self,
@@ -163,44 +315,13 @@ class AuctionItemService:
         if not event:
             raise ValueError(f"Event {event_id} not found")
 
-        # Cross-field validation (deferred from Pydantic schema)
-        if item_data.buy_now_price is not None:
-            if item_data.buy_now_price < item_data.starting_bid:
-                raise ValueError(
-                    f"Buy now price (${item_data.buy_now_price}) must be >= starting bid (${item_data.starting_bid})"
-                )
-
-            if not item_data.buy_now_enabled:
-                raise ValueError("buy_now_enabled must be True when buy_now_price is set")
+        self._validate_buy_now(item_data)
 
         # Get next bid number (atomic)
         bid_number = await self._get_next_bid_number(event_id)
 
-        # Auto-calculate bid_increment if not provided or set to default
-        bid_increment = item_data.bid_increment
-        if bid_increment == Decimal("50.00"):  # Default value
-            bid_increment = calculate_bid_increment(item_data.starting_bid)
-
-        # Create auction item
         auction_item = AuctionItem(
-            event_id=event_id,
-            bid_number=bid_number,
-            title=item_data.title,
-            description=item_data.description,
-            auction_type=item_data.auction_type,
-            starting_bid=item_data.starting_bid,
-            bid_increment=bid_increment,
-            donor_value=item_data.donor_value,
-            cost=item_data.cost,
-            buy_now_price=item_data.buy_now_price,
-            buy_now_enabled=item_data.buy_now_enabled,
-            quantity_available=item_data.quantity_available,
-            donated_by=item_data.donated_by,
-            sponsor_id=item_data.sponsor_id,
-            item_webpage=item_data.item_webpage,
-            display_priority=item_data.display_priority,
-            status=ItemStatus.DRAFT,  # New items start as draft
-            created_by=created_by,
+            **self._new_item_values(event_id, item_data, bid_number, created_by)
         )
 
         self.db.add(auction_item)
@@ -229,6 +350,86 @@ class AuctionItemService:
             logger.error(f"Failed to create auction item: {e}")
             raise ValueError(f"Failed to create auction item: {e}") from e
 
+    async def import_auction_items(
+        self,
+        event_id: UUID,
+        rows: list[AuctionItemCreate],
+        created_by: UUID,
+    ) -> list[AuctionItem]:
+        """Create many auction items at once.
+
+        All rows are validated before anything is written; bid numbers are
+        allocated as one block in row order, and items and audit records are
+        inserted in batched statements and one commit. Media is uploaded per
+        item afterwards, so it gets the upload's validation and derivatives.
+
+        Args:
+            event_id: UUID of the event
+            rows: Items to create, in bid number order
+            created_by: UUID of the user importing the items
+
+        Returns:
+            Created AuctionItem instances, in row order
+
+        Raises:
+            AuctionItemImportError: If any row fails validation
+            ValueError: If the event doesn't exist, bid numbers run out or
+                the insert fails
+        """
+        event_exists = await self.db.scalar(select(Event.id).where(Event.id == event_id))
+        if event_exists is None:
+            raise ValueError(f"Event {event_id} not found")
+
+        errors: list[dict[str, Any]] = []
+        for row_number, row in enumerate(rows, start=1):
+            try:
+                self._validate_buy_now(row)
+            except ValueError as e:
+                errors.append({"row": row_number, "error": str(e)})
+        if errors:
+            raise AuctionItemImportError(errors)
+        if not rows:
+            return []
+
+        bid_numbers = await self._allocate_bid_numbers(event_id, len(rows))
+
+        try:
+            result = await self.db.execute(
+                insert(AuctionItem).returning(AuctionItem, sort_by_parameter_order=True),
+                [
+                    self._new_item_values(event_id, row, bid_number, created_by)
+                    for row, bid_number in zip(rows, bid_numbers, strict=True)
+                ],
+            )
+            items = list(result.scalars().all())
+
+            # Bulk inserts bypass flush-time change tracking
+            queue_event_change(
+                self.db, event_id, AUCTION_ITEMS, item_ids=[item.id for item in items]
+            )
+            for item in items:
+                await AuditService.log_auction_item_created(
+                    db=self.db,
+                    item_id=item.id,
+                    event_id=event_id,
+                    bid_number=item.bid_number,
+                    title=item.title,
+                    created_by_user_id=created_by,
+                    same_transaction=True,
+                )
+            await self.db.commit()
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to import auction items: {e}")
+            raise ValueError(f"Failed to import auction items: {e}") from e
+
+        logger.info(
+            f"Imported {len(items)} auction items with bid numbers "
+            f"{bid_numbers[0]}-{bid_numbers[-1]} for event {event_id}"
+        )
+        return items
+
     async def get_auction_item_by_id(
         self,
         item_id: UUID,
@@ -239,30 +440,132 @@ class AuctionItemService:
 
         Args:
             item_id: UUID of the auction item
-            include_media: Whether to eagerly load media files (not yet implemented)
+            include_media: Whether to eagerly load media files (in display order)
             include_sponsor: Whether to eagerly load sponsor details (not yet implemented)
 
         Returns:
             AuctionItem instance or None if not found
 
         Note:
-            include_media and include_sponsor are placeholders for future functionality.
-            Currently these parameters are ignored.
+            include_sponsor is a placeholder for future functionality and is
+            currently ignored.
         """
         query = select(AuctionItem).where(
             AuctionItem.id == item_id,
             AuctionItem.deleted_at.is_(None),
         )
 
-        # TODO: Implement eager loading when media/sponsor endpoints are ready
-        # if include_media:
-        #     query = query.options(joinedload(AuctionItem.media))
+        if include_media:
+            query = query.options(selectinload(AuctionItem.media))
+        # TODO: Implement sponsor eager loading when sponsor display is ready
         # if include_sponsor:
         #     query = query.options(joinedload(AuctionItem.sponsor))
 
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_primary_images(self, item_ids: list[UUID]) -> dict[UUID, str]:
+        """Get each item's primary image (its first image by display_order).
+
+        One query for a whole page of items instead of one per item.
+
+        Args:
+            item_ids: UUIDs of the auction items
+
+        Returns:
+            Stored file URL of the primary image by item id (items without
+            images are missing)
+        """
+        if not item_ids:
+            return {}
+        query = (
+            select(AuctionItemMedia.auction_item_id, AuctionItemMedia.file_path)
+            .where(
+                AuctionItemMedia.auction_item_id.in_(item_ids),
+                AuctionItemMedia.media_type == "image",
+            )
+            .order_by(AuctionItemMedia.auction_item_id, AuctionItemMedia.display_order)
+            .distinct(AuctionItemMedia.auction_item_id)
+        )
+        result = await self.db.execute(query)
+        return dict(result.tuples().all())
+
+    async def get_catalog_version(self, event_id: UUID, *params: object) -> ResourceVersion:
+        """Get validators for an event's auction catalog without loading items.
+
+        Aggregates count/max(updated_at) over the event's items (soft-deleted
+        rows included, since deletion bumps updated_at) and their media.
+
+        Args:
+            event_id: UUID of the event
+            params: Request parameters that shape the listing (filters, page,
+                draft visibility) and so must be part of the ETag
+
+        Returns:
+            ResourceVersion for the catalog listing
+        """
+        item_ids = select(AuctionItem.id).where(AuctionItem.event_id == event_id)
+        query = select(
+            select(func.count(AuctionItem.id), func.max(AuctionItem.updated_at))
+            .where(AuctionItem.event_id == event_id)
+            .subquery(),
+            select(func.count(AuctionItemMedia.id), func.max(AuctionItemMedia.updated_at))
+            .where(AuctionItemMedia.auction_item_id.in_(item_ids))
+            .subquery(),
+        )
+        item_count, items_updated, media_count, media_updated = (await self.db.execute(query)).one()
+
+        stamps = [value for value in (items_updated, media_updated) if value is not None]
+        return resource_version(
+            "auction_items",
+            event_id,
+            item_count,
+            items_updated,
+            media_count,
+            media_updated,
+            *params,
+            last_modified=max(stamps) if stamps else None,
+            signed_urls=True,
+        )
+
+    async def get_item_version(self, event_id: UUID, item_id: UUID) -> ResourceVersion | None:
+        """Get validators for a single auction item and its media.
+
+        Args:
+            event_id: UUID of the event the item must belong to
+            item_id: UUID of the auction item
+
+        Returns:
+            ResourceVersion, or None if the item is missing, deleted or in another event
+        """
+        query = select(
+            AuctionItem.updated_at,
+            select(func.count(AuctionItemMedia.id))
+            .where(AuctionItemMedia.auction_item_id == item_id)
+            .scalar_subquery(),
+            select(func.max(AuctionItemMedia.updated_at))
+            .where(AuctionItemMedia.auction_item_id == item_id)
+            .scalar_subquery(),
+        ).where(
+            AuctionItem.id == item_id,
+            AuctionItem.event_id == event_id,
+            AuctionItem.deleted_at.is_(None),
+        )
+        row = (await self.db.execute(query)).one_or_none()
+        if row is None:
+            return None
+
+        item_updated, media_count, media_updated = row
+        return resource_version(
+            "auction_item",
+            item_id,
+            item_updated,
+            media_count,
+            media_updated,
+            last_modified=max(filter(None, (item_updated, media_updated))),
+            signed_urls=True,
+        )
+
     async def list_auction_items(
         self,
         event_id: UUID,
@@ -295,6 +598,94 @@ class AuctionItemService:
         if limit < 1 or limit > 100:
             limit = 50
 
+        query = self._list_query(event_id, auction_type, status, search, include_drafts)
+
+        # Get total count
+        total = await count_total(self.db, query, "exact", scope="auction_items") or 0
+
+        # Apply sorting and pagination
+        query = order_by_keys(query, self._sort_keys(sort_by))
+        query = query.offset((page - 1) * limit).limit(limit)
+
+        # Execute query
+        result = await self.db.execute(query)
+        items = list(result.scalars().all())
+
+        return items, total
+
+    async def list_auction_items_keyset(
+        self,
+        event_id: UUID,
+        auction_type: AuctionType | None = None,
+        status: ItemStatus | None = None,
+        search: str | None = None,
+        sort_by: str = "highest_bid",
+        cursor: str | None = None,
+        limit: int = 50,
+        include_drafts: bool = False,
+        total_mode: TotalMode = "none",
+    ) -> KeysetPage[AuctionItem]:
+        """List auction items with keyset (cursor) pagination for infinite scroll.
+
+        Args:
+            event_id: UUID of the event
+            auction_type: Filter by auction type (live/silent)
+            status: Filter by status
+            search: Search by title or bid number
+            sort_by: Sort field - 'highest_bid' (default) or 'newest'
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Items per page (max 100)
+            include_drafts: Whether to include draft items (requires auth)
+            total_mode: How to compute the total (exact, cached, estimate, none)
+
+        Returns:
+            KeysetPage of auction items
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another sort order
+        """
+        if limit < 1 or limit > 100:
+            limit = 50
+
+        return await paginate_keyset(
+            self.db,
+            self._list_query(event_id, auction_type, status, search, include_drafts),
+            self._sort_keys(sort_by),
+            scope=f"auction_items:{sort_by}",
+            cursor=cursor,
+            limit=limit,
+            total_mode=total_mode,
+        )
+
+    @staticmethod
+    def _sort_keys(sort_by: str) -> tuple[SortKey, ...]:
+        """Sort keys for a sort_by value ('newest' or 'highest_bid')."""
+        if sort_by == "newest":
+            # Most recently created first
+            return (
+                SortKey(AuctionItem.created_at, descending=True),
+                SortKey(AuctionItem.bid_number),
+                SortKey(AuctionItem.id),
+            )
+        # Default: "highest_bid"
+        # Highest starting bid first (current_bid tracking will be added later)
+        # Secondary sort by display_priority (NULLs last) and bid_number for consistent ordering
+        return (
+            SortKey(AuctionItem.starting_bid, descending=True),
+            SortKey(func.coalesce(AuctionItem.display_priority, _NULL_PRIORITY)),
+            SortKey(AuctionItem.bid_number),
+            SortKey(AuctionItem.id),
+        )
+
+    @staticmethod
+    def _list_query(
+        event_id: UUID,
+        auction_type: AuctionType | None,
+        status: ItemStatus | None,
+        search: str | None,
+        include_drafts: bool,
+    ) -> Select[Any]:
+        """Build the filtered (unordered, unpaginated) auction item listing query."""
         # Base query
         query = select(AuctionItem).where(
             AuctionItem.event_id == event_id,
@@ -313,40 +704,13 @@ class AuctionItemService:
 
         # Search by title or bid number
         if search:
-            from sqlalchemy import String
-
             search_term = f"%{search}%"
             query = query.where(
                 (AuctionItem.title.ilike(search_term))
                 | (AuctionItem.bid_number.cast(String).like(search_term))
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply sorting based on sort_by parameter
-        if sort_by == "newest":
-            # Most recently created first
-            query = query.order_by(AuctionItem.created_at.desc(), AuctionItem.bid_number.asc())
-        else:  # Default: "highest_bid"
-            # Highest starting bid first (current_bid tracking will be added later)
-            # Secondary sort by display_priority and bid_number for consistent ordering
-            query = query.order_by(
-                AuctionItem.starting_bid.desc().nulls_last(),
-                AuctionItem.display_priority.asc().nulls_last(),
-                AuctionItem.bid_number.asc(),
-            )
-
-        # Apply pagination
-        query = query.offset((page - 1) * limit).limit(limit)
-
-        # Execute query
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
+        return query
 
     async def update_auction_item(
         self,
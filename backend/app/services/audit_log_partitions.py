@@ -0,0 +1,225 @@
+"""Monthly partition maintenance for the audit_logs table.
+
+audit_logs is range-partitioned on created_at with one partition per UTC
+month, named ``audit_logs_pYYYYMM``, plus a DEFAULT partition that catches
+rows outside every monthly range. The maintenance job:
+
+1. Creates partitions ``audit_log_partitions_ahead`` months in advance, so
+   new rows never land in the DEFAULT partition.
+2. Archives partitions that are entirely older than
+   ``audit_log_retention_days`` to Blob Storage as gzipped JSON lines, then
+   detaches and drops them. Dropping a partition is a catalog operation, not
+   a bulk DELETE, so retention never bloats the table or its indexes.
+
+Partitions are never dropped without an archive: when Blob Storage isn't
+configured they are kept and a warning is logged.
+"""
+
+import asyncio
+import gzip
+import json
+import re
+import tempfile
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+PARTITION_PREFIX = "audit_logs_p"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+
+ARCHIVE_COLUMNS = (
+    "id",
+    "user_id",
+    "action",
+    "resource_type",
+    "resource_id",
+    "ip_address",
+    "user_agent",
+    "metadata",
+    "created_at",
+)
+
+
+@dataclass
+class PartitionMaintenanceResult:
+    """What one maintenance run changed."""
+
+    created: list[str] = field(default_factory=list)
+    archived: dict[str, str] = field(default_factory=dict)  # partition -> blob name
+    dropped: list[str] = field(default_factory=list)
+    kept: list[str] = field(default_factory=list)  # expired but not archived
+
+
+def month_start(value: date) -> date:
+    """First day of the month containing ``value``."""
+    return value.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month ``months`` after ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Partition table name for a month."""
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def partition_month(name: str) -> date | None:
+    """Month covered by a monthly partition, or None for other tables."""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def expired_months(months: list[date], today: date, retention_days: int) -> list[date]:
+    """Months whose partitions lie entirely before the retention cutoff."""
+    cutoff = today - timedelta(days=retention_days)
+    return sorted(month for month in months if add_months(month, 1) <= cutoff)
+
+
+def _utc(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=UTC).isoformat()
+
+
+async def is_partitioned(db: AsyncSession) -> bool:
+    """Whether audit_logs is a partitioned table (False e.g. for create_all test schemas)."""
+    result = await db.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass('audit_logs'))"
+        )
+    )
+    return bool(result.scalar())
+
+
+async def list_partition_months(db: AsyncSession) -> list[date]:
+    """Months that currently have a partition."""
+    result = await db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass('audit_logs')"
+        )
+    )
+    months = (partition_month(name) for name in result.scalars())
+    return sorted(month for month in months if month is not None)
+
+
+async def ensure_partitions(db: AsyncSession, today: date, months_ahead: int) -> list[str]:
+    """Create missing partitions from this month through ``months_ahead`` months out.
+
+    Returns:
+        Names of the partitions created
+    """
+    existing = set(await list_partition_months(db))
+    created: list[str] = []
+    this_month = month_start(today)
+    for offset in range(months_ahead + 1):
+        month = add_months(this_month, offset)
+        if month in existing:
+            continue
+        name = partition_name(month)
+        await db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+                f"FOR VALUES FROM ('{_utc(month)}') TO ('{_utc(add_months(month, 1))}')"
+            )
+        )
+        created.append(name)
+    return created
+
+
+async def archive_partition(db: AsyncSession, name: str, batch_size: int = 5000) -> str:
+    """Upload a partition's rows to Blob Storage as gzipped JSON lines.
+
+    Rows are streamed from the server in batches into a temporary file, so
+    memory use doesn't grow with the partition size.
+
+    Returns:
+        Blob name of the archive
+    """
+    from azure.storage.blob import BlobServiceClient
+
+    blob_name = f"audit_logs/{name}.jsonl.gz"
+    with tempfile.TemporaryFile() as archive:
+        result = await db.stream(
+            text(f"SELECT {', '.join(ARCHIVE_COLUMNS)} FROM {name} ORDER BY created_at, id")
+        )
+        with gzip.GzipFile(fileobj=archive, mode="wb") as gz:
+            async for rows in result.mappings().partitions(batch_size):
+                gz.writelines(json.dumps(dict(row), default=str).encode() + b"\n" for row in rows)
+        archive.seek(0)
+
+        def upload() -> None:
+            client = BlobServiceClient.from_connection_string(
+                settings.azure_storage_connection_string or ""
+            )
+            container = client.get_container_client(settings.audit_log_archive_container)
+            if not container.exists():
+                container.create_container()
+            container.upload_blob(blob_name, archive, overwrite=True)
+
+        await asyncio.to_thread(upload)
+    return blob_name
+
+
+async def maintain_partitions(
+    db: AsyncSession, today: date | None = None
+) -> PartitionMaintenanceResult:
+    """Create upcoming partitions, then archive and drop expired ones.
+
+    Each partition is dropped in its own commit right after its archive is
+    uploaded, so a failure leaves at most one partition to redo.
+
+    Args:
+        db: Database session
+        today: Reference date (defaults to the current UTC date)
+
+    Returns:
+        Summary of created, archived, dropped and kept partitions
+    """
+    today = today or datetime.now(UTC).date()
+    outcome = PartitionMaintenanceResult()
+
+    if not await is_partitioned(db):
+        logger.warning("audit_logs is not partitioned; skipping partition maintenance")
+        return outcome
+
+    outcome.created = await ensure_partitions(db, today, settings.audit_log_partitions_ahead)
+    await db.commit()
+
+    expired = expired_months(
+        await list_partition_months(db), today, settings.audit_log_retention_days
+    )
+    for month in expired:
+        name = partition_name(month)
+        if not settings.azure_storage_connection_string:
+            outcome.kept.append(name)
+            continue
+        outcome.archived[name] = await archive_partition(db, name)
+        await db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+        await db.execute(text(f"DROP TABLE {name}"))
+        await db.commit()
+        outcome.dropped.append(name)
+
+    if outcome.kept:
+        logger.warning(
+            "Expired audit log partitions kept: archive storage is not configured",
+            extra={"partitions": outcome.kept},
+        )
+    logger.info(
+        "Audit log partition maintenance complete",
+        extra={"created": outcome.created, "dropped": outcome.dropped},
+    )
+    return outcome
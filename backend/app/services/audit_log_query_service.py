@@ -0,0 +1,91 @@
+"""Audit Log Query Service - read access to audit_logs for compliance review."""
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import KeysetPage, SortKey, TotalMode, paginate_keyset
+from app.models.audit_log import AuditLog
+
+# Newest first; (created_at, id) matches the table's primary key
+AUDIT_LOG_SORT = [
+    SortKey(AuditLog.created_at, descending=True),
+    SortKey(AuditLog.id, descending=True),
+]
+
+
+class AuditLogQueryService:
+    """Service for searching audit log records."""
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID | None = None,
+        actions: list[str] | None = None,
+        resource_type: str | None = None,
+        resource_id: uuid.UUID | None = None,
+        ip_address: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        metadata: dict[str, Any] | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+        total_mode: TotalMode = "none",
+    ) -> KeysetPage[AuditLog]:
+        """
+        Search audit records, newest first, with keyset pagination.
+
+        Every filter is backed by an index: user_id by (user_id, created_at),
+        resources by (resource_type, resource_id, created_at), actions by
+        (action, created_at) and metadata by the jsonb_path_ops GIN index
+        (containment, e.g. {"email": "donor@example.com"}). since/until also
+        prune monthly partitions.
+
+        Args:
+            db: Database session
+            user_id: Records about this user
+            actions: Any of these actions
+            resource_type: Resource type (e.g. "npo", "auction_item")
+            resource_id: Resource UUID
+            ip_address: Client IP address
+            since: Records at or after this time
+            until: Records before this time
+            metadata: JSON object the record's metadata must contain
+            cursor: Cursor from the previous page
+            limit: Page size
+            total_mode: How to compute the total
+
+        Returns:
+            KeysetPage of AuditLog records
+        """
+        stmt = select(AuditLog)
+        if user_id is not None:
+            stmt = stmt.where(AuditLog.user_id == user_id)
+        if actions:
+            stmt = stmt.where(AuditLog.action.in_(actions))
+        if resource_type is not None:
+            stmt = stmt.where(AuditLog.resource_type == resource_type)
+        if resource_id is not None:
+            stmt = stmt.where(AuditLog.resource_id == resource_id)
+        if ip_address is not None:
+            stmt = stmt.where(AuditLog.ip_address == ip_address)
+        if since is not None:
+            stmt = stmt.where(AuditLog.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(AuditLog.created_at < until)
+        if metadata:
+            stmt = stmt.where(AuditLog.event_metadata.contains(metadata))
+
+        return await paginate_keyset(
+            db,
+            stmt,
+            AUDIT_LOG_SORT,
+            scope="admin_audit_logs",
+            cursor=cursor,
+            limit=limit,
+            total_mode=total_mode,
+        )
@@ -7,13 +7,18 @@ Persists audit events to database and logs to structured logger.
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from app.models.audit_log import AuditLog
+
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class AuditEventType(str, Enum):
@@ -66,8 +71,40 @@ class AuditService:
 
     Uses structured logging to capture security events with full context.
     In production, these logs should be sent to a SIEM or log aggregation service.
+
+    Database records are written by the batched audit log writer by default,
+    so logging doesn't commit (or split) the caller's transaction. Account,
+    role and NPO status events are added to the caller's session instead and
+    written by its next commit: they are atomic with the change only when
+    logged before it is committed (ApplicationService, MemberService).
+    Endpoints whose service has already committed the change get the record
+    with the request's final commit.
     """
 
+    @staticmethod
+    async def _record(
+        db: AsyncSession, audit_log: "AuditLog", same_transaction: bool = False
+    ) -> None:
+        """Persist an audit record.
+
+        Args:
+            db: Caller's database session
+            audit_log: Unsaved audit record
+            same_transaction: Add the record to the caller's transaction (it is
+                written when the caller commits) instead of the batched writer
+        """
+        from app.services.audit_writer import audit_log_writer
+
+        if same_transaction:
+            db.add(audit_log)
+            return
+        if settings.audit_log_async_enabled and audit_log_writer.submit(audit_log):
+            return
+
+        # Writer not running (scripts, workers) or queue full: write directly
+        db.add(audit_log)
+        await db.commit()
+
     @staticmethod
     async def log_login_success(
         db: AsyncSession | None,
@@ -101,8 +138,7 @@ class AuditService:
                     "session_id": str(session_id) if session_id else None,
                 },
             )
-            db.add(audit_log)
-            await db.commit()
+            await AuditService._record(db, audit_log)
 
         # Also log to structured logger for redundancy
         logger.info(
@@ -148,8 +184,7 @@ class AuditService:
                 "reason": reason,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         # Also log to structured logger
         logger.warning(
@@ -195,8 +230,7 @@ class AuditService:
                 "session_id": str(session_id) if session_id else None,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         # Also log to structured logger
         logger.info(
@@ -340,8 +374,7 @@ class AuditService:
             user_agent=None,
             event_metadata={"email": email},
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         # Also log to structured logger
         logger.info(
@@ -380,8 +413,7 @@ class AuditService:
             user_agent=None,
             event_metadata={"email": email},
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         # Also log to structured logger
         logger.info(
@@ -480,8 +512,7 @@ class AuditService:
                     "admin_user_id": str(admin_user_id) if admin_user_id else None,
                 },
             )
-            db.add(audit_log)
-            await db.commit()
+            await AuditService._record(db, audit_log, same_transaction=True)
 
         # Also log to structured logger
         logger.warning(
@@ -536,8 +567,7 @@ class AuditService:
                     "admin_email": admin_email,
                 },
             )
-            db.add(audit_log)
-            await db.commit()
+            await AuditService._record(db, audit_log, same_transaction=True)
 
         # Also log to structured logger
         logger.info(
@@ -591,8 +621,7 @@ class AuditService:
                     "admin_email": admin_email,
                 },
             )
-            db.add(audit_log)
-            await db.commit()
+            await AuditService._record(db, audit_log)
 
         # Also log to structured logger
         logger.info(
@@ -645,8 +674,7 @@ class AuditService:
                     "admin_email": admin_email,
                 },
             )
-            db.add(audit_log)
-            await db.commit()
+            await AuditService._record(db, audit_log)
 
         # Also log to structured logger
         logger.info(
@@ -696,8 +724,7 @@ class AuditService:
                     "admin_email": admin_email,
                 },
             )
-            db.add(audit_log)
-            await db.commit()
+            await AuditService._record(db, audit_log, same_transaction=True)
 
         # Also log to structured logger
         logger.warning(
@@ -743,8 +770,7 @@ class AuditService:
                     "admin_user_id": str(admin_user_id) if admin_user_id else None,
                 },
             )
-            db.add(audit_log)
-            await db.commit()
+            await AuditService._record(db, audit_log, same_transaction=True)
 
         # Also log to structured logger
         logger.info(
@@ -785,8 +811,7 @@ class AuditService:
                 "created_by_email": created_by_email,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         logger.info(
             "NPO created",
@@ -830,8 +855,7 @@ class AuditService:
                 "reviewed_by_email": reviewed_by_email,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log, same_transaction=True)
 
         logger.info(
             f"NPO application {status}",
@@ -871,8 +895,7 @@ class AuditService:
                 "role": role,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         logger.info(
             "NPO member added",
@@ -913,8 +936,7 @@ class AuditService:
                 "reason": reason,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         logger.warning(
             "NPO member removed",
@@ -952,8 +974,7 @@ class AuditService:
                 "changes": changes,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         logger.info(
             "NPO updated",
@@ -995,8 +1016,7 @@ class AuditService:
                 "changed_by_email": changed_by_email,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log, same_transaction=True)
 
         logger.info(
             "NPO status changed",
@@ -1020,8 +1040,14 @@ class AuditService:
         title: str,
         created_by_user_id: uuid.UUID,
         ip_address: str | None = None,
+        same_transaction: bool = False,
     ) -> None:
-        """Log auction item creation event."""
+        """Log auction item creation event.
+
+        Args:
+            same_transaction: Write the record with the caller's commit (bulk
+                imports) instead of through the batched writer
+        """
         from app.models.audit_log import AuditLog
 
         audit_log = AuditLog(
@@ -1036,8 +1062,7 @@ class AuditService:
                 "title": title,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log, same_transaction=same_transaction)
 
         logger.info(
             "Auction item created",
@@ -1079,8 +1104,7 @@ class AuditService:
                 "updated_fields": updated_fields,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         logger.info(
             "Auction item updated",
@@ -1123,8 +1147,7 @@ class AuditService:
                 "is_soft_delete": is_soft_delete,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         logger.info(
             "Auction item deleted",
@@ -1193,8 +1216,7 @@ class AuditService:
                 "new_value": str(new_value) if new_value is not None else None,
             },
         )
-        db.add(audit_log)
-        await db.commit()
+        await AuditService._record(db, audit_log)
 
         # Also log to structured logger
         logger.info(
@@ -0,0 +1,174 @@
+"""Asynchronous batched writer for audit log records.
+
+``AuditService`` hands most audit records to this writer instead of adding
+them to the request's session and committing mid-request. Records are held
+in a bounded in-process queue and written by a background task with one
+multi-row ``INSERT`` per batch, whenever ``audit_log_batch_size`` records are
+queued or ``audit_log_flush_interval_seconds`` has passed.
+
+``submit`` never blocks: if the writer isn't running (scripts, Celery
+workers, tests) or the queue is full, it returns False and the caller writes
+the record through its own session instead, so records are never silently
+dropped by back-pressure. ``stop`` drains the queue on shutdown.
+"""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import insert
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import get_logger
+from app.core.metrics import AUDIT_LOG_FLUSH_SIZE, AUDIT_LOG_RECORDS_TOTAL
+from app.models.audit_log import AuditLog
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+def audit_log_values(audit_log: AuditLog) -> dict[str, Any]:
+    """Column values for a multi-row INSERT of an unsaved AuditLog.
+
+    id and created_at are assigned here so they reflect when the event
+    happened rather than when the batch was flushed.
+    """
+    return {
+        "id": audit_log.id or uuid.uuid4(),
+        "user_id": audit_log.user_id,
+        "action": audit_log.action,
+        "resource_type": audit_log.resource_type,
+        "resource_id": audit_log.resource_id,
+        "ip_address": audit_log.ip_address,
+        "user_agent": audit_log.user_agent,
+        "event_metadata": audit_log.event_metadata,
+        "created_at": audit_log.created_at or datetime.now(UTC),
+    }
+
+
+class AuditLogWriter:
+    """Buffers audit records and writes them in batches from a background task."""
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        max_queue_size: int | None = None,
+    ) -> None:
+        """Initialize writer (defaults come from settings).
+
+        Args:
+            batch_size: Records per INSERT, and queue depth that triggers a flush
+            flush_interval: Max seconds a record waits in the queue
+            max_queue_size: Queue bound; submissions beyond it are refused
+        """
+        self.batch_size = batch_size or settings.audit_log_batch_size
+        self.flush_interval = flush_interval or settings.audit_log_flush_interval_seconds
+        self.max_queue_size = max_queue_size or settings.audit_log_queue_max_size
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=self.max_queue_size)
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running and accepting records."""
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    def submit(self, audit_log: AuditLog) -> bool:
+        """Queue a record for the next batch.
+
+        Returns:
+            False if the record was not queued (writer stopped or queue full)
+        """
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait(audit_log_values(audit_log))
+        except asyncio.QueueFull:
+            AUDIT_LOG_RECORDS_TOTAL.labels(result="overflow").inc()
+            return False
+        AUDIT_LOG_RECORDS_TOTAL.labels(result="queued").inc()
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self.running:
+            return
+        self._stopping = False
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="audit-log-writer")
+        logger.info(
+            "Audit log writer started",
+            extra={"batch_size": self.batch_size, "flush_interval": self.flush_interval},
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop accepting records and drain the queue within ``timeout``."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except TimeoutError:
+            logger.error(
+                "Audit log writer did not drain in time; cancelling",
+                extra={"unwritten_records": self._queue.qsize()},
+            )
+            self._task.cancel()
+        self._task = None
+        logger.info("Audit log writer stopped")
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            if not self._stopping and self._queue.qsize() < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except TimeoutError:
+                    pass
+            await self.flush()
+            if self._stopping and self._queue.empty():
+                return
+
+    async def flush(self) -> int:
+        """Write every queued record, one INSERT per ``batch_size`` records.
+
+        Returns:
+            Number of records written
+        """
+        written = 0
+        while not self._queue.empty():
+            batch = [
+                self._queue.get_nowait() for _ in range(min(self.batch_size, self._queue.qsize()))
+            ]
+            if await self._write(batch):
+                written += len(batch)
+        return written
+
+    async def _write(self, batch: list[dict[str, Any]]) -> bool:
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(AuditLog), batch)
+                await session.commit()
+        except Exception as e:
+            # Each record was also emitted to the structured logger by AuditService
+            AUDIT_LOG_RECORDS_TOTAL.labels(result="failed").inc(len(batch))
+            logger.error(
+                "Audit log batch write failed",
+                extra={"records": len(batch), "error": str(e)},
+            )
+            return False
+        AUDIT_LOG_RECORDS_TOTAL.labels(result="written").inc(len(batch))
+        AUDIT_LOG_FLUSH_SIZE.observe(len(batch))
+        return True
+
+
+# Shared writer started in the application lifespan
+audit_log_writer = AuditLogWriter()
@@ -1,7 +1,9 @@
 """
 Auto-assignment service for table seating.
 
-Implements party-aware sequential table filling algorithm.
+Implements party-aware sequential table filling algorithm. Guests are
+selected by their denormalized event_id; event_registrations is only joined
+for the registration status.
 """
 
 from typing import Any
@@ -61,9 +63,9 @@ class AutoAssignService:
         # Get unassigned guests grouped by registration
         unassigned_query = (
             select(RegistrationGuest)
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
-                EventRegistration.event_id == event_id,
+                RegistrationGuest.event_id == event_id,
                 EventRegistration.status == RegistrationStatus.CONFIRMED,
                 RegistrationGuest.table_number.is_(None),
             )
@@ -208,9 +210,9 @@ class AutoAssignService:
                 RegistrationGuest.table_number,
                 func.count(RegistrationGuest.id).label("count"),
             )
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
-                EventRegistration.event_id == event_id,
+                RegistrationGuest.event_id == event_id,
                 EventRegistration.status == RegistrationStatus.CONFIRMED,
                 RegistrationGuest.table_number.isnot(None),
             )
@@ -240,9 +242,9 @@ class AutoAssignService:
 
         query = (
             select(func.count(RegistrationGuest.id))
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
-                EventRegistration.event_id == event_id,
+                RegistrationGuest.event_id == event_id,
                 EventRegistration.status == RegistrationStatus.CONFIRMED,
                 RegistrationGuest.table_number.is_(None),
             )
@@ -1,12 +1,17 @@
-"""Bidder number assignment and management service."""
+"""Bidder number assignment and management service.
+
+Uniqueness per event is enforced by the partial unique index on
+``registration_guests (event_id, bidder_number)``; the queries here filter
+on the denormalized ``event_id`` so they are served by that index.
+"""
 
 from datetime import UTC, datetime
 from uuid import UUID
 
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.event_registration import EventRegistration
 from app.models.registration_guest import RegistrationGuest
 
 
@@ -25,6 +30,8 @@ class BidderNumberService:
         Uses sequential assignment with gap filling:
         - Finds first available number in 100-999 range
         - Reuses numbers from canceled registrations
+        - If a concurrent transaction takes the same number first, the unique
+          index rejects it and the next free number is tried
 
         Args:
             db: Database session
@@ -46,27 +53,22 @@ class BidderNumberService:
         if guest.bidder_number is not None:
             raise ValueError(f"Guest {guest_id} already has bidder number {guest.bidder_number}")
 
-        # Get all used bidder numbers for this event
-        used_numbers_query = (
-            select(RegistrationGuest.bidder_number)
-            .join(EventRegistration)
-            .where(
-                EventRegistration.event_id == event_id,
-                RegistrationGuest.bidder_number.isnot(None),
-            )
-        )
-        result = await db.execute(used_numbers_query)
-        used_numbers = {row[0] for row in result.fetchall()}
+        used_numbers = await BidderNumberService._used_numbers(db, event_id)
 
         # Find first available number (100-999)
         for num in range(100, 1000):
-            if num not in used_numbers:
-                # Assign bidder number
-                guest.bidder_number = num
-                guest.bidder_number_assigned_at = datetime.now(UTC)
-                await db.commit()
-                await db.refresh(guest)
-                return num
+            if num in used_numbers:
+                continue
+            try:
+                async with db.begin_nested():
+                    guest.bidder_number = num
+                    guest.bidder_number_assigned_at = datetime.now(UTC)
+            except IntegrityError:
+                # Taken by a concurrent transaction since we read the used numbers
+                continue
+            await db.commit()
+            await db.refresh(guest)
+            return num
 
         # No available numbers
         raise ValueError(
@@ -93,13 +95,9 @@ class BidderNumberService:
         Raises:
             ValueError: If bidder number is already in use
         """
-        query = (
-            select(RegistrationGuest.id)
-            .join(EventRegistration)
-            .where(
-                EventRegistration.event_id == event_id,
-                RegistrationGuest.bidder_number == bidder_number,
-            )
+        query = select(RegistrationGuest.id).where(
+            RegistrationGuest.event_id == event_id,
+            RegistrationGuest.bidder_number == bidder_number,
         )
 
         if exclude_guest_id:
@@ -130,17 +128,7 @@ class BidderNumberService:
         Returns:
             list[int]: List of available bidder numbers (100-999)
         """
-        # Get all used bidder numbers for this event
-        query = (
-            select(RegistrationGuest.bidder_number)
-            .join(EventRegistration)
-            .where(
-                EventRegistration.event_id == event_id,
-                RegistrationGuest.bidder_number.isnot(None),
-            )
-        )
-        result = await db.execute(query)
-        used_numbers = {row[0] for row in result.fetchall()}
+        used_numbers = await BidderNumberService._used_numbers(db, event_id)
 
         # Find available numbers
         available = []
@@ -191,14 +179,10 @@ class BidderNumberService:
         guest = result.scalar_one()
 
         # Check if number is already in use by another guest
-        conflict_query = (
-            select(RegistrationGuest)
-            .join(EventRegistration)
-            .where(
-                EventRegistration.event_id == event_id,
-                RegistrationGuest.bidder_number == new_bidder_number,
-                RegistrationGuest.id != guest_id,
-            )
+        conflict_query = select(RegistrationGuest).where(
+            RegistrationGuest.event_id == event_id,
+            RegistrationGuest.bidder_number == new_bidder_number,
+            RegistrationGuest.id != guest_id,
         )
         result = await db.execute(conflict_query)
         conflicting_guest = result.scalar_one_or_none()
@@ -272,13 +256,19 @@ class BidderNumberService:
         Returns:
             int: Number of assigned bidder numbers
         """
-        query = (
-            select(func.count(RegistrationGuest.id))
-            .join(EventRegistration)
-            .where(
-                EventRegistration.event_id == event_id,
-                RegistrationGuest.bidder_number.isnot(None),
-            )
+        query = select(func.count(RegistrationGuest.id)).where(
+            RegistrationGuest.event_id == event_id,
+            RegistrationGuest.bidder_number.isnot(None),
         )
         result = await db.execute(query)
         return result.scalar_one()
+
+    @staticmethod
+    async def _used_numbers(db: AsyncSession, event_id: UUID) -> set[int]:
+        """Bidder numbers in use for an event (an index-only scan of the unique index)."""
+        query = select(RegistrationGuest.bidder_number).where(
+            RegistrationGuest.event_id == event_id,
+            RegistrationGuest.bidder_number.isnot(None),
+        )
+        result = await db.execute(query)
+        return set(result.scalars().all())  # type: ignore[arg-type]
@@ -6,16 +6,19 @@ Includes validation for color formats, contrast checking, and social media URL v
 
 import re
 import uuid
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError, ValidationError
+from app.core.http_cache import ResourceVersion, resource_version
 from app.core.logging import get_logger
 from app.models.npo import NPO
 from app.models.npo_branding import NPOBranding
 from app.schemas.npo_branding import BrandingCreateRequest, BrandingUpdateRequest
+from app.services.event_branding_service import EventBrandingService
 
 logger = get_logger(__name__)
 
@@ -327,6 +330,34 @@ class BrandingService:
 
         return {"valid": len(errors) == 0, "errors": errors}
 
+    async def get_branding_version(
+        self, db: AsyncSession, npo_id: uuid.UUID
+    ) -> ResourceVersion | None:
+        """Get validators for an NPO's branding without loading it.
+
+        Args:
+            db: Database session
+            npo_id: NPO ID
+
+        Returns:
+            ResourceVersion, or None if the NPO or its branding row does not exist
+        """
+        stmt = (
+            select(NPOBranding.id, NPOBranding.updated_at)
+            .join(NPO, NPO.id == NPOBranding.npo_id)
+            .where(NPOBranding.npo_id == npo_id, NPO.deleted_at.is_(None))
+        )
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+
+        return self.branding_version(row.id, row.updated_at)
+
+    @staticmethod
+    def branding_version(branding_id: uuid.UUID, updated_at: datetime) -> ResourceVersion:
+        """Build validators for a branding row."""
+        return resource_version("branding", branding_id, updated_at, last_modified=updated_at)
+
     async def get_branding(self, db: AsyncSession, npo_id: uuid.UUID) -> NPOBranding:
         """Get branding for an NPO.
 
@@ -419,6 +450,9 @@ class BrandingService:
 
         # Update logo URL
         if update_data.logo_url is not None:
+            if update_data.logo_url != branding.logo_url:
+                # Derivatives belong to the previous logo
+                branding.logo_derivatives = None
             branding.logo_url = update_data.logo_url
 
         # Validate and update social media links
@@ -438,6 +472,7 @@ class BrandingService:
 
         await db.commit()
         await db.refresh(branding)
+        await EventBrandingService.invalidate_npo(npo_id)
 
         logger.info(f"Updated branding for NPO {npo_id}")
         return branding
@@ -509,6 +544,7 @@ class BrandingService:
         db.add(branding)
         await db.commit()
         await db.refresh(branding)
+        await EventBrandingService.invalidate_npo(npo_id)
 
         logger.info(f"Created branding for NPO {npo_id}")
         return branding
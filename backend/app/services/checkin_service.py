@@ -1,15 +1,23 @@
 """Check-in service for event registration check-in operations."""
 
 from datetime import UTC, datetime
+from typing import cast
 from uuid import UUID
 
-from sqlalchemy import select
+from redis.exceptions import RedisError
+from sqlalchemy import column, func, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.core.logging import get_logger
 from app.models.event_registration import EventRegistration
 from app.models.registration_guest import RegistrationGuest
 from app.models.user import User
+from app.schemas.checkin import CheckInOperation, CheckInOperationResult, CheckInStatus
+from app.services.event_change_feed import CHECKIN, queue_event_change
+from app.services.redis_service import RedisService
+
+logger = get_logger(__name__)
 
 
 class CheckInService:
@@ -216,3 +224,171 @@ class CheckInService:
         await db.refresh(guest)
 
         return guest
+
+    @staticmethod
+    async def check_in_batch(
+        db: AsyncSession, event_id: UUID, operations: list[CheckInOperation]
+    ) -> list[CheckInOperationResult]:
+        """Check in many guests and registrations of an event at once.
+
+        Applies every new operation with one ``UPDATE ... RETURNING`` per
+        target type and a single commit, so a party or an offline queue of
+        hundreds of check-ins costs a handful of queries. Only rows not yet
+        checked in are updated; the rest are reported as already checked in.
+
+        Results are stored by idempotency key for 48 hours: a retried or
+        double-submitted operation returns its original result (marked
+        ``replayed``) instead of being applied again. A registration's
+        check_in_time is the device's ``checked_in_at`` (never later than now).
+
+        Args:
+            db: Database session
+            event_id: Event the guests and registrations must belong to
+            operations: Check-ins; repeated idempotency keys are ignored
+
+        Returns:
+            One result per idempotency key, in request order
+        """
+        by_key: dict[str, CheckInOperation] = {}
+        for op in operations:
+            by_key.setdefault(op.idempotency_key, op)
+        unique = list(by_key.values())
+
+        try:
+            seen = await RedisService.get_checkin_results(
+                event_id, [op.idempotency_key for op in unique]
+            )
+        except RedisError as e:
+            # Check-ins are idempotent anyway; replays just aren't flagged
+            logger.warning("Could not read check-in sync results", extra={"error": str(e)})
+            seen = {}
+        fresh = [op for op in unique if op.idempotency_key not in seen]
+
+        guest_ids = {op.id for op in fresh if op.target == "guest"}
+        now = datetime.now(UTC)
+        registration_times: dict[UUID, datetime] = {}
+        for op in fresh:
+            if op.target == "registration":
+                # Earliest device time wins if the same registration is queued twice
+                checked_in_at = op.checked_in_at or now
+                registration_times[op.id] = min(
+                    registration_times.get(op.id, checked_in_at), checked_in_at
+                )
+
+        checked_guests = await CheckInService._check_in_guests(db, event_id, guest_ids)
+        checked_registrations = await CheckInService._check_in_registrations(
+            db, event_id, registration_times
+        )
+        existing_guests = checked_guests | await CheckInService._existing_ids(
+            db, RegistrationGuest, event_id, guest_ids - checked_guests
+        )
+        existing_registrations = checked_registrations | await CheckInService._existing_ids(
+            db,
+            EventRegistration,
+            event_id,
+            set(registration_times) - checked_registrations,
+        )
+        if checked_guests:
+            queue_event_change(db, event_id, CHECKIN, guest_ids=checked_guests)
+        if checked_registrations:
+            queue_event_change(db, event_id, CHECKIN, registration_ids=checked_registrations)
+        await db.commit()
+
+        statuses = {key: cast(CheckInStatus, status) for key, status in seen.items()}
+        claimed: set[UUID] = set()
+        for op in fresh:
+            checked, existing = (
+                (checked_guests, existing_guests)
+                if op.target == "guest"
+                else (checked_registrations, existing_registrations)
+            )
+            if op.id in checked and op.id not in claimed:
+                claimed.add(op.id)
+                statuses[op.idempotency_key] = "checked_in"
+            elif op.id in existing:
+                statuses[op.idempotency_key] = "already_checked_in"
+            else:
+                statuses[op.idempotency_key] = "not_found"
+
+        try:
+            # Not-found ids may still be created later, so they aren't remembered
+            await RedisService.store_checkin_results(
+                event_id,
+                {
+                    op.idempotency_key: statuses[op.idempotency_key]
+                    for op in fresh
+                    if statuses[op.idempotency_key] != "not_found"
+                },
+            )
+        except RedisError as e:
+            logger.warning("Could not store check-in sync results", extra={"error": str(e)})
+
+        return [
+            CheckInOperationResult(
+                idempotency_key=op.idempotency_key,
+                target=op.target,
+                id=op.id,
+                status=statuses[op.idempotency_key],
+                replayed=op.idempotency_key in seen,
+            )
+            for op in unique
+        ]
+
+    @staticmethod
+    async def _check_in_guests(db: AsyncSession, event_id: UUID, guest_ids: set[UUID]) -> set[UUID]:
+        """Set checked_in on the event's guests that aren't yet; returns their ids."""
+        if not guest_ids:
+            return set()
+        result = await db.execute(
+            update(RegistrationGuest)
+            .where(
+                RegistrationGuest.id.in_(guest_ids),
+                RegistrationGuest.event_id == event_id,
+                RegistrationGuest.checked_in.is_(False),
+            )
+            .values(checked_in=True)
+            .returning(RegistrationGuest.id)
+            .execution_options(synchronize_session=False)
+        )
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def _check_in_registrations(
+        db: AsyncSession, event_id: UUID, check_in_times: dict[UUID, datetime]
+    ) -> set[UUID]:
+        """Set check_in_time on the event's registrations that have none; returns their ids."""
+        if not check_in_times:
+            return set()
+        rows = values(
+            column("id", EventRegistration.id.type),
+            column("checked_in_at", EventRegistration.check_in_time.type),
+            name="device_check_ins",
+        ).data(list(check_in_times.items()))
+        result = await db.execute(
+            update(EventRegistration)
+            .where(
+                EventRegistration.id == rows.c.id,
+                EventRegistration.event_id == event_id,
+                EventRegistration.check_in_time.is_(None),
+            )
+            # Device clocks can run ahead; never record a future check-in
+            .values(check_in_time=func.least(rows.c.checked_in_at, func.now()))
+            .returning(EventRegistration.id)
+            .execution_options(synchronize_session=False)
+        )
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def _existing_ids(
+        db: AsyncSession,
+        model: type[RegistrationGuest] | type[EventRegistration],
+        event_id: UUID,
+        ids: set[UUID],
+    ) -> set[UUID]:
+        """Which of ``ids`` exist in the event."""
+        if not ids:
+            return set()
+        result = await db.execute(
+            select(model.id).where(model.id.in_(ids), model.event_id == event_id)
+        )
+        return set(result.scalars().all())
@@ -0,0 +1,248 @@
+"""Email delivery backends.
+
+Backends deliver one rendered message and return the provider message id.
+They are long-lived: the Azure backend creates its ``EmailClient`` and thread
+pool once and reuses them for every message.
+
+- ``azure``: Azure Communication Services (production)
+- ``smtp``: plain SMTP, e.g. a local MailHog/Mailpit sink
+- ``file``: one ``.eml`` file per message in ``email_file_backend_dir`` (tests)
+- ``log``: log the message only (local development without credentials)
+"""
+
+import asyncio
+import smtplib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Any, Protocol
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.tracing import Span, tracer
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class OutboundEmail:
+    """A fully rendered email ready for delivery."""
+
+    to_email: str
+    subject: str
+    body: str
+    email_type: str
+    html_body: str | None = None
+
+
+class EmailBackend(Protocol):
+    """Delivers rendered emails."""
+
+    name: str
+
+    async def send(self, message: OutboundEmail) -> str | None:
+        """Deliver a message; return the provider message id if there is one."""
+        ...
+
+    async def close(self) -> None:
+        """Release clients and worker threads."""
+        ...
+
+
+def _mime_message(message: OutboundEmail) -> EmailMessage:
+    """Build a MIME message (plain text with optional HTML alternative)."""
+    mime = EmailMessage()
+    mime["From"] = f"{settings.email_from_name} <{settings.email_from_address}>"
+    mime["To"] = message.to_email
+    mime["Subject"] = message.subject
+    mime["X-Fundrbolt-Email-Type"] = message.email_type
+    mime.set_content(message.body)
+    if message.html_body:
+        mime.add_alternative(message.html_body, subtype="html")
+    return mime
+
+
+def _send_span(backend: str, message: OutboundEmail) -> AbstractContextManager[Span | None]:
+    return tracer.span(
+        "email.send",
+        kind="client",
+        attributes={"email.backend": backend, "email.type": message.email_type},
+    )
+
+
+class AzureEmailBackend:
+    """Azure Communication Services backend with a reused client."""
+
+    name = "azure"
+
+    def __init__(self, connection_string: str, max_workers: int) -> None:
+        """Initialize backend.
+
+        Args:
+            connection_string: Azure Communication Services connection string
+            max_workers: Threads for the blocking SDK calls (bounds concurrency)
+        """
+        self._connection_string = connection_string
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="email")
+        self._client: Any = None
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            from azure.communication.email import EmailClient
+
+            self._client = EmailClient.from_connection_string(self._connection_string)
+        return self._client
+
+    def _send_sync(self, message: OutboundEmail) -> str | None:
+        content = {"subject": message.subject, "plainText": message.body}
+        if message.html_body:
+            content["html"] = message.html_body
+
+        poller = self._get_client().begin_send(
+            {
+                "senderAddress": settings.email_from_address,
+                "recipients": {"to": [{"address": message.to_email}]},
+                "content": content,
+            }
+        )
+        result = poller.result()
+        return result.get("id")  # type: ignore[no-any-return]
+
+    async def send(self, message: OutboundEmail) -> str | None:
+        """Send via Azure in the backend's thread pool."""
+        loop = asyncio.get_running_loop()
+        with _send_span(self.name, message):
+            return await loop.run_in_executor(self._executor, self._send_sync, message)
+
+    async def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SmtpEmailBackend:
+    """SMTP backend for local sinks such as MailHog or Mailpit."""
+
+    name = "smtp"
+
+    def __init__(self, host: str, port: int) -> None:
+        """Initialize backend.
+
+        Args:
+            host: SMTP host
+            port: SMTP port
+        """
+        self.host = host
+        self.port = port
+
+    def _send_sync(self, message: OutboundEmail) -> str | None:
+        with smtplib.SMTP(self.host, self.port, timeout=10) as smtp:
+            smtp.send_message(_mime_message(message))
+        return None
+
+    async def send(self, message: OutboundEmail) -> str | None:
+        """Send over SMTP in a worker thread."""
+        with _send_span(self.name, message):
+            return await asyncio.to_thread(self._send_sync, message)
+
+    async def close(self) -> None:
+        """Nothing to release; connections are per message."""
+
+
+class FileEmailBackend:
+    """Writes each message as an ``.eml`` file (tests and local inspection)."""
+
+    name = "file"
+
+    def __init__(self, directory: str) -> None:
+        """Initialize backend.
+
+        Args:
+            directory: Directory to write messages to (created if missing)
+        """
+        self.directory = Path(directory)
+
+    def _write(self, message: OutboundEmail) -> str:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        message_id = uuid.uuid4().hex
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+        path = self.directory / f"{stamp}-{message.email_type}-{message_id}.eml"
+        path.write_bytes(bytes(_mime_message(message)))
+        return message_id
+
+    async def send(self, message: OutboundEmail) -> str | None:
+        """Write the message to disk."""
+        return await asyncio.to_thread(self._write, message)
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class LogEmailBackend:
+    """Logs messages instead of sending them (mock mode)."""
+
+    name = "log"
+
+    async def send(self, message: OutboundEmail) -> str | None:
+        """Log the message."""
+        logger.info(
+            f"[MOCK EMAIL] {message.email_type} email\n"
+            f"To: {message.to_email}\n"
+            f"Subject: {message.subject}\n"
+            f"Body:\n{message.body}"
+        )
+        return None
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+def backend_name() -> str:
+    """Configured backend name (azure when a connection string is set, else log)."""
+    if settings.email_backend:
+        return settings.email_backend
+    return "azure" if settings.azure_communication_connection_string else "log"
+
+
+def create_email_backend() -> EmailBackend:
+    """Create the configured email backend.
+
+    Raises:
+        ValueError: If the azure backend is selected without a connection string
+    """
+    name = backend_name()
+    if name == "azure":
+        if not settings.azure_communication_connection_string:
+            raise ValueError("EMAIL_BACKEND=azure requires AZURE_COMMUNICATION_CONNECTION_STRING")
+        return AzureEmailBackend(
+            settings.azure_communication_connection_string,
+            max_workers=settings.email_dispatch_concurrency,
+        )
+    if name == "smtp":
+        return SmtpEmailBackend(settings.email_smtp_host, settings.email_smtp_port)
+    if name == "file":
+        return FileEmailBackend(settings.email_file_backend_dir)
+    return LogEmailBackend()
+
+
+_email_backend: EmailBackend | None = None
+
+
+def get_email_backend() -> EmailBackend:
+    """Get the process-wide email backend."""
+    global _email_backend
+    if _email_backend is None:
+        _email_backend = create_email_backend()
+    return _email_backend
+
+
+async def close_email_backend() -> None:
+    """Close the process-wide email backend (app shutdown)."""
+    global _email_backend
+    if _email_backend is not None:
+        await _email_backend.close()
+        _email_backend = None
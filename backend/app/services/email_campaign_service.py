@@ -0,0 +1,535 @@
+"""Email Campaign Service - bulk guest emails queued through the outbox."""
+
+import html
+import logging
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, and_, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.models.email_campaign import (
+    EmailCampaign,
+    EmailCampaignAudience,
+    EmailCampaignStatus,
+)
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.models.event import Event
+from app.models.event_registration import EventRegistration, RegistrationStatus
+from app.models.npo import NPO
+from app.models.registration_guest import RegistrationGuest
+from app.services.email_dispatcher import mark_outbox_pending
+from app.services.email_service import _create_email_html_template
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+DEFAULT_BRAND_COLOR = "#3B82F6"
+
+# Branding is admin-entered and lands in HTML attributes
+_HEX_COLOR = re.compile(r"#[0-9A-Fa-f]{6}")
+
+# A campaign whose runner hasn't committed a batch within this (e.g. its
+# worker process was recycled mid-send) is resumed by the scheduler
+CAMPAIGN_LEASE = timedelta(minutes=5)
+
+# Per-recipient fields are rendered into the template as private-use code points,
+# which can't appear in event data and survive html escaping unchanged
+_FIELD_START = "\ue000"
+_FIELD_END = "\ue001"
+_FIELD_PATTERN = re.compile(f"{_FIELD_START}(\\w+){_FIELD_END}")
+
+
+def field(name: str) -> str:
+    """Placeholder for a per-recipient value in a campaign template."""
+    return f"{_FIELD_START}{name}{_FIELD_END}"
+
+
+@dataclass(frozen=True)
+class PreparedTemplate:
+    """Template text pre-split into literal parts and field names.
+
+    Even-indexed parts are literal text; odd-indexed parts are field names
+    filled per recipient, so rendering is a single join.
+    """
+
+    parts: tuple[str, ...]
+    escape: bool = False
+
+    @classmethod
+    def compile(cls, text: str, escape: bool = False) -> "PreparedTemplate":
+        """Split rendered template text on its field placeholders."""
+        return cls(tuple(_FIELD_PATTERN.split(text)), escape)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Fill the fields for one recipient (html-escaped for HTML templates)."""
+        parts = list(self.parts)
+        for i in range(1, len(parts), 2):
+            value = values[parts[i]]
+            parts[i] = html.escape(value) if self.escape else value
+        return "".join(parts)
+
+
+@dataclass(frozen=True)
+class CampaignTemplate:
+    """Subject, plain text and HTML bodies of a campaign email."""
+
+    subject: PreparedTemplate
+    body: PreparedTemplate
+    html_body: PreparedTemplate
+
+    def render(self, values: Mapping[str, str]) -> tuple[str, str, str]:
+        """Render (subject, body, html_body) for one recipient."""
+        return (
+            self.subject.render(values),
+            self.body.render(values),
+            self.html_body.render(values),
+        )
+
+
+def resolve_email_branding(event: Event) -> tuple[str, str, str | None]:
+    """Resolve (brand name, color, logo URL) via fallback chain: event → NPO → defaults.
+
+    Colors that aren't #RRGGBB fall back to the default and logos that aren't
+    https URLs are dropped.
+    """
+    npo = event.npo
+    npo_branding = npo.branding if npo else None
+
+    brand_name = npo.name if npo else "Fundrbolt Platform"
+    color = event.primary_color or (npo_branding.primary_color if npo_branding else None)
+    logo_url = event.logo_url or (npo_branding.logo_url if npo_branding else None)
+    if not color or not _HEX_COLOR.fullmatch(color):
+        color = DEFAULT_BRAND_COLOR
+    if logo_url and not logo_url.startswith("https://"):
+        logo_url = None
+    return brand_name, color, logo_url
+
+
+def build_guest_invitation_template(
+    event: Event, custom_message: str | None = None
+) -> CampaignTemplate:
+    """Render the NPO-branded guest invitation once for a whole campaign.
+
+    Event details, branding and the custom message are rendered here;
+    only guest_name and registration_url vary per recipient.
+
+    Args:
+        event: Event with npo and npo.branding loaded
+        custom_message: Optional message from the organizers
+
+    Returns:
+        Pre-rendered campaign template
+    """
+    brand_name, brand_color, logo_url = resolve_email_branding(event)
+    event_url = html.escape(f"{settings.frontend_donor_url}/events/{event.slug or event.id}")
+    event_when = f"{event.event_datetime.strftime('%B %d, %Y at %I:%M %p')} ({event.timezone})"
+    name = html.escape(event.name)
+
+    body_paragraphs = [
+        f"Hello {field('guest_name')},",
+        f"You have been invited to attend <strong>{name}</strong>.",
+        f"<strong>Date:</strong> {event_when}<br>"
+        f"<strong>Venue:</strong> {html.escape(event.venue_name or '')}<br>"
+        f"{html.escape(event.venue_address or '')}",
+    ]
+    if custom_message:
+        body_paragraphs.append(html.escape(custom_message))
+    body_paragraphs += [
+        "To confirm your attendance, you'll need to create your Fundrbolt account "
+        "(or log in if you already have one), complete your registration, and select "
+        "your meal preferences.",
+        "Click the button below to get started:",
+    ]
+
+    html_body = _create_email_html_template(
+        heading=f"You're Invited to {name}!",
+        body_paragraphs=body_paragraphs,
+        cta_text="Complete Registration",
+        cta_url=field("registration_url"),
+        footer_text=(
+            "This invitation is specifically for you. Please complete your registration "
+            "to confirm your attendance. "
+            f'<a href="{event_url}" style="color: {brand_color};">View event details</a>'
+        ),
+        brand_name=html.escape(brand_name),
+        brand_color=brand_color,
+        logo_url=html.escape(logo_url) if logo_url else None,
+    )
+
+    plain_body_parts = [
+        f"Hello {field('guest_name')},",
+        "",
+        f"You have been invited to attend {event.name}.",
+        "",
+        f"Event: {event.name}",
+        f"Date: {event_when}",
+        f"Venue: {event.venue_name}",
+        f"{event.venue_address}",
+        "",
+    ]
+    if custom_message:
+        plain_body_parts += [custom_message, ""]
+    plain_body_parts += [
+        "To confirm your attendance, you'll need to:",
+        "1. Create your Fundrbolt account (or log in if you already have one)",
+        "2. Complete your registration and select your meal preferences",
+        "3. RSVP for the event",
+        "",
+        "Click the link below to get started:",
+        field("registration_url"),
+        "",
+        "Best regards,",
+        f"The {brand_name} Team",
+    ]
+
+    return CampaignTemplate(
+        subject=PreparedTemplate.compile(f"You're Invited to {event.name}"),
+        body=PreparedTemplate.compile("\n".join(plain_body_parts)),
+        html_body=PreparedTemplate.compile(html_body, escape=True),
+    )
+
+
+class EmailCampaignService:
+    """Service for bulk guest email campaigns."""
+
+    @staticmethod
+    def _audience_filter(
+        event_id: UUID, audience: EmailCampaignAudience
+    ) -> list[ColumnElement[bool]]:
+        """WHERE clauses selecting campaign recipients (joined to EventRegistration)."""
+        clauses: list[ColumnElement[bool]] = [
+            EventRegistration.event_id == event_id,
+            EventRegistration.status != RegistrationStatus.CANCELLED,
+            RegistrationGuest.email.is_not(None),
+        ]
+        if audience == EmailCampaignAudience.UNCONFIRMED:
+            clauses.append(RegistrationGuest.user_id.is_(None))
+        elif audience == EmailCampaignAudience.NOT_INVITED:
+            clauses.append(RegistrationGuest.invitation_sent_at.is_(None))
+        return clauses
+
+    @staticmethod
+    async def create_campaign(
+        db: AsyncSession,
+        event_id: UUID,
+        audience: EmailCampaignAudience,
+        custom_message: str | None,
+        created_by_user_id: UUID | None,
+    ) -> EmailCampaign:
+        """
+        Create a pending guest invitation campaign.
+
+        Args:
+            db: Database session
+            event_id: Event UUID
+            audience: Which guests to email
+            custom_message: Optional message included in every email
+            created_by_user_id: Admin starting the campaign
+
+        Returns:
+            The pending campaign (run it with run_campaign after commit)
+
+        Raises:
+            HTTPException: If the event is not found or a campaign is already active
+        """
+        event = await db.get(Event, event_id)
+        if not event:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Event with ID {event_id} not found",
+            )
+
+        active = await db.execute(
+            select(EmailCampaign.id).where(
+                EmailCampaign.event_id == event_id,
+                EmailCampaign.status.in_(
+                    [EmailCampaignStatus.PENDING, EmailCampaignStatus.RUNNING]
+                ),
+            )
+        )
+        if active.first() is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="An email campaign is already in progress for this event",
+            )
+
+        total = await db.scalar(
+            select(func.count(RegistrationGuest.id))
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
+            .where(*EmailCampaignService._audience_filter(event_id, audience))
+        )
+
+        campaign = EmailCampaign(
+            event_id=event_id,
+            created_by_user_id=created_by_user_id,
+            campaign_type="guest_invitation",
+            audience=audience,
+            custom_message=custom_message,
+            status=EmailCampaignStatus.PENDING,
+            total_recipients=total or 0,
+            queued_count=0,
+        )
+        db.add(campaign)
+        await db.flush()
+        await db.refresh(campaign)
+        return campaign
+
+    @staticmethod
+    def _lease_expired() -> ColumnElement[bool]:
+        """Campaigns whose runner stopped renewing its lease."""
+        return or_(
+            EmailCampaign.lease_expires_at.is_(None),
+            EmailCampaign.lease_expires_at < func.now(),
+        )
+
+    @staticmethod
+    async def run_campaign(campaign_id: UUID) -> bool:
+        """
+        Queue a campaign's emails in throttled batches (background task).
+
+        The runner first claims the campaign: a pending one, or a running one
+        whose lease expired because its runner died. Recipients are read in
+        keyset batches of email_campaign_batch_size, starting after
+        last_recipient_id. Each batch is inserted into the outbox with one
+        multi-row INSERT and committed together with the new resume point and
+        a renewed lease. next_attempt_at is staggered by
+        email_campaign_batch_interval_seconds per batch so the dispatcher hands
+        the campaign to the provider at a bounded rate.
+
+        Args:
+            campaign_id: Campaign UUID
+
+        Returns:
+            False if the campaign wasn't claimed (finished, or running elsewhere)
+        """
+        async with AsyncSessionLocal() as db:
+            claimed = (
+                await db.execute(
+                    update(EmailCampaign)
+                    .where(
+                        EmailCampaign.id == campaign_id,
+                        or_(
+                            EmailCampaign.status == EmailCampaignStatus.PENDING,
+                            and_(
+                                EmailCampaign.status == EmailCampaignStatus.RUNNING,
+                                EmailCampaignService._lease_expired(),
+                            ),
+                        ),
+                    )
+                    .values(
+                        status=EmailCampaignStatus.RUNNING,
+                        started_at=func.coalesce(EmailCampaign.started_at, func.now()),
+                        lease_expires_at=func.now() + CAMPAIGN_LEASE,
+                    )
+                    .returning(EmailCampaign.last_recipient_id)
+                )
+            ).first()
+            await db.commit()
+            if claimed is None:
+                return False
+
+            campaign = await db.get(EmailCampaign, campaign_id)
+            assert campaign is not None
+            event = (
+                await db.execute(
+                    select(Event)
+                    .where(Event.id == campaign.event_id)
+                    .options(selectinload(Event.npo).selectinload(NPO.branding))
+                )
+            ).scalar_one()
+            template = build_guest_invitation_template(event, campaign.custom_message)
+            event_path = f"{settings.frontend_donor_url}/events/{event.slug or event.id}"
+
+            first_due_at = datetime.now(UTC)
+            batch_size = settings.email_campaign_batch_size
+            interval = timedelta(seconds=settings.email_campaign_batch_interval_seconds)
+            recipients = (
+                select(RegistrationGuest.id, RegistrationGuest.name, RegistrationGuest.email)
+                .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
+                .where(*EmailCampaignService._audience_filter(event.id, campaign.audience))
+                .order_by(RegistrationGuest.id)
+                .limit(batch_size)
+            )
+
+            try:
+                last_id: UUID | None = claimed.last_recipient_id
+                batch_index = 0
+                queued = 0
+                while True:
+                    stmt = recipients
+                    if last_id is not None:
+                        stmt = stmt.where(RegistrationGuest.id > last_id)
+                    rows = (await db.execute(stmt)).all()
+                    if not rows:
+                        break
+
+                    # Move the resume point first: its row lock makes a runner
+                    # that lost its lease wait here, then find it moved and stop
+                    guest_ids = [row.id for row in rows]
+                    advanced = await db.execute(
+                        update(EmailCampaign)
+                        .where(
+                            EmailCampaign.id == campaign_id,
+                            EmailCampaign.last_recipient_id.is_not_distinct_from(last_id),
+                        )
+                        .values(
+                            queued_count=EmailCampaign.queued_count + len(rows),
+                            last_recipient_id=guest_ids[-1],
+                            lease_expires_at=func.now() + CAMPAIGN_LEASE,
+                        )
+                        .returning(EmailCampaign.id)
+                    )
+                    if advanced.first() is None:
+                        await db.rollback()
+                        logger.warning(
+                            f"Email campaign {campaign_id} was resumed by another runner"
+                        )
+                        return True
+
+                    due_at = first_due_at + batch_index * interval
+                    outbox_rows: list[dict[str, Any]] = []
+                    for row in rows:
+                        subject, body, html_body = template.render(
+                            {
+                                "guest_name": row.name or "there",
+                                "registration_url": f"{event_path}/register?guest={row.id}",
+                            }
+                        )
+                        outbox_rows.append(
+                            {
+                                "email_type": campaign.campaign_type,
+                                "to_email": row.email,
+                                "subject": subject,
+                                "body": body,
+                                "html_body": html_body,
+                                "status": EmailOutboxStatus.PENDING,
+                                "attempts": 0,
+                                "next_attempt_at": due_at,
+                                "campaign_id": campaign_id,
+                            }
+                        )
+
+                    await db.execute(insert(EmailOutbox), outbox_rows)
+                    await db.execute(
+                        update(RegistrationGuest)
+                        .where(RegistrationGuest.id.in_(guest_ids))
+                        .values(invitation_sent_at=func.now())
+                    )
+                    mark_outbox_pending(db)
+                    await db.commit()
+
+                    last_id = guest_ids[-1]
+                    batch_index += 1
+                    queued += len(rows)
+
+                await db.execute(
+                    update(EmailCampaign)
+                    .where(
+                        EmailCampaign.id == campaign_id,
+                        EmailCampaign.last_recipient_id.is_not_distinct_from(last_id),
+                    )
+                    .values(
+                        status=EmailCampaignStatus.COMPLETED,
+                        completed_at=func.now(),
+                        lease_expires_at=None,
+                    )
+                )
+                await db.commit()
+                logger.info(
+                    f"Email campaign {campaign_id} queued {queued} emails "
+                    f"for event {event.id} in {batch_index} batches"
+                )
+            except Exception as e:
+                logger.exception(f"Email campaign {campaign_id} failed")
+                await db.rollback()
+                await db.execute(
+                    update(EmailCampaign)
+                    .where(
+                        EmailCampaign.id == campaign_id,
+                        EmailCampaign.status == EmailCampaignStatus.RUNNING,
+                    )
+                    .values(
+                        status=EmailCampaignStatus.FAILED,
+                        last_error=str(e)[:2000],
+                        completed_at=func.now(),
+                        lease_expires_at=None,
+                    )
+                )
+                await db.commit()
+            return True
+
+    @staticmethod
+    async def resume_stale_campaigns() -> int:
+        """
+        Run campaigns whose runner was lost (scheduled job).
+
+        Picks up running campaigns whose lease expired and pending campaigns
+        whose background task never started, and resumes each from its last
+        queued guest.
+
+        Returns:
+            Number of campaigns resumed
+        """
+        async with AsyncSessionLocal() as db:
+            stale = await db.scalars(
+                select(EmailCampaign.id)
+                .where(
+                    or_(
+                        and_(
+                            EmailCampaign.status == EmailCampaignStatus.PENDING,
+                            EmailCampaign.created_at < func.now() - CAMPAIGN_LEASE,
+                        ),
+                        and_(
+                            EmailCampaign.status == EmailCampaignStatus.RUNNING,
+                            EmailCampaignService._lease_expired(),
+                        ),
+                    )
+                )
+                .order_by(EmailCampaign.created_at)
+            )
+            campaign_ids = list(stale)
+
+        resumed = 0
+        for campaign_id in campaign_ids:
+            logger.warning(f"Resuming stalled email campaign {campaign_id}")
+            if await EmailCampaignService.run_campaign(campaign_id):
+                resumed += 1
+        return resumed
+
+    @staticmethod
+    async def get_campaign(db: AsyncSession, event_id: UUID, campaign_id: UUID) -> EmailCampaign:
+        """
+        Get a campaign of an event.
+
+        Raises:
+            HTTPException: If the campaign is not found
+        """
+        campaign = await db.get(EmailCampaign, campaign_id)
+        if campaign is None or campaign.event_id != event_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Email campaign with ID {campaign_id} not found",
+            )
+        return campaign
+
+    @staticmethod
+    async def get_delivery_counts(db: AsyncSession, campaign_id: UUID) -> dict[str, int]:
+        """Count the campaign's outbox emails by delivery status."""
+        result = await db.execute(
+            select(EmailOutbox.status, func.count())
+            .where(EmailOutbox.campaign_id == campaign_id)
+            .group_by(EmailOutbox.status)
+        )
+        counts = {s.value: 0 for s in EmailOutboxStatus}
+        for outbox_status, count in result.all():
+            counts[EmailOutboxStatus(outbox_status).value] = count
+        return counts
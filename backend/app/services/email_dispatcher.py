@@ -0,0 +1,304 @@
+"""Background dispatcher for the transactional email outbox.
+
+Request handlers never talk to the email provider: ``EmailService`` adds an
+``email_outbox`` row to the request's session and this dispatcher delivers it
+after the transaction commits.
+
+Each cycle claims up to ``email_dispatch_batch_size`` due rows with
+``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING``, so
+several API processes can run a dispatcher without double-sending. Claimed
+rows are sent concurrently (bounded by ``email_dispatch_concurrency``) over
+one shared backend, then all outcomes are written back in a single
+executemany UPDATE. Failures are retried with jittered exponential backoff
+up to ``email_max_attempts``.
+
+Commits that queued email wake the dispatcher immediately; otherwise it
+polls every ``email_dispatch_poll_seconds`` (for retries and for rows queued
+by other processes).
+"""
+
+import asyncio
+import random
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import get_logger
+from app.core.metrics import (
+    EMAIL_FAILURES_TOTAL,
+    EMAIL_OUTBOX_DELIVERIES_TOTAL,
+    EMAIL_SEND_DURATION_SECONDS,
+)
+from app.core.tracing import tracer
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.services.email_backends import EmailBackend, OutboundEmail, get_email_backend
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# A claimed row is re-delivered if its worker hasn't reported back by then
+CLAIM_LEASE = timedelta(minutes=5)
+SEND_TIMEOUT_SECONDS = 60.0
+
+# Session.info flag set when a session has queued outbox rows
+OUTBOX_PENDING_KEY = "email_outbox_pending"
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before the next attempt after ``attempts`` failed attempts.
+
+    Doubles from ``email_retry_base_seconds`` with +/-20% jitter to spread
+    retries out, capped at ``email_retry_max_seconds``.
+    """
+    delay = settings.email_retry_base_seconds * 2.0 ** min(max(attempts - 1, 0), 32)
+    jittered = delay * random.uniform(0.8, 1.2)  # nosec B311 - jitter, not security
+    return min(jittered, settings.email_retry_max_seconds)
+
+
+def mark_outbox_pending(db: AsyncSession) -> None:
+    """Flag a session so its commit wakes the dispatcher."""
+    db.info[OUTBOX_PENDING_KEY] = True
+
+
+class EmailDispatcher:
+    """Delivers outbox emails from a background asyncio task."""
+
+    def __init__(
+        self,
+        backend: EmailBackend | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+        poll_seconds: float | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        """Initialize dispatcher (defaults come from settings).
+
+        Args:
+            backend: Delivery backend (defaults to the configured shared backend)
+            batch_size: Rows claimed per cycle
+            concurrency: Max in-flight sends
+            poll_seconds: Idle poll interval
+            max_attempts: Attempts before a row is marked FAILED
+        """
+        self._backend = backend
+        self.batch_size = batch_size or settings.email_dispatch_batch_size
+        self.concurrency = concurrency or settings.email_dispatch_concurrency
+        self.poll_seconds = poll_seconds or settings.email_dispatch_poll_seconds
+        self.max_attempts = max_attempts or settings.email_max_attempts
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def backend(self) -> EmailBackend:
+        """Delivery backend, created on first use."""
+        if self._backend is None:
+            self._backend = get_email_backend()
+        return self._backend
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    def wake(self) -> None:
+        """Start a cycle now instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the background delivery loop."""
+        if self.running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="email-dispatcher")
+        logger.info(
+            "Email dispatcher started",
+            extra={
+                "backend": self.backend.name,
+                "batch_size": self.batch_size,
+                "concurrency": self.concurrency,
+            },
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop the loop, letting an in-flight batch finish within ``timeout``."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except TimeoutError:
+            # Claimed rows are re-delivered once their lease expires
+            logger.warning("Email dispatcher did not drain in time; cancelling")
+            self._task.cancel()
+        self._task = None
+        logger.info("Email dispatcher stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error("Email dispatch cycle failed", extra={"error": str(e)})
+                processed = 0
+
+            # A full batch means more rows are probably due
+            if processed >= self.batch_size or self._stopping:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except TimeoutError:
+                pass
+
+    async def run_once(self) -> int:
+        """Claim, send and record one batch of due emails.
+
+        Returns:
+            Number of emails processed (sent, retried or failed)
+        """
+        async with AsyncSessionLocal() as session:
+            claimed = await self._claim(session)
+            await session.commit()
+        if not claimed:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def deliver(row: EmailOutbox) -> dict[str, Any]:
+            async with semaphore:
+                with tracer.span(
+                    "email.deliver",
+                    root=True,
+                    attributes={"outbox_id": str(row.id), "email.type": row.email_type},
+                ):
+                    return await self._deliver(row)
+
+        outcomes = await asyncio.gather(*(deliver(row) for row in claimed))
+
+        async with AsyncSessionLocal() as session:
+            await session.execute(update(EmailOutbox), list(outcomes))
+            await session.commit()
+        return len(claimed)
+
+    async def _claim(self, session: AsyncSession) -> list[EmailOutbox]:
+        """Lease due rows to this worker (skipping rows locked by other workers)."""
+        due = (
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.status.in_([EmailOutboxStatus.PENDING, EmailOutboxStatus.SENDING]),
+                EmailOutbox.next_attempt_at <= func.now(),
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(due.scalar_subquery()))
+            .values(
+                status=EmailOutboxStatus.SENDING,
+                attempts=EmailOutbox.attempts + 1,
+                next_attempt_at=func.now() + CLAIM_LEASE,
+            )
+            .returning(EmailOutbox)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def _deliver(self, row: EmailOutbox) -> dict[str, Any]:
+        """Send one claimed row; return the column values to write back."""
+        message = OutboundEmail(
+            to_email=row.to_email,
+            subject=row.subject,
+            body=row.body,
+            email_type=row.email_type,
+            html_body=row.html_body,
+        )
+        now = datetime.now(UTC)
+        start = time.perf_counter()
+        try:
+            message_id = await asyncio.wait_for(
+                self.backend.send(message), timeout=SEND_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            EMAIL_FAILURES_TOTAL.inc()
+            error = str(e) or type(e).__name__
+            if row.attempts >= self.max_attempts:
+                EMAIL_OUTBOX_DELIVERIES_TOTAL.labels(
+                    email_type=row.email_type, result="failed"
+                ).inc()
+                logger.error(
+                    "Email delivery failed permanently",
+                    extra={
+                        "outbox_id": str(row.id),
+                        "email_type": row.email_type,
+                        "attempts": row.attempts,
+                        "error": error,
+                    },
+                )
+                return {"id": row.id, "status": EmailOutboxStatus.FAILED, "last_error": error}
+
+            delay = retry_delay(row.attempts)
+            EMAIL_OUTBOX_DELIVERIES_TOTAL.labels(email_type=row.email_type, result="retry").inc()
+            logger.warning(
+                "Email delivery failed, will retry",
+                extra={
+                    "outbox_id": str(row.id),
+                    "email_type": row.email_type,
+                    "attempts": row.attempts,
+                    "retry_in_seconds": round(delay, 1),
+                    "error": error,
+                },
+            )
+            return {
+                "id": row.id,
+                "status": EmailOutboxStatus.PENDING,
+                "next_attempt_at": now + timedelta(seconds=delay),
+                "last_error": error,
+            }
+        finally:
+            EMAIL_SEND_DURATION_SECONDS.labels(backend=self.backend.name).observe(
+                time.perf_counter() - start
+            )
+
+        EMAIL_OUTBOX_DELIVERIES_TOTAL.labels(email_type=row.email_type, result="sent").inc()
+        logger.info(
+            "Email sent",
+            extra={
+                "outbox_id": str(row.id),
+                "email_type": row.email_type,
+                "message_id": message_id,
+            },
+        )
+        return {
+            "id": row.id,
+            "status": EmailOutboxStatus.SENT,
+            "sent_at": now,
+            "provider_message_id": message_id,
+            "last_error": None,
+        }
+
+
+# Process-wide dispatcher, started from the app lifespan
+email_dispatcher = EmailDispatcher()
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_dispatcher_after_commit(session: Session) -> None:
+    if session.info.pop(OUTBOX_PENDING_KEY, False):
+        email_dispatcher.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_outbox_flag(session: Session) -> None:
+    session.info.pop(OUTBOX_PENDING_KEY, None)
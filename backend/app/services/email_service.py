@@ -2,13 +2,22 @@
 
 T057: Azure Communication Services email client for sending password reset emails
 T159: Error handling and retry logic for email service failures
+
+Emails sent with a database session are written to the email outbox in the
+caller's transaction and delivered by app.services.email_dispatcher; delivery
+itself goes through the backends in app.services.email_backends.
 """
 
 import asyncio
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.core.metrics import EMAIL_FAILURES_TOTAL
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.services.email_backends import OutboundEmail, backend_name, get_email_backend
+from app.services.email_dispatcher import mark_outbox_pending
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -20,6 +29,9 @@ def _create_email_html_template(
     cta_text: str | None = None,
     cta_url: str | None = None,
     footer_text: str | None = None,
+    brand_name: str = "Fundrbolt Platform",
+    brand_color: str = "#2563eb",
+    logo_url: str | None = None,
 ) -> str:
     """
     Create a professional HTML email template.
@@ -30,6 +42,9 @@ def _create_email_html_template(
         cta_text: Optional call-to-action button text
         cta_url: Optional call-to-action button URL
         footer_text: Optional footer text
+        brand_name: Header title (e.g. the NPO name for branded emails)
+        brand_color: Call-to-action button color
+        logo_url: Optional logo shown above the header title
 
     Returns:
         HTML email template string
@@ -47,7 +62,7 @@ def _create_email_html_template(
           <tr>
             <td>
               <a href="{cta_url}"
-                 style="background-color: #2563eb;
+                 style="background-color: {brand_color};
                         color: #ffffff;
                         padding: 14px 32px;
                         text-decoration: none;
@@ -61,6 +76,13 @@ def _create_email_html_template(
         </table>
         """
 
+    logo_html = ""
+    if logo_url:
+        logo_html = (
+            f'<img src="{logo_url}" alt="{brand_name}" '
+            'style="max-height: 64px; max-width: 240px; margin-bottom: 16px;">'
+        )
+
     # Build footer
     footer_html = ""
     if footer_text:
@@ -99,11 +121,12 @@ def _create_email_html_template(
                 <td style="padding: 40px;">
                   <!-- Header -->
                   <div style="text-align: center; margin-bottom: 32px;">
+                    {logo_html}
                     <h1 style="margin: 0;
                                color: #1f2937;
                                font-size: 24px;
                                font-weight: 700;">
-                      Fundrbolt Platform
+                      {brand_name}
                     </h1>
                   </div>
 
@@ -153,13 +176,13 @@ class EmailService:
 
     def __init__(self) -> None:
         """Initialize email service."""
-        # Check if Azure Communication Services credentials are configured
-        self.enabled = bool(settings.azure_communication_connection_string)
+        # Emails are only logged with the "log" backend (no credentials configured)
+        self.enabled = backend_name() != "log"
 
         if self.enabled:
             logger.info(
-                "EmailService initialized with Azure Communication Services",
-                extra={"email_from": settings.email_from_address},
+                "EmailService initialized",
+                extra={"email_from": settings.email_from_address, "backend": backend_name()},
             )
         else:
             logger.warning(
@@ -168,7 +191,11 @@ class EmailService:
             )
 
     async def send_password_reset_email(
-        self, to_email: str, reset_token: str, user_name: str | None = None
+        self,
+        to_email: str,
+        reset_token: str,
+        user_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send password reset email with reset link and retry logic.
@@ -177,6 +204,7 @@ class EmailService:
             to_email: Recipient email address
             reset_token: Password reset token
             user_name: Optional user's first name for personalization
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully, False otherwise
@@ -207,10 +235,14 @@ The Fundrbolt Platform Team
         """.strip()
 
         # Send with retry logic
-        return await self._send_email_with_retry(to_email, subject, body, "password_reset")
+        return await self._send_email_with_retry(to_email, subject, body, "password_reset", db=db)
 
     async def send_verification_email(
-        self, to_email: str, verification_token: str, user_name: str | None = None
+        self,
+        to_email: str,
+        verification_token: str,
+        user_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send email verification email with retry logic.
@@ -219,6 +251,7 @@ The Fundrbolt Platform Team
             to_email: Recipient email address
             verification_token: Email verification token
             user_name: Optional user's first name for personalization
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully, False otherwise
@@ -263,7 +296,9 @@ The Fundrbolt Platform Team
         )
 
         # Send with retry logic
-        return await self._send_email_with_retry(to_email, subject, body, "verification", html_body)
+        return await self._send_email_with_retry(
+            to_email, subject, body, "verification", html_body, db=db
+        )
 
     async def send_npo_member_invitation_email(
         self,
@@ -272,6 +307,7 @@ The Fundrbolt Platform Team
         npo_name: str,
         role: str,
         invited_by_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send NPO member invitation email.
@@ -282,6 +318,7 @@ The Fundrbolt Platform Team
             npo_name: Name of the NPO
             role: Role being offered (admin, co_admin, staff)
             invited_by_name: Name of person who sent invitation
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully
@@ -332,7 +369,7 @@ The Fundrbolt Platform Team
         )
 
         return await self._send_email_with_retry(
-            to_email, subject, body, "npo_invitation", html_body
+            to_email, subject, body, "npo_invitation", html_body, db=db
         )
 
     async def send_npo_invitation_accepted_email(
@@ -341,6 +378,7 @@ The Fundrbolt Platform Team
         npo_name: str,
         member_name: str,
         member_role: str,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send notification email when someone accepts an NPO invitation.
@@ -352,6 +390,7 @@ The Fundrbolt Platform Team
             npo_name: Name of the NPO
             member_name: Name of the person who accepted
             member_role: Role they accepted (admin, co_admin, staff)
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully
@@ -375,10 +414,16 @@ Best regards,
 The Fundrbolt Platform Team
         """.strip()
 
-        return await self._send_email_with_retry(to_email, subject, body, "npo_invitation_accepted")
+        return await self._send_email_with_retry(
+            to_email, subject, body, "npo_invitation_accepted", db=db
+        )
 
     async def send_npo_application_submitted_email(
-        self, to_email: str, npo_name: str, applicant_name: str | None = None
+        self,
+        to_email: str,
+        npo_name: str,
+        applicant_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send confirmation email when NPO application is submitted.
@@ -387,6 +432,7 @@ The Fundrbolt Platform Team
             to_email: NPO applicant's email
             npo_name: Name of the NPO
             applicant_name: Applicant's name
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully
@@ -410,11 +456,15 @@ The Fundrbolt Platform Team
         """.strip()
 
         return await self._send_email_with_retry(
-            to_email, subject, body, "npo_application_submitted"
+            to_email, subject, body, "npo_application_submitted", db=db
         )
 
     async def send_npo_application_approved_email(
-        self, to_email: str, npo_name: str, applicant_name: str | None = None
+        self,
+        to_email: str,
+        npo_name: str,
+        applicant_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send email when NPO application is approved.
@@ -423,6 +473,7 @@ The Fundrbolt Platform Team
             to_email: NPO applicant's email
             npo_name: Name of the NPO
             applicant_name: Applicant's name
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully
@@ -451,7 +502,7 @@ The Fundrbolt Platform Team
         """.strip()
 
         return await self._send_email_with_retry(
-            to_email, subject, body, "npo_application_approved"
+            to_email, subject, body, "npo_application_approved", db=db
         )
 
     async def send_npo_application_rejected_email(
@@ -460,6 +511,7 @@ The Fundrbolt Platform Team
         npo_name: str,
         rejection_reason: str | None = None,
         applicant_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send email when NPO application is rejected.
@@ -469,6 +521,7 @@ The Fundrbolt Platform Team
             npo_name: Name of the NPO
             rejection_reason: Reason for rejection (optional)
             applicant_name: Applicant's name
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully
@@ -494,7 +547,7 @@ The Fundrbolt Platform Team
         """.strip()
 
         return await self._send_email_with_retry(
-            to_email, subject, body, "npo_application_rejected"
+            to_email, subject, body, "npo_application_rejected", db=db
         )
 
     async def _send_email_with_retry(
@@ -504,9 +557,15 @@ The Fundrbolt Platform Team
         body: str,
         email_type: str,
         html_body: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
-        Send email with retry logic and error handling.
+        Queue an email in the outbox, or send it inline with retry logic.
+
+        With a session (and the outbox enabled) the email is added to the
+        caller's transaction and delivered by the background dispatcher after
+        commit, so the request never waits on the email provider. Without one
+        it is sent immediately through the configured backend.
 
         Args:
             to_email: Recipient email address
@@ -514,29 +573,31 @@ The Fundrbolt Platform Team
             body: Email body (plain text)
             email_type: Type of email (for logging)
             html_body: Optional HTML email body
+            db: Session to queue the email in; None sends inline
 
         Returns:
-            True if email sent successfully
+            True if email was queued or sent successfully
 
         Raises:
-            EmailSendError: If email fails after all retries
+            EmailSendError: If an inline send fails after all retries
         """
+        if db is not None and settings.email_outbox_enabled:
+            self.enqueue_email(db, to_email, subject, body, email_type, html_body)
+            return True
+
+        message = OutboundEmail(
+            to_email=to_email,
+            subject=subject,
+            body=body,
+            email_type=email_type,
+            html_body=html_body,
+        )
         max_retries = 3
         retry_delay = 1.0
 
         for attempt in range(max_retries):
             try:
-                if self.enabled:
-                    # Send via Azure Communication Services
-                    await self._send_via_azure(to_email, subject, body, html_body)
-                else:
-                    # Mock mode for development - just log
-                    logger.info(
-                        f"[MOCK EMAIL] {email_type} email\n"
-                        f"To: {to_email}\n"
-                        f"Subject: {subject}\n"
-                        f"Body:\n{body}"
-                    )
+                await get_email_backend().send(message)
                 return True
 
             except Exception as e:
@@ -572,8 +633,52 @@ The Fundrbolt Platform Team
 
         return False  # Should not reach here
 
+    @staticmethod
+    def enqueue_email(
+        db: AsyncSession,
+        to_email: str,
+        subject: str,
+        body: str,
+        email_type: str,
+        html_body: str | None = None,
+    ) -> EmailOutbox:
+        """
+        Add an email to the outbox in the caller's transaction.
+
+        Nothing is flushed or committed here; the email is delivered only if
+        the caller's transaction commits, and the commit wakes the dispatcher.
+
+        Args:
+            db: Database session of the triggering change
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body (plain text)
+            email_type: Type of email (for logging and metrics)
+            html_body: Optional HTML email body
+
+        Returns:
+            The pending outbox row
+        """
+        outbox = EmailOutbox(
+            email_type=email_type,
+            to_email=to_email,
+            subject=subject,
+            body=body,
+            html_body=html_body,
+            status=EmailOutboxStatus.PENDING,
+            attempts=0,
+        )
+        db.add(outbox)
+        mark_outbox_pending(db)
+        logger.debug("Email queued", extra={"email_type": email_type, "to_email": to_email})
+        return outbox
+
     async def send_application_submitted_email(
-        self, to_email: str, npo_name: str, applicant_name: str | None = None
+        self,
+        to_email: str,
+        npo_name: str,
+        applicant_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send confirmation email when NPO application is submitted.
@@ -585,6 +690,7 @@ The Fundrbolt Platform Team
             to_email: NPO creator's email address
             npo_name: Name of the NPO
             applicant_name: Optional applicant's name for personalization
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully, False otherwise
@@ -615,14 +721,15 @@ This is an automated message. Please do not reply to this email.
         """.strip()
 
         return await self._send_email_with_retry(
-            to_email=to_email,
-            subject=subject,
-            body=body,
-            email_type="application_submitted",
+            to_email=to_email, subject=subject, body=body, email_type="application_submitted", db=db
         )
 
     async def send_application_approved_email(
-        self, to_email: str, npo_name: str, applicant_name: str | None = None
+        self,
+        to_email: str,
+        npo_name: str,
+        applicant_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send notification email when NPO application is approved.
@@ -634,6 +741,7 @@ This is an automated message. Please do not reply to this email.
             to_email: NPO creator's email address
             npo_name: Name of the NPO
             applicant_name: Optional applicant's name for personalization
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully, False otherwise
@@ -666,10 +774,7 @@ This is an automated message. Please do not reply to this email.
         """.strip()
 
         return await self._send_email_with_retry(
-            to_email=to_email,
-            subject=subject,
-            body=body,
-            email_type="application_approved",
+            to_email=to_email, subject=subject, body=body, email_type="application_approved", db=db
         )
 
     async def send_application_rejected_email(
@@ -678,6 +783,7 @@ This is an automated message. Please do not reply to this email.
         npo_name: str,
         reason: str | None = None,
         applicant_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send notification email when NPO application is rejected.
@@ -690,6 +796,7 @@ This is an automated message. Please do not reply to this email.
             npo_name: Name of the NPO
             reason: Optional reason for rejection
             applicant_name: Optional applicant's name for personalization
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully, False otherwise
@@ -718,14 +825,15 @@ This is an automated message. Please do not reply to this email.
         """.strip()
 
         return await self._send_email_with_retry(
-            to_email=to_email,
-            subject=subject,
-            body=body,
-            email_type="application_rejected",
+            to_email=to_email, subject=subject, body=body, email_type="application_rejected", db=db
         )
 
     async def send_admin_application_notification_email(
-        self, npo_name: str, npo_email: str, applicant_name: str | None = None
+        self,
+        npo_name: str,
+        npo_email: str,
+        applicant_name: str | None = None,
+        db: AsyncSession | None = None,
     ) -> bool:
         """
         Send notification to admins when a new NPO application is submitted.
@@ -737,6 +845,7 @@ This is an automated message. Please do not reply to this email.
             npo_name: Name of the NPO
             npo_email: NPO contact email
             applicant_name: Optional applicant's name
+            db: Session to queue the email in (sent after commit); None sends inline
 
         Returns:
             True if email sent successfully, False otherwise
@@ -769,89 +878,9 @@ This is an automated notification from the Fundrbolt Platform.
             subject=subject,
             body=body,
             email_type="admin_application_notification",
+            db=db,
         )
 
-    async def _send_via_azure(
-        self, to_email: str, subject: str, body: str, html_body: str | None = None
-    ) -> None:
-        """
-        Send email via Azure Communication Services.
-
-        Args:
-            to_email: Recipient email address
-            subject: Email subject
-            body: Email body (plain text)
-            html_body: Optional HTML email body
-
-        Raises:
-            EmailSendError: If sending fails
-        """
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-        from typing import Any
-
-        def _send_sync() -> Any:
-            """Synchronous send operation to run in thread pool."""
-            try:
-                from azure.communication.email import EmailClient
-
-                if not settings.azure_communication_connection_string:
-                    raise EmailSendError(
-                        "Azure Communication Services connection string not configured"
-                    )
-
-                # Initialize client
-                client = EmailClient.from_connection_string(
-                    settings.azure_communication_connection_string
-                )
-
-                # Prepare message content
-                content = {
-                    "subject": subject,
-                    "plainText": body,
-                }
-                if html_body:
-                    content["html"] = html_body
-
-                # Prepare message
-                message = {
-                    "senderAddress": settings.email_from_address,
-                    "recipients": {"to": [{"address": to_email}]},
-                    "content": content,
-                }
-
-                # Send email (synchronous Azure SDK call)
-                poller = client.begin_send(message)
-                result = poller.result()
-
-                logger.info(
-                    "Email sent via Azure Communication Services",
-                    extra={
-                        "to": to_email,
-                        "subject": subject,
-                        "message_id": result.get("id"),
-                        "status": result.get("status"),
-                    },
-                )
-                return result
-
-            except ImportError as e:
-                raise EmailSendError(
-                    "Azure Communication Email SDK not installed. "
-                    "Install with: poetry add azure-communication-email"
-                ) from e
-            except Exception as e:
-                logger.error(
-                    "Failed to send email via Azure",
-                    extra={"to": to_email, "subject": subject, "error": str(e)},
-                )
-                raise EmailSendError(f"Failed to send email: {str(e)}") from e
-
-        # Run synchronous Azure SDK call in thread pool to avoid blocking event loop
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            await loop.run_in_executor(executor, _send_sync)
-
 
 # Singleton instance
 _email_service: EmailService | None = None
@@ -0,0 +1,152 @@
+"""Resolved event branding, cached per event.
+
+Resolving an event's branding walks event → NPO → NPO branding → event media
+and applies the system default colors. The result only changes when the event,
+its media, or its NPO's name or branding change, so each event's resolved
+fragment is kept in a ResponseCache tagged with the event and its NPO, and
+dropped by those writes.
+"""
+
+import uuid
+from collections.abc import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.cache import CachedBody, ResponseCache
+from app.core.config import get_settings
+from app.models.event import Event, EventMedia, EventMediaStatus
+from app.models.npo import NPO
+from app.schemas.event_with_branding import ResolvedEventBranding
+
+settings = get_settings()
+
+# Default branding colors (system fallback)
+DEFAULT_PRIMARY = "#3B82F6"
+DEFAULT_SECONDARY = "#9333EA"
+DEFAULT_BACKGROUND = "#FFFFFF"
+DEFAULT_ACCENT = "#3B82F6"
+
+event_branding_cache = ResponseCache(
+    "event_branding", ttl_seconds=settings.event_branding_cache_ttl_seconds
+)
+
+
+def _event_tag(event_id: uuid.UUID) -> str:
+    return f"event:{event_id}"
+
+
+def _npo_tag(npo_id: uuid.UUID) -> str:
+    return f"npo:{npo_id}"
+
+
+class EventBrandingService:
+    """Service for resolved (event → NPO → default) event branding."""
+
+    @staticmethod
+    def resolve(event: Event) -> ResolvedEventBranding:
+        """Resolve an event's branding.
+
+        Args:
+            event: Event with npo, npo.branding and media loaded
+
+        Returns:
+            ResolvedEventBranding for the event
+        """
+        npo = event.npo
+        npo_branding = npo.branding if npo else None
+
+        # Resolve thumbnail: first event media, then event logo, then NPO logo
+        thumbnail_url: str | None = None
+        if event.media:
+            thumbnail_url = event.media[0].file_url
+        elif event.logo_url:
+            thumbnail_url = event.logo_url
+        elif npo_branding and npo_branding.logo_url:
+            thumbnail_url = npo_branding.logo_url
+
+        return ResolvedEventBranding(
+            id=event.id,
+            name=event.name,
+            slug=event.slug,
+            event_datetime=event.event_datetime,
+            timezone=event.timezone or "UTC",
+            thumbnail_url=thumbnail_url,
+            primary_color=(
+                event.primary_color
+                or (npo_branding.primary_color if npo_branding else None)
+                or DEFAULT_PRIMARY
+            ),
+            secondary_color=(
+                event.secondary_color
+                or (npo_branding.secondary_color if npo_branding else None)
+                or DEFAULT_SECONDARY
+            ),
+            background_color=(
+                event.background_color
+                or (npo_branding.background_color if npo_branding else None)
+                or DEFAULT_BACKGROUND
+            ),
+            accent_color=(
+                event.accent_color
+                or (npo_branding.accent_color if npo_branding else None)
+                or DEFAULT_ACCENT
+            ),
+            npo_name=npo.name if npo else "Unknown Organization",
+            npo_logo_url=npo_branding.logo_url if npo_branding else None,
+        )
+
+    @staticmethod
+    async def get_resolved(
+        db: AsyncSession, event_ids: Iterable[uuid.UUID]
+    ) -> dict[uuid.UUID, ResolvedEventBranding]:
+        """Get resolved branding for events, from cache where possible.
+
+        Events missing from the cache are loaded together in one query.
+
+        Args:
+            db: Database session
+            event_ids: Event IDs
+
+        Returns:
+            Resolved branding by event ID (unknown events are left out)
+        """
+
+        async def load(keys: list[str]) -> dict[str, CachedBody]:
+            query = (
+                select(Event)
+                .where(Event.id.in_([uuid.UUID(key) for key in keys]))
+                .options(
+                    selectinload(Event.npo).options(selectinload(NPO.branding)),
+                    selectinload(Event.media.and_(EventMedia.status == EventMediaStatus.SCANNED)),
+                )
+            )
+            events = (await db.execute(query)).scalars().all()
+            return {
+                str(event.id): CachedBody(
+                    EventBrandingService.resolve(event).model_dump_json().encode(),
+                    (_event_tag(event.id), _npo_tag(event.npo_id)),
+                )
+                for event in events
+            }
+
+        bodies = await event_branding_cache.get_many_or_load(
+            (str(event_id) for event_id in event_ids), load
+        )
+        return {
+            uuid.UUID(key): ResolvedEventBranding.model_validate_json(body)
+            for key, body in bodies.items()
+        }
+
+    @staticmethod
+    async def invalidate_events(*event_ids: uuid.UUID) -> None:
+        """Drop cached branding for events after a committed change to them."""
+        await event_branding_cache.invalidate_tags(
+            *(_event_tag(event_id) for event_id in event_ids)
+        )
+
+    @staticmethod
+    async def invalidate_npo(npo_id: uuid.UUID) -> None:
+        """Drop cached branding for all of an NPO's events (name or branding changed)."""
+        await event_branding_cache.invalidate_tags(_npo_tag(npo_id))
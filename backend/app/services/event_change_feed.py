@@ -0,0 +1,379 @@
+"""Event-scoped change notifications over Redis pub/sub.
+
+Seating, check-in and catalog screens subscribe to one stream per event
+(``GET /api/v1/events/{event_id}/changes``) and refetch only when a change
+arrives, instead of polling the heavy occupancy and list queries.
+
+Changes are collected from the ORM at flush time (guests, registrations,
+tables and auction items of the event) and published once the transaction
+commits, so subscribers never see a change that was rolled back. Bulk
+``UPDATE`` statements bypass the ORM and must call ``queue_event_change``.
+
+Each published change carries a per-event version (a Redis counter) and
+only ids, never guest details: clients refetch through the usual
+authorized endpoints. Every API process holds one pub/sub connection and
+subscribes to an event's channel while it has local listeners, so a change
+committed on any replica reaches every connected client.
+
+Delivery is best effort. A listener that falls behind, or any listener
+while the pub/sub connection is down, gets a ``resync`` message and should
+refetch everything.
+"""
+
+import asyncio
+import json
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import instance_state
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import EVENT_CHANGES_PUBLISHED_TOTAL, EVENT_STREAM_CONNECTIONS
+from app.core.redis import execute_pipeline, get_redis
+from app.models.auction_item import AuctionItem
+from app.models.event_registration import EventRegistration
+from app.models.event_table import EventTable
+from app.models.registration_guest import RegistrationGuest
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Change topics
+CHECKIN = "checkin"
+SEATING = "seating"
+REGISTRATIONS = "registrations"
+AUCTION_ITEMS = "auction_items"
+
+# Sent to a listener that may have missed changes; it should refetch everything
+RESYNC = "resync"
+
+# Session.info key holding changes queued by the current transaction
+PENDING_CHANGES_KEY = "event_changes_pending"
+
+# Past this many ids a change only names its topic (clients refetch the list)
+MAX_IDS_PER_CHANGE = 200
+
+VERSION_TTL_SECONDS = 7 * 24 * 3600
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+def channel_name(event_id: uuid.UUID) -> str:
+    """Pub/sub channel for an event's changes."""
+    return f"event_changes:{event_id}"
+
+
+def version_key(event_id: uuid.UUID) -> str:
+    """Redis counter holding the version of an event's latest change."""
+    return f"event_changes:{event_id}:version"
+
+
+@dataclass
+class EventChange:
+    """Ids touched by one transaction under one (event, topic)."""
+
+    event_id: uuid.UUID
+    topic: str
+    ids: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    def add(self, **ids: Iterable[object]) -> None:
+        """Merge ids into the change, e.g. ``add(guest_ids=[guest.id])``."""
+        for name, values in ids.items():
+            self.ids[name].update(str(value) for value in values)
+
+    def payload(self) -> dict[str, Any]:
+        """JSON-ready ids; oversized lists are dropped (refetch the whole topic)."""
+        return {
+            name: sorted(values)
+            for name, values in self.ids.items()
+            if values and len(values) <= MAX_IDS_PER_CHANGE
+        }
+
+
+def queue_event_change(
+    db: Session | AsyncSession, event_id: uuid.UUID, topic: str, **ids: Iterable[object]
+) -> None:
+    """Queue a change to publish when the session's transaction commits.
+
+    Only needed for writes that bypass the ORM (bulk UPDATE/DELETE); changes
+    to mapped objects are picked up automatically at flush.
+
+    Args:
+        db: Session (sync or async) whose commit publishes the change
+        event_id: Event the change belongs to
+        topic: One of the change topics (CHECKIN, SEATING, ...)
+        ids: Named id lists, e.g. ``guest_ids=[...]``
+    """
+    pending: dict[tuple[uuid.UUID, str], EventChange] = db.info.setdefault(PENDING_CHANGES_KEY, {})
+    change = pending.get((event_id, topic))
+    if change is None:
+        change = pending[(event_id, topic)] = EventChange(event_id, topic)
+    change.add(**ids)
+
+
+# (model, id name, event id attribute, column -> topic, topic of other changes)
+_TRACKED: tuple[tuple[type[Any], str, str, dict[str, str], str], ...] = (
+    (
+        RegistrationGuest,
+        "guest_ids",
+        "event_id",
+        {
+            "checked_in": CHECKIN,
+            "table_number": SEATING,
+            "bidder_number": SEATING,
+            "is_table_captain": SEATING,
+        },
+        REGISTRATIONS,
+    ),
+    (EventRegistration, "registration_ids", "event_id", {"check_in_time": CHECKIN}, REGISTRATIONS),
+    (EventTable, "table_ids", "event_id", {}, SEATING),
+    (AuctionItem, "item_ids", "event_id", {}, AUCTION_ITEMS),
+)
+
+
+def _changed_topics(obj: object, columns: dict[str, str], default: str, new: bool) -> set[str]:
+    """Topics affected by a flushed object (every mapped topic if inserted/deleted)."""
+    if new:
+        return {default, *columns.values()}
+    state = instance_state(obj)
+    topics: set[str] = set()
+    for attr in state.mapper.column_attrs:
+        if state.attrs[attr.key].history.has_changes():
+            topics.add(columns.get(attr.key, default))
+    return topics
+
+
+def collect_changes(session: Session) -> None:
+    """Queue changes for the tracked objects in a session's flush."""
+    touched = [(obj, True) for obj in (*session.new, *session.deleted)]
+    touched += [(obj, False) for obj in session.dirty]
+    for obj, new in touched:
+        for model, id_name, event_attr, columns, default in _TRACKED:
+            if not isinstance(obj, model):
+                continue
+            # Read from the instance dict: a deleted row can't be refreshed
+            state = instance_state(obj)
+            event_id = state.dict.get(event_attr)
+            if event_id is None:
+                break
+            for topic in _changed_topics(obj, columns, default, new):
+                queue_event_change(session, event_id, topic, **{id_name: [state.dict.get("id")]})
+            break
+
+
+class Subscription:
+    """One listener's bounded queue of change messages."""
+
+    def __init__(self, event_id: uuid.UUID, max_size: int) -> None:
+        self.event_id = event_id
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_size)
+
+    def deliver(self, message: dict[str, Any]) -> None:
+        """Queue a message; a full queue is replaced by a single resync."""
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.resync()
+
+    def resync(self) -> None:
+        """Drop queued messages; the listener must refetch everything."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait({"topic": RESYNC})
+
+    async def get(self, timeout: float) -> dict[str, Any] | None:
+        """Next message, or None if nothing arrived within ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+
+class EventChangeFeed:
+    """Publishes committed changes and fans them out to this process's listeners."""
+
+    def __init__(self, queue_size: int | None = None) -> None:
+        """Initialize feed (defaults come from settings).
+
+        Args:
+            queue_size: Messages buffered per listener before it is resynced
+        """
+        self.queue_size = queue_size or settings.event_stream_queue_size
+        self._subscriptions: dict[uuid.UUID, set[Subscription]] = defaultdict(set)
+        self._pubsub: Any = None
+        self._channels_changed = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._publishing: set[asyncio.Task[None]] = set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the pub/sub listener is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def connections(self) -> int:
+        """Listeners connected to this process."""
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    async def start(self) -> None:
+        """Open the pub/sub connection and start the listener loop."""
+        if self.running:
+            return
+        client = await get_redis()
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self._channels_changed = asyncio.Event()
+        for event_id in self._subscriptions:
+            await self._pubsub.subscribe(channel_name(event_id))
+        self._task = asyncio.create_task(self._run(), name="event-change-feed")
+        logger.info("Event change feed started")
+
+    async def stop(self) -> None:
+        """Finish in-flight publishes and close the pub/sub connection."""
+        if self._publishing:
+            await asyncio.gather(*self._publishing, return_exceptions=True)
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        with suppress(RedisError):
+            await self._pubsub.aclose()
+        self._pubsub = None
+        logger.info("Event change feed stopped")
+
+    async def current_version(self, event_id: uuid.UUID) -> int:
+        """Version of the event's latest published change (0 if none)."""
+        client = await get_redis()
+        return int(await client.get(version_key(event_id)) or 0)
+
+    @asynccontextmanager
+    async def subscribe(self, event_id: uuid.UUID) -> AsyncIterator[Subscription]:
+        """Listen to an event's changes for the duration of the block."""
+        if not self.running:
+            await self.start()
+        if event_id not in self._subscriptions:
+            await self._pubsub.subscribe(channel_name(event_id))
+            self._channels_changed.set()
+        subscription = Subscription(event_id, self.queue_size)
+        listeners = self._subscriptions[event_id]
+        listeners.add(subscription)
+        EVENT_STREAM_CONNECTIONS.inc()
+        try:
+            yield subscription
+        finally:
+            EVENT_STREAM_CONNECTIONS.dec()
+            listeners.discard(subscription)
+            if not listeners:
+                del self._subscriptions[event_id]
+                if self._pubsub is not None:
+                    with suppress(RedisError):
+                        await self._pubsub.unsubscribe(channel_name(event_id))
+
+    def publish_soon(self, changes: Iterable[EventChange]) -> None:
+        """Publish from a background task (called after commit)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Sync scripts: nobody is listening
+        task = loop.create_task(self.publish(list(changes)))
+        self._publishing.add(task)
+        task.add_done_callback(self._publishing.discard)
+
+    async def publish(self, changes: list[EventChange]) -> None:
+        """Version and publish changes (two round trips however many there are).
+
+        Failures are logged, not raised: the data is already committed and
+        clients fall back to refetching on their next resync.
+        """
+        if not changes:
+            return
+        try:
+            counts: dict[uuid.UUID, int] = defaultdict(int)
+            for change in changes:
+                counts[change.event_id] += 1
+
+            def bump(pipe: Any) -> None:
+                for event_id, count in counts.items():
+                    pipe.incrby(version_key(event_id), count)
+                    pipe.expire(version_key(event_id), VERSION_TTL_SECONDS)
+
+            replies = await execute_pipeline("event_changes.version", bump)
+            next_version = {
+                event_id: version - counts[event_id] + 1
+                for event_id, version in zip(counts, replies[::2], strict=True)
+            }
+
+            messages = []
+            for change in changes:
+                version = next_version[change.event_id]
+                next_version[change.event_id] += 1
+                message = {"topic": change.topic, "version": version, "ids": change.payload()}
+                messages.append((channel_name(change.event_id), json.dumps(message)))
+
+            await execute_pipeline(
+                "event_changes.publish",
+                lambda pipe: [pipe.publish(channel, data) for channel, data in messages],
+            )
+        except RedisError as e:
+            logger.warning("Could not publish event changes", extra={"error": str(e)})
+            return
+        for change in changes:
+            EVENT_CHANGES_PUBLISHED_TOTAL.labels(topic=change.topic).inc()
+
+    def _dispatch(self, channel: str, data: str) -> None:
+        event_id = uuid.UUID(channel.rsplit(":", 1)[-1])
+        message = json.loads(data)
+        for subscription in self._subscriptions.get(event_id, ()):
+            subscription.deliver(message)
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pubsub.subscribed:
+                self._channels_changed.clear()
+                await self._channels_changed.wait()
+                continue
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except (RedisError, OSError) as e:
+                # Messages published meanwhile are lost; the connection
+                # resubscribes its channels when it reconnects
+                logger.warning("Event change feed disconnected", extra={"error": str(e)})
+                for subscriptions in self._subscriptions.values():
+                    for subscription in subscriptions:
+                        subscription.resync()
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                continue
+            if message is not None and message["type"] == "message":
+                self._dispatch(message["channel"], message["data"])
+
+
+# Process-wide feed, started from the app lifespan
+event_change_feed = EventChangeFeed()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes_after_flush(session: Session, flush_context: Any) -> None:
+    collect_changes(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes_after_commit(session: Session) -> None:
+    pending = session.info.pop(PENDING_CHANGES_KEY, None)
+    if pending and settings.event_stream_enabled:
+        event_change_feed.publish_soon(pending.values())
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changes_after_rollback(session: Session, previous_transaction: Any) -> None:
+    # A rolled back savepoint keeps the queue: an extra notification is harmless
+    if previous_transaction.parent is None:
+        session.info.pop(PENDING_CHANGES_KEY, None)
@@ -3,15 +3,23 @@
 import logging
 import uuid
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import (
+    KeysetPage,
+    SortKey,
+    TotalMode,
+    count_total,
+    order_by_keys,
+    paginate_keyset,
+)
 from app.models.event import Event, EventStatus
 from app.models.event_registration import EventRegistration, RegistrationStatus
-from app.models.npo import NPO
 from app.models.registration_guest import RegistrationGuest
 from app.models.user import User
 from app.schemas.event_registration import (
@@ -20,9 +28,22 @@ from app.schemas.event_registration import (
 )
 from app.schemas.event_with_branding import RegisteredEventWithBranding
 from app.services.bidder_number_service import BidderNumberService
+from app.services.event_branding_service import EventBrandingService
 
 logger = logging.getLogger(__name__)
 
+# Newest registrations first; id breaks ties for a total keyset order
+USER_REGISTRATION_SORT = (
+    SortKey(EventRegistration.created_at, descending=True),
+    SortKey(EventRegistration.id, descending=True),
+)
+
+# An event's registrations in sign-up order (oldest first)
+EVENT_REGISTRATION_SORT = (
+    SortKey(EventRegistration.created_at),
+    SortKey(EventRegistration.id),
+)
+
 
 class EventRegistrationService:
     """Service for event registration operations."""
@@ -141,6 +162,62 @@ class EventRegistrationService:
         Returns:
             Tuple of (registrations, total_count)
         """
+        query = EventRegistrationService._user_registrations_query(user_id, status_filter)
+
+        # Get total count
+        total = await count_total(db, query, "exact", scope="user_registrations") or 0
+
+        # Get paginated results
+        query = order_by_keys(query, USER_REGISTRATION_SORT)
+        query = query.offset((page - 1) * per_page).limit(per_page)
+
+        result = await db.execute(query)
+        registrations = result.scalars().all()
+
+        return list(registrations), total
+
+    @staticmethod
+    async def get_user_registrations_keyset(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        status_filter: RegistrationStatus | None = None,
+        cursor: str | None = None,
+        limit: int = 10,
+        total_mode: TotalMode = "none",
+    ) -> KeysetPage[EventRegistration]:
+        """
+        Get a user's registrations with keyset (cursor) pagination.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            status_filter: Optional status filter
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Page size
+            total_mode: How to compute the total (exact, cached, estimate, none)
+
+        Returns:
+            KeysetPage of registrations
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another listing
+        """
+        return await paginate_keyset(
+            db,
+            EventRegistrationService._user_registrations_query(user_id, status_filter),
+            USER_REGISTRATION_SORT,
+            scope="user_registrations",
+            cursor=cursor,
+            limit=limit,
+            total_mode=total_mode,
+        )
+
+    @staticmethod
+    def _user_registrations_query(
+        user_id: uuid.UUID,
+        status_filter: RegistrationStatus | None,
+    ) -> Select[Any]:
+        """Build the filtered (unordered, unpaginated) user registrations query."""
         query = (
             select(EventRegistration)
             .where(EventRegistration.user_id == user_id)
@@ -154,19 +231,7 @@ class EventRegistrationService:
         if status_filter:
             query = query.where(EventRegistration.status == status_filter)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Get paginated results
-        query = query.order_by(EventRegistration.created_at.desc())
-        query = query.offset((page - 1) * per_page).limit(per_page)
-
-        result = await db.execute(query)
-        registrations = result.scalars().all()
-
-        return list(registrations), total
+        return query
 
     @staticmethod
     async def get_registered_events_with_branding(
@@ -178,7 +243,8 @@ class EventRegistrationService:
 
         Returns events sorted with upcoming events first (ascending by date),
         then past events (descending by date). Branding resolves via
-        fallback chain: event → NPO → system defaults.
+        fallback chain: event → NPO → system defaults (cached per event by
+        EventBrandingService).
 
         Args:
             db: Database session
@@ -187,82 +253,35 @@ class EventRegistrationService:
         Returns:
             List of RegisteredEventWithBranding objects
         """
-        # Default branding colors (system fallback)
-        DEFAULT_PRIMARY = "#3B82F6"
-        DEFAULT_SECONDARY = "#9333EA"
-        DEFAULT_BACKGROUND = "#FFFFFF"
-        DEFAULT_ACCENT = "#3B82F6"
-
         now = datetime.now(UTC)
         upcoming_cutoff = now + timedelta(days=30)
 
-        # Query registrations with event, NPO, and branding data
-        query = (
-            select(EventRegistration)
-            .where(
-                and_(
-                    EventRegistration.user_id == user_id,
-                    EventRegistration.status.in_(
-                        [
-                            RegistrationStatus.PENDING,
-                            RegistrationStatus.CONFIRMED,
-                            RegistrationStatus.WAITLISTED,
-                        ]
-                    ),
-                )
-            )
-            .options(
-                selectinload(EventRegistration.event).options(
-                    selectinload(Event.npo).options(selectinload(NPO.branding)),
-                    selectinload(Event.media),
+        # Only the user's event ids come from the database per request; each
+        # event's resolved branding is a cached fragment
+        query = select(EventRegistration.event_id).where(
+            and_(
+                EventRegistration.user_id == user_id,
+                EventRegistration.status.in_(
+                    [
+                        RegistrationStatus.PENDING,
+                        RegistrationStatus.CONFIRMED,
+                        RegistrationStatus.WAITLISTED,
+                    ]
                 ),
             )
         )
+        event_ids = list(dict.fromkeys((await db.execute(query)).scalars()))
+        resolved = await EventBrandingService.get_resolved(db, event_ids)
 
-        result = await db.execute(query)
-        registrations = result.scalars().all()
-
-        # Transform to RegisteredEventWithBranding objects
         events_with_branding: list[RegisteredEventWithBranding] = []
 
-        for reg in registrations:
-            event = reg.event
-            npo = event.npo
-            npo_branding = npo.branding if npo else None
-
-            # Resolve thumbnail: first event media, then NPO logo
-            thumbnail_url: str | None = None
-            if event.media and len(event.media) > 0:
-                thumbnail_url = event.media[0].file_url
-            elif event.logo_url:
-                thumbnail_url = event.logo_url
-            elif npo_branding and npo_branding.logo_url:
-                thumbnail_url = npo_branding.logo_url
-
-            # Resolve colors with fallback chain: event → NPO → defaults
-            primary_color = (
-                event.primary_color
-                or (npo_branding.primary_color if npo_branding else None)
-                or DEFAULT_PRIMARY
-            )
-            secondary_color = (
-                event.secondary_color
-                or (npo_branding.secondary_color if npo_branding else None)
-                or DEFAULT_SECONDARY
-            )
-            background_color = (
-                event.background_color
-                or (npo_branding.background_color if npo_branding else None)
-                or DEFAULT_BACKGROUND
-            )
-            accent_color = (
-                event.accent_color
-                or (npo_branding.accent_color if npo_branding else None)
-                or DEFAULT_ACCENT
-            )
+        for event_id in event_ids:
+            branding = resolved.get(event_id)
+            if branding is None:
+                continue
 
             # Determine is_past and is_upcoming
-            event_dt = event.event_datetime
+            event_dt = branding.event_datetime
             if event_dt.tzinfo is None:
                 # Assume UTC if no timezone
                 event_dt = event_dt.replace(tzinfo=UTC)
@@ -272,20 +291,7 @@ class EventRegistrationService:
 
             events_with_branding.append(
                 RegisteredEventWithBranding(
-                    id=event.id,
-                    name=event.name,
-                    slug=event.slug,
-                    event_datetime=event.event_datetime,
-                    timezone=event.timezone or "UTC",
-                    is_past=is_past,
-                    is_upcoming=is_upcoming,
-                    thumbnail_url=thumbnail_url,
-                    primary_color=primary_color,
-                    secondary_color=secondary_color,
-                    background_color=background_color,
-                    accent_color=accent_color,
-                    npo_name=npo.name if npo else "Unknown Organization",
-                    npo_logo_url=npo_branding.logo_url if npo_branding else None,
+                    **branding.model_dump(), is_past=is_past, is_upcoming=is_upcoming
                 )
             )
 
@@ -323,6 +329,62 @@ class EventRegistrationService:
         Returns:
             Tuple of (registrations, total_count)
         """
+        query = EventRegistrationService._event_registrations_query(event_id, status_filter)
+
+        # Get total count
+        total = await count_total(db, query, "exact", scope="event_registrations") or 0
+
+        # Get paginated results
+        query = order_by_keys(query, EVENT_REGISTRATION_SORT)
+        query = query.offset((page - 1) * per_page).limit(per_page)
+
+        result = await db.execute(query)
+        registrations = result.scalars().all()
+
+        return list(registrations), total
+
+    @staticmethod
+    async def get_event_registrations_keyset(
+        db: AsyncSession,
+        event_id: uuid.UUID,
+        status_filter: RegistrationStatus | None = None,
+        cursor: str | None = None,
+        limit: int = 10,
+        total_mode: TotalMode = "none",
+    ) -> KeysetPage[EventRegistration]:
+        """
+        Get an event's registrations with keyset (cursor) pagination.
+
+        Args:
+            db: Database session
+            event_id: Event ID
+            status_filter: Optional status filter
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Page size
+            total_mode: How to compute the total (exact, cached, estimate, none)
+
+        Returns:
+            KeysetPage of registrations
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another listing
+        """
+        return await paginate_keyset(
+            db,
+            EventRegistrationService._event_registrations_query(event_id, status_filter),
+            EVENT_REGISTRATION_SORT,
+            scope=f"event_registrations:{event_id}",
+            cursor=cursor,
+            limit=limit,
+            total_mode=total_mode,
+        )
+
+    @staticmethod
+    def _event_registrations_query(
+        event_id: uuid.UUID,
+        status_filter: RegistrationStatus | None,
+    ) -> Select[Any]:
+        """Build the filtered (unordered, unpaginated) event registrations query."""
         query = (
             select(EventRegistration)
             .where(EventRegistration.event_id == event_id)
@@ -336,19 +398,7 @@ class EventRegistrationService:
         if status_filter:
             query = query.where(EventRegistration.status == status_filter)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Get paginated results
-        query = query.order_by(EventRegistration.created_at.asc())
-        query = query.offset((page - 1) * per_page).limit(per_page)
-
-        result = await db.execute(query)
-        registrations = result.scalars().all()
-
-        return list(registrations), total
+        return query
 
     @staticmethod
     async def update_registration(
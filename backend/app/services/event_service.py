@@ -2,22 +2,61 @@
 
 import logging
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Any
 
 import pytz
 from fastapi import HTTPException, status
 from slugify import slugify
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import ResponseCache
+from app.core.config import get_settings
+from app.core.http_cache import ResourceVersion, resource_version
 from app.core.metrics import EVENTS_CLOSED_TOTAL, EVENTS_CREATED_TOTAL, EVENTS_PUBLISHED_TOTAL
-from app.models.event import Event, EventStatus
+from app.core.pagination import (
+    KeysetPage,
+    SortKey,
+    TotalMode,
+    count_total,
+    order_by_keys,
+    paginate_keyset,
+)
+from app.models.event import (
+    Event,
+    EventLink,
+    EventMedia,
+    EventMediaStatus,
+    EventStatus,
+    FoodOption,
+)
 from app.models.npo import NPO, NPOStatus
 from app.models.user import User
 from app.schemas.event import EventCreateRequest, EventUpdateRequest
+from app.services.event_branding_service import EventBrandingService
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Cached public (anonymous) event pages: detail by slug, listings by filters
+public_event_cache = ResponseCache(
+    "public_events", ttl_seconds=settings.public_event_cache_ttl_seconds
+)
+PUBLIC_EVENT_LIST_TAG = "events:list"
+
+
+def public_event_tag(event_id: uuid.UUID) -> str:
+    """Cache tag for everything rendered from a single event."""
+    return f"event:{event_id}"
+
+
+# Listing order: soonest-last by event date, id as the unique tiebreaker
+EVENT_LIST_SORT = (
+    SortKey(Event.event_datetime, descending=True),
+    SortKey(Event.id, descending=True),
+)
 
 
 class EventService:
@@ -158,6 +197,8 @@ class EventService:
         )
         event = result.scalar_one()
 
+        await EventService.invalidate_public_cache(event_id)
+
         logger.info(f"Event updated: {event.name} (ID: {event.id}) by user {current_user.id}")
         return event
 
@@ -195,6 +236,8 @@ class EventService:
         )
         event = result.scalar_one()
 
+        await EventService.invalidate_public_cache(event_id)
+
         # Increment metrics
         EVENTS_PUBLISHED_TOTAL.inc()
 
@@ -235,6 +278,8 @@ class EventService:
         )
         event = result.scalar_one()
 
+        await EventService.invalidate_public_cache(event_id)
+
         # Increment metrics
         EVENTS_CLOSED_TOTAL.labels(closure_type="manual").inc()
 
@@ -275,8 +320,26 @@ class EventService:
         await db.delete(event)
         await db.commit()
 
+        await EventService.invalidate_public_cache(event_id)
+
         logger.info(f"Event deleted: {event.name} (ID: {event.id}) by user {current_user.id}")
 
+    @staticmethod
+    async def invalidate_public_cache(event_id: uuid.UUID, include_lists: bool = True) -> None:
+        """
+        Drop cached public pages and resolved branding for an event after a committed change.
+
+        Args:
+            event_id: Event UUID
+            include_lists: Also drop cached listings (set False for changes that
+                only affect the detail page, e.g. media, links, food options)
+        """
+        tags = [public_event_tag(event_id)]
+        if include_lists:
+            tags.append(PUBLIC_EVENT_LIST_TAG)
+        await public_event_cache.invalidate_tags(*tags)
+        await EventBrandingService.invalidate_events(event_id)
+
     @staticmethod
     async def get_event_by_id(
         db: AsyncSession,
@@ -296,17 +359,58 @@ class EventService:
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_event_version(
+        db: AsyncSession,
+        event_id: uuid.UUID,
+    ) -> ResourceVersion | None:
+        """
+        Get validators for an event's detail representation in one round trip.
+
+        Covers the event row (version counter), its NPO name and the media,
+        links and food options it embeds, via count/max(updated_at) aggregates.
+
+        Args:
+            db: Database session
+            event_id: Event UUID
+
+        Returns:
+            ResourceVersion, or None if the event does not exist
+        """
+        child_stamps = []
+        for child in (EventMedia, EventLink, FoodOption):
+            child_stamps += [
+                select(func.count(child.id)).where(child.event_id == event_id).scalar_subquery(),
+                select(func.max(child.updated_at))
+                .where(child.event_id == event_id)
+                .scalar_subquery(),
+            ]
+        query = (
+            select(Event.version, Event.updated_at, NPO.updated_at, *child_stamps)
+            .join(NPO, NPO.id == Event.npo_id)
+            .where(Event.id == event_id)
+        )
+        row = (await db.execute(query)).one_or_none()
+        if row is None:
+            return None
+
+        timestamps = [value for value in row if isinstance(value, datetime)]
+        return resource_version(
+            "event", event_id, *row, last_modified=max(timestamps), signed_urls=True
+        )
+
     @staticmethod
     async def get_event_by_slug(
         db: AsyncSession,
         slug: str,
     ) -> Event | None:
-        """Get active event by slug for public pages."""
+        """Get active event by slug for public pages (scanned media only)."""
         query = (
             select(Event)
             .where(and_(Event.slug == slug, Event.status == EventStatus.ACTIVE))
             .options(
-                selectinload(Event.media),
+                # Files are only served once the virus scan has cleared them
+                selectinload(Event.media.and_(EventMedia.status == EventMediaStatus.SCANNED)),
                 selectinload(Event.links),
                 selectinload(Event.food_options),
             )
@@ -322,23 +426,13 @@ class EventService:
         page: int = 1,
         per_page: int = 20,
     ) -> tuple[list[Event], int]:
-        """List events with filtering and pagination."""
-        from sqlalchemy.orm import selectinload
+        """List events with filtering and offset pagination."""
+        query = EventService._list_events_query(npo_id, status_filter)
 
-        query = select(Event).options(selectinload(Event.npo))
-
-        if npo_id:
-            query = query.where(Event.npo_id == npo_id)
-        if status_filter:
-            query = query.where(Event.status == status_filter)
-
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
+        total = await count_total(db, query, "exact", scope="events") or 0
 
         # Paginate
-        query = query.order_by(Event.event_datetime.desc())
+        query = order_by_keys(query, EVENT_LIST_SORT)
         query = query.offset((page - 1) * per_page).limit(per_page)
 
         result = await db.execute(query)
@@ -346,6 +440,57 @@ class EventService:
 
         return events, total
 
+    @staticmethod
+    async def list_events_keyset(
+        db: AsyncSession,
+        npo_id: uuid.UUID | None = None,
+        status_filter: EventStatus | None = None,
+        cursor: str | None = None,
+        limit: int = 20,
+        total_mode: TotalMode = "none",
+    ) -> KeysetPage[Event]:
+        """
+        List events with filtering and keyset (cursor) pagination.
+
+        Args:
+            db: Database session
+            npo_id: Optional NPO filter
+            status_filter: Optional status filter
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Page size
+            total_mode: How to compute the total (exact, cached, estimate, none)
+
+        Returns:
+            KeysetPage of events
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another listing
+        """
+        return await paginate_keyset(
+            db,
+            EventService._list_events_query(npo_id, status_filter),
+            EVENT_LIST_SORT,
+            scope="events",
+            cursor=cursor,
+            limit=limit,
+            total_mode=total_mode,
+        )
+
+    @staticmethod
+    def _list_events_query(
+        npo_id: uuid.UUID | None,
+        status_filter: EventStatus | None,
+    ) -> Select[Any]:
+        """Build the filtered (unordered, unpaginated) event listing query."""
+        query = select(Event).options(selectinload(Event.npo))
+
+        if npo_id:
+            query = query.where(Event.npo_id == npo_id)
+        if status_filter:
+            query = query.where(Event.status == status_filter)
+
+        return query
+
     @staticmethod
     async def _generate_unique_slug(
         db: AsyncSession,
@@ -383,32 +528,3 @@ class EventService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid timezone: {timezone}",
             )
-
-
-async def close_expired_events(db: AsyncSession) -> int:
-    """
-    Celery task: Close events 24 hours after event_datetime.
-
-    Returns:
-        Number of events closed
-    """
-    cutoff_time = datetime.now(pytz.UTC) - timedelta(hours=24)
-
-    query = select(Event).where(
-        and_(Event.status == EventStatus.ACTIVE, Event.event_datetime < cutoff_time)
-    )
-
-    result = await db.execute(query)
-    events_to_close = list(result.scalars().all())
-
-    for event in events_to_close:
-        event.status = EventStatus.CLOSED
-        event.version += 1
-
-    if events_to_close:
-        await db.commit()
-        # Increment metrics for automatic closure
-        EVENTS_CLOSED_TOTAL.labels(closure_type="automatic").inc(len(events_to_close))
-        logger.info(f"Auto-closed {len(events_to_close)} expired events")
-
-    return len(events_to_close)
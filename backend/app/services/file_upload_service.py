@@ -6,6 +6,7 @@ This service handles:
 - Azure Blob Storage SAS URL generation (production)
 - Local file storage fallback (development)
 - Secure file naming and path management
+- Responsive logo derivatives (stored next to the logo)
 """
 
 import hashlib
@@ -13,22 +14,21 @@ import uuid
 from datetime import datetime, timedelta
 from io import BytesIO
 from pathlib import Path
-
-from azure.storage.blob import (
-    BlobSasPermissions,
-    BlobServiceClient,
-    ContentSettings,
-    generate_blob_sas,
-)
-from PIL import Image
+from typing import TYPE_CHECKING, Any
 
 from app.core.config import Settings
+from app.core.images import Derivative
+from app.core.tracing import BLOB_CLIENT_HOOKS
+from app.services.image_derivative_service import DERIVATIVE_CACHE_CONTROL, ImageDerivativeService
+
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient
 
 
 class FileUploadService:
     """Service for handling file uploads to Azure Blob Storage."""
 
-    blob_service_client: BlobServiceClient | None
+    blob_service_client: "BlobServiceClient | None"
 
     # Allowed image MIME types
     ALLOWED_IMAGE_TYPES = {
@@ -56,6 +56,11 @@ class FileUploadService:
     # SAS URL expiration (15 minutes for upload)
     SAS_EXPIRY_HOURS = 0.25  # 15 minutes
 
+    # Logo derivative widths (logos render small: headers, cards, emails)
+    LOGO_DERIVATIVE_WIDTHS = [128, 256, 512]
+
+    LOCAL_URL_PREFIX = "/static/uploads/logos/"
+
     def __init__(self, settings: Settings):
         """Initialize the file upload service.
 
@@ -67,8 +72,10 @@ class FileUploadService:
 
         # Initialize blob service client if connection string is provided
         if settings.azure_storage_connection_string:
+            from azure.storage.blob import BlobServiceClient
+
             self.blob_service_client = BlobServiceClient.from_connection_string(
-                settings.azure_storage_connection_string
+                settings.azure_storage_connection_string, **BLOB_CLIENT_HOOKS
             )
         else:
             self.blob_service_client = None
@@ -90,6 +97,8 @@ class FileUploadService:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        from PIL import Image
+
         # Check MIME type
         if content_type not in self.ALLOWED_IMAGE_TYPES:
             return False, f"Invalid file type. Allowed types: {', '.join(self.ALLOWED_IMAGE_TYPES)}"
@@ -173,6 +182,8 @@ class FileUploadService:
         Raises:
             ValueError: If Azure Storage is not configured
         """
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         if not self.blob_service_client or not self.settings.azure_storage_account_name:
             raise ValueError(
                 "Azure Blob Storage is not configured. "
@@ -384,6 +395,8 @@ class FileUploadService:
         Raises:
             ValueError: If upload fails
         """
+        from azure.storage.blob import ContentSettings
+
         # Generate blob name
         blob_name = self.generate_blob_name(npo_id, file_name)
 
@@ -441,6 +454,57 @@ class FileUploadService:
         # Return URL that will be served by FastAPI static files
         return f"/static/uploads/logos/{blob_name}"
 
+    def upload_derivatives(
+        self, logo_url: str, derivatives: list[Derivative]
+    ) -> list[dict[str, Any]]:
+        """Store logo derivatives next to an uploaded logo.
+
+        Args:
+            logo_url: URL returned by upload_file
+            derivatives: Renditions of the logo
+
+        Returns:
+            Derivative metadata entries (365-day SAS URLs for Azure, local URLs otherwise)
+        """
+        from azure.storage.blob import ContentSettings
+
+        entries = []
+        if logo_url.startswith(self.LOCAL_URL_PREFIX):
+            local_name = logo_url.removeprefix(self.LOCAL_URL_PREFIX)
+            for derivative in derivatives:
+                name = ImageDerivativeService.blob_name(local_name, derivative)
+                (self.local_storage_dir / name).write_bytes(derivative.data)
+                entries.append(
+                    ImageDerivativeService.metadata(
+                        derivative, f"logos/{name}", f"{self.LOCAL_URL_PREFIX}{name}"
+                    )
+                )
+            return entries
+
+        if not self.blob_service_client:
+            raise ValueError("Azure Blob Storage is not configured")
+
+        logo_blob_name = logo_url.split(f"/{self.container_name}/")[-1].split("?")[0]
+        for derivative in derivatives:
+            blob_name = ImageDerivativeService.blob_name(logo_blob_name, derivative)
+            self.blob_service_client.get_blob_client(
+                container=self.container_name, blob=blob_name
+            ).upload_blob(
+                derivative.data,
+                blob_type="BlockBlob",
+                content_settings=ContentSettings(
+                    content_type=derivative.mime_type,
+                    cache_control=DERIVATIVE_CACHE_CONTROL,
+                ),
+                overwrite=True,
+            )
+            entries.append(
+                ImageDerivativeService.metadata(
+                    derivative, blob_name, self.generate_read_sas_url(blob_name, expiry_days=365)
+                )
+            )
+        return entries
+
     def generate_read_sas_url(self, blob_name: str, expiry_days: int = 365) -> str:
         """Generate a read-only SAS URL for an uploaded blob.
 
@@ -457,6 +521,8 @@ class FileUploadService:
         Raises:
             ValueError: If Azure Storage is not configured
         """
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         if not self.blob_service_client or not self.settings.azure_storage_account_name:
             raise ValueError(
                 "Azure Blob Storage is not configured. "
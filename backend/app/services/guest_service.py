@@ -64,6 +64,7 @@ class GuestService:
         # Create guest record
         guest = RegistrationGuest(
             registration_id=guest_data.registration_id,
+            event_id=registration.event_id,
             name=guest_data.name,
             email=guest_data.email,
             phone=guest_data.phone,
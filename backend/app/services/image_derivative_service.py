@@ -0,0 +1,150 @@
+"""Image Derivative Service - responsive renditions of uploaded images.
+
+Renders the configured width ladder through ``image_worker_pool`` and
+uploads the results next to the original blob. Each rendition is recorded
+as a metadata entry (stored in a JSONB ``derivatives`` column):
+
+    {"blob_name": ..., "url": ..., "width": 640, "height": 480,
+     "format": "webp", "mime_type": "image/webp", "size": 31847}
+
+``url`` is the unsigned blob URL; API responses sign it like the original
+file URL. Clients build ``srcset`` per format from these entries and use
+the JPEG entries as the fallback.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import get_settings
+from app.core.images import Derivative, RenderedImage, image_worker_pool
+
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient
+
+settings = get_settings()
+
+# Derivative blob names are unique per upload and never rewritten
+DERIVATIVE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImageDerivativeService:
+    """Service for rendering and storing responsive image derivatives."""
+
+    @staticmethod
+    async def render(
+        data: bytes,
+        widths: list[int] | None = None,
+        min_size: tuple[int, int] | None = None,
+        max_size: tuple[int, int] | None = None,
+        thumbnail_size: tuple[int, int] | None = None,
+    ) -> RenderedImage:
+        """
+        Validate and render an image with the configured widths and formats.
+
+        Args:
+            data: Uploaded file content
+            widths: Width ladder (defaults to image_derivative_widths)
+            min_size: Minimum (width, height) of the upload
+            max_size: Maximum (width, height) of the upload
+            thumbnail_size: Also produce a JPEG thumbnail fitting in this box
+
+        Returns:
+            RenderedImage
+
+        Raises:
+            ImageProcessingError: If the file is invalid or breaks a size limit
+        """
+        return await image_worker_pool.render(
+            data,
+            widths=widths or settings.image_derivative_widths,
+            formats=settings.image_derivative_formats,
+            min_size=min_size,
+            max_size=max_size,
+            thumbnail_size=thumbnail_size,
+        )
+
+    @staticmethod
+    def blob_name(original_blob_name: str, derivative: Derivative) -> str:
+        """Blob name for a derivative, e.g. ``photo_w640.webp`` for ``photo.jpg``."""
+        base_name = original_blob_name.rsplit(".", 1)[0]
+        return f"{base_name}_w{derivative.width}.{derivative.extension}"
+
+    @staticmethod
+    async def upload(
+        blob_service_client: "BlobServiceClient",
+        container_name: str,
+        original_blob_name: str,
+        derivatives: list[Derivative],
+    ) -> list[dict[str, Any]]:
+        """
+        Upload derivatives next to the original blob.
+
+        Args:
+            blob_service_client: Azure Blob Service client
+            container_name: Container of the original blob
+            original_blob_name: Blob name of the original upload
+            derivatives: Renditions to upload
+
+        Returns:
+            Metadata entries, in the order given
+        """
+        from azure.storage.blob import ContentSettings
+
+        def upload_one(derivative: Derivative) -> dict[str, Any]:
+            blob_name = ImageDerivativeService.blob_name(original_blob_name, derivative)
+            blob_client = blob_service_client.get_blob_client(
+                container=container_name, blob=blob_name
+            )
+            blob_client.upload_blob(
+                derivative.data,
+                blob_type="BlockBlob",
+                content_settings=ContentSettings(
+                    content_type=derivative.mime_type,
+                    cache_control=DERIVATIVE_CACHE_CONTROL,
+                ),
+                overwrite=True,
+            )
+            return ImageDerivativeService.metadata(derivative, blob_name, str(blob_client.url))
+
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(upload_one, derivative) for derivative in derivatives)
+            )
+        )
+
+    @staticmethod
+    def metadata(derivative: Derivative, blob_name: str, url: str) -> dict[str, Any]:
+        """Metadata entry stored for one derivative."""
+        return {
+            "blob_name": blob_name,
+            "url": url,
+            "width": derivative.width,
+            "height": derivative.height,
+            "format": derivative.format,
+            "mime_type": derivative.mime_type,
+            "size": len(derivative.data),
+        }
+
+    @staticmethod
+    def delete(
+        blob_service_client: "BlobServiceClient",
+        container_name: str,
+        entries: list[dict[str, Any]] | None,
+    ) -> None:
+        """Best-effort deletion of stored derivatives."""
+        for entry in entries or []:
+            try:
+                blob_service_client.get_blob_client(
+                    container=container_name, blob=entry["blob_name"]
+                ).delete_blob()
+            except Exception:
+                pass  # Derivative might not exist
+
+    @staticmethod
+    def srcset(entries: list[dict[str, Any]] | None, fmt: str) -> str:
+        """``srcset`` attribute value for one format, e.g. ``a.webp 320w, b.webp 640w``."""
+        matching = sorted(
+            (entry for entry in entries or [] if entry["format"] == fmt),
+            key=lambda entry: entry["width"],
+        )
+        return ", ".join(f"{entry['url']} {entry['width']}w" for entry in matching)
@@ -136,12 +136,8 @@ class InvitationService:
             last_name=last_name,
         )
         invitation.token_hash = hash_password(token)
-        await db.commit()
-
-        # Store token on invitation object for API response (not persisted)
-        invitation.token = token  # type: ignore[attr-defined]
 
-        # Send invitation email
+        # Queue invitation email so it commits together with the invitation
         email_service = get_email_service()
         try:
             await email_service.send_npo_member_invitation_email(
@@ -150,6 +146,7 @@ class InvitationService:
                 npo_name=npo.name,
                 role=role,
                 invited_by_name=inviter_name,
+                db=db,
             )
         except EmailSendError as e:
             # Log error but don't fail the invitation creation
@@ -162,6 +159,11 @@ class InvitationService:
                 extra={"npo_id": str(npo_id), "invitation_id": str(invitation.id)},
             )
 
+        await db.commit()
+
+        # Store token on invitation object for API response (not persisted)
+        invitation.token = token  # type: ignore[attr-defined]
+
         return invitation
 
     @staticmethod
@@ -266,13 +268,7 @@ class InvitationService:
         # Extend expiry by 7 days from now
         invitation.expires_at = datetime.now(UTC) + timedelta(days=7)
 
-        await db.commit()
-        await db.refresh(invitation)
-
-        # Store token on invitation object for API response (not persisted)
-        invitation.token = token  # type: ignore[attr-defined]
-
-        # Send invitation email
+        # Queue invitation email so it commits together with the new token
         email_service = get_email_service()
         try:
             await email_service.send_npo_member_invitation_email(
@@ -281,6 +277,7 @@ class InvitationService:
                 npo_name=npo.name,
                 role=invitation.role,
                 invited_by_name=resender_name,
+                db=db,
             )
         except EmailSendError as e:
             logger.error(
@@ -294,6 +291,12 @@ class InvitationService:
             # Don't fail the request - invitation is updated in DB
             # User can try resending again if needed
 
+        await db.commit()
+        await db.refresh(invitation)
+
+        # Store token on invitation object for API response (not persisted)
+        invitation.token = token  # type: ignore[attr-defined]
+
         return invitation
 
     @staticmethod
@@ -419,6 +422,7 @@ class InvitationService:
                     npo_name=invitation.npo.name,
                     member_name=member_name,
                     member_role=invitation.role,
+                    db=db,
                 )
         except EmailSendError as e:
             # Log error but don't fail the acceptance
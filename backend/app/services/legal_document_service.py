@@ -7,9 +7,10 @@ retrieving legal documents with version control.
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.http_cache import ResourceVersion, resource_version
 from app.models.legal_document import (
     LegalDocument,
     LegalDocumentStatus,
@@ -222,6 +223,62 @@ class LegalDocumentService:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_published_version(
+        self,
+        db: AsyncSession,
+        document_type: LegalDocumentType | None = None,
+    ) -> ResourceVersion:
+        """Get validators for the published document set without loading content.
+
+        Publishing a new version archives the previous one, which bumps its
+        updated_at, so count/max(updated_at) over published rows is sufficient.
+
+        Args:
+            db: Database session
+            document_type: Restrict to one document type (None = all types)
+
+        Returns:
+            ResourceVersion for the published document(s)
+        """
+        stmt = select(func.count(LegalDocument.id), func.max(LegalDocument.updated_at)).where(
+            LegalDocument.status == LegalDocumentStatus.PUBLISHED
+        )
+        if document_type is not None:
+            stmt = stmt.where(LegalDocument.document_type == document_type)
+
+        count, last_modified = (await db.execute(stmt)).one()
+        return resource_version(
+            "legal_documents", document_type, count, last_modified, last_modified=last_modified
+        )
+
+    async def get_document_version(
+        self,
+        db: AsyncSession,
+        document_type: LegalDocumentType,
+        version: str,
+    ) -> ResourceVersion | None:
+        """Get validators for a specific document version without loading content.
+
+        Args:
+            db: Database session
+            document_type: Document type
+            version: Version string
+
+        Returns:
+            ResourceVersion, or None if the document does not exist
+        """
+        stmt = select(LegalDocument.id, LegalDocument.updated_at).where(
+            LegalDocument.document_type == document_type,
+            LegalDocument.version == version,
+        )
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+
+        return resource_version(
+            "legal_document", row.id, row.updated_at, last_modified=row.updated_at
+        )
+
     async def list_documents(
         self,
         db: AsyncSession,
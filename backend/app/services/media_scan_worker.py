@@ -0,0 +1,357 @@
+"""Background virus scanning of uploaded event media.
+
+``MediaService.confirm_upload`` only inserts a ``media_scan_jobs`` row, so
+the upload request never waits for the scanner. This worker claims due jobs
+in batches with ``UPDATE ... FROM event_media ... RETURNING`` (``SKIP
+LOCKED``, so every API process can run a worker), streams each blob in
+``media_scan_chunk_size`` chunks to the scanner backend with at most
+``media_scan_concurrency`` files in flight, and records the verdict through
+``MediaService.mark_scan_complete`` in the same transaction that deletes
+the job.
+
+Clean images also get their responsive derivatives rendered from the bytes
+already streamed through the scanner (no second download). Rendering starts
+after the verdict is recorded and the job deleted, so it holds neither a
+scan slot nor the claim lease.
+
+A claim leases the whole batch, which runs in ``ceil(batch / concurrency)``
+waves; the lease covers every wave taking its full scan timeout, so a slow
+batch is never reclaimed (and scanned twice) by another worker.
+
+Scanner or storage errors are retried with jittered exponential backoff;
+after ``media_scan_max_attempts`` the job is parked (``available_at`` NULL)
+and the media stays UPLOADED, i.e. never served as clean.
+
+Commits that queued a scan wake the worker immediately; otherwise it polls
+every ``media_scan_poll_seconds``.
+"""
+
+import asyncio
+import contextlib
+import math
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import get_logger
+from app.core.metrics import EVENT_MEDIA_SCAN_RESULTS_TOTAL, MEDIA_SCAN_DURATION_SECONDS
+from app.models.event import EventMedia
+from app.models.media_scan_job import MediaScanJob
+from app.services.event_service import EventService
+from app.services.media_scanners import MediaScanner, ScanResult, create_media_scanner
+from app.services.media_service import MediaService
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+SCAN_TIMEOUT_SECONDS = 300.0
+# Allowance per file for writing its verdict once scanned (part of the lease)
+RECORD_BUDGET_SECONDS = 60.0
+RETRY_BASE_SECONDS = 60.0
+RETRY_MAX_SECONDS = 3600.0
+
+# Session.info flag set when a session has queued scan jobs
+SCAN_PENDING_KEY = "media_scan_pending"
+
+BlobReader = Callable[[str], AsyncIterator[bytes]]
+
+
+def mark_scan_pending(db: AsyncSession) -> None:
+    """Flag a session so its commit wakes the scan worker."""
+    db.info[SCAN_PENDING_KEY] = True
+
+
+@dataclass(frozen=True)
+class ClaimedScan:
+    """A job leased to this worker, with the media fields needed to scan it."""
+
+    media_id: uuid.UUID
+    event_id: uuid.UUID
+    blob_name: str
+    attempts: int
+    mime_type: str = ""
+
+    @property
+    def is_image(self) -> bool:
+        """Whether the file gets responsive derivatives once clean."""
+        return self.mime_type.startswith("image/")
+
+
+class MediaScanWorker:
+    """Scans queued media from a background asyncio task."""
+
+    def __init__(
+        self,
+        scanner: MediaScanner | None = None,
+        read_blob: BlobReader | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+        poll_seconds: float | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        """Initialize worker (defaults come from settings).
+
+        Args:
+            scanner: Scanner backend (defaults to media_scanner_backend)
+            read_blob: Blob name -> chunk stream (defaults to Azure Blob Storage)
+            batch_size: Jobs claimed per cycle
+            concurrency: Max files scanned at once
+            poll_seconds: Idle poll interval
+            max_attempts: Attempts before a job is parked
+        """
+        self._scanner = scanner
+        self.read_blob = read_blob or self._read_azure_blob
+        self.batch_size = batch_size or settings.media_scan_batch_size
+        self.concurrency = concurrency or settings.media_scan_concurrency
+        self.poll_seconds = poll_seconds or settings.media_scan_poll_seconds
+        self.max_attempts = max_attempts or settings.media_scan_max_attempts
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def scanner(self) -> MediaScanner:
+        """Scanner backend, created on first use."""
+        if self._scanner is None:
+            self._scanner = create_media_scanner()
+        return self._scanner
+
+    @staticmethod
+    def _read_azure_blob(blob_name: str) -> AsyncIterator[bytes]:
+        return MediaService.stream_blob(blob_name, settings.media_scan_chunk_size)
+
+    @property
+    def claim_lease(self) -> timedelta:
+        """How long claimed jobs stay leased before another worker may retry them."""
+        waves = math.ceil(self.batch_size / self.concurrency)
+        return timedelta(seconds=waves * (SCAN_TIMEOUT_SECONDS + RECORD_BUDGET_SECONDS))
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    def wake(self) -> None:
+        """Start a cycle now instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the background scan loop."""
+        if self.running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="media-scan-worker")
+        logger.info(
+            "Media scan worker started",
+            extra={"scanner": self.scanner.name, "concurrency": self.concurrency},
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop the loop, letting in-flight scans finish within ``timeout``."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except TimeoutError:
+            # Claimed jobs are retried once their lease expires
+            logger.warning("Media scan worker did not drain in time; cancelling")
+            self._task.cancel()
+        self._task = None
+        logger.info("Media scan worker stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error("Media scan cycle failed", extra={"error": str(e)})
+                processed = 0
+
+            # A full batch means more jobs are probably due
+            if processed >= self.batch_size or self._stopping:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except TimeoutError:
+                pass
+
+    async def run_once(self) -> int:
+        """Claim and scan one batch of due jobs.
+
+        Returns:
+            Number of jobs processed (completed, retried or parked)
+        """
+        async with AsyncSessionLocal() as session:
+            claimed = await self._claim(session)
+            await session.commit()
+        if not claimed:
+            return 0
+
+        scan_slots = asyncio.Semaphore(self.concurrency)
+        outcomes = await asyncio.gather(
+            *(self.process(claim, scan_slots=scan_slots) for claim in claimed)
+        )
+        failures = [outcome for outcome in outcomes if outcome is not None]
+        if failures:
+            async with AsyncSessionLocal() as session:
+                await session.execute(update(MediaScanJob), failures)
+                await session.commit()
+        return len(claimed)
+
+    async def _claim(self, session: AsyncSession) -> list[ClaimedScan]:
+        """Lease due jobs to this worker (skipping jobs locked by other workers)."""
+        due = (
+            select(MediaScanJob.media_id)
+            .where(MediaScanJob.available_at <= func.now())
+            .order_by(MediaScanJob.available_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(MediaScanJob)
+            .where(
+                MediaScanJob.media_id.in_(due.scalar_subquery()),
+                EventMedia.id == MediaScanJob.media_id,
+            )
+            .values(
+                attempts=MediaScanJob.attempts + 1,
+                available_at=func.now() + self.claim_lease,
+            )
+            .returning(
+                MediaScanJob.media_id,
+                EventMedia.event_id,
+                EventMedia.blob_name,
+                MediaScanJob.attempts,
+                EventMedia.mime_type,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        return [ClaimedScan(*row) for row in result.all()]
+
+    async def scan(self, blob_name: str, keep: list[bytes] | None = None) -> ScanResult:
+        """Stream one blob through the scanner.
+
+        Args:
+            blob_name: Blob to scan
+            keep: If given, streamed chunks are also appended here
+        """
+
+        async def chunks() -> AsyncIterator[bytes]:
+            async for chunk in self.read_blob(blob_name):
+                if keep is not None:
+                    keep.append(chunk)
+                yield chunk
+
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(self.scanner.scan(chunks()), timeout=SCAN_TIMEOUT_SECONDS)
+        finally:
+            MEDIA_SCAN_DURATION_SECONDS.labels(scanner=self.scanner.name).observe(
+                time.perf_counter() - start
+            )
+
+    async def process(
+        self, claim: ClaimedScan, scan_slots: asyncio.Semaphore | None = None
+    ) -> dict[str, Any] | None:
+        """Scan one claimed file and record the verdict.
+
+        Args:
+            claim: Job to scan
+            scan_slots: Held while scanning and recording, not while rendering
+
+        Returns:
+            None once the verdict is recorded, otherwise the job column values
+            to write back (retry time or parked)
+        """
+        content: list[bytes] | None = [] if claim.is_image else None
+        async with scan_slots or contextlib.nullcontext():
+            try:
+                result = await self.scan(claim.blob_name, keep=content)
+                await self._record(claim, result)
+            except Exception as e:
+                return self._failure(claim, str(e) or type(e).__name__)
+
+        # The job is deleted with the verdict, so rendering needs no lease
+        if result.clean and content is not None:
+            await self._render_derivatives(claim, b"".join(content))
+        return None
+
+    async def _render_derivatives(self, claim: ClaimedScan, content: bytes) -> None:
+        """Best effort: the original is served if derivatives can't be rendered."""
+        try:
+            async with AsyncSessionLocal() as session:
+                await MediaService.generate_derivatives(session, claim.media_id, content)
+        except Exception as e:
+            logger.warning(
+                "Could not render media derivatives",
+                extra={"media_id": str(claim.media_id), "error": str(e)},
+            )
+            return
+        await EventService.invalidate_public_cache(claim.event_id, include_lists=False)
+
+    async def _record(self, claim: ClaimedScan, result: ScanResult) -> None:
+        """Write the verdict and remove the job in one transaction."""
+        details = {"scanner": self.scanner.name}
+        if result.signature:
+            details["signature"] = result.signature
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                delete(MediaScanJob).where(MediaScanJob.media_id == claim.media_id)
+            )
+            await MediaService.mark_scan_complete(session, claim.media_id, result.clean, details)
+        await EventService.invalidate_public_cache(claim.event_id, include_lists=False)
+
+    def _failure(self, claim: ClaimedScan, error: str) -> dict[str, Any]:
+        """Job values after a failed attempt: retry with backoff, or park."""
+        log_extra = {
+            "media_id": str(claim.media_id),
+            "attempts": claim.attempts,
+            "error": error,
+        }
+        if claim.attempts >= self.max_attempts:
+            EVENT_MEDIA_SCAN_RESULTS_TOTAL.labels(result="failed").inc()
+            logger.error("Media scan failed permanently; job parked", extra=log_extra)
+            return {"media_id": claim.media_id, "available_at": None, "last_error": error}
+
+        delay = min(RETRY_BASE_SECONDS * 2 ** (claim.attempts - 1), RETRY_MAX_SECONDS)
+        delay *= random.uniform(0.8, 1.2)  # nosec B311 - jitter, not security
+        EVENT_MEDIA_SCAN_RESULTS_TOTAL.labels(result="retry").inc()
+        logger.warning(
+            "Media scan failed, will retry",
+            extra={**log_extra, "retry_in_seconds": round(delay, 1)},
+        )
+        return {
+            "media_id": claim.media_id,
+            "available_at": datetime.now(UTC) + timedelta(seconds=delay),
+            "last_error": error,
+        }
+
+
+# Process-wide worker, started from the app lifespan
+media_scan_worker = MediaScanWorker()
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_worker_after_commit(session: Session) -> None:
+    if session.info.pop(SCAN_PENDING_KEY, False):
+        media_scan_worker.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_scan_flag(session: Session) -> None:
+    session.info.pop(SCAN_PENDING_KEY, None)
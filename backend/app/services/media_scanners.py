@@ -0,0 +1,136 @@
+"""Virus scanner backends for uploaded media.
+
+Scanners consume a file as an async stream of chunks, so a blob is never
+held in memory or written to disk.
+
+- ``clamd``: ClamAV daemon over TCP (``INSTREAM`` command)
+- ``stub``: flags files containing the EICAR test signature (tests and
+  local development without a ClamAV daemon)
+"""
+
+import asyncio
+import struct
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Protocol
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Standard antivirus test file (https://www.eicar.org/download-anti-malware-testfile/)
+EICAR_SIGNATURE = b"X5O!P%@AP[4\\PZX54(P^)7CC)7}$EICAR-STANDARD-ANTIVIRUS-TEST-FILE!$H+H*"
+
+
+class ScannerError(Exception):
+    """The scanner could not produce a verdict (retry later)."""
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """Scanner verdict for one file."""
+
+    clean: bool
+    signature: str | None = None
+
+
+class MediaScanner(Protocol):
+    """Scans a file streamed as chunks."""
+
+    name: str
+
+    async def scan(self, chunks: AsyncIterator[bytes]) -> ScanResult:
+        """Scan the stream; raise ScannerError if no verdict is possible."""
+        ...
+
+
+class ClamdScanner:
+    """ClamAV daemon scanner using the INSTREAM protocol.
+
+    Each chunk is sent as a 4-byte big-endian length followed by the data,
+    and a zero length ends the stream; clamd replies ``stream: OK`` or
+    ``stream: <signature> FOUND``. Chunks must stay below clamd's
+    ``StreamMaxLength`` in total (25MB by default; media is capped at 10MB).
+    """
+
+    name = "clamd"
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        """Initialize scanner.
+
+        Args:
+            host: clamd host
+            port: clamd TCP port
+            timeout: Seconds allowed for connecting and for each read/write
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    async def scan(self, chunks: AsyncIterator[bytes]) -> ScanResult:
+        """Stream chunks to clamd and parse its reply."""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout=self.timeout
+            )
+        except (OSError, TimeoutError) as e:
+            raise ScannerError(f"Cannot connect to clamd at {self.host}:{self.port}: {e}") from e
+
+        try:
+            writer.write(b"zINSTREAM\0")
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                writer.write(struct.pack("!L", len(chunk)) + chunk)
+                await asyncio.wait_for(writer.drain(), timeout=self.timeout)
+            writer.write(struct.pack("!L", 0))
+            await asyncio.wait_for(writer.drain(), timeout=self.timeout)
+            reply = await asyncio.wait_for(reader.readuntil(b"\0"), timeout=self.timeout)
+        except (OSError, TimeoutError, asyncio.IncompleteReadError) as e:
+            raise ScannerError(f"clamd stream failed: {e}") from e
+        finally:
+            writer.close()
+
+        return self.parse_reply(reply)
+
+    @staticmethod
+    def parse_reply(reply: bytes) -> ScanResult:
+        """Parse an INSTREAM reply, e.g. ``stream: Eicar-Signature FOUND``."""
+        text = reply.rstrip(b"\0").decode(errors="replace").strip()
+        _, _, verdict = text.partition(": ")
+        if verdict == "OK":
+            return ScanResult(clean=True)
+        if verdict.endswith(" FOUND"):
+            return ScanResult(clean=False, signature=verdict.removesuffix(" FOUND"))
+        # e.g. "INSTREAM size limit exceeded. ERROR"
+        raise ScannerError(f"clamd error: {text}")
+
+
+class StubScanner:
+    """Scanner that only detects the EICAR test signature."""
+
+    name = "stub"
+
+    async def scan(self, chunks: AsyncIterator[bytes]) -> ScanResult:
+        """Search the stream for the EICAR signature (across chunk boundaries)."""
+        tail = b""
+        async for chunk in chunks:
+            window = tail + chunk
+            if EICAR_SIGNATURE in window:
+                return ScanResult(clean=False, signature="Eicar-Test-Signature")
+            tail = window[-(len(EICAR_SIGNATURE) - 1) :]
+        return ScanResult(clean=True)
+
+
+def create_media_scanner() -> MediaScanner:
+    """Build the scanner selected by ``media_scanner_backend``."""
+    if settings.media_scanner_backend == "clamd":
+        return ClamdScanner(
+            host=settings.clamd_host,
+            port=settings.clamd_port,
+            timeout=settings.clamd_timeout_seconds,
+        )
+    logger.warning("Using stub media scanner; only the EICAR test file is detected")
+    return StubScanner()
@@ -1,20 +1,29 @@
 """Media Service - Azure Blob Storage integration for event media."""
 
+import asyncio
 import logging
 import mimetypes
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 import pytz
-from azure.storage.blob import BlobSasPermissions, BlobServiceClient, generate_blob_sas
 from fastapi import HTTPException, status
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.metrics import EVENT_MEDIA_SCAN_RESULTS_TOTAL, EVENT_MEDIA_UPLOADS_TOTAL
+from app.core.tracing import BLOB_CLIENT_HOOKS
 from app.models.event import EventMedia, EventMediaStatus, EventMediaType
+from app.models.media_scan_job import MediaScanJob
 from app.models.user import User
+from app.services.image_derivative_service import ImageDerivativeService
+
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -45,7 +54,7 @@ class MediaService:
     }
 
     @staticmethod
-    def _get_blob_client() -> BlobServiceClient:
+    def _get_blob_client() -> "BlobServiceClient":
         """Get Azure Blob Service Client."""
         if not settings.azure_storage_connection_string:
             raise HTTPException(
@@ -53,7 +62,11 @@ class MediaService:
                 detail="Azure Storage not configured",
             )
 
-        return BlobServiceClient.from_connection_string(settings.azure_storage_connection_string)
+        from azure.storage.blob import BlobServiceClient
+
+        return BlobServiceClient.from_connection_string(
+            settings.azure_storage_connection_string, **BLOB_CLIENT_HOOKS
+        )
 
     @staticmethod
     def generate_read_sas_url(blob_name: str, expiry_hours: int = 24) -> str:
@@ -67,6 +80,8 @@ class MediaService:
         Returns:
             Full URL with SAS token for read access
         """
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         blob_client = MediaService._get_blob_client()
         container_name = settings.azure_storage_container_name or "event-media"
         account_name = blob_client.account_name
@@ -124,6 +139,8 @@ class MediaService:
         Raises:
             HTTPException: If validation fails or limits exceeded
         """
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         # Validate file size
         if file_size > MediaService.MAX_FILE_SIZE_BYTES:
             raise HTTPException(
@@ -240,15 +257,51 @@ class MediaService:
 
         return upload_url, media_id
 
+    @staticmethod
+    async def stream_blob(blob_name: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Download a blob as a stream of chunks of at most ``chunk_size`` bytes.
+
+        The blocking SDK download runs in a worker thread one chunk at a time,
+        so only one chunk is held in memory.
+
+        Args:
+            blob_name: The blob path (e.g., events/event-id/media-id/filename.png)
+            chunk_size: Maximum bytes per chunk
+        """
+        from azure.storage.blob import BlobClient
+
+        if not settings.azure_storage_connection_string:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Azure Storage not configured",
+            )
+
+        blob = BlobClient.from_connection_string(
+            settings.azure_storage_connection_string,
+            container_name=settings.azure_storage_container_name or "event-media",
+            blob_name=blob_name,
+            max_single_get_size=chunk_size,
+            **BLOB_CLIENT_HOOKS,
+            max_chunk_get_size=chunk_size,
+        )
+        downloader = await asyncio.to_thread(blob.download_blob)
+        chunks = downloader.chunks()
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+
     @staticmethod
     async def confirm_upload(
         db: AsyncSession,
         media_id: uuid.UUID,
     ) -> EventMedia:
         """
-        Mark media as uploaded after successful Azure Blob upload.
+        Confirm a completed Azure Blob upload and queue it for virus scanning.
 
-        Triggers virus scanning via Celery task.
+        The scan runs in the background (see app.services.media_scan_worker):
+        the media stays UPLOADED until ``mark_scan_complete`` records the
+        verdict. Confirming again before the scan finishes is a no-op. With
+        scanning disabled the media is marked SCANNED straight away.
         """
         query = select(EventMedia).where(EventMedia.id == media_id)
         result = await db.execute(query)
@@ -266,7 +319,18 @@ class MediaService:
                 detail=f"Media is already {media.status.value}",
             )
 
-        media.status = EventMediaStatus.SCANNED  # Will be re-checked after virus scan
+        if settings.media_scan_enabled:
+            from app.services.media_scan_worker import mark_scan_pending
+
+            await db.execute(
+                insert(MediaScanJob)
+                .values(media_id=media_id)
+                .on_conflict_do_nothing(index_elements=[MediaScanJob.media_id])
+            )
+            mark_scan_pending(db)
+            logger.info(f"Media {media_id} queued for scanning")
+        else:
+            media.status = EventMediaStatus.SCANNED
 
         await db.commit()
         await db.refresh(media)
@@ -274,11 +338,6 @@ class MediaService:
         # Increment metrics for successful upload
         EVENT_MEDIA_UPLOADS_TOTAL.labels(status="success").inc()
 
-        # TODO: Trigger Celery task for virus scanning
-        # from app.tasks.media import scan_uploaded_file
-        # scan_uploaded_file.delay(str(media_id))
-
-        logger.info(f"Media {media_id} marked for scanning")
         return media
 
     @staticmethod
@@ -313,6 +372,45 @@ class MediaService:
 
         return media
 
+    @staticmethod
+    async def generate_derivatives(
+        db: AsyncSession,
+        media_id: uuid.UUID,
+        file_content: bytes,
+    ) -> list[dict[str, Any]]:
+        """
+        Render and store responsive derivatives for an image.
+
+        Called by the scan worker after a clean verdict, with the bytes it
+        already streamed through the scanner.
+
+        Args:
+            db: Database session
+            media_id: Media UUID
+            file_content: Original image content
+
+        Returns:
+            Stored derivative metadata entries
+        """
+        media = await db.get(EventMedia, media_id)
+        if not media:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Media with ID {media_id} not found",
+            )
+
+        rendered = await ImageDerivativeService.render(file_content)
+        media.derivatives = await ImageDerivativeService.upload(
+            MediaService._get_blob_client(),
+            settings.azure_storage_container_name or "event-media",
+            media.blob_name,
+            rendered.derivatives,
+        )
+        await db.commit()
+
+        logger.info(f"Generated {len(media.derivatives)} derivatives for media {media_id}")
+        return media.derivatives
+
     @staticmethod
     async def delete_media(
         db: AsyncSession,
@@ -343,6 +441,7 @@ class MediaService:
             container_name = settings.azure_storage_container_name or "event-media"
             blob = blob_client.get_blob_client(container=container_name, blob=media.blob_name)
             blob.delete_blob()
+            ImageDerivativeService.delete(blob_client, container_name, media.derivatives)
         except Exception as e:
             logger.error(f"Failed to delete blob {media.blob_name}: {e}")
             # Continue with DB deletion even if blob deletion fails
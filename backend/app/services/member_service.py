@@ -105,15 +105,13 @@ class MemberService:
 
         old_role = member.role
         member.role = new_role
-        await db.commit()
-        await db.refresh(member)
 
         # Get updater user for audit logging
         user_stmt = select(User).where(User.id == updated_by_user_id)
         user_result = await db.execute(user_stmt)
         updater = user_result.scalar_one()
 
-        # Log audit event
+        # Log audit event (the record commits with the role change)
         await AuditService.log_role_changed(
             db=db,
             user_id=member.user_id,
@@ -123,6 +121,8 @@ class MemberService:
             admin_user_id=updated_by_user_id,
             admin_email=updater.email,
         )
+        await db.commit()
+        await db.refresh(member)
 
         return member
 
@@ -21,9 +21,10 @@ from typing import Any
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.redis import get_redis
+from app.core.redis import get_redis, redis_call_site
 from app.models.npo import NPO, NPOStatus
 from app.models.npo_member import MemberRole, MemberStatus, NPOMember
+from app.services.redis_service import RedisService
 
 
 class NPOPermissionService:
@@ -35,6 +36,7 @@ class NPOPermissionService:
     # Roles that can manage NPOs
     ADMIN_ROLES = {MemberRole.ADMIN, MemberRole.CO_ADMIN}
 
+    @redis_call_site("npo_permission.cache_get")
     async def _get_cached_permission(self, cache_key: str) -> bool | None:
         """Get permission result from cache."""
         try:
@@ -46,6 +48,7 @@ class NPOPermissionService:
         except Exception:
             return None
 
+    @redis_call_site("npo_permission.cache_set")
     async def _set_cached_permission(self, cache_key: str, result: bool) -> None:
         """Cache permission result."""
         try:
@@ -55,6 +58,7 @@ class NPOPermissionService:
             pass
 
     @staticmethod
+    @redis_call_site("npo_permission.invalidate")
     async def invalidate_npo_permissions(
         user_id: uuid.UUID, npo_id: uuid.UUID | None = None
     ) -> None:
@@ -70,14 +74,12 @@ class NPOPermissionService:
             npo_id: Optional NPO ID to invalidate specific NPO permissions only
         """
         try:
-            redis_client = await get_redis()
             if npo_id:
                 pattern = f"npo_perm:{user_id}:{npo_id}:*"
             else:
                 pattern = f"npo_perm:{user_id}:*"
 
-            async for key in redis_client.scan_iter(match=pattern):
-                await redis_client.delete(key)
+            await RedisService.delete_by_pattern(pattern)
         except Exception:
             pass
 
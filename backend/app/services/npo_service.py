@@ -8,20 +8,32 @@ Handles multi-tenant data isolation and status transitions.
 import logging
 import uuid
 from datetime import datetime
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Select, and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import (
+    KeysetPage,
+    SortKey,
+    TotalMode,
+    count_total,
+    order_by_keys,
+    paginate_keyset,
+)
 from app.models.npo import NPO, NPOStatus
 from app.models.npo_member import MemberRole, MemberStatus, NPOMember
 from app.models.user import User
 from app.schemas.npo import NPOCreateRequest, NPOListRequest, NPOUpdateRequest
+from app.services.event_branding_service import EventBrandingService
 from app.services.npo_permission_service import NPOPermissionService
 
 logger = logging.getLogger(__name__)
 
+NPO_LIST_SORT = (SortKey(NPO.created_at, descending=True), SortKey(NPO.id, descending=True))
+
 
 class NPOService:
     """Service for NPO management operations."""
@@ -137,9 +149,64 @@ class NPOService:
         Returns:
             Tuple of (NPO list, total count)
         """
-        # Build base query with branding relationship for logo_url
-        from sqlalchemy.orm import selectinload
+        query = await NPOService._list_npos_query(db, current_user, list_params)
+
+        # Get total count
+        total = await count_total(db, query, "exact", scope="npos") or 0
+
+        # Apply pagination
+        query = order_by_keys(query, NPO_LIST_SORT)
+        query = query.limit(list_params.page_size)
+        query = query.offset((list_params.page - 1) * list_params.page_size)
+
+        # Execute query
+        result = await db.execute(query)
+        npos = result.scalars().all()
+
+        return list(npos), total
+
+    @staticmethod
+    async def list_npos_keyset(
+        db: AsyncSession,
+        current_user: User,
+        list_params: NPOListRequest,
+        cursor: str | None = None,
+        total_mode: TotalMode = "none",
+    ) -> KeysetPage[NPO]:
+        """
+        List NPOs with keyset (cursor) pagination; list_params.page is ignored.
+
+        Args:
+            db: Database session
+            current_user: User making the request
+            list_params: Filter parameters (page_size is the page size)
+            cursor: next_cursor from the previous page (None for the first page)
+            total_mode: How to compute the total (exact, cached, estimate, none)
+
+        Returns:
+            KeysetPage of NPOs
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another listing
+        """
+        return await paginate_keyset(
+            db,
+            await NPOService._list_npos_query(db, current_user, list_params),
+            NPO_LIST_SORT,
+            scope="npos",
+            cursor=cursor,
+            limit=list_params.page_size,
+            total_mode=total_mode,
+        )
 
+    @staticmethod
+    async def _list_npos_query(
+        db: AsyncSession,
+        current_user: User,
+        list_params: NPOListRequest,
+    ) -> Select[Any]:
+        """Build the permission-scoped, filtered (unordered) NPO listing query."""
+        # Build base query with branding relationship for logo_url
         query = select(NPO).options(selectinload(NPO.branding)).where(NPO.deleted_at.is_(None))
 
         # Apply permission filtering
@@ -183,21 +250,7 @@ class NPOService:
                 )
             query = query.where(NPO.created_by_user_id == list_params.created_by_user_id)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Apply pagination
-        query = query.order_by(NPO.created_at.desc())
-        query = query.limit(list_params.page_size)
-        query = query.offset((list_params.page - 1) * list_params.page_size)
-
-        # Execute query
-        result = await db.execute(query)
-        npos = result.scalars().all()
-
-        return list(npos), total
+        return query
 
     @staticmethod
     async def update_npo(
@@ -261,6 +314,9 @@ class NPOService:
 
         await db.commit()
         await db.refresh(npo)
+        if "name" in npo_data.model_fields_set:
+            # Events show the NPO name with their branding
+            await EventBrandingService.invalidate_npo(npo_id)
 
         logger.info(f"NPO updated: {npo.name} (ID: {npo.id}) by user {updated_by_user_id}")
 
@@ -78,10 +78,10 @@ class PasswordService:
         # Store token in Redis (1-hour expiry)
         await RedisService.store_password_reset_token(token_hash, user.id)
 
-        # Send reset email
+        # Queue reset email (delivered after the request commits)
         email_service = get_email_service()
         await email_service.send_password_reset_email(
-            to_email=user.email, reset_token=token, user_name=user.first_name
+            to_email=user.email, reset_token=token, user_name=user.first_name, db=db
         )
 
         logger.info(f"Password reset requested for user: {user.id}")
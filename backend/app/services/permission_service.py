@@ -19,7 +19,8 @@ Permission caching:
 import uuid
 from typing import Any
 
-from app.core.redis import get_redis
+from app.core.redis import get_redis, redis_call_site
+from app.services.redis_service import RedisService
 
 
 class PermissionService:
@@ -43,6 +44,7 @@ class PermissionService:
     # Roles that can assign roles
     ROLES_CAN_ASSIGN_ROLES = {"super_admin", "npo_admin", "event_coordinator"}
 
+    @redis_call_site("permission.cache_get")
     async def _get_cached_permission(self, cache_key: str) -> bool | None:
         """Get permission result from cache.
 
@@ -62,6 +64,7 @@ class PermissionService:
             # If Redis fails, continue without cache
             return None
 
+    @redis_call_site("permission.cache_set")
     async def _set_cached_permission(self, cache_key: str, result: bool) -> None:
         """Cache permission result.
 
@@ -77,6 +80,7 @@ class PermissionService:
             pass
 
     @staticmethod
+    @redis_call_site("permission.invalidate")
     async def invalidate_user_permissions(user_id: uuid.UUID) -> None:
         """Invalidate all cached permissions for a user.
 
@@ -86,11 +90,8 @@ class PermissionService:
             user_id: User ID whose permissions to invalidate
         """
         try:
-            redis_client = await get_redis()
             # Delete all keys matching pattern perm:{user_id}:*
-            pattern = f"perm:{user_id}:*"
-            async for key in redis_client.scan_iter(match=pattern):
-                await redis_client.delete(key)
+            await RedisService.delete_by_pattern(f"perm:{user_id}:*")
         except Exception:
             # If Redis fails, cache will expire naturally
             pass
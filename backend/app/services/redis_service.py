@@ -5,7 +5,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from app.core.redis import get_redis
+from app.core.redis import execute_pipeline, get_redis, redis_call_site
 
 
 class RedisService:
@@ -17,6 +17,7 @@ class RedisService:
     - Email verification tokens (24-hour TTL)
     - Password reset tokens (1-hour TTL)
     - Rate limiting (15-min sliding window)
+    - Check-in sync results by idempotency key (48-hour TTL)
     """
 
     # TTL constants (in seconds)
@@ -25,8 +26,10 @@ class RedisService:
     EMAIL_VERIFY_TTL = 86400  # 24 hours
     PASSWORD_RESET_TTL = 3600  # 1 hour
     RATE_LIMIT_TTL = 900  # 15 minutes
+    CHECKIN_SYNC_TTL = 172800  # 48 hours
 
     @staticmethod
+    @redis_call_site("session.set")
     async def set_session(
         user_id: uuid.UUID,
         jti: str,
@@ -63,6 +66,7 @@ class RedisService:
         )
 
     @staticmethod
+    @redis_call_site("session.get")
     async def get_session(user_id: uuid.UUID, jti: str) -> dict[str, Any] | None:
         """Retrieve active session from Redis.
 
@@ -84,6 +88,7 @@ class RedisService:
         return result
 
     @staticmethod
+    @redis_call_site("session.delete")
     async def delete_session(user_id: uuid.UUID, jti: str) -> None:
         """Delete session from Redis (logout).
 
@@ -96,6 +101,7 @@ class RedisService:
         await redis.delete(key)
 
     @staticmethod
+    @redis_call_site("session.delete_all")
     async def delete_all_user_sessions(user_id: uuid.UUID) -> int:
         """Delete all sessions for a user (password reset, account deactivation).
 
@@ -105,20 +111,10 @@ class RedisService:
         Returns:
             Number of sessions deleted
         """
-        redis = await get_redis()
-        pattern = f"session:{user_id}:*"
-
-        # Find all matching keys
-        keys = []
-        async for key in redis.scan_iter(match=pattern):
-            keys.append(key)
-
-        # Delete all found keys
-        if keys:
-            return await redis.delete(*keys)
-        return 0
+        return await RedisService.delete_by_pattern(f"session:{user_id}:*")
 
     @staticmethod
+    @redis_call_site("auth.blacklist")
     async def blacklist_token(jti: str) -> None:
         """Add access token to blacklist (used during logout).
 
@@ -134,6 +130,7 @@ class RedisService:
         await redis.setex(key, RedisService.ACCESS_TOKEN_TTL, "1")
 
     @staticmethod
+    @redis_call_site("auth.blacklist_check")
     async def is_token_blacklisted(jti: str) -> bool:
         """Check if access token is blacklisted.
 
@@ -149,6 +146,7 @@ class RedisService:
         return result > 0
 
     @staticmethod
+    @redis_call_site("email_verify.store")
     async def store_email_verification_token(token: str, user_id: uuid.UUID) -> None:
         """Store email verification token.
 
@@ -165,6 +163,7 @@ class RedisService:
         await redis.setex(key, RedisService.EMAIL_VERIFY_TTL, str(user_id))
 
     @staticmethod
+    @redis_call_site("email_verify.get")
     async def get_email_verification_user(token: str) -> uuid.UUID | None:
         """Retrieve user ID from email verification token.
 
@@ -184,6 +183,7 @@ class RedisService:
         return uuid.UUID(user_id_str)
 
     @staticmethod
+    @redis_call_site("email_verify.delete")
     async def delete_email_verification_token(token: str) -> None:
         """Delete email verification token (after use).
 
@@ -195,6 +195,7 @@ class RedisService:
         await redis.delete(key)
 
     @staticmethod
+    @redis_call_site("password_reset.store")
     async def store_password_reset_token(token: str, user_id: uuid.UUID) -> None:
         """Store password reset token.
 
@@ -211,6 +212,7 @@ class RedisService:
         await redis.setex(key, RedisService.PASSWORD_RESET_TTL, str(user_id))
 
     @staticmethod
+    @redis_call_site("password_reset.get")
     async def get_password_reset_user(token: str) -> uuid.UUID | None:
         """Retrieve user ID from password reset token.
 
@@ -230,6 +232,7 @@ class RedisService:
         return uuid.UUID(user_id_str)
 
     @staticmethod
+    @redis_call_site("password_reset.delete")
     async def delete_password_reset_token(token: str) -> None:
         """Delete password reset token (after use).
 
@@ -241,6 +244,7 @@ class RedisService:
         await redis.delete(key)
 
     @staticmethod
+    @redis_call_site("rate_limit.check")
     async def check_rate_limit(key: str, max_attempts: int, window_seconds: int) -> bool:
         """Check if rate limit exceeded using sliding window.
 
@@ -254,28 +258,28 @@ class RedisService:
         Returns:
             True if rate limit exceeded, False otherwise
         """
-        redis = await get_redis()
         now = datetime.utcnow().timestamp()
         window_start = now - window_seconds
 
-        # Remove old entries outside the window
-        await redis.zremrangebyscore(key, 0, window_start)
-
-        # Count attempts in current window
-        count = await redis.zcount(key, window_start, now)
+        # Remove old entries outside the window and count the rest (one round trip)
+        _, count = await execute_pipeline(
+            "rate_limit.check",
+            lambda pipe: pipe.zremrangebyscore(key, 0, window_start).zcount(key, window_start, now),
+        )
 
         if count >= max_attempts:
             return True
 
-        # Add current attempt
-        await redis.zadd(key, {str(now): now})
-
-        # Set TTL on the key
-        await redis.expire(key, window_seconds)
+        # Add current attempt and refresh the TTL (one round trip)
+        await execute_pipeline(
+            "rate_limit.record",
+            lambda pipe: pipe.zadd(key, {str(now): now}).expire(key, window_seconds),
+        )
 
         return False
 
     @staticmethod
+    @redis_call_site("rate_limit.reset")
     async def reset_rate_limit(key: str) -> None:
         """Reset rate limit counter.
 
@@ -284,3 +288,75 @@ class RedisService:
         """
         redis = await get_redis()
         await redis.delete(key)
+
+    @staticmethod
+    @redis_call_site("checkin_sync.get")
+    async def get_checkin_results(event_id: uuid.UUID, keys: list[str]) -> dict[str, str]:
+        """Get the stored results of already processed check-in operations.
+
+        Key: checkin_sync:{event_id}:{idempotency_key}
+
+        Args:
+            event_id: Event UUID
+            keys: Client idempotency keys
+
+        Returns:
+            Status by idempotency key, for the keys seen before
+        """
+        if not keys:
+            return {}
+        redis = await get_redis()
+        values = await redis.mget([f"checkin_sync:{event_id}:{key}" for key in keys])
+        return {key: value for key, value in zip(keys, values, strict=True) if value}
+
+    @staticmethod
+    async def store_checkin_results(event_id: uuid.UUID, results: dict[str, str]) -> None:
+        """Store check-in results by idempotency key (one round trip).
+
+        Args:
+            event_id: Event UUID
+            results: Status by idempotency key
+        """
+        if not results:
+            return
+        await execute_pipeline(
+            "checkin_sync.store",
+            lambda pipe: [
+                pipe.set(
+                    f"checkin_sync:{event_id}:{key}",
+                    status,
+                    ex=RedisService.CHECKIN_SYNC_TTL,
+                    nx=True,  # A concurrent duplicate can't overwrite the first result
+                )
+                for key, status in results.items()
+            ],
+        )
+
+    @staticmethod
+    async def delete_by_pattern(pattern: str, batch_size: int = 500) -> int:
+        """Delete all keys matching a glob pattern.
+
+        Keys are collected with SCAN and removed with multi-key UNLINK in
+        batches, so invalidating N keys costs N / batch_size round trips
+        instead of N. Commands are attributed to the caller's call site.
+
+        Args:
+            pattern: Redis glob pattern (e.g., "perm:{user_id}:*")
+            batch_size: Keys per SCAN page and per UNLINK batch
+
+        Returns:
+            Number of keys deleted
+        """
+        redis = await get_redis()
+        deleted = 0
+        batch: list[str] = []
+
+        async for key in redis.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await redis.unlink(*batch)
+                batch = []
+
+        if batch:
+            deleted += await redis.unlink(*batch)
+        return deleted
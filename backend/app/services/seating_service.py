@@ -85,7 +85,7 @@ class SeatingService:
         """
         query = (
             select(func.count(RegistrationGuest.id))
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
                 EventRegistration.event_id == event_id,
                 RegistrationGuest.table_number == table_number,
@@ -113,7 +113,7 @@ class SeatingService:
         """
         query = (
             select(RegistrationGuest)
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
                 EventRegistration.event_id == event_id,
                 RegistrationGuest.table_number == table_number,
@@ -205,7 +205,7 @@ class SeatingService:
         """
         query = (
             select(RegistrationGuest)
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
                 EventRegistration.event_id == event_id,
                 EventRegistration.status == RegistrationStatus.CONFIRMED,
@@ -284,7 +284,7 @@ class SeatingService:
         # Get guest counts
         total_query = (
             select(func.count(RegistrationGuest.id))
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
                 EventRegistration.event_id == event_id,
                 EventRegistration.status == RegistrationStatus.CONFIRMED,
@@ -295,7 +295,7 @@ class SeatingService:
 
         assigned_query = (
             select(func.count(RegistrationGuest.id))
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
                 EventRegistration.event_id == event_id,
                 EventRegistration.status == RegistrationStatus.CONFIRMED,
@@ -398,7 +398,9 @@ class SeatingService:
                 # Get all guests at the same table (excluding self)
                 tablemates_query = (
                     select(RegistrationGuest)
-                    .join(EventRegistration)
+                    .join(
+                        EventRegistration, RegistrationGuest.registration_id == EventRegistration.id
+                    )
                     .where(
                         EventRegistration.event_id == event_id,
                         RegistrationGuest.table_number == my_guest.table_number,
@@ -642,7 +644,7 @@ class SeatingService:
         # Get guest
         guest_query = (
             select(RegistrationGuest)
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
                 EventRegistration.event_id == event_id,
                 RegistrationGuest.id == captain_id,
@@ -5,17 +5,19 @@ import logging
 import uuid
 from datetime import datetime, timedelta
 from io import BytesIO
+from typing import TYPE_CHECKING
 
 import pytz
-from azure.storage.blob import BlobSasPermissions, BlobServiceClient, generate_blob_sas
 from fastapi import HTTPException, status
-from PIL import Image
-from PIL.Image import Image as PILImage
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.core.tracing import BLOB_CLIENT_HOOKS
 from app.models.sponsor import Sponsor
 
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient
+
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
@@ -49,7 +51,7 @@ class SponsorLogoService:
     SAS_EXPIRY_HOURS = 1
 
     @staticmethod
-    def _get_blob_client() -> BlobServiceClient:
+    def _get_blob_client() -> "BlobServiceClient":
         """Get Azure Blob Service Client."""
         if not settings.azure_storage_connection_string:
             raise HTTPException(
@@ -57,7 +59,11 @@ class SponsorLogoService:
                 detail="Azure Storage not configured",
             )
 
-        return BlobServiceClient.from_connection_string(settings.azure_storage_connection_string)
+        from azure.storage.blob import BlobServiceClient
+
+        return BlobServiceClient.from_connection_string(
+            settings.azure_storage_connection_string, **BLOB_CLIENT_HOOKS
+        )
 
     @staticmethod
     def validate_logo_file(
@@ -139,6 +145,8 @@ class SponsorLogoService:
         Raises:
             HTTPException: If validation fails
         """
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         # Validate file
         is_valid, error_msg = SponsorLogoService.validate_logo_file(file_type, file_size)
         if not is_valid:
@@ -205,6 +213,8 @@ class SponsorLogoService:
         Raises:
             HTTPException: If Azure Blob Storage is not configured
         """
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         if not settings.azure_storage_connection_string:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -258,8 +268,10 @@ class SponsorLogoService:
         Raises:
             HTTPException: If thumbnail generation fails
         """
+        from PIL import Image
+
         try:
-            image: PILImage = Image.open(BytesIO(logo_blob_data))
+            image: Image.Image = Image.open(BytesIO(logo_blob_data))
 
             # For SVG or if image is already small, just return original
             if image.format == "SVG" or (
@@ -275,7 +287,7 @@ class SponsorLogoService:
             output = BytesIO()
             # Convert to RGB if necessary (for transparency handling)
             if image.mode in ("RGBA", "LA", "P"):
-                background: PILImage = Image.new("RGB", image.size, (255, 255, 255))
+                background: Image.Image = Image.new("RGB", image.size, (255, 255, 255))
                 if image.mode == "P":
                     image = image.convert("RGBA")
                 background.paste(image, mask=image.split()[-1] if image.mode == "RGBA" else None)
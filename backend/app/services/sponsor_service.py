@@ -5,9 +5,12 @@ import uuid
 from datetime import datetime
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.http_cache import ResourceVersion, resource_version
+from app.core.reorder import InvalidOrderError, reorder_rows
+from app.models.event import Event
 from app.models.sponsor import Sponsor
 from app.models.user import User
 from app.schemas.sponsor import SponsorCreate, SponsorUpdate
@@ -45,6 +48,41 @@ class SponsorService:
         logger.info(f"Retrieved {len(sponsors)} sponsors for event {event_id}")
         return list(sponsors)
 
+    @staticmethod
+    async def get_sponsors_version(
+        db: AsyncSession,
+        event_id: uuid.UUID,
+    ) -> ResourceVersion | None:
+        """
+        Get validators for an event's sponsor list without loading the sponsors.
+
+        Args:
+            db: Database session
+            event_id: Event UUID
+
+        Returns:
+            ResourceVersion, or None if the event does not exist
+        """
+        query = select(
+            exists().where(Event.id == event_id),
+            select(func.count(Sponsor.id)).where(Sponsor.event_id == event_id).scalar_subquery(),
+            select(func.max(Sponsor.updated_at))
+            .where(Sponsor.event_id == event_id)
+            .scalar_subquery(),
+        )
+        event_exists, count, last_modified = (await db.execute(query)).one()
+        if not event_exists:
+            return None
+
+        return resource_version(
+            "sponsors",
+            event_id,
+            count,
+            last_modified,
+            last_modified=last_modified,
+            signed_urls=True,
+        )
+
     @staticmethod
     async def get_sponsor_by_id(
         db: AsyncSession,
@@ -308,26 +346,16 @@ class SponsorService:
         Raises:
             HTTPException: If any sponsor ID is invalid or doesn't belong to event
         """
-        # Fetch all sponsors for validation
-        all_sponsors = await SponsorService.get_sponsors_for_event(db, event_id)
-        all_sponsor_ids = {sponsor.id for sponsor in all_sponsors}
-
-        # Validate that all provided IDs belong to this event
-        provided_ids = set(sponsor_ids_ordered)
-        if not provided_ids.issubset(all_sponsor_ids):
-            invalid_ids = provided_ids - all_sponsor_ids
+        # One UPDATE ... FROM (VALUES ...) RETURNING for all positions; an id of
+        # another event's sponsor matches no row
+        try:
+            await reorder_rows(db, Sponsor, sponsor_ids_ordered, Sponsor.event_id == event_id)
+        except InvalidOrderError as e:
+            await db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid sponsor IDs: {invalid_ids}",
-            )
-
-        # Update display_order for each sponsor
-        for index, sponsor_id in enumerate(sponsor_ids_ordered):
-            query = select(Sponsor).where(Sponsor.id == sponsor_id, Sponsor.event_id == event_id)
-            result = await db.execute(query)
-            sponsor = result.scalar_one()
-            sponsor.display_order = index
-            sponsor.updated_at = datetime.utcnow()
+                detail=f"Invalid sponsor IDs: {e.ids}",
+            ) from e
 
         await db.commit()
 
@@ -10,6 +10,7 @@ from math import ceil
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import SortKey, TotalMode, count_total, order_by_keys, paginate_keyset
 from app.core.security import hash_password
 from app.models.user import User
 from app.schemas.users import (
@@ -20,6 +21,8 @@ from app.schemas.users import (
 )
 from app.services.permission_service import PermissionService
 
+USER_LIST_SORT = (SortKey(User.created_at, descending=True), SortKey(User.id, descending=True))
+
 
 class UserService:
     """Service for user management operations."""
@@ -39,9 +42,15 @@ class UserService:
         email_verified: bool | None = None,
         is_active: bool | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        total_mode: TotalMode = "none",
     ) -> UserListResponse:
         """List users with pagination and filtering.
 
+        Page-number pagination is used unless ``cursor`` is given (empty for
+        the first page), which switches to keyset pagination over
+        (created_at, id) with the total computed per ``total_mode``.
+
         Args:
             db: Database session
             current_user: User making the request
@@ -52,6 +61,8 @@ class UserService:
             email_verified: Filter by email verification status
             is_active: Filter by active status
             search: Search in name and email
+            cursor: Keyset cursor from the previous page's next_cursor
+            total_mode: Total computation in cursor mode (exact, cached, estimate, none)
 
         Returns:
             Paginated list of users
@@ -59,6 +70,7 @@ class UserService:
         Raises:
             ValueError: If page < 1 or per_page < 1 or per_page > 100
             PermissionError: If user doesn't have permission to view users
+            InvalidCursorError: If the cursor is malformed or from another listing
         """
         # Validate pagination
         if page < 1:
@@ -132,17 +144,31 @@ class UserService:
 
             stmt = stmt.where(or_(*search_conditions))
 
-        # Get total count
-        count_stmt = select(func.count()).select_from(stmt.alias())
-        total_result = await db.execute(count_stmt)
-        total = total_result.scalar()
+        next_cursor = None
+        total: int | None
+        if cursor is not None:
+            keyset_page = await paginate_keyset(
+                db,
+                stmt,
+                USER_LIST_SORT,
+                scope="users",
+                cursor=cursor,
+                limit=per_page,
+                total_mode=total_mode,
+            )
+            users = keyset_page.items
+            total, next_cursor = keyset_page.total, keyset_page.next_cursor
+        else:
+            # Get total count
+            total = await count_total(db, stmt, "exact", scope="users")
 
-        # Apply pagination
-        stmt = stmt.offset((page - 1) * per_page).limit(per_page)
+            # Apply pagination
+            stmt = order_by_keys(stmt, USER_LIST_SORT)
+            stmt = stmt.offset((page - 1) * per_page).limit(per_page)
 
-        # Execute query
-        result = await db.execute(stmt)
-        users = result.scalars().all()
+            # Execute query
+            result = await db.execute(stmt)
+            users = list(result.scalars().all())
 
         # Get role names and NPO memberships for users
         user_list = []
@@ -201,6 +227,16 @@ class UserService:
             }
             user_list.append(UserPublicWithRole(**user_dict))
 
+        if cursor is not None:
+            return UserListResponse(
+                items=user_list,
+                total=total,
+                page=None,
+                per_page=per_page,
+                total_pages=ceil(total / per_page) if total is not None else None,
+                next_cursor=next_cursor,
+            )
+
         # Calculate total pages, handling case where total is None
         total_pages = ceil(total / per_page) if (total is not None and total > 0) else 1
         # Ensure total is not None for response
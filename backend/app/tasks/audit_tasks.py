@@ -0,0 +1,31 @@
+"""Audit log background tasks.
+
+NOTE: Like the event tasks, these run as plain async functions until a
+scheduler is configured (e.g. daily).
+"""
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.audit_log_partitions import PartitionMaintenanceResult, maintain_partitions
+
+logger = logging.getLogger(__name__)
+
+
+async def maintain_audit_log_partitions_task(db: AsyncSession) -> PartitionMaintenanceResult:
+    """
+    Background task: create upcoming audit log partitions and retire expired ones.
+
+    Expired partitions are archived to Blob Storage before they are dropped.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Summary of created, archived, dropped and kept partitions
+    """
+    result = await maintain_partitions(db)
+    if result.dropped:
+        logger.info(f"Archived and dropped {len(result.dropped)} audit log partitions")
+    return result
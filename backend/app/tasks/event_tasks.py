@@ -1,119 +1,76 @@
 """Event-related background tasks.
 
-NOTE: Celery is not yet configured in this project. These are placeholder
-functions that should be converted to Celery tasks when Celery is set up.
-
-To set up Celery:
-1. Add celery to pyproject.toml dependencies
-2. Create app/celery_app.py with Celery configuration
-3. Add @celery_app.task decorator to these functions
-4. Configure celery beat for periodic tasks
+Periodic tasks are run by the in-process job scheduler (see
+app/tasks/schedule.py). Uploaded media is virus-scanned by
+app.services.media_scan_worker.
 """
 
 import logging
 from datetime import datetime, timedelta
 
 import pytz
-from sqlalchemy import and_, select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.metrics import EVENTS_CLOSED_TOTAL
 from app.models.event import Event, EventStatus
+from app.services.event_service import PUBLIC_EVENT_LIST_TAG, public_event_cache, public_event_tag
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
-async def close_expired_events_task(db: AsyncSession) -> int:
+async def close_expired_events_task(db: AsyncSession, batch_size: int | None = None) -> int:
     """
     Background task: Close events 24 hours after event_datetime.
 
-    This should be run as a periodic Celery task (e.g., every 15 minutes).
+    Events are closed in batches of ``batch_size`` with a single
+    ``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING id``
+    each, committed per batch, so no ORM objects are loaded and a large
+    backlog never holds locks on every row at once. Rows locked by a
+    concurrent edit are skipped and closed on the next run.
 
     Args:
         db: Database session
+        batch_size: Events per UPDATE (defaults to event_close_batch_size)
 
     Returns:
         Number of events closed
     """
+    batch_size = batch_size or settings.event_close_batch_size
     cutoff_time = datetime.now(pytz.UTC) - timedelta(hours=24)
-
-    query = select(Event).where(
-        and_(Event.status == EventStatus.ACTIVE, Event.event_datetime < cutoff_time)
-    )
-
-    result = await db.execute(query)
-    events_to_close = list(result.scalars().all())
-
-    for event in events_to_close:
-        event.status = EventStatus.CLOSED
-        event.version += 1
-
-    if events_to_close:
+    total = 0
+
+    while True:
+        expired_ids = (
+            select(Event.id)
+            .where(Event.status == EventStatus.ACTIVE, Event.event_datetime < cutoff_time)
+            .order_by(Event.event_datetime)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(Event)
+            .where(Event.id.in_(expired_ids))
+            .values(status=EventStatus.CLOSED, version=Event.version + 1)
+            .returning(Event.id)
+            .execution_options(synchronize_session=False)
+        )
+        closed_ids = list(result.scalars().all())
         await db.commit()
-        EVENTS_CLOSED_TOTAL.labels(closure_type="automatic").inc(len(events_to_close))
-        logger.info(f"Auto-closed {len(events_to_close)} expired events")
-
-    return len(events_to_close)
-
-
-async def scan_uploaded_file_task(media_id: str) -> dict[str, bool | str]:
-    """
-    Background task: Scan uploaded file for viruses using ClamAV.
-
-    This should be run as an async Celery task triggered after file upload.
-
-    Args:
-        media_id: UUID of the EventMedia record
-
-    Returns:
-        dict with scan results: {"passed": bool, "details": str}
-
-    Implementation notes:
-    - Install ClamAV: apt-get install clamav clamav-daemon
-    - Use python-clamav or pyclamd library
-    - Update virus definitions: freshclam
-    - Scan file from Azure Blob Storage
-    - Update EventMedia status based on scan result
-    - Delete file from blob storage if infected
-    """
-    # TODO: Implement ClamAV integration
-    # from app.services.media_service import MediaService
-    # import pyclamd
-    #
-    # Example implementation:
-    # 1. Download file from Azure Blob to temp location
-    # 2. Scan with ClamAV: cd = pyclamd.ClamdUnixSocket()
-    #                      scan_result = cd.scan_file(temp_file_path)
-    # 3. Update media status: await MediaService.mark_scan_complete(db, media_id, passed, details)
-    # 4. Delete temp file
-    # 5. If infected, delete from blob storage
-
-    logger.warning(f"Virus scanning not yet implemented for media {media_id}")
-    return {"passed": True, "details": "Scan not implemented - auto-approved"}
-
-
-# Celery configuration example (when Celery is set up):
-#
-# from app.celery_app import celery_app
-#
-# @celery_app.task(name="event_tasks.close_expired_events")
-# def close_expired_events():
-#     """Celery task wrapper for close_expired_events_task."""
-#     from app.core.database import get_async_session
-#     async with get_async_session() as db:
-#         return await close_expired_events_task(db)
-#
-# @celery_app.task(name="event_tasks.scan_uploaded_file")
-# def scan_uploaded_file(media_id: str):
-#     """Celery task wrapper for scan_uploaded_file_task."""
-#     from app.core.database import get_async_session
-#     async with get_async_session() as db:
-#         return await scan_uploaded_file_task(media_id)
-#
-# Celery Beat schedule:
-# celery_app.conf.beat_schedule = {
-#     "close-expired-events-every-15-minutes": {
-#         "task": "event_tasks.close_expired_events",
-#         "schedule": 900.0,  # 15 minutes in seconds
-#     },
-# }
+        if not closed_ids:
+            break
+
+        total += len(closed_ids)
+        await public_event_cache.invalidate_tags(
+            PUBLIC_EVENT_LIST_TAG, *(public_event_tag(event_id) for event_id in closed_ids)
+        )
+        EVENTS_CLOSED_TOTAL.labels(closure_type="automatic").inc(len(closed_ids))
+        if len(closed_ids) < batch_size:
+            break
+
+    if total:
+        logger.info(f"Auto-closed {total} expired events")
+    return total
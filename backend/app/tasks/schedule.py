@@ -0,0 +1,64 @@
+"""Periodic job definitions for the in-process scheduler.
+
+Each job opens its own database session, so runs are independent of any
+request. Virus scanning is queued per upload (app.services.media_scan_worker)
+rather than run on a schedule.
+"""
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.scheduler import JobScheduler, ScheduledJob
+from app.services.audit_log_partitions import PartitionMaintenanceResult
+from app.services.email_campaign_service import EmailCampaignService
+from app.tasks.audit_tasks import maintain_audit_log_partitions_task
+from app.tasks.event_tasks import close_expired_events_task
+
+settings = get_settings()
+
+
+async def close_expired_events_job() -> int:
+    """Close events that ended more than 24 hours ago."""
+    async with AsyncSessionLocal() as db:
+        return await close_expired_events_task(db)
+
+
+async def maintain_audit_log_partitions_job() -> PartitionMaintenanceResult:
+    """Create upcoming audit log partitions and retire expired ones."""
+    async with AsyncSessionLocal() as db:
+        return await maintain_audit_log_partitions_task(db)
+
+
+async def resume_email_campaigns_job() -> int:
+    """Resume email campaigns whose worker stopped mid-campaign."""
+    return await EmailCampaignService.resume_stale_campaigns()
+
+
+def register_jobs(scheduler: JobScheduler) -> None:
+    """Register the application's periodic jobs."""
+    scheduler.register(
+        ScheduledJob(
+            name="close_expired_events",
+            func=close_expired_events_job,
+            interval=settings.event_close_interval_seconds,
+            timeout=300.0,
+            initial_delay=60.0,
+        )
+    )
+    scheduler.register(
+        ScheduledJob(
+            name="maintain_audit_log_partitions",
+            func=maintain_audit_log_partitions_job,
+            interval=settings.audit_log_maintenance_interval_seconds,
+            timeout=1800.0,
+            jitter=0.05,
+            initial_delay=300.0,
+        )
+    )
+    scheduler.register(
+        ScheduledJob(
+            name="resume_email_campaigns",
+            func=resume_email_campaigns_job,
+            interval=settings.email_campaign_recovery_interval_seconds,
+            timeout=600.0,
+        )
+    )
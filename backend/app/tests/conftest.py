@@ -1,7 +1,8 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 import pytest
@@ -13,7 +14,8 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engin
 from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
-from app.core.database import get_db
+from app.core.database import get_db, get_primary_read_db, get_read_db
+from app.core.query_stats import QueryStats, track_queries
 from app.main import app
 from app.models.base import Base
 from app.models.user import User
@@ -262,7 +264,7 @@ async def async_client(
 
     from app.core.redis import get_redis
 
-    # Override get_db dependency to use test session
+    # Override get_db (and the read-only session dependencies) to use test session
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
@@ -271,6 +273,8 @@ async def async_client(
         return redis_client
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_primary_read_db] = override_get_db
     app.dependency_overrides[get_redis] = override_get_redis
 
     async with AsyncClient(app=app, base_url="http://test") as test_client:
@@ -279,6 +283,26 @@ async def async_client(
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], AbstractContextManager[QueryStats]]:
+    """
+    Fail if a block executes more than ``n`` SQL statements.
+
+    Use around API calls to guard against N+1 loops:
+
+        with assert_max_queries(5):
+            response = await npo_admin_client.get(url)
+    """
+
+    @contextmanager
+    def check(n: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= n, f"Expected at most {n} queries, got {stats.describe()}"
+
+    return check
+
+
 # ================================
 # Authentication Fixtures
 # ================================
@@ -1734,23 +1758,32 @@ def mock_azure_storage(monkeypatch):
         blob_name = kwargs.get("blob_name", "test-blob")
         return f"mock_sas_token=test&sig=mocksignature-{blob_name[:8]}-{timestamp}"
 
+    # The services import these on first use, so patch them where they're defined
     monkeypatch.setattr(
-        "app.services.file_upload_service.BlobServiceClient.from_connection_string",
+        "azure.storage.blob.BlobServiceClient.from_connection_string",
         lambda *args, **kwargs: mock_blob_service,
     )
     monkeypatch.setattr(
-        "app.services.file_upload_service.generate_blob_sas",
-        mock_generate_sas,
-    )
-
-    # Also mock for sponsor_logo_service
-    monkeypatch.setattr(
-        "app.services.sponsor_logo_service.BlobServiceClient.from_connection_string",
-        lambda *args, **kwargs: mock_blob_service,
-    )
-    monkeypatch.setattr(
-        "app.services.sponsor_logo_service.generate_blob_sas",
+        "azure.storage.blob.generate_blob_sas",
         mock_generate_sas,
     )
 
     return mock_blob_service
+
+
+# ================================
+# Response Cache Fixture
+# ================================
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_response_caches() -> AsyncGenerator[None, None]:
+    """Start every test with empty response caches.
+
+    Test transactions are rolled back, so cached pages from a previous test
+    (e.g. a public event slug) would otherwise outlive the rows they came from.
+    """
+    from app.core.cache import ResponseCache
+
+    await ResponseCache.clear_all()
+    yield
@@ -42,7 +42,7 @@ class TestMediaUploadURL:
         await db_session.refresh(auction_item)
 
         # Mock Azure Blob Storage
-        with patch("app.services.auction_item_media_service.BlobServiceClient") as mock_blob_client:
+        with patch("azure.storage.blob.BlobServiceClient") as mock_blob_client:
             mock_blob = MagicMock()
             mock_blob.url = (
                 f"https://test.blob.core.windows.net/container/test-{auction_item.id}.jpg"
@@ -112,7 +112,7 @@ class TestMediaUploadURL:
         await db_session.commit()
         await db_session.refresh(auction_item)
 
-        with patch("app.services.auction_item_media_service.BlobServiceClient") as mock_blob_client:
+        with patch("azure.storage.blob.BlobServiceClient") as mock_blob_client:
             mock_blob = MagicMock()
             mock_blob.url = (
                 f"https://test.blob.core.windows.net/container/test-{auction_item.id}.mp4"
@@ -163,7 +163,7 @@ class TestMediaUploadURL:
         await db_session.commit()
         await db_session.refresh(auction_item)
 
-        with patch("app.services.auction_item_media_service.BlobServiceClient"):
+        with patch("azure.storage.blob.BlobServiceClient"):
             payload = {
                 "file_name": "test.pdf",
                 "content_type": "application/pdf",
@@ -217,7 +217,7 @@ class TestMediaUploadURL:
         await db_session.commit()
         await db_session.refresh(auction_item)
 
-        with patch("app.services.auction_item_media_service.BlobServiceClient"):
+        with patch("azure.storage.blob.BlobServiceClient"):
             payload = {
                 "file_name": "huge-image.jpg",
                 "content_type": "image/jpeg",
@@ -323,7 +323,7 @@ class TestMediaConfirm:
         img_bytes.seek(0)
 
         # Mock Azure Blob Storage
-        with patch("app.services.auction_item_media_service.BlobServiceClient") as mock_blob_client:
+        with patch("azure.storage.blob.BlobServiceClient") as mock_blob_client:
             mock_blob = MagicMock()
             mock_blob.url = "https://test.blob.core.windows.net/container/test.jpg"
             mock_blob.exists.return_value = True
@@ -410,7 +410,7 @@ class TestMediaConfirm:
         await db_session.commit()
         await db_session.refresh(auction_item)
 
-        with patch("app.services.auction_item_media_service.BlobServiceClient") as mock_blob_client:
+        with patch("azure.storage.blob.BlobServiceClient") as mock_blob_client:
             mock_blob = MagicMock()
             mock_blob.url = "https://test.blob.core.windows.net/container/test.mp4"
             mock_blob.exists.return_value = True
@@ -465,7 +465,7 @@ class TestMediaConfirm:
         await db_session.commit()
         await db_session.refresh(auction_item)
 
-        with patch("app.services.auction_item_media_service.BlobServiceClient") as mock_blob_client:
+        with patch("azure.storage.blob.BlobServiceClient") as mock_blob_client:
             mock_blob = MagicMock()
             mock_blob.exists.return_value = False
             mock_blob_client.from_connection_string.return_value.get_blob_client.return_value = (
@@ -544,6 +544,7 @@ class TestMediaList:
         test_event: Any,
         db_session: AsyncSession,
         mock_azure_storage: Any,
+        assert_max_queries: Any,
     ) -> None:
         """Test listing media items ordered by display_order."""
         from app.models.auction_item import AuctionItem, AuctionItemMedia
@@ -586,9 +587,11 @@ class TestMediaList:
         db_session.add_all([media1, media2])
         await db_session.commit()
 
-        response = await npo_admin_client.get(
-            f"/api/v1/events/{test_event.id}/auction-items/{auction_item.id}/media"
-        )
+        # Auth (user, role), item, media page: not one query per media row
+        with assert_max_queries(4):
+            response = await npo_admin_client.get(
+                f"/api/v1/events/{test_event.id}/auction-items/{auction_item.id}/media"
+            )
 
         assert response.status_code == 200
         data = response.json()
@@ -877,7 +880,7 @@ class TestMediaDelete:
         await db_session.commit()
         await db_session.refresh(media)
 
-        with patch("app.services.auction_item_media_service.BlobServiceClient") as mock_blob_client:
+        with patch("azure.storage.blob.BlobServiceClient") as mock_blob_client:
             mock_blob = MagicMock()
             mock_blob_client.from_connection_string.return_value.get_blob_client.return_value = (
                 mock_blob
@@ -238,6 +238,76 @@ class TestAuctionItemCreation:
         assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+class TestAuctionItemImport:
+    """Test POST /api/v1/events/{event_id}/auction-items/import endpoint contract."""
+
+    async def test_import_auction_items_success(
+        self,
+        npo_admin_client: AsyncClient,
+        test_event: Any,
+    ) -> None:
+        """Test an admin of the event's NPO can import items."""
+        payload = {
+            "items": [
+                {
+                    "title": f"Imported Item {i}",
+                    "description": "Imported description",
+                    "auction_type": "silent",
+                    "starting_bid": 100.00,
+                }
+                for i in range(3)
+            ]
+        }
+
+        response = await npo_admin_client.post(
+            f"/api/v1/events/{test_event.id}/auction-items/import", json=payload
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 3
+        assert [item["bid_number"] for item in data["items"]] == [100, 101, 102]
+
+    async def test_import_auction_items_rejects_donors(
+        self,
+        donor_client: AsyncClient,
+        test_event: Any,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test a donor can't import items into an event, as JSON or CSV."""
+        from sqlalchemy import func, select
+
+        from app.models.auction_item import AuctionItem
+
+        payload = {
+            "items": [
+                {
+                    "title": "Imported Item",
+                    "description": "Imported description",
+                    "auction_type": "silent",
+                    "starting_bid": 100.00,
+                }
+            ]
+        }
+        response = await donor_client.post(
+            f"/api/v1/events/{test_event.id}/auction-items/import", json=payload
+        )
+        assert response.status_code == 403
+
+        csv_body = "title,description,auction_type,starting_bid\nWine,Six bottles,live,100\n"
+        response = await donor_client.post(
+            f"/api/v1/events/{test_event.id}/auction-items/import/csv",
+            files={"file": ("items.csv", csv_body, "text/csv")},
+        )
+        assert response.status_code == 403
+
+        count = await db_session.scalar(
+            select(func.count(AuctionItem.id)).where(AuctionItem.event_id == test_event.id)
+        )
+        assert count == 0
+
+
 @pytest.mark.asyncio
 class TestAuctionItemList:
     """Test GET /api/v1/events/{event_id}/auction-items endpoint contract."""
@@ -443,6 +513,61 @@ class TestAuctionItemList:
         assert len(data["items"]) == 1
         assert "Wine" in data["items"][0]["title"]
 
+    async def test_list_auction_items_query_count_is_constant(
+        self,
+        npo_admin_client: AsyncClient,
+        test_event: Any,
+        db_session: AsyncSession,
+        assert_max_queries: Any,
+    ) -> None:
+        """Test listing items with media takes a fixed number of queries, paged or by cursor."""
+        from app.models.auction_item import AuctionItem, AuctionItemMedia
+
+        items = [
+            AuctionItem(
+                event_id=test_event.id,
+                title=f"Item {i}",
+                description="Description",
+                auction_type="silent",
+                bid_number=100 + i,
+                starting_bid=100.00,
+                bid_increment=10.00,
+                quantity_available=1,
+                status="draft",
+                created_by=test_event.created_by,
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(items)
+        await db_session.flush()
+        db_session.add_all(
+            AuctionItemMedia(
+                auction_item_id=item.id,
+                media_type="image",
+                file_path=f"https://test.blob.core.windows.net/container/{item.id}-{n}.jpg",
+                file_name=f"{n}.jpg",
+                file_size=1024,
+                mime_type="image/jpeg",
+                display_order=n,
+            )
+            for item in items
+            for n in range(2)
+        )
+        await db_session.commit()
+        url = f"/api/v1/events/{test_event.id}/auction-items"
+
+        # Auth (user, role), event, count, page, primary images
+        with assert_max_queries(6):
+            response = await npo_admin_client.get(url)
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 5
+
+        # The cursor path skips the count
+        with assert_max_queries(5):
+            response = await npo_admin_client.get(url, params={"cursor": "", "limit": 3})
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 3
+
     async def test_list_auction_items_allows_unauthenticated(
         self,
         client: AsyncClient,
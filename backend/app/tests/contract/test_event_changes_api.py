@@ -0,0 +1,25 @@
+"""Contract tests for the event change stream endpoint."""
+
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+class TestEventChangeStreamAccess:
+    """The change stream carries guest and registration ids, so it is admin-only."""
+
+    async def test_stream_requires_authentication(
+        self, client: AsyncClient, test_event: Any
+    ) -> None:
+        """Test GET /events/{event_id}/changes returns 401 without a token."""
+        response = await client.get(f"/api/v1/events/{test_event.id}/changes")
+
+        assert response.status_code == 401
+
+    async def test_stream_rejects_donors(self, donor_client: AsyncClient, test_event: Any) -> None:
+        """Test GET /events/{event_id}/changes returns 403 for a donor."""
+        response = await donor_client.get(f"/api/v1/events/{test_event.id}/changes")
+
+        assert response.status_code == 403
@@ -4,6 +4,11 @@ from typing import Any
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.main import app
+from app.models.event import EventMedia, EventMediaStatus, EventMediaType
 
 
 @pytest.mark.asyncio
@@ -44,6 +49,25 @@ class TestEventRetrieval:
         assert isinstance(data["links"], list)
         assert isinstance(data["food_options"], list)
 
+    async def test_get_event_never_opens_a_write_session(
+        self,
+        npo_admin_client: AsyncClient,
+        test_event: Any,
+    ) -> None:
+        """Test event retrieval authenticates and reads on the read session only."""
+        read_db_override = app.dependency_overrides[get_db]
+
+        async def no_write_session() -> None:
+            raise AssertionError("read endpoint depended on get_db")
+
+        app.dependency_overrides[get_db] = no_write_session
+        try:
+            response = await npo_admin_client.get(f"/api/v1/events/{test_event.id}")
+        finally:
+            app.dependency_overrides[get_db] = read_db_override
+
+        assert response.status_code == 200
+
     async def test_get_event_not_found(
         self,
         npo_admin_client: AsyncClient,
@@ -138,3 +162,35 @@ class TestPublicEventRetrieval:
         assert response.status_code == 200
         data = response.json()
         assert data["slug"] == test_active_event.slug
+
+    async def test_get_public_event_hides_unscanned_media(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_active_event: Any,
+        test_npo_admin_user: Any,
+    ) -> None:
+        """Test public event retrieval only lists media that passed the virus scan."""
+        for status in EventMediaStatus:
+            db_session.add(
+                EventMedia(
+                    event_id=test_active_event.id,
+                    media_type=EventMediaType.IMAGE,
+                    file_url=f"https://example.com/{status.value}.png",
+                    file_name=f"{status.value}.png",
+                    file_type="image/png",
+                    mime_type="image/png",
+                    blob_name=f"events/{status.value}.png",
+                    file_size=1024,
+                    status=status,
+                    uploaded_by=test_npo_admin_user.id,
+                )
+            )
+        await db_session.commit()
+        db_session.expunge_all()
+
+        response = await client.get(f"/api/v1/events/public/{test_active_event.slug}")
+
+        assert response.status_code == 200
+        media = response.json()["media"]
+        assert [item["status"] for item in media] == [EventMediaStatus.SCANNED.value]
@@ -57,6 +57,7 @@ class TestEventListing:
         db_session: AsyncSession,
         test_approved_npo: Any,
         test_npo_admin_user: Any,
+        assert_max_queries: Any,
     ) -> None:
         """Test event listing pagination with page and per_page parameters."""
         from app.models.event import Event, EventStatus
@@ -80,8 +81,9 @@ class TestEventListing:
         db_session.add_all(events)
         await db_session.commit()
 
-        # Page 1 with 2 items per page
-        response = await npo_admin_client.get("/api/v1/events?page=1&per_page=2")
+        # Page 1 with 2 items per page; NPOs are loaded with the page, not per event
+        with assert_max_queries(5):
+            response = await npo_admin_client.get("/api/v1/events?page=1&per_page=2")
         assert response.status_code == 200
         data = response.json()
 
@@ -18,6 +18,7 @@ from fastapi import status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.audit_log import AuditLog
 from app.models.npo import NPO
 from app.models.npo_member import NPOMember
 from app.models.user import User
@@ -224,8 +225,9 @@ class TestUpdateMemberEndpoint:
         authenticated_client,
         test_npo: NPO,
         test_staff_member: NPOMember,
+        db_session: AsyncSession,
     ):
-        """Admin can update member role"""
+        """Admin can update member role; the audit record commits with it"""
         update_data = {
             "role": "co_admin",
         }
@@ -239,6 +241,15 @@ class TestUpdateMemberEndpoint:
         data = response.json()
         assert data["member"]["role"] == "co_admin"
 
+        audit_log = await db_session.scalar(
+            select(AuditLog).where(
+                AuditLog.user_id == test_staff_member.user_id,
+                AuditLog.action == "role_changed",
+            )
+        )
+        assert audit_log is not None
+        assert audit_log.event_metadata["new_role"] == "co_admin"
+
     async def test_update_member_invalid_role(
         self,
         authenticated_client,
@@ -12,6 +12,8 @@ import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import get_db, get_read_db
+from app.main import app
 from app.models.event import Event, EventStatus
 from app.models.event_registration import EventRegistration, RegistrationStatus
 from app.models.npo_branding import NPOBranding
@@ -212,6 +214,24 @@ class TestGetRegisteredEventsWithBrandingContract:
         assert isinstance(data["events"], list)
         assert len(data["events"]) == 0
 
+    async def test_get_registered_events_with_branding_uses_one_primary_session(
+        self, authenticated_client: AsyncClient
+    ):
+        """Test the user is authenticated on the route's primary read session."""
+        overrides = {dep: app.dependency_overrides[dep] for dep in (get_db, get_read_db)}
+
+        async def other_session() -> None:
+            raise AssertionError("endpoint opened a second session")
+
+        app.dependency_overrides[get_db] = other_session
+        app.dependency_overrides[get_read_db] = other_session
+        try:
+            response = await authenticated_client.get("/api/v1/registrations/events-with-branding")
+        finally:
+            app.dependency_overrides.update(overrides)
+
+        assert response.status_code == 200
+
     async def test_get_registered_events_with_branding_event_colors(
         self,
         authenticated_client: AsyncClient,
@@ -0,0 +1,141 @@
+"""Integration tests for queueing bulk email campaigns."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.models.email_campaign import EmailCampaign, EmailCampaignAudience, EmailCampaignStatus
+from app.models.email_outbox import EmailOutbox
+from app.models.event_registration import EventRegistration, RegistrationStatus
+from app.models.registration_guest import RegistrationGuest
+from app.services.email_campaign_service import EmailCampaignService
+
+settings = get_settings()
+
+
+@pytest.fixture(autouse=True)
+def campaign_sessions(db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run campaigns inside the test transaction, in batches of two, 10s apart."""
+    sessions = async_sessionmaker(
+        bind=db_session.bind, expire_on_commit=False, join_transaction_mode="create_savepoint"
+    )
+    monkeypatch.setattr("app.services.email_campaign_service.AsyncSessionLocal", sessions)
+    monkeypatch.setattr(settings, "email_campaign_batch_size", 2)
+    monkeypatch.setattr(settings, "email_campaign_batch_interval_seconds", 10.0)
+
+
+@pytest_asyncio.fixture
+async def invited_guests(
+    db_session: AsyncSession, test_event: Any, test_donor_user: Any
+) -> list[RegistrationGuest]:
+    """Five guests with an email, ordered by id (the campaign's batch order)."""
+    registration = EventRegistration(
+        event_id=test_event.id,
+        user_id=test_donor_user.id,
+        status=RegistrationStatus.CONFIRMED,
+        number_of_guests=5,
+    )
+    db_session.add(registration)
+    await db_session.flush()
+    guests = [
+        RegistrationGuest(
+            registration_id=registration.id,
+            event_id=test_event.id,
+            name=f"Guest {i}",
+            email=f"guest{i}@example.com",
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(guests)
+    await db_session.commit()
+    return sorted(guests, key=lambda guest: guest.id)
+
+
+async def start_campaign(db_session: AsyncSession, event_id: Any) -> EmailCampaign:
+    """Create a pending campaign to all guests."""
+    campaign = await EmailCampaignService.create_campaign(
+        db_session, event_id, EmailCampaignAudience.ALL, None, None
+    )
+    await db_session.commit()
+    return campaign
+
+
+async def queued_emails(db_session: AsyncSession, campaign_id: Any) -> list[EmailOutbox]:
+    """The campaign's outbox rows."""
+    result = await db_session.scalars(
+        select(EmailOutbox).where(EmailOutbox.campaign_id == campaign_id)
+    )
+    return list(result)
+
+
+@pytest.mark.asyncio
+class TestEmailCampaignRun:
+    """Tests for batching, throttling, progress and recovery of campaign runs."""
+
+    async def test_campaign_queues_guests_in_staggered_batches(
+        self, db_session: AsyncSession, test_event: Any, invited_guests: list[RegistrationGuest]
+    ) -> None:
+        """Every guest is queued once; each batch of two is due 10s after the previous one."""
+        campaign = await start_campaign(db_session, test_event.id)
+
+        assert await EmailCampaignService.run_campaign(campaign.id) is True
+
+        emails = await queued_emails(db_session, campaign.id)
+        assert sorted(email.to_email for email in emails) == sorted(
+            guest.email for guest in invited_guests if guest.email
+        )
+        due_times = sorted({email.next_attempt_at for email in emails})
+        assert len(due_times) == 3
+        assert [
+            later - earlier for earlier, later in zip(due_times, due_times[1:], strict=False)
+        ] == [timedelta(seconds=10)] * 2
+
+        await db_session.refresh(campaign)
+        assert campaign.status == EmailCampaignStatus.COMPLETED
+        assert campaign.queued_count == 5
+        assert campaign.last_recipient_id == invited_guests[-1].id
+        assert campaign.lease_expires_at is None
+
+        counts = await EmailCampaignService.get_delivery_counts(db_session, campaign.id)
+        assert counts == {"pending": 5, "sending": 0, "sent": 0, "failed": 0}
+
+    async def test_stalled_campaign_resumes_after_last_queued_guest(
+        self, db_session: AsyncSession, test_event: Any, invited_guests: list[RegistrationGuest]
+    ) -> None:
+        """A running campaign whose lease expired is finished without re-sending."""
+        campaign = await start_campaign(db_session, test_event.id)
+        campaign.status = EmailCampaignStatus.RUNNING
+        campaign.last_recipient_id = invited_guests[1].id
+        campaign.queued_count = 2
+        campaign.lease_expires_at = datetime.now(UTC) - timedelta(minutes=1)
+        await db_session.commit()
+
+        assert await EmailCampaignService.resume_stale_campaigns() == 1
+
+        emails = await queued_emails(db_session, campaign.id)
+        assert sorted(email.to_email for email in emails) == sorted(
+            guest.email for guest in invited_guests[2:] if guest.email
+        )
+        await db_session.refresh(campaign)
+        assert campaign.status == EmailCampaignStatus.COMPLETED
+        assert campaign.queued_count == 5
+
+    async def test_live_campaigns_are_left_to_their_runner(
+        self, db_session: AsyncSession, test_event: Any, invited_guests: list[RegistrationGuest]
+    ) -> None:
+        """A held lease blocks other runners, and fresh pending campaigns aren't resumed."""
+        campaign = await start_campaign(db_session, test_event.id)
+        assert await EmailCampaignService.resume_stale_campaigns() == 0
+
+        campaign.status = EmailCampaignStatus.RUNNING
+        campaign.lease_expires_at = datetime.now(UTC) + timedelta(minutes=5)
+        await db_session.commit()
+
+        assert await EmailCampaignService.run_campaign(campaign.id) is False
+        assert await EmailCampaignService.resume_stale_campaigns() == 0
+        assert await queued_emails(db_session, campaign.id) == []
@@ -808,7 +808,7 @@ class TestSeatingDragDropWorkflow:
         # Verify parties stayed together by checking database
         query = (
             select(RegistrationGuest)
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(EventRegistration.event_id == test_active_event.id)
             .order_by(RegistrationGuest.registration_id, RegistrationGuest.name)
         )
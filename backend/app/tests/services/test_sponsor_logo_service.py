@@ -159,7 +159,7 @@ async def test_generate_upload_url_structure():
         patch(
             "app.services.sponsor_logo_service.SponsorLogoService._get_blob_client"
         ) as mock_blob_client,
-        patch("app.services.sponsor_logo_service.generate_blob_sas", side_effect=mock_generate_sas),
+        patch("azure.storage.blob.generate_blob_sas", side_effect=mock_generate_sas),
     ):
         # Mock blob service client
         mock_client = MagicMock()
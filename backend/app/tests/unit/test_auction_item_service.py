@@ -9,8 +9,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.auction_item import AuctionItem, AuctionType, ItemStatus
 from app.models.event import Event, EventStatus
 from app.models.npo import NPO, NPOStatus
-from app.schemas.auction_item import AuctionItemCreate, AuctionItemUpdate
-from app.services.auction_item_service import AuctionItemService
+from app.schemas.auction_item import (
+    AuctionItemCreate,
+    AuctionItemUpdate,
+)
+from app.services.auction_item_service import (
+    AuctionItemImportError,
+    AuctionItemService,
+    parse_import_csv,
+)
 
 
 @pytest.fixture
@@ -230,6 +237,97 @@ class TestBidNumberAssignment:
             )
 
 
+@pytest.mark.asyncio
+class TestBulkImport:
+    """Test bulk import with block bid number allocation."""
+
+    async def test_import_allocates_block(
+        self,
+        db_session: AsyncSession,
+        test_event: Event,
+        test_user,
+        auction_item_service: AuctionItemService,
+        assert_max_queries,
+    ):
+        """Test items get consecutive bid numbers in few statements."""
+        rows = [
+            AuctionItemCreate(
+                title=f"Item {i}",
+                description="Imported",
+                auction_type=AuctionType.SILENT,
+                starting_bid=Decimal("100.00"),
+            )
+            for i in range(5)
+        ]
+
+        # Event check, sequence, block allocation, items, audit rows
+        with assert_max_queries(5):
+            items = await auction_item_service.import_auction_items(
+                event_id=test_event.id, rows=rows, created_by=test_user.id
+            )
+
+        assert [item.bid_number for item in items] == [100, 101, 102, 103, 104]
+        assert [item.title for item in items] == [row.title for row in rows]
+        assert all(item.bid_increment == Decimal("10.00") for item in items)
+
+        # The sequence is now known: a single create skips the DDL
+        with assert_max_queries(1):
+            next_number = await auction_item_service._get_next_bid_number(test_event.id)
+        assert next_number == 105
+
+    async def test_invalid_rows_write_nothing(
+        self,
+        db_session: AsyncSession,
+        test_event: Event,
+        test_user,
+        auction_item_service: AuctionItemService,
+    ):
+        """Test every invalid row is reported before anything is written."""
+        rows = parse_import_csv(
+            [
+                "title,description,auction_type,starting_bid,buy_now_price,buy_now_enabled\n",
+                "Good,Fine,silent,10.00,,\n",
+                "Bad,Too cheap,silent,50.00,20.00,true\n",
+            ]
+        )
+
+        with pytest.raises(AuctionItemImportError) as exc_info:
+            await auction_item_service.import_auction_items(
+                event_id=test_event.id, rows=rows, created_by=test_user.id
+            )
+        assert [error["row"] for error in exc_info.value.errors] == [2]
+        count = await db_session.scalar(
+            text("SELECT count(*) FROM auction_items WHERE event_id = :event_id"),
+            {"event_id": test_event.id},
+        )
+        assert count == 0
+
+
+@pytest.mark.unit
+class TestParseImportCsv:
+    """Tests for CSV import parsing."""
+
+    def test_rows_are_validated_one_by_one(self) -> None:
+        """Test empty cells take defaults and bad rows are reported by number."""
+        with pytest.raises(AuctionItemImportError) as exc_info:
+            parse_import_csv(
+                [
+                    "title,description,auction_type,starting_bid,quantity_available\n",
+                    "Wine,Six bottles,live,100,\n",
+                    "Trip,,silent,abc,2\n",
+                ]
+            )
+        [error] = exc_info.value.errors
+        assert error["row"] == 2
+        assert {detail["loc"][0] for detail in error["error"]} == {"description", "starting_bid"}
+
+        [row] = parse_import_csv(
+            ["title,description,auction_type,starting_bid\n", "Wine,Six bottles,live,100\n"]
+        )
+        assert row.quantity_available == 1
+        assert row.auction_type == AuctionType.LIVE
+
+
 @pytest.mark.asyncio
 class TestBuyNowPriceValidation:
     """Test T028: Buy-now price validation logic."""
@@ -0,0 +1,63 @@
+"""Unit tests for audit log partition maintenance and queries."""
+
+import uuid
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import KeysetPage
+from app.services.audit_log_partitions import (
+    add_months,
+    expired_months,
+    partition_month,
+    partition_name,
+)
+from app.services.audit_log_query_service import AuditLogQueryService
+
+
+@pytest.mark.unit
+class TestAuditLogPartitions:
+    """Tests for partition naming, month arithmetic and retention."""
+
+    def test_partition_names_round_trip(self) -> None:
+        """Monthly partitions are named audit_logs_pYYYYMM; others are ignored."""
+        assert partition_name(date(2026, 3, 1)) == "audit_logs_p202603"
+        assert partition_month("audit_logs_p202603") == date(2026, 3, 1)
+        assert partition_month("audit_logs_default") is None
+
+    def test_add_months_crosses_years(self) -> None:
+        """Month arithmetic wraps December into January."""
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_only_fully_expired_months_are_retired(self) -> None:
+        """A partition expires only once its whole month is past the cutoff."""
+        months = [date(2026, m, 1) for m in range(5, 11)]
+
+        # Cutoff 2026-07-21: May and June end before it, July doesn't
+        expired = expired_months(months, today=date(2026, 10, 19), retention_days=90)
+
+        assert expired == [date(2026, 5, 1), date(2026, 6, 1)]
+
+    async def test_search_filters_use_indexed_predicates(self) -> None:
+        """Filters compile to index-friendly predicates, including JSONB containment."""
+        user_id = uuid.uuid4()
+        with patch(
+            "app.services.audit_log_query_service.paginate_keyset",
+            AsyncMock(return_value=KeysetPage(items=[], next_cursor=None)),
+        ) as paginate:
+            await AuditLogQueryService.search(
+                AsyncMock(),
+                user_id=user_id,
+                actions=["login_success"],
+                metadata={"email": "donor@example.com"},
+            )
+
+        stmt = paginate.call_args.args[1]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "audit_logs.user_id = " in sql
+        assert "audit_logs.action IN" in sql
+        assert "audit_logs.metadata @> " in sql
+        assert paginate.call_args.kwargs["scope"] == "admin_audit_logs"
@@ -0,0 +1,93 @@
+"""Unit tests for the batched audit log writer."""
+
+import asyncio
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.audit_log import AuditLog
+from app.services.audit_service import AuditService
+from app.services.audit_writer import AuditLogWriter, audit_log_values
+
+
+def audit_record(action: str = "login_success") -> AuditLog:
+    """Build an unsaved audit record."""
+    return AuditLog(
+        user_id=uuid.uuid4(),
+        action=action,
+        ip_address="127.0.0.1",
+        event_metadata={"email": "donor@example.com"},
+    )
+
+
+class RecordingWriter(AuditLogWriter):
+    """Writer that records batches instead of inserting them."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.batches: list[list[dict[str, Any]]] = []
+
+    async def _write(self, batch: list[dict[str, Any]]) -> bool:
+        self.batches.append(batch)
+        return True
+
+
+@pytest.mark.unit
+class TestAuditLogWriter:
+    """Tests for buffering, batching and draining."""
+
+    async def test_flushes_on_size_threshold_and_drains_on_stop(self) -> None:
+        """A full batch flushes without waiting for the timer; stop writes the rest."""
+        writer = RecordingWriter(batch_size=3, flush_interval=60.0, max_queue_size=100)
+        assert writer.submit(audit_record()) is False  # Not started
+
+        await writer.start()
+        for _ in range(3):
+            assert writer.submit(audit_record()) is True
+        await asyncio.sleep(0.05)
+        assert [len(b) for b in writer.batches] == [3]
+
+        assert writer.submit(audit_record()) is True
+        await writer.stop()
+        assert [len(b) for b in writer.batches] == [3, 1]
+        assert writer.submit(audit_record()) is False
+
+    async def test_full_queue_refuses_records(self) -> None:
+        """Back-pressure is reported to the caller instead of blocking."""
+        writer = RecordingWriter(batch_size=10, flush_interval=60.0, max_queue_size=2)
+        await writer.start()
+        try:
+            assert writer.submit(audit_record())
+            assert writer.submit(audit_record())
+            assert writer.submit(audit_record()) is False
+        finally:
+            await writer.stop()
+
+    def test_values_carry_event_time_and_id(self) -> None:
+        """Rows get their id and timestamp when queued, not when flushed."""
+        values = audit_log_values(audit_record("logout"))
+        assert values["action"] == "logout"
+        assert isinstance(values["id"], uuid.UUID)
+        assert values["created_at"] is not None
+        assert values["event_metadata"] == {"email": "donor@example.com"}
+
+    async def test_record_modes(self) -> None:
+        """Queued records skip the caller's session; atomic ones join its transaction."""
+        db = MagicMock()
+        db.commit = AsyncMock()
+
+        with patch("app.services.audit_writer.audit_log_writer") as writer:
+            writer.submit.return_value = True
+            await AuditService._record(db, audit_record())
+            db.add.assert_not_called()
+
+            await AuditService._record(db, audit_record(), same_transaction=True)
+            db.add.assert_called_once()
+            db.commit.assert_not_awaited()
+
+            # Writer unavailable: fall back to writing through the session
+            writer.submit.return_value = False
+            await AuditService._record(db, audit_record())
+            db.commit.assert_awaited_once()
@@ -130,7 +130,7 @@ class TestAutoAssignService:
         # Verify tables filled sequentially (table 1 full, table 2 full, table 3 full)
         query = (
             select(RegistrationGuest)
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(EventRegistration.event_id == test_active_event.id)
             .order_by(RegistrationGuest.table_number)
         )
@@ -259,7 +259,7 @@ class TestAutoAssignService:
         # Count guests at largest party's table
         count_query = (
             select(RegistrationGuest)
-            .join(EventRegistration)
+            .join(EventRegistration, RegistrationGuest.registration_id == EventRegistration.id)
             .where(
                 EventRegistration.event_id == test_active_event.id,
                 RegistrationGuest.table_number == largest_party_table,
@@ -233,6 +233,37 @@ class TestBidderNumberService:
         # Should not raise for unique number
         await BidderNumberService.validate_bidder_number_uniqueness(db_session, event_id, 101)
 
+    @pytest.mark.asyncio
+    async def test_unique_index_rejects_duplicate_in_event(
+        self, db_session: AsyncSession, test_active_event, test_donor
+    ):
+        """Test event_id is filled from the registration and duplicates are rejected."""
+        from sqlalchemy.exc import IntegrityError
+
+        from app.models.event_registration import EventRegistration, RegistrationStatus
+
+        registration = EventRegistration(
+            id=uuid4(),
+            event_id=test_active_event.id,
+            user_id=test_donor.id,
+            status=RegistrationStatus.CONFIRMED,
+        )
+        db_session.add(registration)
+        await db_session.commit()
+
+        first = RegistrationGuest(id=uuid4(), registration_id=registration.id, bidder_number=100)
+        db_session.add(first)
+        await db_session.commit()
+        assert first.event_id == test_active_event.id
+
+        with pytest.raises(IntegrityError):
+            async with db_session.begin_nested():
+                db_session.add(
+                    RegistrationGuest(
+                        id=uuid4(), registration_id=registration.id, bidder_number=100
+                    )
+                )
+
     @pytest.mark.asyncio
     async def test_reassign_available_number(
         self, db_session: AsyncSession, test_active_event, test_donor
@@ -0,0 +1,77 @@
+"""Unit tests for batch check-in."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.event_registration import EventRegistration, RegistrationStatus
+from app.models.registration_guest import RegistrationGuest
+from app.schemas.checkin import CheckInOperation
+from app.services.checkin_service import CheckInService
+
+
+class TestCheckInBatch:
+    """Test suite for CheckInService.check_in_batch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_idempotent(
+        self, db_session: AsyncSession, test_active_event, test_donor
+    ):
+        """Test one batch checks in a party; replayed keys return the original result."""
+        registration = EventRegistration(
+            id=uuid4(),
+            event_id=test_active_event.id,
+            user_id=test_donor.id,
+            status=RegistrationStatus.CONFIRMED,
+        )
+        db_session.add(registration)
+        await db_session.commit()
+        guests = [
+            RegistrationGuest(id=uuid4(), registration_id=registration.id, name=f"Guest {i}")
+            for i in range(3)
+        ]
+        guests[2].checked_in = True
+        db_session.add_all(guests)
+        await db_session.commit()
+
+        recorded_at = datetime.now(UTC) - timedelta(minutes=5)
+        operations = [
+            CheckInOperation(idempotency_key=f"{uuid4()}", target="guest", id=guest.id)
+            for guest in guests
+        ]
+        operations += [
+            CheckInOperation(
+                idempotency_key=f"{uuid4()}",
+                target="registration",
+                id=registration.id,
+                checked_in_at=recorded_at,
+            ),
+            CheckInOperation(idempotency_key=f"{uuid4()}", target="guest", id=uuid4()),
+        ]
+
+        results = await CheckInService.check_in_batch(db_session, test_active_event.id, operations)
+        assert [result.status for result in results] == [
+            "checked_in",
+            "checked_in",
+            "already_checked_in",
+            "checked_in",
+            "not_found",
+        ]
+        assert not any(result.replayed for result in results)
+
+        await db_session.refresh(registration)
+        assert registration.check_in_time == recorded_at
+        for guest in guests:
+            await db_session.refresh(guest)
+            assert guest.checked_in
+
+        # A retried sync (e.g. the response was lost) changes nothing
+        replay = await CheckInService.check_in_batch(
+            db_session, test_active_event.id, operations[:2]
+        )
+        assert [(result.status, result.replayed) for result in replay] == [
+            ("checked_in", True),
+            ("checked_in", True),
+        ]
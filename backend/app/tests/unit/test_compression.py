@@ -0,0 +1,88 @@
+"""Unit tests for negotiated response compression."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+LARGE_BODY = {"items": [{"id": i, "title": f"Auction item {i}"} for i in range(200)]}
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """App with a large JSON, a small JSON and an image endpoint behind the middleware."""
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large() -> dict[str, list[dict[str, object]]]:
+        return LARGE_BODY
+
+    @app.get("/small")
+    async def small() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/image")
+    async def image() -> Response:
+        return Response(content=b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+    @app.get("/export")
+    async def export() -> StreamingResponse:
+        async def rows() -> AsyncIterator[bytes]:
+            for i in range(3):
+                yield f"row {i}\n".encode()
+
+        return StreamingResponse(rows(), media_type="text/csv")
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestCompression:
+    """Tests for CompressionMiddleware and Accept-Encoding negotiation."""
+
+    def test_negotiate_encoding(self) -> None:
+        """Brotli wins ties, q-values are honored and q=0 disables a coding."""
+        assert negotiate_encoding("gzip, deflate, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0.5") == "gzip"
+        assert negotiate_encoding("br;q=0, gzip;q=0") is None
+        assert negotiate_encoding("*") == "br"
+        assert negotiate_encoding("gzip, br", brotli_available=False) == "gzip"
+        assert negotiate_encoding("") is None
+
+    def test_large_json_is_brotli_or_gzip_compressed(self, client: TestClient) -> None:
+        """Bodies over the threshold are compressed with the negotiated coding."""
+        br = client.get("/large", headers={"Accept-Encoding": "br"})
+        gz = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert br.headers["content-encoding"] == "br"
+        assert gz.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in br.headers["vary"]
+        # httpx decodes both codings transparently
+        assert br.json() == LARGE_BODY
+        assert gz.json() == LARGE_BODY
+        assert int(br.headers["content-length"]) < len(br.content)
+
+    def test_small_and_incompressible_responses_pass_through(self, client: TestClient) -> None:
+        """Small bodies and images are sent without Content-Encoding."""
+        small = client.get("/small", headers={"Accept-Encoding": "br, gzip"})
+        image = client.get("/image", headers={"Accept-Encoding": "br, gzip"})
+        identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in image.headers
+        assert "content-encoding" not in identity.headers
+        assert identity.json() == LARGE_BODY
+
+    def test_streamed_response_is_compressed_chunk_by_chunk(self, client: TestClient) -> None:
+        """Streamed bodies are compressed regardless of size and lose Content-Length."""
+        for coding in ("br", "gzip"):
+            response = client.get("/export", headers={"Accept-Encoding": coding})
+
+            assert response.headers["content-encoding"] == coding
+            assert "content-length" not in response.headers
+            assert response.text == "row 0\nrow 1\nrow 2\n"
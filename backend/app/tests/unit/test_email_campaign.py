@@ -0,0 +1,103 @@
+"""Unit tests for bulk email campaign templates."""
+
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from app.services.email_campaign_service import (
+    DEFAULT_BRAND_COLOR,
+    PreparedTemplate,
+    build_guest_invitation_template,
+    field,
+    resolve_email_branding,
+)
+from app.services.email_service import _create_email_html_template
+
+
+def make_event(**overrides: Any) -> Any:
+    """Build an event-like object with NPO branding."""
+    branding = SimpleNamespace(primary_color="#112233", logo_url="https://cdn/npo.png")
+    values: dict[str, Any] = {
+        "id": uuid.uuid4(),
+        "slug": "spring-gala",
+        "name": "Spring Gala",
+        "event_datetime": datetime(2026, 5, 1, 18, 30),
+        "timezone": "America/Chicago",
+        "venue_name": "Grand Hall",
+        "venue_address": "1 Main St",
+        "primary_color": None,
+        "logo_url": None,
+        "npo": SimpleNamespace(name="Hope Foundation", branding=branding),
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.mark.unit
+class TestEmailCampaignTemplate:
+    """Tests for pre-rendered campaign templates."""
+
+    def test_prepared_template_fills_fields(self) -> None:
+        """Fields are filled per recipient; HTML templates escape values."""
+        text = f"Hi {field('guest_name')}, go to {field('url')}"
+
+        plain = PreparedTemplate.compile(text)
+        assert plain.render({"guest_name": "A&B", "url": "x"}) == "Hi A&B, go to x"
+
+        escaped = PreparedTemplate.compile(text, escape=True)
+        assert escaped.render({"guest_name": "<b>", "url": "x"}) == "Hi &lt;b&gt;, go to x"
+
+    def test_invitation_is_rendered_once_per_campaign(self) -> None:
+        """The HTML template is built once, then only guest fields vary."""
+        event = make_event()
+        with patch(
+            "app.services.email_campaign_service._create_email_html_template",
+            wraps=_create_email_html_template,
+        ) as render:
+            template = build_guest_invitation_template(event, custom_message="See you there")
+            results = [
+                template.render(
+                    {"guest_name": f"Guest {i}", "registration_url": f"https://x/r?guest={i}"}
+                )
+                for i in range(3)
+            ]
+
+        assert render.call_count == 1
+        subject, body, html_body = results[2]
+        assert subject == "You're Invited to Spring Gala"
+        assert "Hello Guest 2," in body
+        assert "See you there" in body
+        assert 'href="https://x/r?guest=2"' in html_body
+        assert "Hope Foundation" in html_body
+        assert "\ue000" not in html_body
+
+    def test_branding_falls_back_event_then_npo_then_default(self) -> None:
+        """Event colors win over NPO branding, which wins over the default."""
+        assert resolve_email_branding(make_event(primary_color="#abcdef"))[1] == "#abcdef"
+        assert resolve_email_branding(make_event()) == (
+            "Hope Foundation",
+            "#112233",
+            "https://cdn/npo.png",
+        )
+        no_branding = make_event(npo=SimpleNamespace(name="Hope", branding=None))
+        assert resolve_email_branding(no_branding)[1] == DEFAULT_BRAND_COLOR
+
+    def test_unsafe_branding_is_not_rendered_into_html(self) -> None:
+        """Colors must be #RRGGBB and logos https URLs; both stay inside their attributes."""
+        event = make_event(
+            primary_color='red;" onmouseover="alert(1)',
+            logo_url='https://cdn/logo.png" onerror="alert(1)',
+        )
+        assert resolve_email_branding(event)[1] == DEFAULT_BRAND_COLOR
+        assert resolve_email_branding(make_event(logo_url="javascript:alert(1)"))[2] is None
+
+        _, _, html_body = build_guest_invitation_template(event).render(
+            {"guest_name": "Guest", "registration_url": "https://x/r"}
+        )
+        assert 'onmouseover="' not in html_body
+        assert 'onerror="' not in html_body
+        assert 'src="https://cdn/logo.png&quot; onerror=&quot;alert(1)"' in html_body
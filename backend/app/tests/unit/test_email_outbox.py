@@ -0,0 +1,126 @@
+"""Unit tests for the transactional email outbox."""
+
+import uuid
+from email import message_from_bytes
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.services.email_backends import FileEmailBackend, OutboundEmail
+from app.services.email_dispatcher import OUTBOX_PENDING_KEY, EmailDispatcher, retry_delay
+from app.services.email_service import EmailService
+
+
+class FailingBackend:
+    """Backend whose provider is down."""
+
+    name = "failing"
+
+    async def send(self, message: OutboundEmail) -> str | None:
+        raise ConnectionError("provider unavailable")
+
+    async def close(self) -> None:
+        pass
+
+
+class RecordingBackend:
+    """Backend that records delivered messages."""
+
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.sent: list[OutboundEmail] = []
+
+    async def send(self, message: OutboundEmail) -> str | None:
+        self.sent.append(message)
+        return f"msg-{len(self.sent)}"
+
+    async def close(self) -> None:
+        pass
+
+
+def outbox_row(attempts: int) -> EmailOutbox:
+    """Build a claimed outbox row without a database."""
+    return EmailOutbox(
+        id=uuid.uuid4(),
+        email_type="verification",
+        to_email="donor@example.com",
+        subject="Verify your email",
+        body="Hi",
+        status=EmailOutboxStatus.SENDING,
+        attempts=attempts,
+    )
+
+
+@pytest.mark.unit
+class TestEmailOutbox:
+    """Tests for outbox queueing, delivery outcomes and backends."""
+
+    async def test_email_with_session_is_queued_not_sent(self) -> None:
+        """Passing db adds an outbox row to the session instead of calling the provider."""
+        db = MagicMock()
+        db.info = {}
+
+        with patch("app.services.email_service.get_email_backend") as get_backend:
+            sent = await EmailService().send_password_reset_email(
+                to_email="donor@example.com", reset_token="tok", db=db
+            )
+
+        assert sent is True
+        get_backend.assert_not_called()
+        outbox = db.add.call_args.args[0]
+        assert isinstance(outbox, EmailOutbox)
+        assert outbox.email_type == "password_reset"
+        assert outbox.status == EmailOutboxStatus.PENDING
+        assert "token=tok" in outbox.body
+        assert db.info[OUTBOX_PENDING_KEY] is True
+
+    async def test_delivery_outcomes(self) -> None:
+        """Success marks SENT; failures back off until max attempts, then FAILED."""
+        backend = RecordingBackend()
+        ok = await EmailDispatcher(backend=backend, max_attempts=3)._deliver(outbox_row(1))
+        assert ok["status"] == EmailOutboxStatus.SENT
+        assert ok["provider_message_id"] == "msg-1"
+        assert backend.sent[0].to_email == "donor@example.com"
+
+        dispatcher = EmailDispatcher(backend=FailingBackend(), max_attempts=3)
+        retry = await dispatcher._deliver(outbox_row(1))
+        assert retry["status"] == EmailOutboxStatus.PENDING
+        assert "provider unavailable" in retry["last_error"]
+        assert "next_attempt_at" in retry
+
+        failed = await dispatcher._deliver(outbox_row(3))
+        assert failed["status"] == EmailOutboxStatus.FAILED
+
+    def test_retry_delay_is_exponential_and_capped(self) -> None:
+        """Backoff doubles per attempt (with jitter); the cap applies after jitter."""
+        with patch("app.services.email_dispatcher.settings") as settings:
+            settings.email_retry_base_seconds = 10.0
+            settings.email_retry_max_seconds = 100.0
+
+            assert 8.0 <= retry_delay(1) <= 12.0
+            assert 32.0 <= retry_delay(3) <= 48.0
+            assert retry_delay(30) == 100.0
+
+    async def test_file_backend_writes_eml(self, tmp_path: Path) -> None:
+        """The file backend writes a MIME message with text and HTML parts."""
+        backend = FileEmailBackend(str(tmp_path))
+
+        message_id = await backend.send(
+            OutboundEmail(
+                to_email="donor@example.com",
+                subject="Welcome",
+                body="Plain body",
+                email_type="verification",
+                html_body="<p>HTML body</p>",
+            )
+        )
+
+        (path,) = tmp_path.glob("*.eml")
+        assert message_id is not None and message_id in path.name
+        parsed = message_from_bytes(path.read_bytes())
+        assert parsed["To"] == "donor@example.com"
+        assert parsed["Subject"] == "Welcome"
+        assert parsed.is_multipart()
@@ -0,0 +1,115 @@
+"""Unit tests for event change collection and the change stream."""
+
+import json
+import uuid
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.api.v1.event_changes import change_stream
+from app.models.auction_item import AuctionItem
+from app.models.registration_guest import RegistrationGuest
+from app.services.event_change_feed import (
+    AUCTION_ITEMS,
+    CHECKIN,
+    MAX_IDS_PER_CHANGE,
+    PENDING_CHANGES_KEY,
+    SEATING,
+    EventChange,
+    Subscription,
+    collect_changes,
+    event_change_feed,
+    queue_event_change,
+)
+
+EVENT_ID = uuid.uuid4()
+
+
+def pending(session: Session) -> dict[str, dict[str, list[str]]]:
+    """Queued changes of the session as {topic: payload}."""
+    return {
+        topic: change.payload()
+        for (_, topic), change in session.info.get(PENDING_CHANGES_KEY, {}).items()
+    }
+
+
+@pytest.mark.unit
+class TestEventChangeFeed:
+    """Tests for change tracking, publishing hooks and stream frames."""
+
+    def test_flushed_columns_map_to_topics(self) -> None:
+        """Changed guest columns pick their topic; new items are catalog changes."""
+        session = Session()
+        guest = RegistrationGuest(id=uuid.uuid4(), registration_id=uuid.uuid4(), event_id=EVENT_ID)
+        make_transient_to_detached(guest)
+        session.add(guest)
+        guest.checked_in = True
+        guest.table_number = 4
+        item = AuctionItem(id=uuid.uuid4(), event_id=EVENT_ID)
+        session.add(item)
+
+        collect_changes(session)
+
+        assert pending(session) == {
+            CHECKIN: {"guest_ids": [str(guest.id)]},
+            SEATING: {"guest_ids": [str(guest.id)]},
+            AUCTION_ITEMS: {"item_ids": [str(item.id)]},
+        }
+
+    def test_oversized_id_lists_are_dropped(self) -> None:
+        """Large changes only name their topic."""
+        change = EventChange(EVENT_ID, SEATING)
+        change.add(guest_ids=range(MAX_IDS_PER_CHANGE + 1), table_ids=[1])
+        assert change.payload() == {"table_ids": ["1"]}
+
+    def test_changes_publish_on_commit_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Rolled back changes are discarded; committed ones are published once."""
+        published: list[list[EventChange]] = []
+        monkeypatch.setattr(
+            event_change_feed, "publish_soon", lambda changes: published.append(list(changes))
+        )
+        session = Session(create_engine("sqlite://"))
+
+        queue_event_change(session, EVENT_ID, CHECKIN, guest_ids=["a"])
+        session.execute(text("SELECT 1"))
+        session.rollback()
+        assert PENDING_CHANGES_KEY not in session.info
+
+        queue_event_change(session, EVENT_ID, CHECKIN, guest_ids=["a"])
+        queue_event_change(session, EVENT_ID, CHECKIN, guest_ids=["b"])
+        session.execute(text("SELECT 1"))
+        session.commit()
+
+        [[change]] = published
+        assert change.payload() == {"guest_ids": ["a", "b"]}
+
+    @pytest.mark.asyncio
+    async def test_stream_frames(self) -> None:
+        """Stale clients resync; changes carry their version; idle streams heartbeat."""
+        subscription = Subscription(EVENT_ID, max_size=2)
+        frames = change_stream(subscription, version=7, last_event_id=5, heartbeat_seconds=0.01)
+
+        assert await anext(frames) == "retry: 3000\n\n"
+        assert await anext(frames) == "id: 7\nevent: resync\ndata: {}\n\n"
+
+        subscription.deliver({"topic": SEATING, "version": 8, "ids": {"guest_ids": ["g"]}})
+        frame = await anext(frames)
+        assert frame.startswith("id: 8\nevent: seating\n")
+        assert json.loads(frame.split("data: ")[1]) == {"guest_ids": ["g"]}
+
+        assert await anext(frames) == ": heartbeat\n\n"
+
+    @pytest.mark.asyncio
+    async def test_slow_listener_is_resynced(self) -> None:
+        """Overflowing a listener's queue replaces its backlog with one resync."""
+        subscription = Subscription(EVENT_ID, max_size=2)
+        messages: list[dict[str, Any]] = [
+            {"topic": SEATING, "version": version, "ids": {}} for version in range(3)
+        ]
+        for message in messages:
+            subscription.deliver(message)
+
+        assert await subscription.get(timeout=0.01) == {"topic": "resync"}
+        assert await subscription.get(timeout=0.01) is None
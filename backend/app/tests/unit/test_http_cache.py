@@ -0,0 +1,78 @@
+"""Unit tests for HTTP conditional request helpers."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+from fastapi import Response
+from starlette.requests import Request
+
+from app.core.http_cache import (
+    body_version,
+    not_modified,
+    resource_version,
+    set_validators,
+)
+
+
+def make_request(**headers: str) -> Request:
+    """Build a bare GET request with the given headers."""
+    raw = [
+        (name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()
+    ]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+@pytest.mark.unit
+class TestConditionalRequests:
+    """Tests for ETag / Last-Modified evaluation."""
+
+    def test_etag_is_stable_and_input_sensitive(self) -> None:
+        """Same version inputs give the same weak ETag; different inputs differ."""
+        assert resource_version("event", 1, 3).etag == resource_version("event", 1, 3).etag
+        assert resource_version("event", 1, 3).etag != resource_version("event", 1, 4).etag
+        assert resource_version("event", 1, 3).etag.startswith('W/"')
+
+    def test_if_none_match_returns_304_with_validators(self) -> None:
+        """A matching ETag (weak or strong form, in a list) yields a bodiless 304."""
+        version = body_version(b'{"a":1}')
+        strong = version.etag.removeprefix("W/")
+
+        response = not_modified(make_request(if_none_match=f'"other", {strong}'), version)
+
+        assert response is not None
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == version.etag
+        assert not_modified(make_request(if_none_match='"other"'), version) is None
+        assert not_modified(make_request(), version) is None
+        assert not_modified(make_request(if_none_match="*"), None) is None
+
+    def test_if_modified_since(self) -> None:
+        """If-Modified-Since is honored at one-second resolution unless an ETag is sent."""
+        updated = datetime(2025, 5, 1, 12, 0, 0, 500_000, tzinfo=UTC)
+        version = resource_version("doc", 1, last_modified=updated)
+        same_second = format_datetime(updated.replace(microsecond=0), usegmt=True)
+        earlier = format_datetime(updated - timedelta(minutes=1), usegmt=True)
+
+        assert not_modified(make_request(if_modified_since=same_second), version) is not None
+        assert not_modified(make_request(if_modified_since=earlier), version) is None
+        assert not_modified(make_request(if_modified_since="garbage"), version) is None
+        # If-None-Match takes precedence over If-Modified-Since
+        request = make_request(if_none_match='"other"', if_modified_since=same_second)
+        assert not_modified(request, version) is None
+
+    def test_signed_urls_rotate_validators(self) -> None:
+        """Versions of bodies with SAS URLs carry the current window start as Last-Modified."""
+        old = datetime(2020, 1, 1, tzinfo=UTC)
+        signed = resource_version("sponsors", 1, last_modified=old, signed_urls=True)
+        unsigned = resource_version("sponsors", 1, last_modified=old)
+
+        assert signed.etag != unsigned.etag
+        assert signed.last_modified is not None and signed.last_modified > old
+        assert datetime.now(UTC) - signed.last_modified < timedelta(hours=24)
+
+        full = Response(content=b"[]")
+        set_validators(full, signed)
+        assert full.headers["Cache-Control"] == "private, no-cache"
+        assert full.headers["Last-Modified"].endswith("GMT")
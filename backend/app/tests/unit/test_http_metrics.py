@@ -0,0 +1,99 @@
+"""Unit tests for route-templated HTTP metrics."""
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.middleware.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """App with a prefixed, parameterized route behind the middleware."""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    router = APIRouter(prefix="/metrics-test/items")
+
+    @router.get("/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        if item_id == "missing":
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"id": item_id}
+
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestHttpMetrics:
+    """Tests for MetricsMiddleware labels and observations."""
+
+    def test_requests_are_labelled_by_route_template(self, client: TestClient) -> None:
+        """Distinct ids share one series keyed by the route template."""
+        template = "/metrics-test/items/{item_id}"
+        before = sample("fundrbolt_http_requests_total", method="GET", path=template, status="200")
+
+        responses = [client.get(f"/metrics-test/items/{i}") for i in ("a", "b", "c")]
+
+        assert all(r.status_code == 200 for r in responses)
+        assert float(responses[0].headers["x-process-time"]) >= 0
+        assert (
+            sample("fundrbolt_http_requests_total", method="GET", path=template, status="200")
+            == before + 3
+        )
+        assert (
+            sample("fundrbolt_http_request_duration_seconds_count", method="GET", path=template)
+            >= 3
+        )
+        assert sample("fundrbolt_http_response_size_bytes_sum", method="GET", path=template) >= sum(
+            len(r.content) for r in responses
+        )
+        assert sample("fundrbolt_http_requests_in_progress", method="GET") == 0
+
+    def test_unmatched_and_unknown_methods_are_bucketed(self, client: TestClient) -> None:
+        """Unrouted paths and non-standard methods don't create new series."""
+        unmatched = sample(
+            "fundrbolt_http_requests_total", method="GET", path=UNMATCHED_ROUTE, status="404"
+        )
+        handled_404 = sample(
+            "fundrbolt_http_requests_total",
+            method="GET",
+            path="/metrics-test/items/{item_id}",
+            status="404",
+        )
+
+        client.get("/no/such/path/123")
+        client.get("/metrics-test/items/missing")
+        client.request("PROPFIND", "/metrics-test/items/a")
+
+        assert (
+            sample(
+                "fundrbolt_http_requests_total",
+                method="GET",
+                path=UNMATCHED_ROUTE,
+                status="404",
+            )
+            == unmatched + 1
+        )
+        assert (
+            sample(
+                "fundrbolt_http_requests_total",
+                method="GET",
+                path="/metrics-test/items/{item_id}",
+                status="404",
+            )
+            == handled_404 + 1
+        )
+        assert sample("fundrbolt_http_requests_in_progress", method="OTHER") == 0
+        assert (
+            REGISTRY.get_sample_value(
+                "fundrbolt_http_requests_total",
+                {"method": "PROPFIND", "path": UNMATCHED_ROUTE, "status": "405"},
+            )
+            is None
+        )
@@ -0,0 +1,90 @@
+"""Unit tests for responsive image derivatives."""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from app.core.images import (
+    ImageProcessingError,
+    ladder,
+    render_derivatives,
+    supported_formats,
+)
+from app.services.image_derivative_service import ImageDerivativeService
+
+
+def encode(image: Image.Image, fmt: str, **options: object) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+@pytest.mark.unit
+class TestImageDerivatives:
+    """Tests for rendering, ladders and srcset metadata."""
+
+    def test_ladder_never_upscales(self) -> None:
+        """Widths above the original are dropped; the original width caps the ladder."""
+        assert ladder([320, 640, 960, 1280], 1000) == [1000, 960, 640, 320]
+        assert ladder([320, 640], 4000) == [640, 320]
+        assert ladder([320, 640], 200) == [200]
+
+    def test_jpeg_renders_every_width_and_format(self) -> None:
+        """Each width is produced in each modern format plus a JPEG fallback."""
+        exif = Image.Exif()
+        exif[0x010F] = "Test Camera"  # Make
+        data = encode(Image.new("RGB", (2000, 1000), "red"), "JPEG", exif=exif.tobytes())
+
+        rendered = render_derivatives(data, [320, 640], ["avif", "webp"])
+
+        formats = [*supported_formats(["avif", "webp"]), "jpeg"]
+        assert (rendered.width, rendered.height) == (2000, 1000)
+        assert [(d.width, d.height, d.format) for d in rendered.derivatives] == [
+            (w, w // 2, fmt) for w in (640, 320) for fmt in formats
+        ]
+        fallback = Image.open(BytesIO(rendered.derivatives[-1].data))
+        assert fallback.format == "JPEG"
+        assert not fallback.getexif()
+
+    def test_orientation_and_transparency(self) -> None:
+        """EXIF rotation is applied and transparency is flattened for JPEG only."""
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Rotated 90 degrees
+        portrait = render_derivatives(
+            encode(Image.new("RGB", (800, 400)), "JPEG", exif=exif.tobytes()), [200], []
+        )
+        assert (portrait.width, portrait.height) == (400, 800)
+        assert (portrait.derivatives[0].width, portrait.derivatives[0].height) == (200, 400)
+
+        logo = render_derivatives(
+            encode(Image.new("RGBA", (400, 400), (0, 0, 0, 0)), "PNG"),
+            [200],
+            ["webp"],
+            thumbnail_size=(100, 100),
+        )
+        webp, jpeg = (Image.open(BytesIO(d.data)) for d in logo.derivatives)
+        assert webp.mode == "RGBA"
+        assert jpeg.mode == "RGB" and jpeg.getpixel((0, 0)) == (255, 255, 255)
+        assert logo.thumbnail is not None and logo.thumbnail.width == 100
+
+    def test_size_limits_and_corrupt_files(self) -> None:
+        """Dimension limits and undecodable files raise ImageProcessingError."""
+        small = encode(Image.new("RGB", (100, 100)), "PNG")
+        with pytest.raises(ImageProcessingError, match="too small"):
+            render_derivatives(small, [320], [], min_size=(200, 200))
+        with pytest.raises(ImageProcessingError, match="Invalid image"):
+            render_derivatives(b"not an image", [320], [])
+
+    def test_srcset_groups_by_format(self) -> None:
+        """srcset lists one format's entries in ascending width."""
+        entries = [
+            {"url": "a_w640.webp", "width": 640, "format": "webp"},
+            {"url": "a_w320.webp", "width": 320, "format": "webp"},
+            {"url": "a_w320.jpg", "width": 320, "format": "jpeg"},
+        ]
+
+        assert (
+            ImageDerivativeService.srcset(entries, "webp") == "a_w320.webp 320w, a_w640.webp 640w"
+        )
+        assert ImageDerivativeService.srcset(None, "webp") == ""
@@ -0,0 +1,30 @@
+"""Unit tests keeping heavy SDKs out of the app's import (cold start)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Heavy SDKs are imported by the services that use them, on first use."""
+
+    def test_app_import_skips_heavy_sdks(self) -> None:
+        """Importing app.main doesn't load Azure, Pillow or bleach."""
+        probe = (
+            "import sys, app.main; "
+            "print(','.join(m for m in ('azure.storage.blob', 'azure.communication.email', "
+            "'PIL', 'bleach') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == ""
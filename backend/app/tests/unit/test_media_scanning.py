@@ -0,0 +1,162 @@
+"""Unit tests for the media virus-scan pipeline."""
+
+import asyncio
+import struct
+import uuid
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.media_scan_worker import SCAN_TIMEOUT_SECONDS, ClaimedScan, MediaScanWorker
+from app.services.media_scanners import (
+    EICAR_SIGNATURE,
+    ClamdScanner,
+    ScannerError,
+    ScanResult,
+    StubScanner,
+)
+
+
+async def stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+class FailingScanner:
+    name = "failing"
+
+    async def scan(self, chunks: AsyncIterator[bytes]) -> ScanResult:
+        raise ScannerError("clamd unavailable")
+
+
+@pytest.mark.unit
+class TestMediaScanners:
+    """Tests for the scanner backends."""
+
+    async def test_clamd_instream_protocol(self) -> None:
+        """Chunks are length-prefixed, terminated by a zero length, and the reply parsed."""
+        received: list[bytes] = []
+
+        async def fake_clamd(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            assert await reader.readuntil(b"\0") == b"zINSTREAM\0"
+            while size := struct.unpack("!L", await reader.readexactly(4))[0]:
+                received.append(await reader.readexactly(size))
+            writer.write(b"stream: Win.Test.EICAR_HDB-1 FOUND\0")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(fake_clamd, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            result = await ClamdScanner("127.0.0.1", port, timeout=5).scan(
+                stream(b"first", b"", b"second")
+            )
+
+        assert received == [b"first", b"second"]
+        assert result == ScanResult(clean=False, signature="Win.Test.EICAR_HDB-1")
+
+    def test_clamd_replies(self) -> None:
+        """OK is clean; errors raise so the job is retried."""
+        assert ClamdScanner.parse_reply(b"stream: OK\0") == ScanResult(clean=True)
+        with pytest.raises(ScannerError):
+            ClamdScanner.parse_reply(b"INSTREAM size limit exceeded. ERROR\0")
+
+    async def test_stub_detects_signature_across_chunks(self) -> None:
+        """The EICAR string is found even when split between chunks."""
+        head, tail = EICAR_SIGNATURE[:20], EICAR_SIGNATURE[20:]
+
+        infected = await StubScanner().scan(stream(b"x" * 100 + head, tail))
+        clean = await StubScanner().scan(stream(b"x" * 100, head))
+
+        assert not infected.clean
+        assert clean.clean
+
+
+@pytest.mark.unit
+class TestMediaScanWorker:
+    """Tests for claiming and retrying scan jobs."""
+
+    def _claim(self, attempts: int) -> ClaimedScan:
+        return ClaimedScan(
+            media_id=uuid.uuid4(),
+            event_id=uuid.uuid4(),
+            blob_name="events/e/m/flyer.pdf",
+            attempts=attempts,
+        )
+
+    async def test_scanner_errors_retry_then_park(self) -> None:
+        """Failed scans back off, and the last attempt parks the job."""
+        worker = MediaScanWorker(
+            scanner=FailingScanner(),
+            read_blob=lambda blob_name: stream(b"data"),
+            max_attempts=3,
+        )
+
+        retry = await worker.process(self._claim(attempts=1))
+        parked = await worker.process(self._claim(attempts=3))
+
+        assert retry is not None and retry["available_at"] is not None
+        assert retry["last_error"] == "clamd unavailable"
+        assert parked is not None and parked["available_at"] is None
+
+    def test_lease_covers_every_wave_of_a_batch(self) -> None:
+        """A batch scanned in several waves stays leased until the last wave times out."""
+        worker = MediaScanWorker(scanner=StubScanner(), batch_size=20, concurrency=4)
+
+        assert worker.claim_lease.total_seconds() > 5 * SCAN_TIMEOUT_SECONDS
+
+    async def test_rendering_releases_the_scan_slot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Derivatives are rendered after the verdict, without holding a scan slot."""
+        worker = MediaScanWorker(scanner=StubScanner(), read_blob=lambda blob_name: stream(b"png"))
+        scan_slots = asyncio.Semaphore(1)
+        rendered: list[tuple[bool, bytes]] = []
+
+        async def render(claim: ClaimedScan, content: bytes) -> None:
+            rendered.append((scan_slots.locked(), content))
+
+        monkeypatch.setattr(worker, "_record", AsyncMock())
+        monkeypatch.setattr(worker, "_render_derivatives", render)
+        claim = ClaimedScan(
+            media_id=uuid.uuid4(),
+            event_id=uuid.uuid4(),
+            blob_name="events/e/m/photo.png",
+            attempts=1,
+            mime_type="image/png",
+        )
+
+        assert await worker.process(claim, scan_slots=scan_slots) is None
+        assert rendered == [(False, b"png")]
+
+    async def test_claim_leases_due_jobs_with_media_fields(self) -> None:
+        """Claiming is one UPDATE ... FROM event_media ... RETURNING with SKIP LOCKED."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(all=lambda: [])
+        await MediaScanWorker(scanner=StubScanner())._claim(session)
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE media_scan_jobs SET")
+        assert "FROM event_media" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING media_scan_jobs.media_id, event_media.event_id" in sql
+
+
+@pytest.mark.unit
+class TestScannerStartupCheck:
+    """Production must not run the stub scanner."""
+
+    async def test_production_refuses_stub_scanner(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Startup fails before any background task starts."""
+        from app import main
+
+        monkeypatch.setattr(main.settings, "environment", "production")
+        monkeypatch.setattr(main.settings, "media_scan_enabled", True)
+        monkeypatch.setattr(main.settings, "media_scanner_backend", "stub")
+        start = AsyncMock()
+        monkeypatch.setattr(main.email_dispatcher, "start", start)
+
+        with pytest.raises(RuntimeError, match="MEDIA_SCANNER_BACKEND=clamd"):
+            async with main.lifespan(main.app):
+                pass
+        start.assert_not_called()
@@ -0,0 +1,135 @@
+"""Unit tests for keyset pagination helpers."""
+
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import InvalidCursorError
+from app.core.pagination import (
+    SortKey,
+    _Explain,
+    decode_cursor,
+    encode_cursor,
+    keyset_predicate,
+    paginate_keyset,
+    total_pages,
+)
+from app.models.auction_item import AuctionItem
+from app.models.event import Event
+
+
+def compile_sql(clause: object) -> str:
+    """Compile a SQL clause for PostgreSQL with inlined parameters."""
+    return str(
+        clause.compile(  # type: ignore[attr-defined]
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+@pytest.mark.unit
+class TestKeysetPagination:
+    """Tests for cursor encoding and keyset predicates."""
+
+    def test_cursor_round_trip(self) -> None:
+        """Typed sort values survive encoding and the cursor is URL-safe."""
+        values = [datetime(2025, 6, 1, 18, 30, tzinfo=UTC), uuid.uuid4(), Decimal("12.50"), 7]
+
+        cursor = encode_cursor("events", values)
+
+        assert decode_cursor("events", cursor) == values
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    def test_invalid_or_foreign_cursor_is_rejected(self) -> None:
+        """Cursors from another listing and garbage input raise InvalidCursorError (400)."""
+        cursor = encode_cursor("auction_items:newest", [1])
+
+        with pytest.raises(InvalidCursorError) as exc_info:
+            decode_cursor("auction_items:highest_bid", cursor)
+        assert exc_info.value.status_code == 400
+
+        for garbage in ("not-a-cursor", "e30", "!!!"):
+            with pytest.raises(InvalidCursorError):
+                decode_cursor("events", garbage)
+
+    def test_keyset_predicate_uses_row_comparison_for_uniform_direction(self) -> None:
+        """Same-direction keys compile to a single (a, b) < (x, y) comparison."""
+        keys = [SortKey(Event.event_datetime, descending=True), SortKey(Event.id, descending=True)]
+        last_id = uuid.uuid4()
+
+        sql = compile_sql(keyset_predicate(keys, [datetime(2025, 6, 1, tzinfo=UTC), last_id]))
+
+        assert sql.startswith("(events.event_datetime, events.id) < (")
+        assert str(last_id) in sql
+
+    def test_keyset_predicate_expands_mixed_directions(self) -> None:
+        """Mixed directions expand to an OR chain with equal prefixes."""
+        keys = [
+            SortKey(AuctionItem.created_at, descending=True),
+            SortKey(AuctionItem.bid_number),
+        ]
+
+        sql = compile_sql(keyset_predicate(keys, [datetime(2025, 6, 1, tzinfo=UTC), 120]))
+
+        assert "auction_items.created_at < " in sql
+        assert " OR " in sql
+        assert "auction_items.bid_number > 120" in sql
+
+        with pytest.raises(InvalidCursorError):
+            keyset_predicate(keys, [1])
+
+    def test_total_pages(self) -> None:
+        """Pages round up and are unknown when no total was computed."""
+        assert total_pages(0, 20) == 0
+        assert total_pages(41, 20) == 3
+        assert total_pages(None, 20) is None
+
+    def test_row_estimate_binds_search_text_as_parameters(self) -> None:
+        """The EXPLAIN for estimated totals keeps user input out of the SQL text."""
+        stmt = select(AuctionItem).where(AuctionItem.title.ilike("%a :bar'; --%"))
+
+        compiled = _Explain(stmt).compile(dialect=postgresql.dialect())
+
+        assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert ":bar" not in str(compiled)
+        assert "%a :bar'; --%" in compiled.params.values()
+
+    @pytest.mark.asyncio
+    async def test_paginate_keyset_yields_entities_page_by_page(
+        self, db_session: AsyncSession, test_event: Any
+    ) -> None:
+        """Entity queries page through every row once and return model instances."""
+        items = [
+            AuctionItem(
+                event_id=test_event.id,
+                title=f"Item {i}",
+                description="Description",
+                auction_type="silent",
+                bid_number=100 + i,
+                starting_bid=Decimal("100.00"),
+                bid_increment=Decimal("10.00"),
+                quantity_available=1,
+                status="draft",
+                created_by=test_event.created_by,
+            )
+            for i in range(3)
+        ]
+        db_session.add_all(items)
+        await db_session.commit()
+
+        stmt = select(AuctionItem).where(AuctionItem.event_id == test_event.id)
+        keys = (SortKey(AuctionItem.bid_number), SortKey(AuctionItem.id))
+        first = await paginate_keyset(db_session, stmt, keys, scope="t", cursor=None, limit=2)
+        second = await paginate_keyset(
+            db_session, stmt, keys, scope="t", cursor=first.next_cursor, limit=2
+        )
+
+        assert first.next_cursor is not None
+        assert second.next_cursor is None
+        assert [item.bid_number for item in first.items + second.items] == [100, 101, 102]
@@ -0,0 +1,81 @@
+"""Unit tests for per-request database query instrumentation."""
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, text
+
+from app.core.query_stats import QueryStats, fingerprint, track_queries
+from app.middleware.query_stats import QueryStatsMiddleware
+
+
+@pytest.fixture
+def engine() -> Engine:
+    """In-memory SQLite engine (the hooks listen on every Engine)."""
+    return create_engine("sqlite://")
+
+
+def run_n_plus_one(engine: Engine, n: int) -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        for i in range(n):
+            conn.execute(text("SELECT :id AS id"), {"id": i})
+
+
+@pytest.mark.unit
+class TestQueryStats:
+    """Tests for statement collection, fingerprints and the middleware."""
+
+    def test_fingerprint_collapses_parameters(self) -> None:
+        """Parameter styles and IN lists of any length share a fingerprint."""
+        assert fingerprint("SELECT * FROM t WHERE id IN ($1, $2, $3)") == fingerprint(
+            "SELECT * FROM t\n WHERE id IN ($1)"
+        )
+        assert fingerprint("SELECT :id") == fingerprint("SELECT %(id)s") == "SELECT ?"
+        assert fingerprint("SELECT x::text") == "SELECT x::text"
+
+    def test_collectors_nest_and_detect_repeats(self, engine: Engine) -> None:
+        """Outer collectors see inner statements; repeated statements are reported."""
+        run_n_plus_one(engine, 2)  # Not tracked
+
+        with track_queries() as outer:
+            run_n_plus_one(engine, 1)
+            with track_queries() as inner:
+                run_n_plus_one(engine, 3)
+
+        assert (outer.count, inner.count) == (6, 4)
+        assert outer.total_seconds > 0
+        assert inner.repeated() == [("SELECT ? AS id", 3)]
+        assert "3x SELECT ? AS id" in inner.describe()
+
+    def test_assert_max_queries(
+        self,
+        engine: Engine,
+        assert_max_queries: Callable[[int], AbstractContextManager[QueryStats]],
+    ) -> None:
+        """The fixture fails with the repeated statements when over the limit."""
+        with assert_max_queries(3):
+            run_n_plus_one(engine, 2)
+
+        with pytest.raises(AssertionError, match="got 6 queries") as exc_info:
+            with assert_max_queries(3):
+                run_n_plus_one(engine, 5)
+        assert "5x SELECT ? AS id" in str(exc_info.value)
+
+    def test_middleware_sets_server_timing(self, engine: Engine) -> None:
+        """Each response reports its own statement count."""
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, warn_threshold=2)
+
+        @app.get("/items")
+        async def items(n: int) -> dict[str, int]:
+            run_n_plus_one(engine, n)
+            return {"n": n}
+
+        client = TestClient(app)
+
+        assert 'desc="4 queries"' in client.get("/items?n=3").headers["server-timing"]
+        assert client.get("/items?n=0").headers["server-timing"].endswith('desc="1 queries"')
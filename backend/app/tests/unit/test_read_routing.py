@@ -0,0 +1,62 @@
+"""Unit tests for read-only session routing to the read replica."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.database import ReplicaRouter
+
+
+def make_router(check_interval_seconds: float = 60.0) -> ReplicaRouter:
+    """Router for an engine that is never connected (lag checks are patched)."""
+    engine = create_async_engine("postgresql+asyncpg://replica/db", poolclass=NullPool)
+    return ReplicaRouter(engine, max_lag_seconds=2.0, check_interval_seconds=check_interval_seconds)
+
+
+@pytest.mark.unit
+class TestReplicaRouter:
+    """Tests for lag-aware replica routing."""
+
+    @pytest.mark.asyncio
+    async def test_without_replica_reads_primary(self) -> None:
+        """No configured replica routes every read to the primary."""
+        router = ReplicaRouter(None, max_lag_seconds=2.0, check_interval_seconds=60.0)
+        assert await router.use_replica() is False
+
+    @pytest.mark.asyncio
+    async def test_lag_reading_is_reused_within_interval(self) -> None:
+        """A caught-up replica is used, measuring lag once per interval."""
+        router = make_router()
+        with patch.object(router, "measure_lag", new=AsyncMock(return_value=0.3)) as measure:
+            assert await router.use_replica() is True
+            assert await router.use_replica() is True
+        assert measure.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_falls_back_until_next_check(self) -> None:
+        """Lag above the limit reads from the primary; the next check can restore it."""
+        router = make_router(check_interval_seconds=0.0)
+        with patch.object(router, "measure_lag", new=AsyncMock(side_effect=[30.0, 0.0])):
+            assert await router.use_replica() is False
+            assert await router.use_replica() is True
+
+    @pytest.mark.asyncio
+    async def test_failed_check_falls_back_to_primary(self) -> None:
+        """An unreachable replica reads from the primary."""
+        router = make_router()
+        error = OperationalError("SELECT 1", {}, ConnectionRefusedError())
+        with patch.object(router, "measure_lag", new=AsyncMock(side_effect=error)):
+            assert await router.use_replica() is False
+
+    @pytest.mark.asyncio
+    async def test_mark_unavailable_skips_replica_until_next_check(self) -> None:
+        """A replica connection failure routes reads to the primary for an interval."""
+        router = make_router()
+        with patch.object(router, "measure_lag", new=AsyncMock(return_value=0.0)) as measure:
+            assert await router.use_replica() is True
+            router.mark_unavailable()
+            assert await router.use_replica() is False
+        assert measure.await_count == 1
@@ -0,0 +1,65 @@
+"""Unit tests for the shared Redis connection pool and instrumentation."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.config import get_settings
+from app.core.redis import (
+    InstrumentedConnectionPool,
+    InstrumentedRedis,
+    build_connection_pool,
+    redis_call_site,
+)
+
+
+@pytest.mark.unit
+class TestRedisPool:
+    """Tests for pool construction from settings."""
+
+    def test_pool_uses_configured_limits(self) -> None:
+        """Pool size, wait timeout and socket options come from settings."""
+        settings = get_settings()
+        pool = build_connection_pool(decode_responses=True)
+
+        assert isinstance(pool, InstrumentedConnectionPool)
+        assert pool.max_connections == settings.redis_max_connections
+        assert pool.timeout == settings.redis_pool_timeout
+        assert pool.connection_kwargs["socket_timeout"] == settings.redis_socket_timeout
+        assert (
+            pool.connection_kwargs["health_check_interval"] == settings.redis_health_check_interval
+        )
+        assert pool.connection_kwargs["protocol"] == settings.redis_protocol
+
+    def test_binary_pool_does_not_decode(self) -> None:
+        """Binary pool returns raw bytes for pre-serialized payloads."""
+        pool = build_connection_pool(decode_responses=False)
+
+        assert pool.pool_name == "binary"
+        assert pool.connection_kwargs["decode_responses"] is False
+
+
+@pytest.mark.unit
+class TestRedisCallSite:
+    """Tests for per-call-site command latency metrics."""
+
+    @pytest.mark.asyncio
+    async def test_commands_are_labelled_with_call_site(self) -> None:
+        """Commands issued inside a decorated function use its call site label."""
+        client = InstrumentedRedis(connection_pool=build_connection_pool(decode_responses=True))
+        labels = {"call_site": "unit.test_site", "command": "GET"}
+        before = (
+            REGISTRY.get_sample_value("fundrbolt_redis_command_duration_seconds_count", labels)
+            or 0.0
+        )
+
+        @redis_call_site("unit.test_site")
+        async def lookup() -> None:
+            await client.get("key")
+
+        with patch("redis.asyncio.client.Redis.execute_command", new=AsyncMock()):
+            await lookup()
+
+        after = REGISTRY.get_sample_value("fundrbolt_redis_command_duration_seconds_count", labels)
+        assert after == before + 1
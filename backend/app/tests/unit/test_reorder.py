@@ -0,0 +1,60 @@
+"""Unit tests for set-based display_order updates."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.reorder import InvalidOrderError, reorder_rows
+from app.models.event import FoodOption
+
+
+class TestReorderRows:
+    """Test suite for reorder_rows."""
+
+    @pytest.mark.asyncio
+    async def test_reorder_in_one_statement(
+        self, db_session: AsyncSession, test_active_event, assert_max_queries
+    ):
+        """Test positions follow the id list and rows come back in order."""
+        options = [
+            FoodOption(event_id=test_active_event.id, name=f"Option {i}", display_order=i)
+            for i in range(4)
+        ]
+        db_session.add_all(options)
+        await db_session.commit()
+
+        new_order = [options[2].id, options[0].id, options[3].id, options[1].id]
+        with assert_max_queries(1):
+            reordered = await reorder_rows(
+                db_session, FoodOption, new_order, FoodOption.event_id == test_active_event.id
+            )
+        await db_session.commit()
+
+        assert [option.id for option in reordered] == new_order
+        assert [option.display_order for option in reordered] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_ids_outside_scope_are_rejected(
+        self, db_session: AsyncSession, test_active_event
+    ):
+        """Test unknown and repeated ids raise with the offending ids."""
+        option = FoodOption(event_id=test_active_event.id, name="Option", display_order=0)
+        db_session.add(option)
+        await db_session.commit()
+        # Read before the rollback below expires the instance
+        option_id, event_id = option.id, test_active_event.id
+
+        unknown = uuid4()
+        with pytest.raises(InvalidOrderError) as exc_info:
+            await reorder_rows(
+                db_session,
+                FoodOption,
+                [option_id, unknown],
+                FoodOption.event_id == event_id,
+            )
+        assert exc_info.value.ids == {unknown}
+        await db_session.rollback()
+
+        with pytest.raises(InvalidOrderError, match="Duplicate"):
+            await reorder_rows(db_session, FoodOption, [option_id, option_id])
@@ -0,0 +1,107 @@
+"""Unit tests for the two-tier response cache."""
+
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.cache import CachedBody, ResponseCache
+
+
+@pytest_asyncio.fixture
+async def cache() -> AsyncGenerator[ResponseCache, None]:
+    """Response cache with the Redis tier unavailable (local tier only)."""
+    response_cache = ResponseCache("unit_test", ttl_seconds=60, local_ttl_seconds=30)
+    with patch(
+        "app.core.cache.execute_pipeline",
+        new=AsyncMock(side_effect=RedisConnectionError("redis down")),
+    ):
+        yield response_cache
+    ResponseCache._instances.remove(response_cache)
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Tests for ResponseCache read-through and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_loader(self, cache: ResponseCache) -> None:
+        """Second lookup is served from the local tier without calling the loader."""
+        loader = AsyncMock(return_value=CachedBody(b'{"a":1}', ("event:1",)))
+
+        first = await cache.get_or_load("slug:gala", loader)
+        second = await cache.get_or_load("slug:gala", loader)
+
+        assert first == second == b'{"a":1}'
+        assert loader.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tag_drops_only_tagged_entries(self, cache: ResponseCache) -> None:
+        """Invalidating a tag forces a reload of entries carrying it."""
+        gala = AsyncMock(return_value=CachedBody(b"gala", ("event:1",)))
+        auction = AsyncMock(return_value=CachedBody(b"auction", ("event:2",)))
+        await cache.get_or_load("slug:gala", gala)
+        await cache.get_or_load("slug:auction", auction)
+
+        await cache.invalidate_tags("event:1")
+        await cache.get_or_load("slug:gala", gala)
+        await cache.get_or_load("slug:auction", auction)
+
+        assert gala.await_count == 2
+        assert auction.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_loader_errors_are_not_cached(self, cache: ResponseCache) -> None:
+        """A loader exception (e.g. 404) propagates and the next call retries."""
+        loader = AsyncMock(side_effect=[LookupError("not found"), CachedBody(b"ok")])
+
+        with pytest.raises(LookupError):
+            await cache.get_or_load("slug:missing", loader)
+        assert await cache.get_or_load("slug:missing", loader) == b"ok"
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_restores_tags(self) -> None:
+        """Entries read from Redis keep their tags in the local tier."""
+        response_cache = ResponseCache("unit_test_redis", ttl_seconds=60, local_ttl_seconds=30)
+        stored: list[Any] = [b"event:7\n{}"]
+        try:
+            with patch("app.core.cache.execute_pipeline", new=AsyncMock(return_value=stored)):
+                loader = AsyncMock()
+                assert await response_cache.get_or_load("slug:x", loader) == b"{}"
+                loader.assert_not_awaited()
+
+                await response_cache.invalidate_tags("event:7")
+                assert response_cache._get_local("slug:x") is None
+        finally:
+            ResponseCache._instances.remove(response_cache)
+
+    @pytest.mark.asyncio
+    async def test_get_many_loads_misses_together(self) -> None:
+        """Redis hits are used; all remaining misses go to one loader call."""
+        response_cache = ResponseCache("unit_test_many", ttl_seconds=60, local_ttl_seconds=30)
+
+        async def pipeline(call_site: str, build: Any, binary: bool = False) -> list[Any]:
+            if call_site.endswith(".get"):
+                return [[b"npo:1\nfrom-redis", None, None]]
+            return []
+
+        loader = AsyncMock(return_value={"b": CachedBody(b"loaded", ("npo:1",))})
+        try:
+            with patch("app.core.cache.execute_pipeline", new=pipeline):
+                bodies = await response_cache.get_many_or_load(["a", "b", "c", "a"], loader)
+                assert bodies == {"a": b"from-redis", "b": b"loaded"}
+                loader.assert_awaited_once_with(["b", "c"])
+
+                # Both are now local; invalidating their NPO drops both
+                assert await response_cache.get_many_or_load(["a", "b"], loader) == {
+                    "a": b"from-redis",
+                    "b": b"loaded",
+                }
+                await response_cache.invalidate_tags("npo:1")
+                assert response_cache._get_local("a") is None
+                assert response_cache._get_local("b") is None
+        finally:
+            ResponseCache._instances.remove(response_cache)
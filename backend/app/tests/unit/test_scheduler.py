@@ -0,0 +1,94 @@
+"""Unit tests for the periodic job scheduler."""
+
+import asyncio
+
+import pytest
+
+from app.core.scheduler import JobRun, JobScheduler, ScheduledJob
+
+
+class SharedLockScheduler(JobScheduler):
+    """Scheduler whose lock and history live in a dict shared by 'replicas'."""
+
+    def __init__(self, instance_id: str, locks: dict[str, str]) -> None:
+        super().__init__(instance_id=instance_id)
+        self.locks = locks
+        self.recorded: list[JobRun] = []
+
+    async def _acquire_lock(self, job: ScheduledJob) -> bool:
+        return self.locks.setdefault(job.name, self.instance_id) == self.instance_id
+
+    async def _record_run(self, run: JobRun) -> None:
+        self.recorded.append(run)
+
+
+@pytest.mark.unit
+class TestJobScheduler:
+    """Tests for leader election, timeouts and run history."""
+
+    async def test_only_lock_holder_runs_job(self) -> None:
+        """Replicas that lose the lock skip the tick."""
+        calls: list[str] = []
+
+        async def job_func() -> int:
+            calls.append("run")
+            return 3
+
+        job = ScheduledJob(name="close_expired_events", func=job_func, interval=60, timeout=5)
+        locks: dict[str, str] = {}
+        leader = SharedLockScheduler("api-1", locks)
+        follower = SharedLockScheduler("api-2", locks)
+
+        run = await leader.tick(job)
+        assert await follower.tick(job) is None
+
+        assert calls == ["run"]
+        assert run is not None and run.status == "success" and run.result == "3"
+        assert leader.recorded == [run]
+        assert follower.recorded == []
+
+    async def test_failures_and_timeouts_are_recorded(self) -> None:
+        """A failing or hung job is reported, not propagated."""
+
+        async def failing() -> None:
+            raise RuntimeError("database unavailable")
+
+        async def hanging() -> None:
+            await asyncio.sleep(10)
+
+        scheduler = SharedLockScheduler("api-1", {})
+        failed = await scheduler.run(ScheduledJob("failing", failing, interval=60, timeout=5))
+        timed_out = await scheduler.run(ScheduledJob("hanging", hanging, interval=60, timeout=0.01))
+
+        assert failed.status == "error" and failed.error == "database unavailable"
+        assert timed_out.status == "timeout"
+
+    async def test_loop_runs_on_interval_and_stops(self) -> None:
+        """Started loops tick on their interval until stopped."""
+        ticks = 0
+
+        async def job_func() -> None:
+            nonlocal ticks
+            ticks += 1
+
+        scheduler = SharedLockScheduler("api-1", {})
+        scheduler.register(
+            ScheduledJob("fast", job_func, interval=0.01, timeout=1, jitter=0, initial_delay=0)
+        )
+
+        await scheduler.start()
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+
+        assert ticks >= 2
+        assert not scheduler.running
+
+    def test_lock_ttl_covers_run_but_not_next_tick(self) -> None:
+        """The lock outlives a run but expires before the earliest next tick."""
+
+        async def noop() -> None:
+            pass
+
+        job = ScheduledJob("job", noop, interval=900, timeout=300, jitter=0.1)
+        assert job.lock_ttl == 810
+        assert ScheduledJob("slow", noop, interval=60, timeout=120).lock_ttl == 120
@@ -0,0 +1,119 @@
+"""Unit tests for single-pass response serialization."""
+
+import json
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from app.core.serialization import PRIMARY_IMAGES, URL_SIGNER, json_response
+from app.models.auction_item import AuctionItem, AuctionItemMedia, AuctionType, ItemStatus
+from app.schemas.auction_item import AuctionItemDetail, AuctionItemListResponse
+from app.schemas.auction_item_media import MediaResponse
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeSigner:
+    """Appends a token to every URL."""
+
+    def signed_url(self, url: str | None) -> str | None:
+        return f"{url}?sig=1" if url else url
+
+    def sign_derivatives(self, entries: list[dict[str, Any]] | None) -> list[dict[str, Any]] | None:
+        if entries is None:
+            return None
+        return [{**entry, "url": self.signed_url(entry["url"])} for entry in entries]
+
+
+def make_item(**overrides: Any) -> AuctionItem:
+    values: dict[str, Any] = {
+        "id": uuid.uuid4(),
+        "event_id": uuid.uuid4(),
+        "bid_number": 100,
+        "title": "Weekend getaway",
+        "description": "Two nights at a lakeside cabin",
+        "auction_type": AuctionType.SILENT,
+        "starting_bid": Decimal("250.00"),
+        "bid_increment": Decimal("25.00"),
+        "buy_now_enabled": False,
+        "quantity_available": 1,
+        "status": ItemStatus.PUBLISHED,
+        "created_by": uuid.uuid4(),
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+    return AuctionItem(**{**values, **overrides})
+
+
+def make_media(item: AuctionItem, order: int) -> AuctionItemMedia:
+    return AuctionItemMedia(
+        id=uuid.uuid4(),
+        auction_item_id=item.id,
+        media_type="image",
+        file_path=f"https://blob/items/{order}.jpg",
+        file_name=f"{order}.jpg",
+        file_size=1024,
+        mime_type="image/jpeg",
+        display_order=order,
+        thumbnail_path=None,
+        derivatives=[
+            {
+                "url": f"https://blob/items/{order}-400.webp",
+                "blob_name": f"items/{order}-400.webp",
+                "width": 400,
+                "height": 300,
+                "format": "webp",
+                "mime_type": "image/webp",
+                "size": 512,
+            }
+        ],
+        video_url=None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+@pytest.mark.unit
+class TestSinglePassSerialization:
+    """Tests for URL hooks applied during validation."""
+
+    def test_list_signs_primary_images_from_context(self) -> None:
+        """Primary images come from the context; items without one stay null."""
+        with_image, without_image = make_item(), make_item(bid_number=101)
+        body = AuctionItemListResponse.model_validate(
+            {
+                "items": [with_image, without_image],
+                "pagination": {"page": 1, "limit": 50, "total": 2, "pages": 1},
+            },
+            context={
+                URL_SIGNER: FakeSigner(),
+                PRIMARY_IMAGES: {with_image.id: "https://blob/a.jpg"},
+            },
+        )
+
+        assert [item.primary_image_url for item in body.items] == [
+            "https://blob/a.jpg?sig=1",
+            None,
+        ]
+
+    def test_detail_signs_media_and_renders_bytes(self) -> None:
+        """Nested media is signed in the same pass and rendered as the model dumps."""
+        item = make_item()
+        item.media = [make_media(item, 0), make_media(item, 1)]
+        detail = AuctionItemDetail.model_validate(item, context={URL_SIGNER: FakeSigner()})
+        response = json_response(detail)
+
+        payload = json.loads(bytes(response.body))
+        assert payload == json.loads(detail.model_dump_json())
+        assert payload["media"][1]["file_path"] == "https://blob/items/1.jpg?sig=1"
+        assert payload["media"][0]["derivatives"][0]["url"].endswith("?sig=1")
+        assert response.media_type == "application/json"
+
+    def test_validation_without_context_leaves_urls(self) -> None:
+        """Schemas validated without a signer keep stored URLs."""
+        item = make_item()
+        media = MediaResponse.model_validate(make_media(item, 0))
+        assert media.file_path == "https://blob/items/0.jpg"
@@ -0,0 +1,32 @@
+"""Unit tests for the multi-process server's worker settings."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from app.server import max_requests_for_worker, worker_count
+
+
+@pytest.mark.unit
+class TestWorkerSettings:
+    """Tests for worker sizing and recycling limits."""
+
+    def test_configured_worker_count_wins(self) -> None:
+        """An explicit worker count is used as is."""
+        assert worker_count(3) == 3
+
+    def test_default_worker_count_follows_usable_cores(self) -> None:
+        """Zero means one worker per core this process may run on."""
+        with patch.object(os, "sched_getaffinity", return_value={0, 1, 2, 3}, create=True):
+            assert worker_count(0) == 4
+
+    def test_max_requests_disabled(self) -> None:
+        """A zero limit never recycles workers."""
+        assert max_requests_for_worker(0, 100) is None
+
+    def test_max_requests_jitter_stays_in_range(self) -> None:
+        """Each worker gets the limit plus up to the jitter."""
+        limits = {max_requests_for_worker(1000, 50) for _ in range(200)}
+        assert all(limit is not None and 1000 <= limit <= 1050 for limit in limits)
+        assert len(limits) > 1
@@ -0,0 +1,132 @@
+"""Unit tests for tracing spans, sampling and request id propagation."""
+
+import json
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.tracing import (
+    BLOB_CLIENT_HOOKS,
+    FileSpanExporter,
+    RatioSampler,
+    TraceParent,
+    trace_id_for,
+    tracer,
+)
+from app.middleware.request_id import RequestIDMiddleware
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+def read_spans(path: Path) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path) -> Iterator[Path]:
+    """Export every trace of the process-wide tracer to a temporary file."""
+    path = tmp_path / "traces.jsonl"
+    tracer.configure(FileSpanExporter(path))
+    yield path
+    tracer.configure(None)
+
+
+@pytest.mark.unit
+class TestTracing:
+    """Tests for the tracer and its instrumentation."""
+
+    def test_traceparent_and_request_id_mapping(self) -> None:
+        """Valid headers parse; a UUID request id maps to the same trace id."""
+        parent = TraceParent.parse(f"00-{TRACE_ID}-00f067aa0ba902b7-01")
+        assert parent == TraceParent(TRACE_ID, "00f067aa0ba902b7", sampled=True)
+        assert TraceParent.parse(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+        assert TraceParent.parse("garbage") is None
+
+        assert trace_id_for(str(uuid.UUID(TRACE_ID))) == TRACE_ID
+        assert len(trace_id_for("client-supplied-id")) == 32
+
+    def test_ratio_sampler_uses_low_trace_id_bits(self) -> None:
+        """Decisions are deterministic per trace id."""
+        low, high = "f" * 16 + "0" * 16, "0" * 16 + "f" * 16
+        assert RatioSampler(0.5).should_sample(low)
+        assert not RatioSampler(0.5).should_sample(high)
+        assert RatioSampler(1.0).should_sample(high)
+        assert not RatioSampler(0.0).should_sample(low)
+
+    def test_trace_is_exported_when_root_ends(self, trace_file: Path) -> None:
+        """Child spans (including SQL) link to the root; untraced work records nothing."""
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))  # No root span
+
+            with tracer.span("job", root=True, trace_id=TRACE_ID):
+                with tracer.span("step"):
+                    conn.execute(text("SELECT :x"), {"x": 1})
+                with pytest.raises(RuntimeError), tracer.span("failing"):
+                    raise RuntimeError("boom")
+
+        spans = {span["name"]: span for span in read_spans(trace_file)}
+        assert list(spans) == ["db.query", "step", "failing", "job"]
+        assert {span["trace_id"] for span in spans.values()} == {TRACE_ID}
+        assert spans["db.query"]["parent_id"] == spans["step"]["span_id"]
+        assert spans["db.query"]["attributes"]["db.statement"] == "SELECT ?"
+        assert spans["failing"]["status"] == "error"
+        assert spans["job"]["parent_id"] is None
+
+    def test_unsampled_traces_are_not_exported(self, trace_file: Path) -> None:
+        """A negative sampling decision applies to the whole trace."""
+        tracer.configure(FileSpanExporter(trace_file), RatioSampler(0.0))
+        with tracer.span("job", root=True) as root, tracer.span("step") as child:
+            assert root is not None and child is not None
+            assert not child.recording
+        assert not trace_file.exists()
+
+    def test_request_id_is_trace_id(self, trace_file: Path) -> None:
+        """Requests continue the caller's trace and are named by route template."""
+        app = FastAPI()
+        app.add_middleware(RequestIDMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str) -> dict[str, str]:
+            return {"id": item_id}
+
+        response = TestClient(app).get(
+            "/items/42", headers={"traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"}
+        )
+
+        assert response.headers["X-Request-ID"] == str(uuid.UUID(TRACE_ID))
+        [span] = read_spans(trace_file)
+        assert span["name"] == "GET /items/{item_id}"
+        assert (span["trace_id"], span["parent_id"]) == (TRACE_ID, "00f067aa0ba902b7")
+        assert span["kind"] == "server"
+        assert span["attributes"]["http.status_code"] == 200
+
+    def test_blob_hooks_record_requests_without_sas(self, trace_file: Path) -> None:
+        """Blob HTTP requests get client spans; query strings are dropped."""
+        context: dict[str, Any] = {}
+        request = SimpleNamespace(
+            http_request=SimpleNamespace(
+                method="PUT", url="https://acct.blob.core.windows.net/media/a.jpg?sig=secret"
+            ),
+            context=context,
+        )
+        response = SimpleNamespace(context=context, http_response=SimpleNamespace(status_code=201))
+
+        with tracer.span("upload", root=True):
+            BLOB_CLIENT_HOOKS["raw_request_hook"](request)
+            BLOB_CLIENT_HOOKS["raw_response_hook"](response)
+
+        blob = read_spans(trace_file)[0]
+        assert blob["name"] == "blob PUT"
+        assert blob["attributes"] == {
+            "http.method": "PUT",
+            "http.url": "https://acct.blob.core.windows.net/media/a.jpg",
+            "http.status_code": 201,
+        }
@@ -0,0 +1,151 @@
+"""
+Benchmark building a list_auction_items response from ORM objects.
+
+Compares, for one page of auction items:
+
+- previous: validate each item, dump it to a dict, patch primary_image_url in,
+  build the model again, then let FastAPI's response_model handling dump,
+  re-validate and serialize it before ORJSONResponse renders it
+- single pass: validate the page once with URL hooks in the validation
+  context and render it straight to bytes (app.core.serialization)
+
+Reports CPU time (p50/p95) and peak memory allocated per request. URL signing
+is stubbed so only serialization is measured. No database or running server
+is needed.
+
+Usage:
+    poetry run python bench_auction_item_responses.py [--items 100] [--rounds 300]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+
+from app.core.serialization import PRIMARY_IMAGES, URL_SIGNER, json_response
+from app.models.auction_item import AuctionItem, AuctionType, ItemStatus
+from app.schemas.auction_item import AuctionItemListResponse, AuctionItemResponse, PaginationInfo
+
+SAS_QUERY = (
+    "se=2025-01-01T00%3A00%3A00Z&sp=r&sv=2023-11-03&sr=b&sig="
+    "abcdefghijklmnopqrstuvwxyz0123456789ABCDEFGH%3D"
+)
+
+
+class StubSigner:
+    """Appends a fixed SAS query instead of computing one."""
+
+    def signed_url(self, url: str | None) -> str | None:
+        return f"{url}?{SAS_QUERY}" if url else url
+
+    def sign_derivatives(self, entries: list[dict[str, Any]] | None) -> list[dict[str, Any]] | None:
+        return entries
+
+
+def build_items(count: int) -> tuple[list[AuctionItem], dict[uuid.UUID, str]]:
+    """Transient ORM items shaped like a catalog page, plus their primary images."""
+    now = datetime.now(UTC)
+    event_id = uuid.uuid4()
+    items = [
+        AuctionItem(
+            id=uuid.uuid4(),
+            event_id=event_id,
+            bid_number=100 + i,
+            status=ItemStatus.PUBLISHED,
+            created_by=uuid.uuid4(),
+            created_at=now,
+            updated_at=now,
+            title=f"Weekend getaway package #{i}",
+            description="Two nights at a lakeside cabin with dinner for two. " * 4,
+            auction_type=AuctionType.SILENT,
+            starting_bid=Decimal("250.00"),
+            bid_increment=Decimal("25.00"),
+            donor_value=Decimal("800.00"),
+            buy_now_price=Decimal("1200.00"),
+            buy_now_enabled=True,
+            quantity_available=1,
+            donated_by="Lakeside Cabins LLC",
+            item_webpage="https://example.com/lakeside",
+        )
+        for i in range(count)
+    ]
+    primary_images = {
+        item.id: f"https://fundrboltstorage.blob.core.windows.net/npo-assets/{item.id}/image.jpg"
+        for item in items
+    }
+    return items, primary_images
+
+
+def previous(items: list[AuctionItem], primary_images: dict[uuid.UUID, str]) -> bytes:
+    """The dict round trip plus FastAPI's response_model processing."""
+    signer = StubSigner()
+    enriched = []
+    for item in items:
+        item_dict = AuctionItemResponse.model_validate(item).model_dump()
+        item_dict["primary_image_url"] = signer.signed_url(primary_images.get(item.id))
+        enriched.append(AuctionItemResponse(**item_dict))
+    body = AuctionItemListResponse(
+        items=enriched,
+        pagination=PaginationInfo(page=1, limit=len(items), total=len(items), pages=1),
+    )
+    # What FastAPI does with a returned model and response_model set
+    validated = AuctionItemListResponse.model_validate(body.model_dump())
+    return bytes(ORJSONResponse(validated.model_dump(mode="json")).body)
+
+
+def single_pass(items: list[AuctionItem], primary_images: dict[uuid.UUID, str]) -> bytes:
+    """One validation with URL hooks, rendered straight to bytes."""
+    body = AuctionItemListResponse.model_validate(
+        {
+            "items": items,
+            "pagination": {"page": 1, "limit": len(items), "total": len(items), "pages": 1},
+        },
+        context={URL_SIGNER: StubSigner(), PRIMARY_IMAGES: primary_images},
+    )
+    return bytes(json_response(body).body)
+
+
+def measure(fn: Callable[[], bytes], rounds: int) -> tuple[int, float, float, int]:
+    """Return output size, CPU p50/p95 in ms and peak bytes allocated per call."""
+    samples = []
+    output = b""
+    for _ in range(rounds):
+        start = time.process_time()
+        output = fn()
+        samples.append((time.process_time() - start) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(samples, n=20)
+    return len(output), statistics.median(samples), quantiles[18], peak
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=100, help="Auction items per page")
+    parser.add_argument("--rounds", type=int, default=300, help="Iterations per path")
+    args = parser.parse_args()
+
+    items, primary_images = build_items(args.items)
+    assert previous(items, primary_images) == single_pass(items, primary_images), "bodies differ"
+
+    print(f"list_auction_items ({args.items} items)")
+    print(f"{'path':<14}{'bytes':>10}{'cpu p50 ms':>12}{'cpu p95 ms':>12}{'peak KiB':>10}")
+    for label, fn in (("previous", previous), ("single pass", single_pass)):
+        size, p50, p95, peak = measure(lambda fn=fn: fn(items, primary_images), args.rounds)
+        print(f"{label:<14}{size:>10}{p50:>12.3f}{p95:>12.3f}{peak / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Import-time budget for the API (the cold-start cost before lifespan startup).
+
+Imports ``app.main`` in fresh interpreters and reports:
+
+- wall-clock import time (median and max over the runs) against a budget
+- the packages with the most import time (self time summed per top-level
+  package, from one extra ``python -X importtime`` run)
+- modules that must stay lazy: heavy SDKs that are only needed once a
+  request uses them (Azure Blob Storage, Azure email, Pillow, bleach)
+
+Exits non-zero when the median is over budget or a lazy module is imported
+eagerly, so it can gate CI. Needs the backend environment (.env) but no
+database, Redis or running server.
+
+Usage:
+    poetry run python ../scripts/dev-utils/bench_import_time.py [--runs 5] [--budget-ms 1600] [--top 15]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Imported by the services that use them, on first use
+LAZY_MODULES = ("azure.storage.blob", "azure.communication.email", "PIL", "bleach")
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+PROBE = f"""
+import sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+eager = [m for m in {LAZY_MODULES!r} if m in sys.modules]
+print(f"{{elapsed * 1000:.1f}}|{{','.join(eager)}}")
+"""
+
+
+def run_once(backend_dir: Path, importtime: bool = False) -> tuple[float, list[str], str]:
+    """Import the app in a fresh interpreter.
+
+    Returns:
+        Wall-clock ms, lazy modules that were imported, and the -X importtime
+        report (empty unless requested; it slows the import down)
+    """
+    flags = ["-X", "importtime"] if importtime else []
+    result = subprocess.run(
+        [sys.executable, *flags, "-c", PROBE],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, eager = result.stdout.strip().splitlines()[-1].split("|")
+    return float(elapsed), [m for m in eager.split(",") if m], result.stderr
+
+
+def self_time_by_package(report: str) -> dict[str, int]:
+    """Self import time (us) summed per top-level package."""
+    per_package: dict[str, int] = defaultdict(int)
+    for line in report.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            per_package[match.group(4).split(".")[0]] += int(match.group(1))
+    return per_package
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time")
+    parser.add_argument("--budget-ms", type=float, default=1600.0, help="Median import budget")
+    parser.add_argument("--top", type=int, default=15, help="Packages to list")
+    args = parser.parse_args()
+
+    backend_dir = Path(__file__).resolve().parents[2] / "backend"
+    runs = [run_once(backend_dir) for _ in range(args.runs)]
+    timings = [elapsed for elapsed, _, _ in runs]
+    median = statistics.median(timings)
+    eager = sorted({module for _, modules, _ in runs for module in modules})
+    _, _, report = run_once(backend_dir, importtime=True)
+
+    print(f"import app.main ({args.runs} runs)")
+    print(f"  median {median:.0f} ms, max {max(timings):.0f} ms, budget {args.budget_ms:.0f} ms")
+    print(f"\n{'package (-X importtime)':<24}{'self ms':>10}")
+    per_package = self_time_by_package(report)
+    for package, micros in sorted(per_package.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{package:<24}{micros / 1000:>10.1f}")
+
+    failures = []
+    if median > args.budget_ms:
+        failures.append(
+            f"median import time {median:.0f} ms is over the {args.budget_ms:.0f} ms budget"
+        )
+    if eager:
+        failures.append(f"imported eagerly (should load on first use): {', '.join(eager)}")
+    for failure in failures:
+        print(f"\nFAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
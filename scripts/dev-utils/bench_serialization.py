@@ -0,0 +1,174 @@
+"""
+Benchmark response serialization and compression for large API payloads.
+
+Builds synthetic payloads shaped like the two largest responses -
+list_auction_items (a page of items with long SAS URLs) and get_event_tables
+(every table with guests) - and reports payload sizes plus p50/p95 timings for:
+
+- stdlib json rendering (FastAPI JSONResponse, the previous default)
+- orjson rendering (ORJSONResponse, the app's default response class)
+- gzip and Brotli at the levels configured for CompressionMiddleware
+
+No database or running server is needed.
+
+Usage:
+    poetry run python bench_serialization.py [--items 100] [--tables 40] [--guests 10]
+"""
+
+import argparse
+import gzip
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import brotli
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.core.config import get_settings
+from app.models.auction_item import AuctionType, ItemStatus
+from app.schemas.auction_item import AuctionItemListResponse, AuctionItemResponse, PaginationInfo
+
+SAS_URL = (
+    "https://fundrboltstorage.blob.core.windows.net/npo-assets/auction-items/{item}/"
+    "image.jpg?se=2025-01-01T00%3A00%3A00Z&sp=r&sv=2023-11-03&sr=b&sig="
+    "abcdefghijklmnopqrstuvwxyz0123456789ABCDEFGH%3D"
+)
+
+
+def build_auction_items(count: int) -> AuctionItemListResponse:
+    """Build a list_auction_items page with SAS URLs on every item."""
+    now = datetime.now(UTC)
+    event_id = uuid.uuid4()
+    items = [
+        AuctionItemResponse(
+            id=uuid.uuid4(),
+            event_id=event_id,
+            bid_number=100 + i,
+            status=ItemStatus.PUBLISHED,
+            created_by=uuid.uuid4(),
+            created_at=now,
+            updated_at=now,
+            title=f"Weekend getaway package #{i}",
+            description="Two nights at a lakeside cabin with dinner for two. " * 4,
+            auction_type=AuctionType.SILENT,
+            starting_bid=Decimal("250.00"),
+            bid_increment=Decimal("25.00"),
+            donor_value=Decimal("800.00"),
+            buy_now_price=Decimal("1200.00"),
+            buy_now_enabled=True,
+            donated_by="Lakeside Cabins LLC",
+            item_webpage="https://example.com/lakeside",
+            primary_image_url=SAS_URL.format(item=uuid.uuid4()),
+        )
+        for i in range(count)
+    ]
+    return AuctionItemListResponse(
+        items=items, pagination=PaginationInfo(page=1, limit=100, total=count, pages=1)
+    )
+
+
+def build_event_tables(tables: int, guests_per_table: int) -> dict[str, Any]:
+    """Build a get_event_tables(include_guests=true) response body."""
+    table_list = []
+    for number in range(1, tables + 1):
+        guests = [
+            {
+                "id": str(uuid.uuid4()),
+                "first_name": "Guest",
+                "last_name": f"Number {number}-{g}",
+                "bidder_number": 100 + number * guests_per_table + g,
+                "is_table_captain": g == 0,
+            }
+            for g in range(guests_per_table)
+        ]
+        table_list.append(
+            {
+                "id": str(uuid.uuid4()),
+                "table_number": number,
+                "custom_capacity": None,
+                "table_name": f"Table {number}",
+                "table_captain": {"id": guests[0]["id"], "first_name": "Guest", "last_name": ""},
+                "current_occupancy": guests_per_table,
+                "effective_capacity": guests_per_table,
+                "is_full": True,
+                "guests": guests,
+            }
+        )
+    return {
+        "event_id": str(uuid.uuid4()),
+        "event_max_guests_per_table": guests_per_table,
+        "tables": table_list,
+        "summary": {
+            "total_tables": tables,
+            "total_capacity": tables * guests_per_table,
+            "total_assigned": tables * guests_per_table,
+            "tables_full": tables,
+            "tables_with_captains": tables,
+        },
+    }
+
+
+def timed(fn: Callable[[], bytes], rounds: int) -> tuple[bytes, float, float]:
+    """Run fn repeatedly; return its output with p50 and p95 latency in ms."""
+    samples = []
+    output = b""
+    for _ in range(rounds):
+        start = time.perf_counter()
+        output = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    quantiles = statistics.quantiles(samples, n=20)
+    return output, statistics.median(samples), quantiles[18]
+
+
+def report(name: str, content: Any, rounds: int) -> None:
+    """Print size and timing rows for one payload."""
+    settings = get_settings()
+    print(f"\n{name}")
+    print(f"{'step':<28}{'bytes':>10}{'p50 ms':>10}{'p95 ms':>10}")
+
+    rows: list[tuple[str, Callable[[], bytes]]] = [
+        ("json (JSONResponse)", lambda: bytes(JSONResponse(content).body)),
+        ("orjson (ORJSONResponse)", lambda: bytes(ORJSONResponse(content).body)),
+    ]
+    body = bytes(ORJSONResponse(content).body)
+    rows += [
+        (
+            f"gzip level {settings.compression_gzip_level}",
+            lambda: gzip.compress(body, compresslevel=settings.compression_gzip_level),
+        ),
+        (
+            f"brotli quality {settings.compression_brotli_quality}",
+            lambda: brotli.compress(
+                body, mode=brotli.MODE_TEXT, quality=settings.compression_brotli_quality
+            ),
+        ),
+    ]
+    for label, fn in rows:
+        output, p50, p95 = timed(fn, rounds)
+        print(f"{label:<28}{len(output):>10}{p50:>10.3f}{p95:>10.3f}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=100, help="Auction items per page")
+    parser.add_argument("--tables", type=int, default=40, help="Tables in the event")
+    parser.add_argument("--guests", type=int, default=10, help="Guests per table")
+    parser.add_argument("--rounds", type=int, default=200, help="Iterations per step")
+    args = parser.parse_args()
+
+    # FastAPI serializes response models to JSON-compatible Python before rendering
+    items = build_auction_items(args.items).model_dump(mode="json")
+    tables = jsonable_encoder(build_event_tables(args.tables, args.guests))
+
+    report(f"list_auction_items ({args.items} items)", items, args.rounds)
+    report(f"get_event_tables ({args.tables} tables x {args.guests} guests)", tables, args.rounds)
+
+
+if __name__ == "__main__":
+    main()